@@ -0,0 +1,366 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Microbenchmark for single-traversal function context extraction.
+
+Extracts the AST facts of every function in the eval skill scripts with one
+``ast.walk()`` per fact (as before) and with one FunctionFactsVisitor pass,
+checking both give the same fields and reporting the per-function time.
+Parameter flows come from the dataflow analysis and are not part of either.
+"""
+
+import ast
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skill_scanner.core.static_analysis import ScriptArtifacts
+from skill_scanner.core.static_analysis.context_extractor import ContextExtractor, FunctionFactsVisitor
+
+
+class MultiPassExtractor(ContextExtractor):
+    """Function fact extraction with a separate AST walk per fact."""
+
+    def _extract_function_calls(self, node: ast.AST) -> list[dict[str, Any]]:
+        """Extract all function calls with arguments."""
+        calls = []
+        for child in ast.walk(node):
+            if isinstance(child, ast.Call):
+                args_list = []
+                for arg in child.args:
+                    try:
+                        args_list.append(ast.unparse(arg))
+                    except (AttributeError, TypeError, ValueError):
+                        args_list.append("<complex>")
+
+                call_info = {
+                    "name": self._get_call_name(child),
+                    "args": args_list,
+                    "line": child.lineno if hasattr(child, "lineno") else 0,
+                }
+                calls.append(call_info)
+        return calls
+
+    def _extract_assignments(self, node: ast.AST) -> list[dict[str, Any]]:
+        """Extract all assignments."""
+        assignments = []
+        for child in ast.walk(node):
+            if isinstance(child, ast.Assign):
+                for target in child.targets:
+                    if isinstance(target, ast.Name):
+                        try:
+                            value_str = ast.unparse(child.value)
+                        except (AttributeError, TypeError, ValueError):
+                            value_str = "<complex>"
+                        assignments.append(
+                            {
+                                "variable": target.id,
+                                "value": value_str,
+                                "line": child.lineno if hasattr(child, "lineno") else 0,
+                            }
+                        )
+        return assignments
+
+    def _analyze_control_flow(self, node: ast.AST) -> dict[str, Any]:
+        """Analyze control flow structure."""
+        has_if = any(isinstance(n, ast.If) for n in ast.walk(node))
+        has_for = any(isinstance(n, (ast.For, ast.AsyncFor)) for n in ast.walk(node))
+        has_while = any(isinstance(n, ast.While) for n in ast.walk(node))
+        has_try = any(isinstance(n, ast.Try) for n in ast.walk(node))
+
+        return {
+            "has_conditionals": has_if,
+            "has_loops": has_for or has_while,
+            "has_exception_handling": has_try,
+        }
+
+    def _extract_constants(self, node: ast.AST) -> dict[str, Any]:
+        """Extract constant values."""
+        constants = {}
+        for child in ast.walk(node):
+            if isinstance(child, ast.Assign):
+                for target in child.targets:
+                    if isinstance(target, ast.Name) and isinstance(child.value, ast.Constant):
+                        constants[target.id] = child.value.value
+        return constants
+
+    def _analyze_variable_dependencies(self, node: ast.AST) -> dict[str, list[str]]:
+        """Analyze variable dependencies."""
+        dependencies = {}
+        for child in ast.walk(node):
+            if isinstance(child, ast.Assign):
+                for target in child.targets:
+                    if isinstance(target, ast.Name):
+                        deps = []
+                        for name_node in ast.walk(child.value):
+                            if isinstance(name_node, ast.Name):
+                                deps.append(name_node.id)
+                        dependencies[target.id] = deps
+        return dependencies
+
+    def _has_file_operations(self, node: ast.AST) -> bool:
+        """Check for file operations."""
+        file_patterns = ["open", "read", "write", "path", "file", "os.remove", "shutil"]
+        for child in ast.walk(node):
+            if isinstance(child, ast.Call):
+                call_name = self._get_call_name(child).lower()
+                if any(pattern in call_name for pattern in file_patterns):
+                    return True
+        return False
+
+    def _has_network_operations(self, node: ast.AST) -> bool:
+        """Check for network operations."""
+        network_patterns = ["requests", "urllib", "http", "socket", "post", "get", "fetch"]
+        for child in ast.walk(node):
+            if isinstance(child, ast.Call):
+                call_name = self._get_call_name(child).lower()
+                if any(pattern in call_name for pattern in network_patterns):
+                    return True
+        return False
+
+    def _has_subprocess_calls(self, node: ast.AST) -> bool:
+        """Check for subprocess calls."""
+        subprocess_patterns = ["subprocess", "os.system", "os.popen", "shell", "exec"]
+        for child in ast.walk(node):
+            if isinstance(child, ast.Call):
+                call_name = self._get_call_name(child).lower()
+                if any(pattern in call_name for pattern in subprocess_patterns):
+                    return True
+        return False
+
+    def _has_eval_exec(self, node: ast.AST) -> bool:
+        """Check for eval/exec calls."""
+        for child in ast.walk(node):
+            if isinstance(child, ast.Call):
+                call_name = self._get_call_name(child)
+                if call_name in ["eval", "exec", "compile", "__import__"]:
+                    return True
+        return False
+
+    def _extract_string_literals(self, node: ast.AST) -> list[str]:
+        """Extract all string literals from function."""
+        literals = []
+        for child in ast.walk(node):
+            if isinstance(child, ast.Constant) and isinstance(child.value, str):
+                literal = child.value[:200]
+                if literal and literal not in literals:
+                    literals.append(literal)
+        return literals[:20]
+
+    def _extract_return_expressions(self, node: ast.AST) -> list[str]:
+        """Extract return expressions from function."""
+        returns = []
+        for child in ast.walk(node):
+            if isinstance(child, ast.Return) and child.value:
+                try:
+                    return_expr = ast.unparse(child.value)[:100]
+                    returns.append(return_expr)
+                except (AttributeError, TypeError, ValueError):
+                    returns.append("<unparseable>")
+        return returns
+
+    def _extract_exception_handlers(self, node: ast.AST) -> list[dict[str, Any]]:
+        """Extract exception handling details."""
+        handlers = []
+        for child in ast.walk(node):
+            if isinstance(child, ast.ExceptHandler):
+                handler_info = {
+                    "line": child.lineno,
+                    "exception_type": ast.unparse(child.type) if child.type else "Exception",
+                    "is_silent": len(child.body) == 1 and isinstance(child.body[0], ast.Pass),
+                }
+                handlers.append(handler_info)
+        return handlers
+
+    def _extract_env_var_access(self, node: ast.AST) -> list[str]:
+        """Extract environment variable accesses."""
+        env_accesses = []
+        for child in ast.walk(node):
+            if isinstance(child, ast.Call):
+                call_name = self._get_call_name(child)
+                if "environ" in call_name or "getenv" in call_name:
+                    if child.args and isinstance(child.args[0], ast.Constant):
+                        key = child.args[0].value
+                        env_accesses.append(f"{call_name}('{key}')")
+                    else:
+                        env_accesses.append(call_name)
+        return env_accesses
+
+    def _extract_global_writes(self, node: ast.AST) -> list[dict[str, Any]]:
+        """Extract global variable writes."""
+        global_writes = []
+        global_vars = set()
+
+        for child in ast.walk(node):
+            if isinstance(child, ast.Global):
+                global_vars.update(child.names)
+
+        for child in ast.walk(node):
+            if isinstance(child, ast.Assign):
+                for target in child.targets:
+                    if isinstance(target, ast.Name) and target.id in global_vars:
+                        try:
+                            value_str = ast.unparse(child.value)[:100]
+                        except (AttributeError, TypeError, ValueError):
+                            value_str = "<complex>"
+                        global_writes.append({"variable": target.id, "value": value_str, "line": child.lineno})
+
+        return global_writes
+
+    def _extract_attribute_access(self, node: ast.AST) -> list[dict[str, Any]]:
+        """Extract attribute access patterns."""
+        attribute_ops = []
+
+        for child in ast.walk(node):
+            if isinstance(child, ast.Assign):
+                for target in child.targets:
+                    if isinstance(target, ast.Attribute):
+                        obj_name = ""
+                        if isinstance(target.value, ast.Name):
+                            obj_name = target.value.id
+                        try:
+                            value_str = ast.unparse(child.value)[:100]
+                        except (AttributeError, TypeError, ValueError):
+                            value_str = "<complex>"
+                        attribute_ops.append(
+                            {
+                                "type": "write",
+                                "object": obj_name,
+                                "attribute": target.attr,
+                                "value": value_str,
+                                "line": child.lineno,
+                            }
+                        )
+
+        return attribute_ops[:20]
+
+    def _create_dataflow_summary(self, node: ast.AST) -> dict[str, Any]:
+        """Create dataflow summary."""
+        return {
+            "total_statements": len([n for n in ast.walk(node) if isinstance(n, ast.stmt)]),
+            "total_expressions": len([n for n in ast.walk(node) if isinstance(n, ast.expr)]),
+            "complexity": self._calculate_complexity(node),
+        }
+
+    def _calculate_complexity(self, node: ast.AST) -> int:
+        """Calculate cyclomatic complexity."""
+        complexity = 1
+        for child in ast.walk(node):
+            if isinstance(child, (ast.If, ast.For, ast.While, ast.ExceptHandler)):
+                complexity += 1
+            elif isinstance(child, ast.BoolOp):
+                complexity += len(child.values) - 1
+        return complexity
+
+    def extract(self, node: ast.AST) -> dict[str, Any]:
+        return {
+            "function_calls": self._extract_function_calls(node),
+            "assignments": self._extract_assignments(node),
+            "control_flow": self._analyze_control_flow(node),
+            "constants": self._extract_constants(node),
+            "variable_dependencies": self._analyze_variable_dependencies(node),
+            "has_file_operations": self._has_file_operations(node),
+            "has_network_operations": self._has_network_operations(node),
+            "has_subprocess_calls": self._has_subprocess_calls(node),
+            "has_eval_exec": self._has_eval_exec(node),
+            "string_literals": self._extract_string_literals(node),
+            "return_expressions": self._extract_return_expressions(node),
+            "exception_handlers": self._extract_exception_handlers(node),
+            "env_var_access": self._extract_env_var_access(node),
+            "global_writes": self._extract_global_writes(node),
+            "attribute_access": self._extract_attribute_access(node),
+            "dataflow_summary": self._create_dataflow_summary(node),
+        }
+
+
+def single_pass(get_call_name, node: ast.AST) -> dict[str, Any]:
+    facts = FunctionFactsVisitor(get_call_name).collect(node)
+    return {
+        "function_calls": facts.function_calls,
+        "assignments": facts.assignments,
+        "control_flow": facts.control_flow(),
+        "constants": facts.constants,
+        "variable_dependencies": facts.variable_dependencies,
+        "has_file_operations": facts.has_file_operations,
+        "has_network_operations": facts.has_network_operations,
+        "has_subprocess_calls": facts.has_subprocess_calls,
+        "has_eval_exec": facts.has_eval_exec,
+        "string_literals": facts.string_literals[:20],
+        "return_expressions": facts.return_expressions,
+        "exception_handlers": facts.exception_handlers,
+        "env_var_access": facts.env_var_access,
+        "global_writes": facts.global_writes(),
+        "attribute_access": facts.attribute_access[:20],
+        "dataflow_summary": facts.dataflow_summary(),
+    }
+
+
+def collect_functions(skills_dir: Path) -> list[ast.AST]:
+    """Parse every script under the directory and return its function nodes."""
+    functions = []
+    for path in sorted(skills_dir.rglob("*.py")):
+        tree = ScriptArtifacts(path.read_text(encoding="utf-8", errors="ignore")).tree
+        if tree is None:
+            continue
+        functions.extend(node for node in ast.walk(tree) if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)))
+    return functions
+
+
+def measure(label: str, extract, functions: list[ast.AST], repeat: int) -> list[dict[str, Any]]:
+    """Time extraction over all functions, keeping the best of several runs."""
+    best = float("inf")
+    results: list[dict[str, Any]] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [extract(node) for node in functions]
+        best = min(best, time.perf_counter() - start)
+    print(f"{label + ':':14s}{best * 1000:.1f}ms total, {best / len(functions) * 1e6:.1f}us per function")
+    return results
+
+
+def main():
+    """Main entry point for the context extraction benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark single-traversal function context extraction")
+    parser.add_argument("--skills-dir", default="evals/skills", help="Directory of skill scripts")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs over the corpus (best is reported)")
+
+    args = parser.parse_args()
+
+    functions = collect_functions(Path(args.skills_dir))
+    if not functions:
+        print(f"Error: no Python functions found under {args.skills_dir}")
+        return 1
+    print(f"Functions: {len(functions)}")
+
+    baseline = MultiPassExtractor()
+    multi = measure("multi-pass", baseline.extract, functions, args.repeat)
+    fused = measure("single-pass", lambda node: single_pass(baseline._get_call_name, node), functions, args.repeat)
+
+    if multi != fused:
+        print("Error: extracted fields differ")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
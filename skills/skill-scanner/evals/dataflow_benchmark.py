@@ -0,0 +1,172 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Microbenchmark for the CFG dataflow worklist solver.
+
+Runs ForwardDataflowAnalysis on every function of the Python files under a
+directory (plus a generated loop-heavy function) with the FIFO worklist the
+solver used before and with the reverse-postorder/SCC worklist, checking both
+reach the same flows and reporting iterations and iteration-cap hits.
+"""
+
+import ast
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skill_scanner.core.static_analysis.dataflow import ForwardDataflowAnalysis
+from skill_scanner.core.static_analysis.parser.python_parser import PythonParser
+
+
+class FIFOForwardAnalysis(ForwardDataflowAnalysis):
+    """Forward analysis solved with a FIFO worklist seeded in node insertion order."""
+
+    def analyze(self, initial_fact, forward=True, max_iteration_multiplier=1000):
+        if not self.cfg:
+            self.build_cfg()
+        for node in self.cfg.nodes:
+            self.in_facts[node.id] = initial_fact
+            self.out_facts[node.id] = initial_fact
+
+        worklist = list(self.cfg.nodes)
+        in_worklist = {node.id for node in worklist}
+        max_iterations = len(self.cfg.nodes) * int(max_iteration_multiplier * 0.3)
+        self.stats.iterations = 0
+        self.stats.hit_iteration_cap = False
+        while worklist:
+            if self.stats.iterations >= max_iterations:
+                self.stats.hit_iteration_cap = True
+                break
+            self.stats.iterations += 1
+            node = worklist.pop(0)
+            in_worklist.discard(node.id)
+            preds = [self.out_facts[pred.id] for pred in node.predecessors]
+            in_fact = self.merge(preds) if preds else initial_fact
+            self.in_facts[node.id] = in_fact
+            out_fact = self.transfer(node, in_fact)
+            if out_fact != self.out_facts[node.id]:
+                self.out_facts[node.id] = out_fact
+                for succ in node.successors:
+                    if succ.id not in in_worklist:
+                        worklist.append(succ)
+                        in_worklist.add(succ.id)
+
+
+def generated_function(loops: int) -> str:
+    """Generate a function with many nested loops and early returns."""
+    lines = ["def handler(data, url):", "    token = os.getenv('API_TOKEN')"]
+    for i in range(loops):
+        lines += [
+            "    for item in data:",
+            f"        value{i} = item + token",
+            "        while item:",
+            f"            item = value{i}",
+            f"            if value{i}:",
+            f"                requests.post(url, value{i})",
+            f"                return value{i}",
+            f"    data = value{i}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def collect_functions(root: Path, loops: int) -> list[tuple[str, str, list[str]]]:
+    """Collect (name, source, parameters) for every function under root."""
+    functions = [("<generated>", generated_function(loops), ["data", "url"])]
+    for path in sorted(root.rglob("*.py")):
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8", errors="ignore"))
+        except SyntaxError:
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.args.args:
+                params = [arg.arg for arg in node.args.args]
+                functions.append((f"{path}:{node.name}", ast.unparse(node), params))
+    return functions
+
+
+def flows_key(flows) -> list[tuple]:
+    """Order-insensitive summary of flow paths for comparison."""
+    return sorted(
+        (
+            flow.parameter_name,
+            tuple(sorted({repr(sorted(op.items())) for op in flow.operations})),
+            tuple(sorted(flow.reaches_calls)),
+            flow.reaches_returns,
+            flow.reaches_external,
+        )
+        for flow in flows
+    )
+
+
+def run(analysis_cls, functions):
+    """Analyze every function; return (total seconds, iterations, cap hits, flows)."""
+    total_time = 0.0
+    iterations = 0
+    cap_hits = 0
+    results = []
+    for _, source, params in functions:
+        parser = PythonParser(source)
+        if not parser.parse():
+            results.append(None)
+            continue
+        analysis = analysis_cls(parser, params)
+        start = time.perf_counter()
+        flows = analysis.analyze_forward_flows()
+        total_time += time.perf_counter() - start
+        iterations += analysis.stats.iterations
+        cap_hits += analysis.stats.hit_iteration_cap
+        results.append(flows_key(flows))
+    return total_time, iterations, cap_hits, results
+
+
+def main():
+    """Main entry point for the dataflow solver benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the CFG dataflow worklist solver")
+    parser.add_argument("--skills-dir", default="evals/skills", help="Directory of Python files to analyze")
+    parser.add_argument("--loops", type=int, default=40, help="Loops in the generated function")
+
+    args = parser.parse_args()
+
+    functions = collect_functions(Path(args.skills_dir), args.loops)
+    print(f"Functions: {len(functions)} (including a generated one with {args.loops} nested loops)")
+
+    fifo_time, fifo_iterations, fifo_caps, fifo_results = run(FIFOForwardAnalysis, functions)
+    rpo_time, rpo_iterations, rpo_caps, rpo_results = run(ForwardDataflowAnalysis, functions)
+
+    differing = [
+        name
+        for (name, _, _), fifo, rpo in zip(functions, fifo_results, rpo_results, strict=True)
+        if fifo != rpo and not fifo_caps
+    ]
+    if differing:
+        print(f"Error: flows differ for {', '.join(differing)}")
+        return 1
+
+    print(f"FIFO worklist: {fifo_time:.3f}s, {fifo_iterations:,} iterations, {fifo_caps} hit the iteration cap")
+    print(f"RPO worklist:  {rpo_time:.3f}s, {rpo_iterations:,} iterations, {rpo_caps} hit the iteration cap")
+    if rpo_caps:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Microbenchmark for description overlap detection.
+
+Generates a catalogue of synthetic skill descriptions, some of them near
+duplicates, and compares every pair (as before) against the MinHash/LSH
+DescriptionIndex, checking both report the same pairs above 0.5 similarity.
+"""
+
+import random
+import sys
+import time
+from itertools import combinations
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skill_scanner.core.description_index import DescriptionIndex, description_tokens, jaccard
+
+VOCABULARY_SIZE = 5000
+WORDS_PER_DESCRIPTION = 12
+
+
+def _word(n: int) -> str:
+    """Spell a vocabulary index with letters only, so it survives tokenization."""
+    letters = []
+    while True:
+        n, r = divmod(n, 26)
+        letters.append(chr(97 + r))
+        if n == 0:
+            return "w" + "".join(letters)
+
+
+def build_descriptions(count: int, duplicate_every: int, seed: int = 7) -> list[str]:
+    """Generate random descriptions, every few of them a light edit of an earlier one."""
+    rng = random.Random(seed)
+    descriptions: list[str] = []
+    for n in range(count):
+        if descriptions and n % duplicate_every == 0:
+            words = rng.choice(descriptions).split()
+            words[rng.randrange(len(words))] = _word(rng.randrange(VOCABULARY_SIZE))
+        else:
+            words = [_word(rng.randrange(VOCABULARY_SIZE)) for _ in range(WORDS_PER_DESCRIPTION)]
+        descriptions.append(" ".join(words))
+    return descriptions
+
+
+def pairwise(descriptions: list[str]) -> set[tuple[int, int]]:
+    """Compare every pair of descriptions."""
+    tokens = [description_tokens(d) for d in descriptions]
+    return {(i, j) for i, j in combinations(range(len(tokens)), 2) if jaccard(tokens[i], tokens[j]) > 0.5}
+
+
+def indexed(descriptions: list[str]) -> set[tuple[int, int]]:
+    """Find similar pairs through the LSH index."""
+    index = DescriptionIndex()
+    for i, description in enumerate(descriptions):
+        index.add(str(i), str(i), description)
+    pairs = set()
+    for i in range(len(descriptions)):
+        for other, _ in index.similar(str(i)):
+            pairs.add((min(i, int(other)), max(i, int(other))))
+    return pairs
+
+
+def main():
+    """Main entry point for the description overlap benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark description overlap detection")
+    parser.add_argument("--count", type=int, default=5000, help="Number of descriptions")
+    parser.add_argument("--duplicate-every", type=int, default=50, help="Make every Nth description a near duplicate")
+
+    args = parser.parse_args()
+
+    descriptions = build_descriptions(args.count, args.duplicate_every)
+    print(f"Descriptions: {len(descriptions)}, pairs: {len(descriptions) * (len(descriptions) - 1) // 2:,}")
+
+    start = time.perf_counter()
+    lsh_pairs = indexed(descriptions)
+    lsh_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    exact_pairs = pairwise(descriptions)
+    pairwise_time = time.perf_counter() - start
+
+    if lsh_pairs != exact_pairs:
+        print(f"Error: LSH found {len(lsh_pairs)} pairs, pairwise comparison {len(exact_pairs)}")
+        return 1
+
+    print(f"Similar pairs: {len(exact_pairs)}")
+    print(f"Pairwise comparison: {pairwise_time:.3f}s")
+    print(f"DescriptionIndex:    {lsh_time:.3f}s ({pairwise_time / lsh_time:.1f}x faster)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -32,6 +32,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import os
 
 from skill_scanner.core.analyzers.static import StaticAnalyzer
+from skill_scanner.core.llm_cache import LLMResponseCache
 from skill_scanner.core.models import Severity
 from skill_scanner.core.scanner import SkillScanner
 
@@ -55,7 +56,13 @@ class EvalResult:
 class EvaluationRunner:
     """Runs evaluation tests on analyzer accuracy."""
 
-    def __init__(self, test_skills_dir: Path, use_llm: bool = False, use_meta: bool = False):
+    def __init__(
+        self,
+        test_skills_dir: Path,
+        use_llm: bool = False,
+        use_meta: bool = False,
+        llm_cache: LLMResponseCache | None = None,
+    ):
         """
         Initialize evaluation runner.
 
@@ -63,6 +70,7 @@ class EvaluationRunner:
             test_skills_dir: Directory containing test skills
             use_llm: Whether to use LLM analyzer
             use_meta: Whether to use Meta-Analyzer for false positive filtering
+            llm_cache: Optional LLM response cache; re-runs reuse earlier responses
         """
         self.test_skills_dir = test_skills_dir
         self.use_meta = use_meta
@@ -86,6 +94,7 @@ class EvaluationRunner:
                         api_key=api_key,
                         base_url=base_url,
                         api_version=api_version,
+                        response_cache=llm_cache,
                     )
                     analyzers.append(llm_analyzer)
                     print(f"Using LLM analyzer with model: {model}")
@@ -97,7 +106,7 @@ class EvaluationRunner:
             try:
                 from skill_scanner.core.analyzers.meta_analyzer import MetaAnalyzer
 
-                self.meta_analyzer = MetaAnalyzer()
+                self.meta_analyzer = MetaAnalyzer(response_cache=llm_cache)
                 print("Using Meta-Analyzer for false positive filtering and prioritization")
             except Exception as e:
                 print(f"Warning: Could not initialize Meta-Analyzer: {e}")
@@ -336,7 +345,7 @@ def print_metrics(results: dict, title: str = "Evaluation Results"):
             print(f"  Filter rate: {filter_rate:.1%}")
 
 
-def run_comparison(test_dir: Path, show_details: bool = False):
+def run_comparison(test_dir: Path, show_details: bool = False, llm_cache: LLMResponseCache | None = None):
     """Run evaluation both with and without meta analyzer and compare results."""
     print("=" * 70)
     print("META ANALYZER COMPARISON EVALUATION")
@@ -345,12 +354,12 @@ def run_comparison(test_dir: Path, show_details: bool = False):
 
     # Run WITHOUT meta
     print("\n[1/2] Running evaluation WITHOUT Meta-Analyzer...")
-    runner_no_meta = EvaluationRunner(test_dir, use_llm=True, use_meta=False)
+    runner_no_meta = EvaluationRunner(test_dir, use_llm=True, use_meta=False, llm_cache=llm_cache)
     results_no_meta = runner_no_meta.run_evaluation()
 
     # Run WITH meta
     print("\n[2/2] Running evaluation WITH Meta-Analyzer...")
-    runner_with_meta = EvaluationRunner(test_dir, use_llm=True, use_meta=True)
+    runner_with_meta = EvaluationRunner(test_dir, use_llm=True, use_meta=True, llm_cache=llm_cache)
     results_with_meta = runner_with_meta.run_evaluation()
 
     # Print comparison
@@ -517,6 +526,11 @@ def main():
     )
     parser.add_argument("--show-aitech", action="store_true", help="Show AITech taxonomy codes in detailed findings")
     parser.add_argument("--show-details", action="store_true", help="Show detailed per-skill analysis in compare mode")
+    parser.add_argument(
+        "--llm-cache",
+        action="store_true",
+        help="Reuse cached LLM responses so repeated runs are fast and deterministic",
+    )
 
     args = parser.parse_args()
 
@@ -527,9 +541,11 @@ def main():
         print("Create test skills with _expected.json files")
         return 1
 
+    llm_cache = LLMResponseCache() if args.llm_cache else None
+
     # Compare mode - run both and compare
     if args.compare:
-        comparison_results = run_comparison(test_dir, show_details=args.show_details)
+        comparison_results = run_comparison(test_dir, show_details=args.show_details, llm_cache=llm_cache)
 
         # Save if requested
         if args.output:
@@ -554,8 +570,10 @@ def main():
         print("Warning: --use-meta requires --use-llm. Enabling LLM analyzer.")
         args.use_llm = True
 
-    runner = EvaluationRunner(test_dir, use_llm=args.use_llm, use_meta=args.use_meta)
+    runner = EvaluationRunner(test_dir, use_llm=args.use_llm, use_meta=args.use_meta, llm_cache=llm_cache)
     results = runner.run_evaluation()
+    if llm_cache:
+        print(f"LLM cache: {llm_cache.stats}")
 
     # Print results
     mode = "With Meta-Analyzer" if args.use_meta else "Without Meta-Analyzer"
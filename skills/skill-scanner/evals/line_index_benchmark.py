@@ -0,0 +1,114 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Microbenchmark for offset-to-line resolution of YARA matches.
+
+Builds a multi-MB generated script with thousands of YARA string hits and
+compares resolving each hit by rescanning the file prefix (count/rfind/find)
+against LineIndex, checking both give the same line numbers and snippets.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skill_scanner.core.rules.yara_scanner import YaraScanner
+from skill_scanner.utils.line_index import LineIndex
+
+FILLER_LINE = "value_{n} = compute(value_{m}, factor={n} % 7)  # generated\n"
+HIT_LINE = "result_{n} = eval(user_input_{n})\n"
+
+
+def build_content(target_bytes: int, hit_every: int) -> str:
+    """Generate a large Python-like file with a YARA hit every few lines."""
+    parts: list[str] = []
+    size = 0
+    n = 0
+    while size < target_bytes:
+        line = HIT_LINE.format(n=n) if n % hit_every == 0 else FILLER_LINE.format(n=n, m=n - 1)
+        parts.append(line)
+        size += len(line)
+        n += 1
+    return "".join(parts)
+
+
+def resolve_prefix_scan(content: str, offsets: list[int]) -> list[tuple[int, str]]:
+    """Resolve offsets the way YaraScanner did before LineIndex."""
+    resolved = []
+    for offset in offsets:
+        line_num = content[:offset].count("\n") + 1
+        line_start = content.rfind("\n", 0, offset) + 1
+        line_end = content.find("\n", offset)
+        if line_end == -1:
+            line_end = len(content)
+        resolved.append((line_num, content[line_start:line_end].strip()))
+    return resolved
+
+
+def resolve_line_index(content: str, offsets: list[int]) -> list[tuple[int, str]]:
+    """Resolve offsets with a LineIndex built once for the file."""
+    index = LineIndex(content)
+    resolved = []
+    for offset in offsets:
+        line_num, line_text = index.line_at(offset)
+        resolved.append((line_num, line_text.strip()))
+    return resolved
+
+
+def main():
+    """Main entry point for the line index benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark offset-to-line resolution for YARA matches")
+    parser.add_argument("--size-mb", type=float, default=4.0, help="Size of the generated file in MB")
+    parser.add_argument("--hit-every", type=int, default=20, help="Insert a YARA hit every N lines")
+
+    args = parser.parse_args()
+
+    content = build_content(int(args.size_mb * 1024 * 1024), args.hit_every)
+    scanner = YaraScanner()
+
+    start = time.perf_counter()
+    matches = scanner.scan_content(content, "generated.py")
+    scan_time = time.perf_counter() - start
+
+    offsets = [s["offset"] for m in matches for s in m["strings"]]
+    print(f"File: {len(content) / 1024 / 1024:.1f} MB, {content.count(chr(10))} lines, {len(offsets)} YARA string hits")
+    print(f"YaraScanner.scan_content (with LineIndex): {scan_time:.3f}s")
+
+    start = time.perf_counter()
+    indexed = resolve_line_index(content, offsets)
+    index_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    legacy = resolve_prefix_scan(content, offsets)
+    legacy_time = time.perf_counter() - start
+
+    if indexed != legacy:
+        print("Error: line resolution differs")
+        return 1
+
+    print(f"Line resolution, prefix scan: {legacy_time:.3f}s")
+    print(f"Line resolution, LineIndex:   {index_time:.3f}s ({legacy_time / index_time:.0f}x faster)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Microbenchmark for the single-pass security rule engine.
+
+Builds large synthetic scripts from the evaluation skills and compares
+per-rule matching (SecurityRule.scan_content for every rule) against
+CompiledRuleSet.scan_content, checking that both produce identical matches.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skill_scanner.core.rules.patterns import RuleLoader
+
+SUFFIXES = {"python": ".py", "bash": ".sh", "markdown": ".md"}
+
+
+def build_corpus(eval_dir: Path, file_type: str, target_bytes: int) -> str:
+    """Concatenate evaluation files of one type until the target size is reached."""
+    sources = [p.read_text(encoding="utf-8") for p in sorted(eval_dir.rglob(f"*{SUFFIXES[file_type]}"))]
+    if not sources:
+        return ""
+
+    parts: list[str] = []
+    size = 0
+    while size < target_bytes:
+        for source in sources:
+            parts.append(source)
+            size += len(source)
+    return "\n".join(parts)
+
+
+def time_best(func, repeat: int) -> float:
+    """Run a function several times and return the fastest wall time."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Main entry point for the rule engine benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark per-rule vs single-pass rule matching")
+    parser.add_argument("--eval-dir", default="evals/skills", help="Directory containing evaluation skills")
+    parser.add_argument("--size-mb", type=float, default=2.0, help="Size of each synthetic file in MB")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+
+    args = parser.parse_args()
+
+    eval_dir = Path(args.eval_dir)
+    if not eval_dir.exists():
+        print(f"Error: Evaluation directory not found: {eval_dir}")
+        return 1
+
+    loader = RuleLoader()
+    loader.load_rules()
+
+    print(
+        f"{'File type':<10} {'Lines':>9} {'Rules':>6} {'Per-rule':>10} {'Single-pass':>12} {'Speedup':>8} {'Matches':>8}"
+    )
+    print("-" * 70)
+
+    for file_type in SUFFIXES:
+        content = build_corpus(eval_dir, file_type, int(args.size_mb * 1024 * 1024))
+        if not content:
+            continue
+
+        rules = loader.get_rules_for_file_type(file_type)
+        rule_set = loader.get_rule_set(file_type)
+
+        def per_rule():
+            return [(rule.id, m) for rule in rules if (m := rule.scan_content(content, "bench"))]
+
+        def single_pass():
+            return [(rule.id, m) for rule, m in rule_set.scan_content(content, "bench")]
+
+        expected = per_rule()
+        if single_pass() != expected:
+            print(f"Error: results differ for {file_type}")
+            return 1
+
+        legacy_time = time_best(per_rule, args.repeat)
+        engine_time = time_best(single_pass, args.repeat)
+        match_count = sum(len(m) for _, m in expected)
+        print(
+            f"{file_type:<10} {content.count(chr(10)) + 1:>9} {len(rules):>6} "
+            f"{legacy_time:>9.3f}s {engine_time:>11.3f}s {legacy_time / engine_time:>7.1f}x {match_count:>8}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
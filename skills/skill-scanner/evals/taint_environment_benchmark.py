@@ -0,0 +1,138 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Microbenchmark for copy-on-write taint environments.
+
+Runs ForwardDataflowAnalysis on every function of the Python files under a
+directory (plus a generated function with a long straight-line body) with
+facts that are deep-copied at every transfer and merge, as before, and with
+the copy-on-write facts, checking both reach the same flows and reporting
+time and memory allocated.
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dataflow_benchmark import collect_functions, flows_key
+
+from skill_scanner.core.static_analysis.dataflow import ForwardDataflowAnalysis
+from skill_scanner.core.static_analysis.dataflow.forward_analysis import ForwardFlowFact
+from skill_scanner.core.static_analysis.parser.python_parser import PythonParser
+from skill_scanner.core.static_analysis.taint import ShapeEnvironment
+
+
+def eager_copy(fact: ForwardFlowFact) -> ForwardFlowFact:
+    """Copy every shape and flow path of a fact, sharing nothing."""
+    shape_env = ShapeEnvironment()
+    for var_name, shape in fact.shape_env._shapes.items():
+        shape_env._shapes[var_name] = shape.copy()
+        shape_env._owned.add(var_name)
+    copied = ForwardFlowFact(
+        shape_env=shape_env,
+        parameter_flows={name: flow.copy() for name, flow in fact.parameter_flows.items()},
+    )
+    copied._owned_flows.update(copied.parameter_flows)
+    return copied
+
+
+class EagerCopyForwardAnalysis(ForwardDataflowAnalysis):
+    """Forward analysis whose facts are deep-copied at every transfer and merge."""
+
+    def transfer(self, node, in_fact):
+        out_fact = eager_copy(in_fact)
+        self._transfer_python(node.ast_node, out_fact)
+        return out_fact
+
+    def merge(self, facts):
+        return eager_copy(super().merge(facts)) if len(facts) > 1 else facts[0] if facts else ForwardFlowFact()
+
+
+def long_function(statements: int) -> str:
+    """Generate a function with many assignments and calls on many variables."""
+    lines = ["def handler(data, url):", "    token = os.getenv('API_TOKEN')"]
+    for i in range(statements):
+        lines += [
+            f"    value{i} = data + token" if i % 3 else f"    value{i} = {i}",
+            f"    if value{i}:",
+            f"        requests.post(url, value{i})",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def run(analysis_cls, functions, measure_memory: bool):
+    """Analyze every function; return (seconds, allocated bytes, peak bytes, flows)."""
+    total_time = 0.0
+    allocated = 0
+    peak = 0
+    results = []
+    for _, source, params in functions:
+        parser = PythonParser(source)
+        if not parser.parse():
+            results.append(None)
+            continue
+        analysis = analysis_cls(parser, params)
+        if measure_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        flows = analysis.analyze_forward_flows()
+        total_time += time.perf_counter() - start
+        if measure_memory:
+            current, function_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            allocated += current
+            peak = max(peak, function_peak)
+        results.append(flows_key(flows))
+    return total_time, allocated, peak, results
+
+
+def main():
+    """Main entry point for the taint environment benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark copy-on-write taint environments")
+    parser.add_argument("--skills-dir", default="evals/skills", help="Directory of Python files to analyze")
+    parser.add_argument("--loops", type=int, default=40, help="Loops in the generated loop-heavy function")
+    parser.add_argument("--statements", type=int, default=400, help="Statements in the generated long function")
+
+    args = parser.parse_args()
+
+    functions = collect_functions(Path(args.skills_dir), args.loops)
+    functions.append(("<long>", long_function(args.statements), ["data", "url"]))
+    print(f"Functions: {len(functions)} (including generated ones)")
+
+    results = {}
+    for label, analysis_cls in (("Eager copies", EagerCopyForwardAnalysis), ("Copy-on-write", ForwardDataflowAnalysis)):
+        seconds, _, _, flows = run(analysis_cls, functions, measure_memory=False)
+        _, allocated, peak, _ = run(analysis_cls, functions, measure_memory=True)
+        results[label] = flows
+        print(f"{label + ':':15s}{seconds:.3f}s, {allocated / 1e6:.1f} MB retained, {peak / 1e6:.1f} MB peak")
+
+    eager, cow = results.values()
+    differing = [name for (name, _, _), a, b in zip(functions, eager, cow, strict=True) if a != b]
+    if differing:
+        print(f"Error: flows differ for {', '.join(differing)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Microbenchmark for interned bitset taint labels.
+
+Merges, compares and stores taints whose labels are Python sets of strings
+(as before) and taints whose labels are bitmasks over a LabelTable,
+checking both give the same labels and reporting time and memory.
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skill_scanner.core.static_analysis.taint import LabelTable, Taint, TaintStatus
+
+
+@dataclass
+class SetTaint:
+    """Taint with labels stored as a set of strings."""
+
+    status: TaintStatus = TaintStatus.UNTAINTED
+    labels: set[str] = field(default_factory=set)
+
+    def is_tainted(self) -> bool:
+        return self.status == TaintStatus.TAINTED
+
+    def merge(self, other: "SetTaint") -> "SetTaint":
+        if not self.is_tainted() and not other.is_tainted():
+            return SetTaint(status=TaintStatus.UNTAINTED)
+        return SetTaint(status=TaintStatus.TAINTED, labels=self.labels | other.labels)
+
+
+def make_taints(factory, label_sets):
+    return [factory(labels) for labels in label_sets]
+
+
+def merge_all(taints, rounds: int):
+    """Merge neighbouring taints and compare the results, as a dataflow join does."""
+    equal = 0
+    merged = taints
+    for _ in range(rounds):
+        merged = [a.merge(b) for a, b in zip(merged, merged[1:] + merged[:1], strict=True)]
+        equal += sum(a == b for a, b in zip(merged, taints, strict=True))
+    return merged, equal
+
+
+def measure(label, factory, label_sets, rounds):
+    """Time merges and measure the memory held by the taints."""
+    tracemalloc.start()
+    taints = make_taints(factory, label_sets)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    merged, equal = merge_all(taints, rounds)
+    seconds = time.perf_counter() - start
+    print(f"{label + ':':12s}{seconds:.3f}s for {rounds} merge rounds, {held / len(taints):.0f} bytes per taint")
+    return [frozenset(taint.labels) for taint in merged], equal
+
+
+def main():
+    """Main entry point for the taint label benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark interned bitset taint labels")
+    parser.add_argument("--taints", type=int, default=20000, help="Number of tainted variables")
+    parser.add_argument("--labels", type=int, default=24, help="Distinct labels (params and sources)")
+    parser.add_argument("--rounds", type=int, default=10, help="Merge rounds")
+
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [f"param:arg{i}" for i in range(args.labels // 2)]
+    names += [f"source:env_var:TOKEN_{i}" for i in range(args.labels - len(names))]
+    label_sets = [rng.sample(names, rng.randint(1, 4)) for _ in range(args.taints)]
+
+    table = LabelTable()
+    sets, set_equal = measure(
+        "set[str]", lambda labels: SetTaint(TaintStatus.TAINTED, set(labels)), label_sets, args.rounds
+    )
+    masks, mask_equal = measure(
+        "bitmask", lambda labels: Taint(TaintStatus.TAINTED, labels, table=table), label_sets, args.rounds
+    )
+
+    if sets != masks or set_equal != mask_equal:
+        print("Error: merged labels differ")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
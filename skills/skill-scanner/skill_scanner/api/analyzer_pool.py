@@ -0,0 +1,265 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Long-lived analyzer pool for the API server.
+
+Building a StaticAnalyzer loads signatures.yaml, compiles every regex and
+compiles the whole YARA rule directory. The pool does that once per
+configuration and shares the analyzers, plus one bounded worker pool,
+across requests.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from ..core.analyzers.static import StaticAnalyzer
+
+try:
+    from ..core.analyzers.behavioral_analyzer import BehavioralAnalyzer
+
+    BEHAVIORAL_AVAILABLE = True
+except (ImportError, ModuleNotFoundError):
+    BEHAVIORAL_AVAILABLE = False
+    BehavioralAnalyzer = None
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+DEFAULT_MAX_CONFIGS = 16
+
+
+@dataclass(frozen=True)
+class AnalyzerConfig:
+    """Settings that change how a static analyzer is built; used as the pool key."""
+
+    yara_mode: str = "balanced"
+    custom_rules: str | None = None
+    disabled_rules: frozenset[str] = field(default_factory=frozenset)
+
+    @classmethod
+    def create(
+        cls, yara_mode: str | None = None, custom_rules: str | None = None, disabled_rules: list[str] | None = None
+    ) -> "AnalyzerConfig":
+        """Build a normalized config from request fields."""
+        return cls(
+            yara_mode=(yara_mode or "balanced").lower(),
+            custom_rules=custom_rules or None,
+            disabled_rules=frozenset(disabled_rules or ()),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "yara_mode": self.yara_mode,
+            "custom_rules": self.custom_rules,
+            "disabled_rules": sorted(self.disabled_rules),
+        }
+
+
+class AnalyzerPool:
+    """
+    Analyzers built once per configuration, shared by all requests.
+
+    Static analyzers are kept in a small LRU keyed by AnalyzerConfig; the
+    behavioral analyzer has no per-request configuration and is shared as a
+    single instance. Scans run on one bounded ThreadPoolExecutor instead of a
+    fresh executor per request.
+
+    Example:
+        >>> pool = AnalyzerPool(max_workers=8)
+        >>> analyzer = pool.get_static_analyzer(AnalyzerConfig(yara_mode="strict"))
+        >>> result = await pool.run(scanner.scan_skill, skill_dir)
+    """
+
+    def __init__(self, max_workers: int | None = None, max_configs: int = DEFAULT_MAX_CONFIGS):
+        """
+        Initialize analyzer pool.
+
+        Args:
+            max_workers: Size of the shared worker pool. Defaults to
+                $SKILL_SCANNER_API_WORKERS or min(32, cpu_count + 4).
+            max_configs: Maximum number of distinct static analyzer
+                configurations kept alive at once.
+        """
+        if max_workers is None:
+            max_workers = int(os.getenv("SKILL_SCANNER_API_WORKERS", DEFAULT_MAX_WORKERS))
+        self.max_workers = max(1, max_workers)
+        self.max_configs = max(1, max_configs)
+        self.generation = 0
+
+        self._lock = threading.Lock()
+        self._static: OrderedDict[AnalyzerConfig, StaticAnalyzer] = OrderedDict()
+        self._behavioral: Any | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The shared worker pool (created on first use)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="skill-scan")
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking function on the shared worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    def get_static_analyzer(self, config: AnalyzerConfig | None = None) -> StaticAnalyzer:
+        """
+        Get the shared static analyzer for a configuration, building it on first use.
+
+        Args:
+            config: Analyzer configuration (defaults to balanced mode, built-in rules)
+
+        Returns:
+            StaticAnalyzer instance shared with other requests
+        """
+        config = config or AnalyzerConfig()
+        with self._lock:
+            analyzer = self._static.get(config)
+            if analyzer is not None:
+                self._static.move_to_end(config)
+                return analyzer
+
+        # Build outside the lock; YARA compilation can take a while
+        analyzer = self._build_static_analyzer(config)
+
+        with self._lock:
+            existing = self._static.get(config)
+            if existing is not None:
+                return existing
+            self._static[config] = analyzer
+            while len(self._static) > self.max_configs:
+                evicted, _ = self._static.popitem(last=False)
+                logger.debug("Evicted static analyzer for %s", evicted)
+        return analyzer
+
+    def get_behavioral_analyzer(self) -> Any:
+        """Get the shared behavioral analyzer, building it on first use."""
+        if not BEHAVIORAL_AVAILABLE:
+            raise RuntimeError("Behavioral analyzer is not available")
+        with self._lock:
+            if self._behavioral is None:
+                self._behavioral = BehavioralAnalyzer(use_static_analysis=True)
+            return self._behavioral
+
+    @staticmethod
+    def _build_static_analyzer(config: AnalyzerConfig) -> StaticAnalyzer:
+        return StaticAnalyzer(
+            yara_mode=config.yara_mode,
+            custom_yara_rules_path=config.custom_rules,
+            disabled_rules=set(config.disabled_rules),
+        )
+
+    def warm_up(self) -> None:
+        """Build the default analyzers so the first request does not pay for it."""
+        self.get_static_analyzer()
+        if BEHAVIORAL_AVAILABLE:
+            self.get_behavioral_analyzer()
+
+    def reload(self) -> dict[str, Any]:
+        """
+        Rebuild every cached analyzer from the rule files on disk.
+
+        New analyzers are built before they replace the old ones, so scans
+        already running finish with the rules they started with.
+
+        Returns:
+            Summary with the new generation and the reloaded configurations
+        """
+        with self._lock:
+            configs = list(self._static) or [AnalyzerConfig()]
+            rebuild_behavioral = self._behavioral is not None
+
+        rebuilt = OrderedDict((config, self._build_static_analyzer(config)) for config in configs)
+        behavioral = BehavioralAnalyzer(use_static_analysis=True) if rebuild_behavioral else None
+
+        with self._lock:
+            self._static = rebuilt
+            if rebuild_behavioral:
+                self._behavioral = behavioral
+            self.generation += 1
+            generation = self.generation
+
+        logger.info("Reloaded %d analyzer configuration(s), generation %d", len(configs), generation)
+        return {"generation": generation, "configurations": [config.to_dict() for config in configs]}
+
+    def stats(self) -> dict[str, Any]:
+        """Describe the pool for health and diagnostics endpoints."""
+        with self._lock:
+            return {
+                "generation": self.generation,
+                "max_workers": self.max_workers,
+                "static_configurations": len(self._static),
+                "behavioral_loaded": self._behavioral is not None,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool and drop cached analyzers."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._static.clear()
+            self._behavioral = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+_pool: AnalyzerPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_analyzer_pool() -> AnalyzerPool:
+    """Get the process-wide analyzer pool, creating it if needed."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = AnalyzerPool()
+        return _pool
+
+
+def shutdown_analyzer_pool() -> None:
+    """Shut down and discard the process-wide analyzer pool."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+@asynccontextmanager
+async def analyzer_pool_lifespan(app: Any):
+    """FastAPI lifespan: build analyzers at startup and release them at shutdown."""
+    from .jobs import shutdown_job_manager
+
+    pool = get_analyzer_pool()
+    await asyncio.get_running_loop().run_in_executor(pool.executor, pool.warm_up)
+    try:
+        yield
+    finally:
+        # Batch jobs scan on the pool's workers, so stop them first
+        shutdown_job_manager()
+        shutdown_analyzer_pool()
@@ -21,6 +21,7 @@ This module provides a FastAPI application for scanning agent skills packages.
 
 from fastapi import FastAPI
 
+from .analyzer_pool import analyzer_pool_lifespan
 from .router import router as api_router
 
 app = FastAPI(
@@ -29,6 +30,7 @@ app = FastAPI(
     version="0.2.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=analyzer_pool_lifespan,
 )
 
 app.include_router(api_router)
@@ -20,22 +20,25 @@ REST API server for Skill Scanner.
 Provides HTTP endpoints for skill scanning, similar to MCP Scanner's API server.
 """
 
-import shutil
-import tempfile
 import uuid
-from datetime import datetime
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
 try:
-    from fastapi import BackgroundTasks, FastAPI, File, HTTPException, Query, UploadFile
+    from fastapi import FastAPI, File, Header, HTTPException, Query, UploadFile
+    from fastapi.responses import StreamingResponse
     from pydantic import BaseModel, Field
 except ImportError:
     raise ImportError("API server requires FastAPI. Install with: pip install fastapi uvicorn python-multipart")
 
-from ..core.analyzers.static import StaticAnalyzer
-from ..core.models import Report  # noqa: F401 - used in type hints
+from ..core.archive import is_archive
+from ..core.loader import SkillLoader, SkillLoadError
+from ..core.models import Report, ScanResult, Skill  # noqa: F401 - used in type hints
 from ..core.scanner import SkillScanner
+from .analyzer_pool import AnalyzerConfig, analyzer_pool_lifespan, get_analyzer_pool
+from .jobs import STREAM_MEDIA_TYPES, BatchScanTask, get_job_manager
 
 # Try to import LLM analyzer
 try:
@@ -88,6 +91,9 @@ class ScanRequest(BaseModel):
     enable_meta: bool = Field(
         False, description="Enable meta-analysis to filter false positives and prioritize findings"
     )
+    yara_mode: str = Field("balanced", description="YARA detection mode (strict, balanced, permissive)")
+    custom_rules: str | None = Field(None, description="Path to directory with custom YARA rules")
+    disabled_rules: list[str] = Field(default_factory=list, description="Rule names to disable")
 
 
 class ScanResponse(BaseModel):
@@ -101,6 +107,7 @@ class ScanResponse(BaseModel):
     scan_duration_seconds: float
     timestamp: str
     findings: list[dict]
+    analysis_incomplete: bool = False
 
 
 class HealthResponse(BaseModel):
@@ -122,6 +129,9 @@ class BatchScanRequest(BaseModel):
     use_aidefense: bool = False
     aidefense_api_key: str | None = None
     enable_meta: bool = Field(False, description="Enable meta-analysis to filter false positives")
+    yara_mode: str = "balanced"
+    custom_rules: str | None = None
+    disabled_rules: list[str] = Field(default_factory=list)
 
 
 # Create FastAPI app
@@ -131,11 +141,9 @@ app = FastAPI(
     version="0.2.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=analyzer_pool_lifespan,
 )
 
-# In-memory storage for async scans (in production, use Redis or database)
-scan_results_cache = {}
-
 
 @app.get("/", response_model=dict)
 async def root():
@@ -159,6 +167,26 @@ async def health_check():
     return HealthResponse(status="healthy", version="0.2.0", analyzers_available=analyzers)
 
 
+@app.post("/analyzers/reload")
+async def reload_analyzers():
+    """
+    Reload rules for every pooled analyzer.
+
+    Re-reads signatures.yaml and recompiles YARA rules (built-in or custom)
+    without restarting the server. Scans already running finish with the
+    rules they started with.
+
+    Returns:
+        Pool generation and the configurations that were rebuilt
+    """
+    pool = get_analyzer_pool()
+    try:
+        summary = await pool.run(pool.reload)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Reload failed: {str(e)}")
+    return {"status": "reloaded", **summary}
+
+
 @app.post("/scan", response_model=ScanResponse)
 async def scan_skill(request: ScanRequest):
     """
@@ -170,10 +198,6 @@ async def scan_skill(request: ScanRequest):
     Returns:
         Scan results with findings
     """
-    import asyncio
-    import concurrent.futures
-    import os
-
     skill_dir = Path(request.skill_directory)
 
     if not skill_dir.exists():
@@ -182,16 +206,43 @@ async def scan_skill(request: ScanRequest):
     if not (skill_dir / "SKILL.md").exists():
         raise HTTPException(status_code=400, detail="SKILL.md not found in directory")
 
+    return await _execute_scan(
+        request,
+        scan=lambda scanner: scanner.scan_skill(skill_dir),
+        load=lambda loader: loader.load_skill(skill_dir),
+    )
+
+
+async def _execute_scan(
+    request: ScanRequest,
+    scan: Callable[[SkillScanner], ScanResult],
+    load: Callable[[SkillLoader], Skill],
+) -> ScanResponse:
+    """
+    Run a scan request on the shared worker pool and build its response.
+
+    Args:
+        request: Scan options
+        scan: Scans the skill with a scanner configured from the request
+        load: Loads the skill again for meta-analysis
+
+    Returns:
+        Scan results with findings
+    """
+    import os
+
+    pool = get_analyzer_pool()
+
     def run_scan():
         """Run the scan in a separate thread to avoid event loop conflicts."""
         from ..core.analyzers.base import BaseAnalyzer
 
-        # Create scanner with configured analyzers
-        analyzers: list[BaseAnalyzer] = [StaticAnalyzer()]
+        # Create scanner with pooled analyzers for this configuration
+        config = AnalyzerConfig.create(request.yara_mode, request.custom_rules, request.disabled_rules)
+        analyzers: list[BaseAnalyzer] = [pool.get_static_analyzer(config)]
 
         if request.use_behavioral and BEHAVIORAL_AVAILABLE:
-            behavioral_analyzer = BehavioralAnalyzer(use_static_analysis=True)
-            analyzers.append(behavioral_analyzer)
+            analyzers.append(pool.get_behavioral_analyzer())
 
         if request.use_llm and LLM_AVAILABLE:
             # Check for model override from environment
@@ -213,14 +264,16 @@ async def scan_skill(request: ScanRequest):
             analyzers.append(aidefense_analyzer)
 
         scanner = SkillScanner(analyzers=analyzers)
-        return scanner.scan_skill(skill_dir)
+        try:
+            return scan(scanner)
+        finally:
+            # Releases the AI Defense client built for this request; pooled analyzers hold nothing to close
+            scanner.close()
 
     try:
-        # Run the scan in a thread pool to avoid nested event loop issues
+        # Run the scan on the shared worker pool to avoid nested event loop issues
         # (LLMAnalyzer.analyze() uses asyncio.run() which can't be called from a running loop)
-        loop = asyncio.get_running_loop()
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            result = await loop.run_in_executor(executor, run_scan)
+        result = await pool.run(run_scan)
 
         # Run meta-analysis if enabled
         if request.enable_meta and META_AVAILABLE and len(result.findings) > 0:
@@ -229,16 +282,13 @@ async def scan_skill(request: ScanRequest):
                 meta_analyzer = MetaAnalyzer()
 
                 # Load skill for context
-                from ..core.loader import SkillLoader
-
                 loader = SkillLoader()
-                skill = loader.load_skill(skill_dir)
+                skill = load(loader)
 
                 # Run meta-analysis
                 import asyncio as async_lib
 
-                meta_result = await loop.run_in_executor(
-                    executor,
+                meta_result = await pool.run(
                     lambda: async_lib.run(
                         meta_analyzer.analyze_with_findings(
                             skill=skill,
@@ -274,8 +324,11 @@ async def scan_skill(request: ScanRequest):
             scan_duration_seconds=result.scan_duration_seconds,
             timestamp=result.timestamp.isoformat(),
             findings=[f.to_dict() for f in result.findings],
+            analysis_incomplete=result.analysis_incomplete,
         )
 
+    except SkillLoadError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -284,7 +337,7 @@ async def scan_skill(request: ScanRequest):
 
 @app.post("/scan-upload")
 async def scan_uploaded_skill(
-    file: UploadFile = File(..., description="ZIP file containing skill package"),
+    file: UploadFile = File(..., description="ZIP or tar archive containing skill package"),
     use_llm: bool = Query(False, description="Enable LLM analyzer"),
     llm_provider: str = Query("anthropic", description="LLM provider"),
     use_behavioral: bool = Query(False, description="Enable behavioral analyzer"),
@@ -292,10 +345,10 @@ async def scan_uploaded_skill(
     aidefense_api_key: str | None = Query(None, description="AI Defense API key"),
 ):
     """
-    Scan an uploaded skill package (ZIP file).
+    Scan an uploaded skill package (ZIP or tar archive) without extracting it.
 
     Args:
-        file: ZIP file containing skill package
+        file: ZIP or tar archive containing skill package
         use_llm: Enable LLM analyzer
         llm_provider: LLM provider to use
         use_behavioral: Enable behavioral analyzer
@@ -305,253 +358,260 @@ async def scan_uploaded_skill(
     Returns:
         Scan results
     """
-    if not file.filename or not file.filename.endswith(".zip"):
-        raise HTTPException(status_code=400, detail="File must be a ZIP archive")
+    if not file.filename or not is_archive(file.filename):
+        raise HTTPException(status_code=400, detail="File must be a ZIP or tar archive")
+
+    request = ScanRequest(
+        skill_directory=file.filename,
+        use_llm=use_llm,
+        llm_provider=llm_provider,
+        use_behavioral=use_behavioral,
+        use_aidefense=use_aidefense,
+        aidefense_api_key=aidefense_api_key,
+    )
 
-    # Create temporary directory
-    temp_dir = Path(tempfile.mkdtemp(prefix="skill_scanner_"))
+    # Read the archive straight from the upload stream; nothing is extracted to disk
+    return await _execute_scan(
+        request,
+        scan=lambda scanner: scanner.scan_archive(file.file, name=file.filename),
+        load=lambda loader: loader.load_skill_archive(file.file, name=file.filename),
+    )
 
-    try:
-        # Save uploaded file
-        zip_path = temp_dir / file.filename
-        with open(zip_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
-
-        # Extract ZIP
-        import zipfile
-
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(temp_dir / "extracted")
-
-        # Find skill directory (look for SKILL.md)
-        extracted_dir = temp_dir / "extracted"
-        skill_dirs = list(extracted_dir.rglob("SKILL.md"))
-
-        if not skill_dirs:
-            raise HTTPException(status_code=400, detail="No SKILL.md found in uploaded archive")
-
-        skill_dir = skill_dirs[0].parent
-
-        # Scan using the scan endpoint logic
-        request = ScanRequest(
-            skill_directory=str(skill_dir),
-            use_llm=use_llm,
-            llm_provider=llm_provider,
-            use_behavioral=use_behavioral,
-            use_aidefense=use_aidefense,
-            aidefense_api_key=aidefense_api_key,
-        )
 
-        result = await scan_skill(request)
+def _submit_batch_job(request: BatchScanRequest):
+    """Validate a batch request and queue it as a job."""
+    skills_dir = Path(request.skills_directory)
 
-        return result
+    if not skills_dir.exists():
+        raise HTTPException(status_code=404, detail=f"Skills directory not found: {skills_dir}")
 
-    finally:
-        # Cleanup temporary files
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    # Queue the scan as a job; skills run on the shared worker pool
+    config = AnalyzerConfig.create(request.yara_mode, request.custom_rules, request.disabled_rules)
+    task = BatchScanTask(
+        skills_dir,
+        request.recursive,
+        partial(
+            build_batch_analyzers,
+            request.use_llm,
+            request.llm_provider,
+            request.use_behavioral,
+            request.use_aidefense,
+            request.aidefense_api_key,
+            config,
+        ),
+        post_process=_make_meta_post_process() if request.enable_meta and META_AVAILABLE else None,
+    )
+    return get_job_manager().submit(task, params=request.model_dump(exclude={"aidefense_api_key"}))
 
 
 @app.post("/scan-batch")
-async def scan_batch(request: BatchScanRequest, background_tasks: BackgroundTasks):
+async def scan_batch(request: BatchScanRequest):
     """
     Scan multiple skills in a directory (batch scan).
 
-    Returns a scan ID. Use /scan-batch/{scan_id} to get results.
+    Returns a scan ID. Use /scan-batch/{scan_id} to follow progress and get results.
 
     Args:
         request: Batch scan request
-        background_tasks: FastAPI background tasks
 
     Returns:
         Scan ID for tracking
     """
-    skills_dir = Path(request.skills_directory)
+    job = _submit_batch_job(request)
 
-    if not skills_dir.exists():
-        raise HTTPException(status_code=404, detail=f"Skills directory not found: {skills_dir}")
+    return {
+        "scan_id": job.job_id,
+        "status": job.status,
+        "message": "Batch scan started. Use GET /scan-batch/{scan_id} to check status.",
+    }
 
-    # Generate scan ID
-    scan_id = str(uuid.uuid4())
 
-    # Initialize result in cache
-    scan_results_cache[scan_id] = {"status": "processing", "started_at": datetime.now().isoformat(), "result": None}
+@app.post("/scan-batch/stream")
+async def scan_batch_stream(
+    request: BatchScanRequest,
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$", description="Stream format: ndjson or sse"),
+):
+    """
+    Run a batch scan and stream each skill's result as soon as it finishes.
 
-    # Start background scan
-    background_tasks.add_task(
-        run_batch_scan,
-        scan_id,
-        skills_dir,
-        request.recursive,
-        request.use_llm,
-        request.llm_provider,
-        request.use_behavioral,
-        request.use_aidefense,
-        request.aidefense_api_key,
-        request.enable_meta,
-    )
+    The response is NDJSON (one record per line) or server-sent events. Each
+    skill produces a ``result`` (or ``error``) record; the last record has
+    ``"type": "status"`` with the final status and summary. The scan ID is in
+    the ``X-Scan-Id`` header, and closing the connection cancels the scan.
 
-    return {
-        "scan_id": scan_id,
-        "status": "processing",
-        "message": "Batch scan started. Use GET /scan-batch/{scan_id} to check status.",
-    }
+    Args:
+        request: Batch scan request
+        format: Stream format
+
+    Returns:
+        Streaming response
+    """
+    job = _submit_batch_job(request)
+    return StreamingResponse(
+        get_job_manager().stream(job.job_id, fmt=format, cancel_on_close=True),
+        media_type=STREAM_MEDIA_TYPES[format],
+        headers={"X-Scan-Id": job.job_id},
+    )
 
 
 @app.get("/scan-batch/{scan_id}")
-async def get_batch_scan_result(scan_id: str):
+async def get_batch_scan_result(
+    scan_id: str,
+    after: int = Query(0, ge=0, description="Only return skill results recorded after this cursor"),
+    stream: bool = Query(False, description="Stream skill results until the scan finishes"),
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$", description="Stream format: ndjson or sse"),
+    last_event_id: int | None = Header(None, description="SSE reconnect cursor (overrides 'after')"),
+):
     """
-    Get results of a batch scan.
+    Get progress and results of a batch scan.
 
     Args:
         scan_id: Scan ID from /scan-batch
+        after: Cursor (``next_cursor`` from a previous response)
+        stream: Stream results as they complete instead of returning a snapshot
+        format: Stream format when ``stream`` is set
+        last_event_id: Cursor sent by SSE clients when they reconnect
 
     Returns:
-        Scan results or status
+        Scan status, progress and results
     """
-    if scan_id not in scan_results_cache:
+    manager = get_job_manager()
+    job = manager.get(scan_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Scan ID not found")
 
-    cached = scan_results_cache[scan_id]
-
-    if cached["status"] == "processing":
-        return {"scan_id": scan_id, "status": "processing", "started_at": cached["started_at"]}
-    elif cached["status"] == "completed":
-        return {
-            "scan_id": scan_id,
-            "status": "completed",
-            "started_at": cached["started_at"],
-            "completed_at": cached.get("completed_at"),
-            "result": cached["result"],
-        }
-    else:
-        return {"scan_id": scan_id, "status": "error", "error": cached.get("error", "Unknown error")}
+    if last_event_id is not None:
+        after = last_event_id
+    if stream:
+        return StreamingResponse(manager.stream(scan_id, after, fmt=format), media_type=STREAM_MEDIA_TYPES[format])
+    return manager.describe(job, after)
 
 
-def run_batch_scan(
-    scan_id: str,
-    skills_dir: Path,
-    recursive: bool,
+@app.post("/scan-batch/{scan_id}/cancel")
+async def cancel_batch_scan(scan_id: str):
+    """
+    Cancel a batch scan.
+
+    Skills already being scanned finish and keep their results; no new ones start.
+
+    Args:
+        scan_id: Scan ID from /scan-batch
+
+    Returns:
+        Scan status after the cancellation request
+    """
+    job = get_job_manager().cancel(scan_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Scan ID not found")
+    return {**job.to_dict(), "cancel_requested": job.cancel_requested}
+
+
+def build_batch_analyzers(
     use_llm: bool,
     llm_provider: str | None,
     use_behavioral: bool = False,
     use_aidefense: bool = False,
     aidefense_api_key: str | None = None,
-    enable_meta: bool = False,
-):
+    config: AnalyzerConfig | None = None,
+) -> list:
     """
-    Background task to run batch scan.
+    Build the analyzers for a batch scan.
 
     Args:
-        scan_id: Scan ID
-        skills_dir: Directory containing skills
-        recursive: Search recursively
         use_llm: Use LLM analyzer
         llm_provider: LLM provider
         use_behavioral: Use behavioral analyzer
         use_aidefense: Use AI Defense analyzer
         aidefense_api_key: AI Defense API key
-        enable_meta: Enable meta-analysis
+        config: Static analyzer configuration
+
+    Returns:
+        Analyzers to run on every skill
+
+    Raises:
+        ValueError: If AI Defense is requested without an API key
     """
-    try:
-        import os
+    import os
 
-        from ..core.analyzers.base import BaseAnalyzer
+    from ..core.analyzers.base import BaseAnalyzer
 
-        # Create scanner
-        analyzers: list[BaseAnalyzer] = [StaticAnalyzer()]
+    # Create scanner with pooled analyzers
+    pool = get_analyzer_pool()
+    analyzers: list[BaseAnalyzer] = [pool.get_static_analyzer(config)]
 
-        if use_behavioral and BEHAVIORAL_AVAILABLE:
-            try:
-                behavioral_analyzer = BehavioralAnalyzer(use_static_analysis=True)
-                analyzers.append(behavioral_analyzer)
-            except Exception:
-                pass  # Continue without behavioral analyzer
+    if use_behavioral and BEHAVIORAL_AVAILABLE:
+        try:
+            analyzers.append(pool.get_behavioral_analyzer())
+        except Exception:
+            pass  # Continue without behavioral analyzer
 
-        if use_llm and LLM_AVAILABLE:
-            try:
-                # Check for model override from environment
-                llm_model = os.getenv("SKILL_SCANNER_LLM_MODEL")
-                provider_str = llm_provider or "anthropic"
-                if llm_model:
-                    # Use explicit model from environment
-                    llm_analyzer = LLMAnalyzer(model=llm_model)
-                else:
-                    # Use provider default model
-                    llm_analyzer = LLMAnalyzer(provider=provider_str)
-                analyzers.append(llm_analyzer)
-            except Exception:
-                pass  # Continue without LLM analyzer
-
-        if use_aidefense and AIDEFENSE_AVAILABLE:
-            try:
-                api_key = aidefense_api_key or os.getenv("AI_DEFENSE_API_KEY")
-                if not api_key:
-                    raise ValueError("AI Defense API key required (set AI_DEFENSE_API_KEY or pass aidefense_api_key)")
-                aidefense_analyzer = AIDefenseAnalyzer(api_key=api_key)
-                analyzers.append(aidefense_analyzer)
-            except ValueError:
-                raise  # Re-raise ValueError to fail the batch scan
-            except Exception:
-                pass  # Continue without AI Defense analyzer for other errors
+    if use_llm and LLM_AVAILABLE:
+        try:
+            # Check for model override from environment
+            llm_model = os.getenv("SKILL_SCANNER_LLM_MODEL")
+            provider_str = llm_provider or "anthropic"
+            if llm_model:
+                # Use explicit model from environment
+                llm_analyzer = LLMAnalyzer(model=llm_model)
+            else:
+                # Use provider default model
+                llm_analyzer = LLMAnalyzer(provider=provider_str)
+            analyzers.append(llm_analyzer)
+        except Exception:
+            pass  # Continue without LLM analyzer
 
-        scanner = SkillScanner(analyzers=analyzers)
+    if use_aidefense and AIDEFENSE_AVAILABLE:
+        try:
+            api_key = aidefense_api_key or os.getenv("AI_DEFENSE_API_KEY")
+            if not api_key:
+                raise ValueError("AI Defense API key required (set AI_DEFENSE_API_KEY or pass aidefense_api_key)")
+            aidefense_analyzer = AIDefenseAnalyzer(api_key=api_key)
+            analyzers.append(aidefense_analyzer)
+        except ValueError:
+            raise  # Re-raise ValueError to fail the batch scan
+        except Exception:
+            pass  # Continue without AI Defense analyzer for other errors
 
-        # Scan directory
-        report = scanner.scan_directory(skills_dir, recursive=recursive)
+    return analyzers
 
-        # Run meta-analysis on each skill's results if enabled
-        if enable_meta and META_AVAILABLE:
-            import asyncio
 
-            try:
-                meta_analyzer = MetaAnalyzer()
+def _make_meta_post_process():
+    """Build the per-skill meta-analysis step for batch scans, or None if the meta-analyzer is unavailable."""
+    import asyncio
 
-                for result in report.scan_results:
-                    if result.findings:
-                        try:
-                            # Load skill for context
-                            skill_dir_path = Path(result.skill_directory)
-                            skill = scanner.loader.load_skill(skill_dir_path)
-
-                            # Run meta-analysis
-                            meta_result = asyncio.run(
-                                meta_analyzer.analyze_with_findings(
-                                    skill=skill,
-                                    findings=result.findings,
-                                    analyzers_used=result.analyzers_used,
-                                )
-                            )
-
-                            # Apply meta-analysis results
-                            filtered_findings = apply_meta_analysis_to_results(
-                                original_findings=result.findings,
-                                meta_result=meta_result,
-                                skill=skill,
-                            )
-                            result.findings = filtered_findings
-                            result.analyzers_used.append("meta_analyzer")
-
-                        except Exception:
-                            pass  # Continue without meta-analysis for this skill
-
-            except Exception:
-                pass  # Continue without meta-analysis
-
-        # Update cache
-        scan_results_cache[scan_id] = {
-            "status": "completed",
-            "started_at": scan_results_cache[scan_id]["started_at"],
-            "completed_at": datetime.now().isoformat(),
-            "result": report.to_dict(),
-        }
+    try:
+        meta_analyzer = MetaAnalyzer()
+    except Exception:
+        return None  # Continue without meta-analysis
+
+    def run_meta(scanner: SkillScanner, result):
+        if not result.findings:
+            return result
+        try:
+            # Load skill for context
+            skill = scanner.loader.load_skill(Path(result.skill_directory))
+
+            # Run meta-analysis
+            meta_result = asyncio.run(
+                meta_analyzer.analyze_with_findings(
+                    skill=skill,
+                    findings=result.findings,
+                    analyzers_used=result.analyzers_used,
+                )
+            )
+
+            # Apply meta-analysis results
+            result.findings = apply_meta_analysis_to_results(
+                original_findings=result.findings,
+                meta_result=meta_result,
+                skill=skill,
+            )
+            result.analyzers_used.append("meta_analyzer")
+        except Exception:
+            pass  # Continue without meta-analysis for this skill
+        return result
 
-    except Exception as e:
-        scan_results_cache[scan_id] = {
-            "status": "error",
-            "started_at": scan_results_cache[scan_id]["started_at"],
-            "error": str(e),
-        }
+    return run_meta
 
 
 @app.get("/analyzers")
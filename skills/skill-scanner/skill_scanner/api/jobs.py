@@ -0,0 +1,812 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Batch scan jobs for the API server.
+
+A job scans every skill under a directory. Jobs run on a bounded pool of
+coordinator threads; each coordinator fans its skills out to the shared scan
+executor a few at a time and records every per-skill result in a result store
+as soon as it finishes, so clients can follow progress and read results
+before the whole batch is done. Finished jobs are evicted by age (TTL) and,
+beyond a count limit, least recently read first.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ..core.analyzers.base import BaseAnalyzer
+from ..core.models import Report, ScanResult
+from ..core.scan_cache import default_cache_dir
+from ..core.scanner import SkillScanner
+
+logger = logging.getLogger(__name__)
+
+JOB_PROCESSING = "processing"
+JOB_COMPLETED = "completed"
+JOB_CANCELLED = "cancelled"
+JOB_ERROR = "error"
+FINISHED_STATUSES = frozenset({JOB_COMPLETED, JOB_CANCELLED, JOB_ERROR})
+
+JOB_DB_NAME = "batch_jobs.sqlite3"
+
+DEFAULT_MAX_CONCURRENT_JOBS = 2
+DEFAULT_SKILL_CONCURRENCY = 4
+DEFAULT_JOB_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_FINISHED_JOBS = 100
+# A running job that has recorded no progress for this long is assumed to
+# belong to a server process that has exited
+DEFAULT_STALE_AFTER_SECONDS = 60 * 60
+EVICTION_INTERVAL_SECONDS = 30
+STREAM_POLL_INTERVAL_SECONDS = 0.25
+
+
+STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
+
+def _format_record(record: dict[str, Any], fmt: str, event_id: int | None = None) -> str:
+    """Serialize one stream record as an NDJSON line or a server-sent event."""
+    data = json.dumps(record, default=str)
+    if fmt == "sse":
+        prefix = f"id: {event_id}\n" if event_id is not None else ""
+        return f"{prefix}event: {record['type']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+def _isoformat(timestamp: float | None) -> str | None:
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp is not None else None
+
+
+@dataclass
+class BatchJob:
+    """State and progress counters of one batch scan job."""
+
+    job_id: str
+    status: str = JOB_PROCESSING
+    params: dict[str, Any] = field(default_factory=dict)
+    total: int | None = None
+    completed: int = 0
+    failed: int = 0
+    cancel_requested: bool = False
+    error: str | None = None
+    summary: dict[str, Any] | None = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+    accessed_at: float = field(default_factory=time.time)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def progress(self) -> dict[str, Any]:
+        """Per-skill counters; ``total`` is None until skill discovery has finished."""
+        done = self.completed + self.failed
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "pending": self.total - done if self.total is not None else None,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Describe the job for API responses."""
+        data: dict[str, Any] = {
+            "scan_id": self.job_id,
+            "status": self.status,
+            "started_at": _isoformat(self.created_at),
+            "progress": self.progress(),
+        }
+        if self.finished:
+            data["completed_at"] = _isoformat(self.finished_at)
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class ResultStore(ABC):
+    """
+    Storage for batch job state and per-skill result events.
+
+    Events are JSON-serializable dicts appended in completion order; each
+    gets a sequence number starting at 1 that clients use as a cursor.
+    """
+
+    @abstractmethod
+    def create(self, job: BatchJob) -> None:
+        """Store a new job."""
+
+    @abstractmethod
+    def get(self, job_id: str) -> BatchJob | None:
+        """Get a job, or None if it does not exist."""
+
+    @abstractmethod
+    def update(self, job_id: str, **fields: Any) -> None:
+        """Update fields of a job."""
+
+    @abstractmethod
+    def add_event(self, job_id: str, event: dict[str, Any]) -> int:
+        """Append a per-skill event and return its sequence number."""
+
+    @abstractmethod
+    def events(self, job_id: str, after: int = 0) -> list[tuple[int, dict[str, Any]]]:
+        """Get ``(sequence, event)`` pairs recorded after a sequence number."""
+
+    @abstractmethod
+    def list_jobs(self, statuses: Iterable[str]) -> list[BatchJob]:
+        """Get every job in one of the given states."""
+
+    @abstractmethod
+    def delete(self, job_ids: Iterable[str]) -> None:
+        """Delete jobs and their events."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook, most stores hold nothing to release
+        """Release resources held by the store."""
+
+
+class MemoryResultStore(ResultStore):
+    """Result store kept in process memory; jobs do not survive a restart."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs: dict[str, BatchJob] = {}
+        self._events: dict[str, list[dict[str, Any]]] = {}
+
+    def create(self, job: BatchJob) -> None:
+        with self._lock:
+            self._jobs[job.job_id] = BatchJob(**asdict(job))
+            self._events[job.job_id] = []
+
+    def get(self, job_id: str) -> BatchJob | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return BatchJob(**asdict(job)) if job is not None else None
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                for name, value in fields.items():
+                    setattr(job, name, value)
+
+    def add_event(self, job_id: str, event: dict[str, Any]) -> int:
+        with self._lock:
+            events = self._events.setdefault(job_id, [])
+            events.append(event)
+            return len(events)
+
+    def events(self, job_id: str, after: int = 0) -> list[tuple[int, dict[str, Any]]]:
+        with self._lock:
+            events = self._events.get(job_id, [])
+            return list(enumerate(events[after:], start=after + 1))
+
+    def list_jobs(self, statuses: Iterable[str]) -> list[BatchJob]:
+        wanted = set(statuses)
+        with self._lock:
+            return [BatchJob(**asdict(job)) for job in self._jobs.values() if job.status in wanted]
+
+    def delete(self, job_ids: Iterable[str]) -> None:
+        with self._lock:
+            for job_id in job_ids:
+                self._jobs.pop(job_id, None)
+                self._events.pop(job_id, None)
+
+
+class SQLiteResultStore(ResultStore):
+    """
+    Result store backed by SQLite.
+
+    Jobs and results survive server restarts and are visible to every worker
+    process sharing the database file (WAL mode).
+    """
+
+    _JSON_FIELDS = frozenset({"params", "summary"})
+
+    def __init__(self, db_path: str | Path | None = None):
+        """
+        Initialize SQLite result store.
+
+        Args:
+            db_path: Database file. Defaults to $SKILL_SCANNER_JOB_DB or
+                batch_jobs.sqlite3 in the scanner cache directory.
+        """
+        if db_path is None:
+            db_path = os.getenv("SKILL_SCANNER_JOB_DB") or default_cache_dir() / JOB_DB_NAME
+        self.db_path = Path(db_path).expanduser()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, status TEXT NOT NULL, params TEXT NOT NULL, total INTEGER, "
+                "completed INTEGER NOT NULL, failed INTEGER NOT NULL, cancel_requested INTEGER NOT NULL, "
+                "error TEXT, summary TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL, "
+                "finished_at REAL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                "job_id TEXT NOT NULL, seq INTEGER NOT NULL, payload TEXT NOT NULL, PRIMARY KEY (job_id, seq))"
+            )
+            self._conn = conn
+        return self._conn
+
+    @classmethod
+    def _encode(cls, name: str, value: Any) -> Any:
+        if name in cls._JSON_FIELDS:
+            return json.dumps(value, default=str) if value is not None else None
+        if name == "cancel_requested":
+            return int(value)
+        return value
+
+    @classmethod
+    def _decode(cls, row: sqlite3.Row) -> BatchJob:
+        data = dict(row)
+        data["params"] = json.loads(data["params"])
+        data["summary"] = json.loads(data["summary"]) if data["summary"] else None
+        data["cancel_requested"] = bool(data["cancel_requested"])
+        return BatchJob(**data)
+
+    def _query(self, sql: str, args: tuple = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._connect().execute(sql, args).fetchall()
+
+    def create(self, job: BatchJob) -> None:
+        data = {name: self._encode(name, value) for name, value in asdict(job).items()}
+        columns = ", ".join(data)
+        placeholders = ", ".join("?" for _ in data)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(f"INSERT INTO jobs ({columns}) VALUES ({placeholders})", tuple(data.values()))
+            conn.commit()
+
+    def get(self, job_id: str) -> BatchJob | None:
+        rows = self._query("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+        return self._decode(rows[0]) if rows else None
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        if not fields:
+            return
+        unknown = set(fields) - BatchJob.__dataclass_fields__.keys()
+        if unknown:
+            raise ValueError(f"Unknown job fields: {sorted(unknown)}")
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        values = tuple(self._encode(name, value) for name, value in fields.items())
+        with self._lock:
+            conn = self._connect()
+            conn.execute(f"UPDATE jobs SET {assignments} WHERE job_id = ?", (*values, job_id))
+            conn.commit()
+
+    def add_event(self, job_id: str, event: dict[str, Any]) -> int:
+        payload = json.dumps(event, default=str)
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM events WHERE job_id = ?", (job_id,)).fetchone()
+            seq = row[0] + 1
+            conn.execute("INSERT INTO events (job_id, seq, payload) VALUES (?, ?, ?)", (job_id, seq, payload))
+            conn.commit()
+        return seq
+
+    def events(self, job_id: str, after: int = 0) -> list[tuple[int, dict[str, Any]]]:
+        rows = self._query("SELECT seq, payload FROM events WHERE job_id = ? AND seq > ? ORDER BY seq", (job_id, after))
+        return [(row["seq"], json.loads(row["payload"])) for row in rows]
+
+    def list_jobs(self, statuses: Iterable[str]) -> list[BatchJob]:
+        statuses = list(statuses)
+        if not statuses:
+            return []
+        placeholders = ", ".join("?" for _ in statuses)
+        rows = self._query(f"SELECT * FROM jobs WHERE status IN ({placeholders})", tuple(statuses))
+        return [self._decode(row) for row in rows]
+
+    def delete(self, job_ids: Iterable[str]) -> None:
+        job_ids = [(job_id,) for job_id in job_ids]
+        if not job_ids:
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("DELETE FROM events WHERE job_id = ?", job_ids)
+            conn.executemany("DELETE FROM jobs WHERE job_id = ?", job_ids)
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def create_result_store(kind: str | None = None) -> ResultStore:
+    """
+    Create a result store by name.
+
+    Args:
+        kind: "sqlite" or "memory". Defaults to $SKILL_SCANNER_JOB_STORE, then "sqlite".
+
+    Returns:
+        ResultStore instance
+    """
+    kind = (kind or os.getenv("SKILL_SCANNER_JOB_STORE") or "sqlite").lower()
+    if kind == "sqlite":
+        return SQLiteResultStore()
+    if kind == "memory":
+        return MemoryResultStore()
+    raise ValueError(f"Unknown job store '{kind}'. Use 'sqlite' or 'memory'")
+
+
+class BatchScanTask:
+    """
+    The work of one batch job: find the skills under a directory and scan them.
+
+    Skills are scanned in groups of ``batch_size`` so analyzers can share work
+    across a group (the LLM analyzer packs small skills into one request).
+
+    Analyzers are built in ``prepare`` on the coordinator thread, so
+    configuration errors (such as a missing API key) fail the job rather
+    than the request that submitted it.
+    """
+
+    def __init__(
+        self,
+        skills_directory: Path,
+        recursive: bool,
+        build_analyzers: Callable[[], list[BaseAnalyzer]],
+        post_process: Callable[[SkillScanner, ScanResult], ScanResult] | None = None,
+    ):
+        """
+        Initialize batch scan task.
+
+        Args:
+            skills_directory: Directory containing skill packages
+            recursive: Search for SKILL.md files recursively
+            build_analyzers: Factory for the analyzers to run on every skill
+            post_process: Optional step applied to each result (e.g. meta-analysis)
+        """
+        self.skills_directory = Path(skills_directory)
+        self.recursive = recursive
+        self.build_analyzers = build_analyzers
+        self.post_process = post_process
+        self.scanner: SkillScanner | None = None
+
+    def prepare(self) -> list[Path]:
+        """Build the scanner and return the skill directories to scan."""
+        self.scanner = SkillScanner(analyzers=self.build_analyzers())
+        return self.scanner._find_skill_directories(self.skills_directory, self.recursive)
+
+    @property
+    def batch_size(self) -> int:
+        """Skills handed to one scan_batch call."""
+        return self.scanner.batch_size if self.scanner is not None else 1
+
+    def scan_batch(self, skill_dirs: list[Path]) -> list[ScanResult | Exception]:
+        """
+        Scan a group of skills together.
+
+        Runs concurrently for groups in flight, which share the scanner and its analyzers.
+
+        Returns:
+            A result for each skill in the order given, or the exception that failed it
+        """
+        if self.scanner is None:
+            raise RuntimeError("prepare() must be called before scan_batch()")
+        outcomes = self.scanner.scan_skill_batch(skill_dirs)
+        if self.post_process is not None:
+            outcomes = [
+                outcome if isinstance(outcome, Exception) else self.post_process(self.scanner, outcome)
+                for outcome in outcomes
+            ]
+        return outcomes
+
+    def close(self) -> None:
+        """Release the connections held by the job's analyzers."""
+        if self.scanner is not None:
+            self.scanner.close()
+
+
+class BatchJobManager:
+    """
+    Runs batch scan jobs and tracks their progress in a result store.
+
+    At most ``max_concurrent_jobs`` jobs run at once; later jobs wait in the
+    coordinator pool's queue. Each job keeps at most ``skill_concurrency``
+    skills in flight on the scan executor, submitted in groups of the task's
+    ``batch_size``. Cancelling a job stops it from
+    starting more skills; skills already running finish and are recorded.
+
+    Example:
+        >>> manager = BatchJobManager(store=MemoryResultStore())
+        >>> job = manager.submit(BatchScanTask(skills_dir, False, lambda: [StaticAnalyzer()]))
+        >>> manager.events(job.job_id)
+        [(1, {"type": "result", "position": 0, ...})]
+    """
+
+    def __init__(
+        self,
+        store: ResultStore | None = None,
+        max_concurrent_jobs: int | None = None,
+        skill_concurrency: int | None = None,
+        ttl_seconds: float | None = None,
+        max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS,
+        stale_after_seconds: float = DEFAULT_STALE_AFTER_SECONDS,
+        scan_executor: Callable[[], Executor] | None = None,
+    ):
+        """
+        Initialize batch job manager.
+
+        Args:
+            store: Result store. Defaults to create_result_store().
+            max_concurrent_jobs: Jobs running at once. Defaults to
+                $SKILL_SCANNER_BATCH_MAX_JOBS or 2.
+            skill_concurrency: Skills in flight per job. Defaults to
+                $SKILL_SCANNER_BATCH_SKILL_CONCURRENCY or 4.
+            ttl_seconds: How long finished jobs are kept. Defaults to
+                $SKILL_SCANNER_BATCH_JOB_TTL or one day.
+            max_finished_jobs: Finished jobs kept before the least recently
+                read ones are evicted.
+            stale_after_seconds: Running jobs owned by no live manager are
+                marked failed after this long without progress.
+            scan_executor: Returns the executor skills are scanned on.
+                Defaults to a private thread pool.
+        """
+        if max_concurrent_jobs is None:
+            max_concurrent_jobs = int(os.getenv("SKILL_SCANNER_BATCH_MAX_JOBS", DEFAULT_MAX_CONCURRENT_JOBS))
+        if skill_concurrency is None:
+            skill_concurrency = int(os.getenv("SKILL_SCANNER_BATCH_SKILL_CONCURRENCY", DEFAULT_SKILL_CONCURRENCY))
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("SKILL_SCANNER_BATCH_JOB_TTL", DEFAULT_JOB_TTL_SECONDS))
+
+        self.store = store if store is not None else create_result_store()
+        self.max_concurrent_jobs = max(1, max_concurrent_jobs)
+        self.skill_concurrency = max(1, skill_concurrency)
+        self.ttl_seconds = ttl_seconds
+        self.max_finished_jobs = max(0, max_finished_jobs)
+        self.stale_after_seconds = stale_after_seconds
+
+        self._lock = threading.Lock()
+        self._cancel_events: dict[str, threading.Event] = {}
+        self._coordinators = ThreadPoolExecutor(max_workers=self.max_concurrent_jobs, thread_name_prefix="batch-job")
+        self._private_executor: ThreadPoolExecutor | None = None
+        self._scan_executor = scan_executor
+        self._last_eviction = 0.0
+
+    def _executor(self) -> Executor:
+        if self._scan_executor is not None:
+            return self._scan_executor()
+        with self._lock:
+            if self._private_executor is None:
+                self._private_executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_jobs * self.skill_concurrency, thread_name_prefix="batch-scan"
+                )
+            return self._private_executor
+
+    def submit(self, task: BatchScanTask, params: dict[str, Any] | None = None) -> BatchJob:
+        """
+        Queue a batch scan.
+
+        Args:
+            task: Skills to scan and how to scan them
+            params: Request parameters to record with the job
+
+        Returns:
+            The new job
+        """
+        self.evict()
+        job = BatchJob(job_id=str(uuid.uuid4()), params=params or {})
+        self.store.create(job)
+        cancel_event = threading.Event()
+        with self._lock:
+            self._cancel_events[job.job_id] = cancel_event
+        self._coordinators.submit(self._run_job, job.job_id, task, cancel_event)
+        return job
+
+    def get(self, job_id: str) -> BatchJob | None:
+        """Get a job and mark it as recently read."""
+        self._maybe_evict()
+        job = self.store.get(job_id)
+        if job is not None:
+            job.accessed_at = time.time()
+            self.store.update(job_id, accessed_at=job.accessed_at)
+        return job
+
+    def events(self, job_id: str, after: int = 0) -> list[tuple[int, dict[str, Any]]]:
+        """Get per-skill events recorded after a cursor, in completion order."""
+        return self.store.events(job_id, after)
+
+    def report(self, job: BatchJob) -> dict[str, Any]:
+        """
+        Build the combined report of a finished job.
+
+        Returns:
+            Same shape as Report.to_dict(), with results in directory order
+        """
+        results = sorted(
+            (event for _, event in self.store.events(job.job_id) if event["type"] == "result"),
+            key=lambda event: event["position"],
+        )
+        return {"summary": job.summary, "results": [event["result"] for event in results]}
+
+    def describe(self, job: BatchJob, after: int = 0) -> dict[str, Any]:
+        """
+        Build the API response for a job.
+
+        While the job runs, the response carries the per-skill events recorded
+        after ``after`` and a ``next_cursor`` to poll with. Once the job has
+        completed or been cancelled it carries the combined report instead
+        (plus events, if a cursor was given).
+
+        Args:
+            job: Job to describe
+            after: Cursor from a previous response
+
+        Returns:
+            JSON-serializable response body
+        """
+        data = job.to_dict()
+        if not job.finished or after:
+            events = self.events(job.job_id, after)
+            data["events"] = [{"cursor": seq, **event} for seq, event in events]
+            data["next_cursor"] = events[-1][0] if events else after
+        if job.status in (JOB_COMPLETED, JOB_CANCELLED):
+            data["result"] = self.report(job)
+        return data
+
+    async def stream(
+        self,
+        job_id: str,
+        after: int = 0,
+        poll_interval: float = STREAM_POLL_INTERVAL_SECONDS,
+        fmt: str = "ndjson",
+        cancel_on_close: bool = False,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a job's per-skill events until it finishes.
+
+        Each skill result or error is one record, in completion order; the
+        last record has ``"type": "status"`` with the final job state and
+        summary. Only the records not yet sent are read from the store on each
+        poll, so memory use does not depend on the size of the batch.
+
+        Args:
+            job_id: Job to follow
+            after: Cursor to resume from
+            poll_interval: Seconds between store polls while waiting for progress
+            fmt: "ndjson" (one JSON object per line) or "sse" (server-sent events
+                whose ``id`` is the cursor)
+            cancel_on_close: Cancel the job if the stream is closed before it finishes
+        """
+        if fmt not in STREAM_MEDIA_TYPES:
+            raise ValueError(f"Unknown stream format '{fmt}'. Use one of: {', '.join(STREAM_MEDIA_TYPES)}")
+
+        cursor = after
+        finished = False
+        try:
+            while True:
+                job = await asyncio.to_thread(self.store.get, job_id)
+                if job is None:
+                    return
+                # Events are recorded before the final status, so reading the job
+                # first guarantees no event is missed once it reports finished
+                for seq, event in await asyncio.to_thread(self.events, job_id, cursor):
+                    cursor = seq
+                    yield _format_record({"cursor": seq, **event}, fmt, seq)
+                if job.finished:
+                    finished = True
+                    yield _format_record({"type": "status", **job.to_dict(), "summary": job.summary}, fmt)
+                    return
+                await asyncio.sleep(poll_interval)
+        finally:
+            if cancel_on_close and not finished:
+                self.cancel(job_id)
+
+    def cancel(self, job_id: str) -> BatchJob | None:
+        """
+        Request cancellation of a job.
+
+        Returns:
+            The job, or None if it does not exist
+        """
+        job = self.store.get(job_id)
+        if job is None:
+            return None
+        if not job.finished:
+            self.store.update(job_id, cancel_requested=True)
+            job.cancel_requested = True
+            with self._lock:
+                cancel_event = self._cancel_events.get(job_id)
+            if cancel_event is not None:
+                cancel_event.set()
+        return job
+
+    def is_active(self, job_id: str) -> bool:
+        """Whether this manager is running the job."""
+        with self._lock:
+            return job_id in self._cancel_events
+
+    def _maybe_evict(self) -> None:
+        if time.time() - self._last_eviction >= EVICTION_INTERVAL_SECONDS:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Drop expired finished jobs and fail abandoned running ones.
+
+        Returns:
+            Number of jobs deleted
+        """
+        now = time.time()
+        self._last_eviction = now
+
+        for job in self.store.list_jobs([JOB_PROCESSING]):
+            if not self.is_active(job.job_id) and now - job.updated_at > self.stale_after_seconds:
+                self.store.update(
+                    job.job_id,
+                    status=JOB_ERROR,
+                    error="Job was interrupted before it finished",
+                    finished_at=now,
+                    updated_at=now,
+                )
+
+        finished = self.store.list_jobs(FINISHED_STATUSES)
+        expired = {job.job_id for job in finished if now - (job.finished_at or job.updated_at) > self.ttl_seconds}
+        remaining = sorted((job for job in finished if job.job_id not in expired), key=lambda job: job.accessed_at)
+        overflow = len(remaining) - self.max_finished_jobs
+        if overflow > 0:
+            expired.update(job.job_id for job in remaining[:overflow])
+
+        if expired:
+            self.store.delete(expired)
+            logger.debug("Evicted %d finished batch job(s)", len(expired))
+        return len(expired)
+
+    def _cancelled(self, job_id: str, cancel_event: threading.Event) -> bool:
+        if cancel_event.is_set():
+            return True
+        # Cancellation may come from another server process sharing the store
+        job = self.store.get(job_id)
+        if job is not None and job.cancel_requested:
+            cancel_event.set()
+        return cancel_event.is_set()
+
+    def _run_job(self, job_id: str, task: BatchScanTask, cancel_event: threading.Event) -> None:
+        """Coordinator: scan the job's skills and record each result as it completes."""
+        # Only summary counters are kept; results live in the store
+        report = Report()
+        completed = failed = 0
+        try:
+            skill_dirs = [] if self._cancelled(job_id, cancel_event) else task.prepare()
+            self.store.update(job_id, total=len(skill_dirs), updated_at=time.time())
+
+            executor = self._executor()
+            pending_dirs = iter(enumerate(skill_dirs))
+            in_flight: dict[Future, list[tuple[int, Path]]] = {}
+            skills_in_flight = 0
+
+            while True:
+                # A group larger than skill_concurrency still goes out on its own
+                while skills_in_flight < self.skill_concurrency and not self._cancelled(job_id, cancel_event):
+                    group = list(itertools.islice(pending_dirs, task.batch_size))
+                    if not group:
+                        break
+                    in_flight[executor.submit(task.scan_batch, [skill_dir for _, skill_dir in group])] = group
+                    skills_in_flight += len(group)
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    group = in_flight.pop(future)
+                    skills_in_flight -= len(group)
+                    try:
+                        outcomes = future.result()
+                    except Exception as e:
+                        outcomes = [e] * len(group)
+                    for (position, skill_dir), outcome in zip(group, outcomes, strict=True):
+                        event: dict[str, Any] = {"position": position, "skill_directory": str(skill_dir)}
+                        if isinstance(outcome, Exception):
+                            logger.warning("Failed to scan %s: %s", skill_dir, outcome)
+                            event.update(type="error", error=str(outcome))
+                            failed += 1
+                        else:
+                            report.count_scan_result(outcome)
+                            event.update(type="result", result=outcome.to_dict())
+                            completed += 1
+                        self.store.add_event(job_id, event)
+                        self.store.update(job_id, completed=completed, failed=failed, updated_at=time.time())
+
+            status = JOB_CANCELLED if cancel_event.is_set() else JOB_COMPLETED
+            now = time.time()
+            self.store.update(
+                job_id, status=status, summary=report.to_dict()["summary"], finished_at=now, updated_at=now
+            )
+
+        except Exception as e:
+            logger.warning("Batch job %s failed: %s", job_id, e)
+            now = time.time()
+            self.store.update(job_id, status=JOB_ERROR, error=str(e), finished_at=now, updated_at=now)
+
+        finally:
+            task.close()
+            with self._lock:
+                self._cancel_events.pop(job_id, None)
+
+    def shutdown(self, cancel_running: bool = True) -> None:
+        """
+        Stop accepting jobs and wait for running coordinators.
+
+        Args:
+            cancel_running: Cancel running jobs instead of letting them finish
+        """
+        if cancel_running:
+            with self._lock:
+                cancel_events = list(self._cancel_events.values())
+            for cancel_event in cancel_events:
+                cancel_event.set()
+        self._coordinators.shutdown(wait=True, cancel_futures=cancel_running)
+        with self._lock:
+            # Jobs still registered here were queued and never started
+            never_started = list(self._cancel_events)
+            self._cancel_events.clear()
+            private_executor, self._private_executor = self._private_executor, None
+        now = time.time()
+        for job_id in never_started:
+            self.store.update(job_id, status=JOB_CANCELLED, total=0, finished_at=now, updated_at=now)
+        if private_executor is not None:
+            private_executor.shutdown(wait=True)
+        self.store.close()
+
+
+_manager: BatchJobManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> BatchJobManager:
+    """Get the process-wide batch job manager, scanning on the analyzer pool's workers."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            from .analyzer_pool import get_analyzer_pool
+
+            _manager = BatchJobManager(scan_executor=lambda: get_analyzer_pool().executor)
+        return _manager
+
+
+def shutdown_job_manager() -> None:
+    """Cancel running jobs and discard the process-wide batch job manager."""
+    global _manager
+    with _manager_lock:
+        manager, _manager = _manager, None
+    if manager is not None:
+        manager.shutdown()
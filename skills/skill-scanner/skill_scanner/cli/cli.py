@@ -26,9 +26,14 @@ from pathlib import Path
 
 from ..core.analyzers.behavioral_analyzer import BehavioralAnalyzer
 from ..core.analyzers.static import StaticAnalyzer
+from ..core.description_index import DescriptionIndex
+from ..core.llm_cache import LLMResponseCache, llm_cache_enabled
 from ..core.reporters.json_reporter import JSONReporter
+from ..core.reporters.ndjson_reporter import NDJSONReporter
 from ..core.reporters.sarif_reporter import SARIFReporter
+from ..core.scan_cache import ScanCache
 from ..core.scanner import SkillScanner
+from ..core.vt_cache import VirusTotalCache, vt_cache_enabled
 
 # Optional LLM analyzer
 try:
@@ -54,18 +59,68 @@ from ..core.reporters.markdown_reporter import MarkdownReporter
 from ..core.reporters.table_reporter import TableReporter
 
 
+def create_scan_cache(args) -> ScanCache | None:
+    """Create the incremental scan cache if --cache was given."""
+    if not getattr(args, "cache", False):
+        return None
+    return ScanCache(cache_dir=getattr(args, "cache_dir", None))
+
+
+def create_llm_cache(args) -> LLMResponseCache | None:
+    """Create the LLM response cache if --llm-cache or SKILL_SCANNER_LLM_CACHE is set."""
+    if not (getattr(args, "llm_cache", False) or llm_cache_enabled()):
+        return None
+    return LLMResponseCache(cache_dir=getattr(args, "cache_dir", None))
+
+
+def create_vt_cache(args) -> VirusTotalCache | None:
+    """Create the VirusTotal verdict cache if --vt-cache or SKILL_SCANNER_VT_CACHE is set."""
+    if not (getattr(args, "vt_cache", False) or vt_cache_enabled()):
+        return None
+    return VirusTotalCache(cache_dir=getattr(args, "cache_dir", None))
+
+
+def create_description_index(args) -> DescriptionIndex | None:
+    """Open the persistent description overlap index if --overlap-index was given."""
+    path = getattr(args, "overlap_index", None)
+    return DescriptionIndex(path) if path else None
+
+
+def llm_usage_summary(analyzers) -> str | None:
+    """Describe the LLM analyzer's requests and tokens, if it sent any in this process."""
+    for analyzer in analyzers:
+        if LLMAnalyzer is not None and isinstance(analyzer, LLMAnalyzer):
+            usage = analyzer.total_usage
+            if usage.requests or usage.cached_responses:
+                return f"LLM usage: {usage}"
+    return None
+
+
 def scan_command(args):
     """Handle the scan command for a single skill."""
-    skill_dir = Path(args.skill_directory)
-
-    if not skill_dir.exists():
-        print(f"Error: Directory does not exist: {skill_dir}", file=sys.stderr)
+    archive_path = Path(args.archive) if getattr(args, "archive", None) else None
+    if (archive_path is None) == (args.skill_directory is None):
+        print("Error: Give either a skill directory or --archive", file=sys.stderr)
         return 1
 
+    if archive_path is not None:
+        if not archive_path.is_file():
+            print(f"Error: Archive does not exist: {archive_path}", file=sys.stderr)
+            return 1
+    else:
+        skill_dir = Path(args.skill_directory)
+
+        if not skill_dir.exists():
+            print(f"Error: Directory does not exist: {skill_dir}", file=sys.stderr)
+            return 1
+
     # Get YARA mode and custom rules from args
     yara_mode = getattr(args, "yara_mode", "balanced")
     custom_rules_path = getattr(args, "custom_rules", None)
     disabled_rules = set(getattr(args, "disabled_rules", None) or [])
+    scan_cache = create_scan_cache(args)
+    llm_cache = create_llm_cache(args)
+    vt_cache = create_vt_cache(args)
 
     # Create scanner with configured analyzers
     analyzers = [
@@ -73,6 +128,7 @@ def scan_command(args):
             yara_mode=yara_mode,
             custom_yara_rules_path=custom_rules_path,
             disabled_rules=disabled_rules,
+            cache=scan_cache,
         )
     ]
 
@@ -88,7 +144,7 @@ def scan_command(args):
     # Add behavioral analyzer if requested
     if hasattr(args, "use_behavioral") and args.use_behavioral:
         try:
-            behavioral_analyzer = BehavioralAnalyzer(use_static_analysis=True)
+            behavioral_analyzer = BehavioralAnalyzer(use_static_analysis=True, cache=scan_cache)
             analyzers.append(behavioral_analyzer)
             status_print("Using behavioral analyzer (static dataflow analysis)")
         except Exception as e:
@@ -113,6 +169,7 @@ def scan_command(args):
                     api_key=api_key,
                     base_url=base_url,
                     api_version=api_version,
+                    response_cache=llm_cache,
                 )
                 analyzers.append(llm_analyzer)
                 status_print(f"Using LLM analyzer with model: {model}")
@@ -130,7 +187,9 @@ def scan_command(args):
                 from ..core.analyzers.virustotal_analyzer import VirusTotalAnalyzer
 
                 vt_upload = getattr(args, "vt_upload_files", False)
-                vt_analyzer = VirusTotalAnalyzer(api_key=vt_api_key, enabled=True, upload_files=vt_upload)
+                vt_analyzer = VirusTotalAnalyzer(
+                    api_key=vt_api_key, enabled=True, upload_files=vt_upload, cache=vt_cache
+                )
                 analyzers.append(vt_analyzer)
                 mode = "with file uploads" if vt_upload else "hash-only mode"
                 status_print(f"Using VirusTotal binary file scanner ({mode})")
@@ -189,32 +248,45 @@ def scan_command(args):
                     api_key=meta_api_key,
                     base_url=meta_base_url,
                     api_version=meta_api_version,
+                    response_cache=llm_cache,
                 )
                 status_print("Using Meta-Analyzer for false positive filtering and finding prioritization")
             except Exception as e:
                 print(f"Warning: Could not initialize Meta-Analyzer: {e}", file=sys.stderr)
 
-    scanner = SkillScanner(analyzers=analyzers)
+    scanner = SkillScanner(analyzers=analyzers, description_index=create_description_index(args))
 
     try:
-        # Scan the skill
-        result = scanner.scan_skill(skill_dir)
+        # Scan the skill; archives are read in place without extracting them
+        if archive_path is not None:
+            result = scanner.scan_archive(archive_path)
+        else:
+            result = scanner.scan_skill(skill_dir)
+        if scan_cache:
+            status_print(f"Scan cache: {scan_cache.stats}")
 
         # Run meta-analysis if enabled and we have findings
         if meta_analyzer and result.findings:
             status_print("Running meta-analysis to filter false positives...")
             try:
                 # Load the skill for context
-                skill = scanner.loader.load_skill(skill_dir)
+                if archive_path is not None:
+                    skill = scanner.loader.load_skill_archive(archive_path)
+                else:
+                    skill = scanner.loader.load_skill(skill_dir)
 
                 # Run meta-analysis asynchronously
-                meta_result = asyncio.run(
-                    meta_analyzer.analyze_with_findings(
-                        skill=skill,
-                        findings=result.findings,
-                        analyzers_used=result.analyzers_used,
+                try:
+                    meta_result = asyncio.run(
+                        meta_analyzer.analyze_with_findings(
+                            skill=skill,
+                            findings=result.findings,
+                            analyzers_used=result.analyzers_used,
+                        )
                     )
-                )
+                finally:
+                    if skill.archive is not None:
+                        skill.archive.close()
 
                 # Apply meta-analysis results
                 filtered_findings = apply_meta_analysis_to_results(
@@ -238,6 +310,14 @@ def scan_command(args):
                 print(f"Warning: Meta-analysis failed: {e}", file=sys.stderr)
                 print("Continuing with original findings.", file=sys.stderr)
 
+        if llm_cache:
+            status_print(f"LLM cache: {llm_cache.stats}")
+        if vt_cache:
+            status_print(f"VirusTotal cache: {vt_cache.stats}")
+        usage_summary = llm_usage_summary(analyzers)
+        if usage_summary:
+            status_print(usage_summary)
+
         # Generate report based on format
         if args.format == "json":
             reporter = JSONReporter(pretty=not args.compact)
@@ -274,6 +354,8 @@ def scan_command(args):
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
         return 1
+    finally:
+        scanner.close()
 
 
 def scan_all_command(args):
@@ -288,6 +370,9 @@ def scan_all_command(args):
     yara_mode = getattr(args, "yara_mode", "balanced")
     custom_rules_path = getattr(args, "custom_rules", None)
     disabled_rules = set(getattr(args, "disabled_rules", None) or [])
+    scan_cache = create_scan_cache(args)
+    llm_cache = create_llm_cache(args)
+    vt_cache = create_vt_cache(args)
 
     # Create scanner with configured analyzers
     analyzers = [
@@ -295,11 +380,12 @@ def scan_all_command(args):
             yara_mode=yara_mode,
             custom_yara_rules_path=custom_rules_path,
             disabled_rules=disabled_rules,
+            cache=scan_cache,
         )
     ]
 
     # Helper to print status messages - go to stderr when JSON output to avoid breaking parsing
-    is_json_output = getattr(args, "format", "summary") == "json"
+    is_json_output = getattr(args, "format", "summary") in ("json", "ndjson")
 
     def status_print(msg: str) -> None:
         if is_json_output:
@@ -310,7 +396,7 @@ def scan_all_command(args):
     # Add behavioral analyzer if requested
     if hasattr(args, "use_behavioral") and args.use_behavioral:
         try:
-            behavioral_analyzer = BehavioralAnalyzer(use_static_analysis=True)
+            behavioral_analyzer = BehavioralAnalyzer(use_static_analysis=True, cache=scan_cache)
             analyzers.append(behavioral_analyzer)
             status_print("Using behavioral analyzer (static dataflow analysis)")
         except Exception as e:
@@ -330,6 +416,7 @@ def scan_all_command(args):
                 api_key=api_key,
                 base_url=base_url,
                 api_version=api_version,
+                response_cache=llm_cache,
             )
             analyzers.append(llm_analyzer)
             status_print(f"Using LLM analyzer with model: {model}")
@@ -347,7 +434,9 @@ def scan_all_command(args):
             try:
                 from ..core.analyzers.virustotal_analyzer import VirusTotalAnalyzer
 
-                vt_analyzer = VirusTotalAnalyzer(api_key=vt_api_key, enabled=True, upload_files=vt_upload)
+                vt_analyzer = VirusTotalAnalyzer(
+                    api_key=vt_api_key, enabled=True, upload_files=vt_upload, cache=vt_cache
+                )
                 analyzers.append(vt_analyzer)
                 mode = "with file uploads" if vt_upload else "hash-only mode"
                 status_print(f"Using VirusTotal binary file scanner ({mode})")
@@ -406,17 +495,77 @@ def scan_all_command(args):
                     api_key=meta_api_key,
                     base_url=meta_base_url,
                     api_version=meta_api_version,
+                    response_cache=llm_cache,
                 )
                 status_print("Using Meta-Analyzer for false positive filtering and finding prioritization")
             except Exception as e:
                 print(f"Warning: Could not initialize Meta-Analyzer: {e}", file=sys.stderr)
 
-    scanner = SkillScanner(analyzers=analyzers)
+    scanner = SkillScanner(analyzers=analyzers, description_index=create_description_index(args))
+
+    def run_meta_analysis(result, skill=None) -> tuple[int, int]:
+        """Apply meta-analysis to one skill's result; returns (false positives filtered, new threats)."""
+        if not result.findings:
+            return 0, 0
+        try:
+            # Load the skill for context
+            if skill is None:
+                skill = scanner.loader.load_skill(Path(result.skill_directory))
+
+            # Run meta-analysis asynchronously
+            meta_result = asyncio.run(
+                meta_analyzer.analyze_with_findings(
+                    skill=skill,
+                    findings=result.findings,
+                    analyzers_used=result.analyzers_used,
+                )
+            )
+
+            # Apply meta-analysis results
+            original_count = len(result.findings)
+            filtered_findings = apply_meta_analysis_to_results(
+                original_findings=result.findings,
+                meta_result=meta_result,
+                skill=skill,
+            )
+
+            # Track statistics
+            fp_count = original_count - len([f for f in filtered_findings if f.analyzer != "meta"])
+            new_count = len([f for f in filtered_findings if f.analyzer == "meta"])
+
+            # Update result
+            result.findings = filtered_findings
+            result.analyzers_used.append("meta_analyzer")
+            return fp_count, new_count
+
+        except Exception as e:
+            print(f"Warning: Meta-analysis failed for {result.skill_name}: {e}", file=sys.stderr)
+            return 0, 0
 
     try:
         # Scan all skills
-        check_overlap = hasattr(args, "check_overlap") and args.check_overlap
-        report = scanner.scan_directory(skills_dir, recursive=args.recursive, check_overlap=check_overlap)
+        check_overlap = (hasattr(args, "check_overlap") and args.check_overlap) or scanner.description_index is not None
+        jobs = getattr(args, "jobs", 1) or 1
+        if jobs > 1:
+            status_print(f"Scanning with {jobs} parallel workers")
+
+        if args.format == "ndjson":
+            return stream_scan_all(
+                scanner,
+                skills_dir,
+                args,
+                check_overlap=check_overlap,
+                workers=jobs,
+                meta_step=run_meta_analysis if meta_analyzer else None,
+                scan_cache=scan_cache,
+                llm_cache=llm_cache,
+                vt_cache=vt_cache,
+            )
+
+        report = scanner.scan_directory(skills_dir, recursive=args.recursive, check_overlap=check_overlap, workers=jobs)
+
+        if scan_cache:
+            status_print(f"Scan cache: {scan_cache.stats}")
 
         if report.total_skills_scanned == 0:
             print("No skills found to scan.", file=sys.stderr)
@@ -429,41 +578,9 @@ def scan_all_command(args):
             total_new_threats = 0
 
             for result in report.scan_results:
-                if result.findings:
-                    try:
-                        # Load the skill for context
-                        skill_dir = Path(result.skill_directory)
-                        skill = scanner.loader.load_skill(skill_dir)
-
-                        # Run meta-analysis asynchronously
-                        meta_result = asyncio.run(
-                            meta_analyzer.analyze_with_findings(
-                                skill=skill,
-                                findings=result.findings,
-                                analyzers_used=result.analyzers_used,
-                            )
-                        )
-
-                        # Apply meta-analysis results
-                        original_count = len(result.findings)
-                        filtered_findings = apply_meta_analysis_to_results(
-                            original_findings=result.findings,
-                            meta_result=meta_result,
-                            skill=skill,
-                        )
-
-                        # Track statistics
-                        fp_count = original_count - len([f for f in filtered_findings if f.analyzer != "meta"])
-                        new_count = len([f for f in filtered_findings if f.analyzer == "meta"])
-                        total_fp_filtered += fp_count
-                        total_new_threats += new_count
-
-                        # Update result
-                        result.findings = filtered_findings
-                        result.analyzers_used.append("meta_analyzer")
-
-                    except Exception as e:
-                        print(f"Warning: Meta-analysis failed for {result.skill_name}: {e}", file=sys.stderr)
+                fp_count, new_count = run_meta_analysis(result)
+                total_fp_filtered += fp_count
+                total_new_threats += new_count
 
             status_print(
                 f"Meta-analysis complete: {total_fp_filtered} total false positives filtered, {total_new_threats} new threats detected"
@@ -482,6 +599,14 @@ def scan_all_command(args):
             report.info_count = sum(1 for r in report.scan_results for f in r.findings if f.severity.value == "INFO")
             report.safe_count = sum(1 for r in report.scan_results if r.is_safe)
 
+        if llm_cache:
+            status_print(f"LLM cache: {llm_cache.stats}")
+        if vt_cache:
+            status_print(f"VirusTotal cache: {vt_cache.stats}")
+        usage_summary = llm_usage_summary(analyzers)
+        if usage_summary:
+            status_print(usage_summary)
+
         # Generate report based on format
         if args.format == "json":
             reporter = JSONReporter(pretty=not args.compact)
@@ -515,6 +640,83 @@ def scan_all_command(args):
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
         return 1
+    finally:
+        scanner.close()
+
+
+def stream_scan_all(
+    scanner: SkillScanner,
+    skills_dir: Path,
+    args,
+    check_overlap: bool = False,
+    workers: int = 1,
+    meta_step=None,
+    scan_cache: ScanCache | None = None,
+    llm_cache: LLMResponseCache | None = None,
+    vt_cache: VirusTotalCache | None = None,
+) -> int:
+    """
+    Scan skills and write each result as an NDJSON line as soon as it is ready.
+
+    Only summary counters are kept in memory (plus loaded skills when
+    --check-overlap needs them), so output starts with the first skill and
+    memory use stays flat however many skills are scanned.
+
+    Args:
+        scanner: Configured scanner
+        skills_dir: Directory containing skills
+        args: Parsed scan-all arguments
+        check_overlap: Run cross-skill checks after the last skill
+        workers: Number of worker processes
+        meta_step: Optional per-result meta-analysis step
+        scan_cache: Scan cache whose stats are reported at the end
+        llm_cache: LLM response cache whose stats are reported at the end
+        vt_cache: VirusTotal verdict cache whose stats are reported at the end
+
+    Returns:
+        Exit code
+    """
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    reporter = NDJSONReporter(output)
+    loaded_skills = []
+
+    try:
+        for skill, result in scanner.iter_scan_directory(skills_dir, recursive=args.recursive, workers=workers):
+            if meta_step is not None:
+                meta_step(result, skill)
+            reporter.write_result(result)
+            if check_overlap:
+                loaded_skills.append(skill)
+
+        if check_overlap and (len(loaded_skills) > 1 or (loaded_skills and scanner.description_index is not None)):
+            reporter.write_cross_skill(scanner.check_cross_skill(loaded_skills))
+
+        reporter.write_summary()
+    finally:
+        if args.output:
+            output.close()
+
+    if scan_cache:
+        print(f"Scan cache: {scan_cache.stats}", file=sys.stderr)
+    if llm_cache:
+        print(f"LLM cache: {llm_cache.stats}", file=sys.stderr)
+    if vt_cache:
+        print(f"VirusTotal cache: {vt_cache.stats}", file=sys.stderr)
+    usage_summary = llm_usage_summary(scanner.analyzers)
+    if usage_summary:
+        print(usage_summary, file=sys.stderr)
+    if args.output:
+        print(f"Report saved to: {args.output}", file=sys.stderr)
+
+    summary = reporter.summary
+    if summary.total_skills_scanned == 0:
+        print("No skills found to scan.", file=sys.stderr)
+        return 1
+
+    if args.fail_on_findings and (summary.critical_count > 0 or summary.high_count > 0):
+        return 1
+
+    return 0
 
 
 def list_analyzers_command(args):
@@ -616,6 +818,26 @@ def validate_rules_command(args):
         return 1
 
 
+def rules_compile_command(args):
+    """Handle the rules compile command."""
+    from ..core.rules.yara_scanner import YaraScanner
+
+    rules_dirs = args.custom_rules or [None]
+    bundle_dir = Path(args.bundle_dir) if args.bundle_dir else None
+
+    for rules_dir in rules_dirs:
+        try:
+            scanner = YaraScanner(rules_dir=rules_dir, bundle_dir=bundle_dir, use_bundle_cache=False, load_rules=False)
+            bundle_path = scanner.compile_bundle()
+        except Exception as e:
+            print(f"[FAIL] Error compiling YARA rules in {rules_dir or 'built-in rules'}: {e}", file=sys.stderr)
+            return 1
+
+        print(f"[OK] Compiled {scanner.rules_dir} -> {bundle_path}")
+
+    return 0
+
+
 def generate_summary(result) -> str:
     """Generate a simple summary output."""
     lines = []
@@ -686,17 +908,29 @@ Examples:
   # Scan with JSON output
   skill-scanner scan /path/to/skill --format json
 
+  # Scan a packed skill without extracting it
+  skill-scanner scan --archive skill.zip
+
   # Scan all skills in a directory
   skill-scanner scan-all /path/to/skills
 
   # Scan recursively with all engines
   skill-scanner scan-all /path/to/skills --recursive --use-behavioral --use-llm
 
+  # Scan a large skills directory using 8 worker processes
+  skill-scanner scan-all /path/to/skills --recursive --jobs 8
+
+  # Only re-analyze files that changed since the last scan
+  skill-scanner scan-all /path/to/skills --recursive --cache
+
   # List available analyzers
   skill-scanner list-analyzers
 
   # Validate rule signatures
   skill-scanner validate-rules
+
+  # Precompile YARA rules (e.g. while building a container image)
+  skill-scanner rules compile
         """,
     )
 
@@ -704,7 +938,12 @@ Examples:
 
     # Scan command
     scan_parser = subparsers.add_parser("scan", help="Scan a single skill package")
-    scan_parser.add_argument("skill_directory", help="Path to skill directory")
+    scan_parser.add_argument("skill_directory", nargs="?", help="Path to skill directory")
+    scan_parser.add_argument(
+        "--archive",
+        metavar="PATH",
+        help="Scan a skill packed in a zip or tar archive (.zip, .tar, .tar.gz, ...) without extracting it",
+    )
     scan_parser.add_argument(
         "--format",
         choices=["summary", "json", "markdown", "table", "sarif"],
@@ -730,6 +969,11 @@ Examples:
         action="store_true",
         help="Upload unknown files to VirusTotal (default: hash-only lookup for privacy)",
     )
+    scan_parser.add_argument(
+        "--vt-cache",
+        action="store_true",
+        help="Reuse VirusTotal verdicts for previously seen file hashes from the on-disk cache",
+    )
     scan_parser.add_argument(
         "--use-aidefense", action="store_true", help="Enable AI Defense analyzer (requires API key)"
     )
@@ -768,6 +1012,28 @@ Examples:
         dest="disabled_rules",
         help="Disable a specific rule by name (can be used multiple times). Example: --disable-rule YARA_script_injection",
     )
+    scan_parser.add_argument(
+        "--overlap-index",
+        metavar="PATH",
+        help="Persistent description overlap index (SQLite file). Skills are checked for description overlap "
+        "against every skill indexed by earlier runs, then added to it",
+    )
+    scan_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse per-file results for unchanged files from the incremental scan cache",
+    )
+    scan_parser.add_argument(
+        "--cache-dir",
+        metavar="PATH",
+        help="Directory for the scan, LLM and VirusTotal caches "
+        "(default: $SKILL_SCANNER_CACHE_DIR or ~/.cache/skill-scanner)",
+    )
+    scan_parser.add_argument(
+        "--llm-cache",
+        action="store_true",
+        help="Answer repeated LLM prompts (LLM, meta and alignment analysis) from the on-disk response cache",
+    )
 
     # Scan-all command
     scan_all_parser = subparsers.add_parser("scan-all", help="Scan multiple skill packages")
@@ -775,9 +1041,12 @@ Examples:
     scan_all_parser.add_argument("--recursive", "-r", action="store_true", help="Recursively search for skills")
     scan_all_parser.add_argument(
         "--format",
-        choices=["summary", "json", "markdown", "table", "sarif"],
+        choices=["summary", "json", "ndjson", "markdown", "table", "sarif"],
         default="summary",
-        help="Output format (default: summary). Use 'sarif' for GitHub Code Scanning integration.",
+        help=(
+            "Output format (default: summary). Use 'sarif' for GitHub Code Scanning integration, "
+            "'ndjson' to stream one result per line as each skill finishes."
+        ),
     )
     scan_all_parser.add_argument("--output", "-o", help="Output file path")
     scan_all_parser.add_argument("--detailed", action="store_true", help="Include detailed findings")
@@ -800,6 +1069,11 @@ Examples:
         action="store_true",
         help="Upload unknown files to VirusTotal (default: hash-only lookup for privacy)",
     )
+    scan_all_parser.add_argument(
+        "--vt-cache",
+        action="store_true",
+        help="Reuse VirusTotal verdicts for previously seen file hashes from the on-disk cache",
+    )
     scan_all_parser.add_argument(
         "--use-aidefense", action="store_true", help="Enable AI Defense analyzer (requires API key)"
     )
@@ -818,6 +1092,20 @@ Examples:
     scan_all_parser.add_argument(
         "--check-overlap", action="store_true", help="Enable cross-skill description overlap detection"
     )
+    scan_all_parser.add_argument(
+        "--overlap-index",
+        metavar="PATH",
+        help="Persistent description overlap index (SQLite file). Skills are checked for description overlap "
+        "against every skill indexed by earlier runs, then added to it",
+    )
+    scan_all_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of parallel worker processes used to scan skills (default: 1)",
+    )
     scan_all_parser.add_argument(
         "--enable-meta",
         action="store_true",
@@ -841,6 +1129,22 @@ Examples:
         dest="disabled_rules",
         help="Disable a specific rule by name (can be used multiple times). Example: --disable-rule YARA_script_injection",
     )
+    scan_all_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse per-file results for unchanged files from the incremental scan cache",
+    )
+    scan_all_parser.add_argument(
+        "--cache-dir",
+        metavar="PATH",
+        help="Directory for the scan, LLM and VirusTotal caches "
+        "(default: $SKILL_SCANNER_CACHE_DIR or ~/.cache/skill-scanner)",
+    )
+    scan_all_parser.add_argument(
+        "--llm-cache",
+        action="store_true",
+        help="Answer repeated LLM prompts (LLM, meta and alignment analysis) from the on-disk response cache",
+    )
 
     # List analyzers command
     subparsers.add_parser("list-analyzers", help="List available analyzers")
@@ -849,6 +1153,24 @@ Examples:
     validate_parser = subparsers.add_parser("validate-rules", help="Validate rule signatures")
     validate_parser.add_argument("--rules-file", help="Path to custom rules file")
 
+    # Rules commands
+    rules_parser = subparsers.add_parser("rules", help="Manage detection rules")
+    rules_subparsers = rules_parser.add_subparsers(dest="rules_command", help="Rules command to execute")
+    compile_parser = rules_subparsers.add_parser(
+        "compile", help="Precompile YARA rules into a bundle loaded on later runs"
+    )
+    compile_parser.add_argument(
+        "--custom-rules",
+        metavar="PATH",
+        action="append",
+        help="Directory of custom YARA rules to compile (repeatable; default: built-in rules)",
+    )
+    compile_parser.add_argument(
+        "--bundle-dir",
+        metavar="PATH",
+        help="Bundle directory (default: $SKILL_SCANNER_YARA_BUNDLE_DIR or <cache dir>/yara)",
+    )
+
     # Parse arguments
     args = parser.parse_args()
 
@@ -865,6 +1187,11 @@ Examples:
         return list_analyzers_command(args)
     elif args.command == "validate-rules":
         return validate_rules_command(args)
+    elif args.command == "rules":
+        if args.rules_command == "compile":
+            return rules_compile_command(args)
+        rules_parser.print_help()
+        return 1
     else:
         parser.print_help()
         return 1
@@ -20,9 +20,9 @@ Analyzer modules for detecting security vulnerabilities in agent skills.
 Structure mirrors MCP Scanner's analyzer organization.
 """
 
-from .base import BaseAnalyzer
+from .base import AnalysisOutput, BaseAnalyzer
 
-__all__ = ["BaseAnalyzer"]
+__all__ = ["AnalysisOutput", "BaseAnalyzer"]
 
 # Import available analyzers (re-exported via __all__)
 try:
@@ -22,12 +22,22 @@ Integrates with Cisco AI Defense API (https://api.aidefense.cisco.com) for:
 - Tool poisoning detection
 - Data exfiltration detection
 - Malicious content analysis
+
+Files of a skill are inspected concurrently, bounded by a semaphore, over one
+pooled HTTP client that is kept alive across the skills of a batch. Small
+files can optionally be coalesced into a single request; a batch that comes
+back flagged is re-inspected file by file so findings point at the right file.
 """
 
 import asyncio
 import hashlib
 import json
 import os
+import random
+import threading
+import time
+import weakref
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 try:
@@ -56,6 +66,40 @@ DEFAULT_ENABLED_RULES = [
     {"rule_name": "Code Detection"},
 ]
 
+# Requests in flight at once across every skill sharing an analyzer
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Per-file content limits sent to the API
+PROMPT_CONTENT_LIMIT = 10000
+CODE_CONTENT_LIMIT = 15000
+
+# Upper bound on a server-requested Retry-After wait
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _stop_event_loop(
+    loop: asyncio.AbstractEventLoop, thread: threading.Thread, clients: "list[httpx.AsyncClient]"
+) -> None:
+    """Close the clients opened on a background event loop, then stop it and wait for its thread to exit."""
+    if loop.is_closed():
+        return
+    if thread is not threading.current_thread():
+        # Their connections belong to the loop, so they are closed on it before it stops
+        for client in clients:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not threading.current_thread():
+        thread.join()
+        loop.close()
+
 
 class AIDefenseAnalyzer(BaseAnalyzer):
     """
@@ -91,6 +135,11 @@ class AIDefenseAnalyzer(BaseAnalyzer):
         ...     api_key="your-api-key",
         ...     include_rules=False  # Don't send rules config
         ... )
+
+        >>> # Batch scans: one pooled client for every skill, released at the end
+        >>> analyzer = AIDefenseAnalyzer(api_key="your-api-key", max_concurrency=16)
+        >>> results = [analyzer.analyze(skill) for skill in skills]
+        >>> analyzer.close()
     """
 
     def __init__(
@@ -101,6 +150,9 @@ class AIDefenseAnalyzer(BaseAnalyzer):
         max_retries: int = 3,
         enabled_rules: list[dict[str, str]] | None = None,
         include_rules: bool = True,
+        max_concurrency: int | None = None,
+        batch_max_chars: int | None = None,
+        transport: "httpx.AsyncBaseTransport | None" = None,
     ):
         """
         Initialize AI Defense API analyzer.
@@ -114,6 +166,12 @@ class AIDefenseAnalyzer(BaseAnalyzer):
                           Format: [{"rule_name": "Prompt Injection"}, ...]
             include_rules: Whether to include enabled_rules in API payload.
                           Set to False if API key has pre-configured rules.
+            max_concurrency: Maximum API requests in flight at once
+                            (default: $AI_DEFENSE_MAX_CONCURRENCY or 8)
+            batch_max_chars: Coalesce markdown and code files smaller than this many
+                            characters into shared requests; 0 sends one request per
+                            file (default: $AI_DEFENSE_BATCH_MAX_CHARS or 0)
+            transport: Optional httpx transport, e.g. httpx.MockTransport in tests
         """
         super().__init__("aidefense_analyzer")
 
@@ -135,11 +193,46 @@ class AIDefenseAnalyzer(BaseAnalyzer):
         self.enabled_rules = enabled_rules or DEFAULT_ENABLED_RULES
         self.include_rules = include_rules
 
-        # Initialize async client
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("AI_DEFENSE_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if batch_max_chars is None:
+            batch_max_chars = int(os.getenv("AI_DEFENSE_BATCH_MAX_CHARS", "0"))
+        self.max_concurrency = max_concurrency
+        self.batch_max_chars = batch_max_chars
+        self.transport = transport
+
+        # Async client and request semaphore, created on the event loop that uses them
         self._client = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+        # Background event loop that runs the sync analyze() calls
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_finalizer: weakref.finalize | None = None
+        self._loop_clients: list[httpx.AsyncClient] = []  # Clients opened on the background loop
+        self._loop_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the live client and event loop when shipping to worker processes."""
+        state = self.__dict__.copy()
+        for key in ("_client", "_semaphore", "_client_loop", "_loop", "_loop_finalizer", "_loop_lock"):
+            state[key] = None
+        state["_loop_clients"] = []
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._loop_lock = threading.Lock()
 
     def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
+        loop = _running_loop()
+        if self._client is not None and loop is not None and self._client_loop not in (None, loop):
+            # Created under another event loop (e.g. an earlier asyncio.run); its connections are unusable here
+            self._client = None
+            self._semaphore = None
         if self._client is None:
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.timeout),
@@ -148,14 +241,51 @@ class AIDefenseAnalyzer(BaseAnalyzer):
                     "Content-Type": "application/json",
                     "Accept": "application/json",
                 },
+                transport=self.transport,
             )
+            if loop is not None and loop is self._loop:
+                self._loop_clients.append(self._client)
+        if self._client_loop is None:
+            self._client_loop = loop
         return self._client
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get or create the semaphore bounding requests in flight."""
+        self._get_client()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
     async def _close_client(self):
         """Close HTTP client."""
         if self._client is not None:
             await self._client.aclose()
             self._client = None
+            self._semaphore = None
+            self._client_loop = None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get or start the background event loop used by analyze()."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="aidefense-analyzer", daemon=True)
+                thread.start()
+                self._loop = loop
+                self._loop_clients = []
+                # Close the client and stop the loop when the analyzer is garbage collected without close()
+                self._loop_finalizer = weakref.finalize(self, _stop_event_loop, loop, thread, self._loop_clients)
+            return self._loop
+
+    def close(self) -> None:
+        """Close the pooled HTTP client and stop the background event loop."""
+        with self._loop_lock:
+            loop, finalizer = self._loop, self._loop_finalizer
+            self._loop = self._loop_finalizer = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._close_client(), loop).result()
+        finalizer()
 
     def _get_payload(
         self,
@@ -223,27 +353,26 @@ class AIDefenseAnalyzer(BaseAnalyzer):
         """
         Analyze skill using AI Defense API (sync wrapper).
 
+        Runs on a background event loop owned by the analyzer, so the pooled
+        client and its connections are reused by every skill in a batch and
+        the call works from any thread, including ones with a running loop.
+        Call close() when done to release them.
+
         Args:
             skill: Skill to analyze
 
         Returns:
             List of security findings
         """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        try:
-            return loop.run_until_complete(self.analyze_async(skill))
-        finally:
-            loop.run_until_complete(self._close_client())
+        return asyncio.run_coroutine_threadsafe(self.analyze_async(skill), self._get_loop()).result()
 
     async def analyze_async(self, skill: Skill) -> list[Finding]:
         """
         Analyze skill using AI Defense API (async).
 
+        Every file is inspected concurrently, up to max_concurrency requests at
+        once, and findings are returned in file order.
+
         Args:
             skill: Skill to analyze
 
@@ -253,38 +382,38 @@ class AIDefenseAnalyzer(BaseAnalyzer):
         findings = []
 
         try:
-            # 1. Analyze SKILL.md content (prompts/instructions)
-            skill_md_findings = await self._analyze_prompt_content(
-                skill.instruction_body, skill.name, "SKILL.md", "skill_instructions"
-            )
-            findings.extend(skill_md_findings)
-
-            # 2. Analyze manifest/description
-            manifest_findings = await self._analyze_prompt_content(
-                f"Name: {skill.manifest.name}\nDescription: {skill.manifest.description}",
-                skill.name,
-                "manifest",
-                "skill_manifest",
-            )
-            findings.extend(manifest_findings)
-
-            # 3. Analyze each markdown file
-            for md_file in skill.get_markdown_files():
-                content = md_file.read_content()
-                if content:
-                    md_findings = await self._analyze_prompt_content(
-                        content, skill.name, md_file.relative_path, "markdown_content"
-                    )
-                    findings.extend(md_findings)
-
-            # 4. Analyze code files
-            for script_file in skill.get_scripts():
-                content = script_file.read_content()
-                if content:
-                    code_findings = await self._analyze_code_content(
-                        content, skill.name, script_file.relative_path, script_file.file_type
-                    )
-                    findings.extend(code_findings)
+            # 1. SKILL.md content (prompts/instructions) and 2. manifest/description
+            requests = [
+                self._analyze_prompt_content(skill.instruction_body, skill.name, "SKILL.md", "skill_instructions"),
+                self._analyze_prompt_content(
+                    f"Name: {skill.manifest.name}\nDescription: {skill.manifest.description}",
+                    skill.name,
+                    "manifest",
+                    "skill_manifest",
+                ),
+            ]
+
+            # 3. Markdown files and 4. code files, small ones coalesced when batching is enabled
+            markdown_files = [
+                (md_file.relative_path, content, None)
+                for md_file in skill.get_markdown_files()
+                if (content := md_file.read_content()) and content.strip()
+            ]
+            code_files = [
+                (script_file.relative_path, content, script_file.file_type)
+                for script_file in skill.get_scripts()
+                if (content := script_file.read_content()) and content.strip()
+            ]
+            for files, content_type in ((markdown_files, "markdown_content"), (code_files, "code")):
+                requests.extend(
+                    self._analyze_batch(batch, skill.name, content_type) for batch in self._batch_files(files)
+                )
+
+            for result in await asyncio.gather(*requests, return_exceptions=True):
+                if isinstance(result, Exception):
+                    print(f"AI Defense API analysis failed for {skill.name}: {result}")
+                else:
+                    findings.extend(result)
 
         except Exception as e:
             print(f"AI Defense API analysis failed for {skill.name}: {e}")
@@ -292,6 +421,110 @@ class AIDefenseAnalyzer(BaseAnalyzer):
 
         return findings
 
+    def _batch_files(self, files: list[tuple[str, str, str | None]]) -> list[list[tuple[str, str, str | None]]]:
+        """
+        Group files into request batches, in file order.
+
+        Files smaller than batch_max_chars are packed together until the next one
+        would push a batch past that size; larger files, or every file when
+        batching is disabled, get a request of their own.
+
+        Args:
+            files: (file_path, content, language) tuples
+
+        Returns:
+            List of batches
+        """
+        if self.batch_max_chars <= 0:
+            return [[file] for file in files]
+
+        batches: list[list[tuple[str, str, str | None]]] = []
+        current: list[tuple[str, str, str | None]] = []
+        size = 0
+        for file in files:
+            length = len(file[1])
+            if current and size + length > self.batch_max_chars:
+                batches.append(current)
+                current, size = [], 0
+            if length >= self.batch_max_chars:
+                batches.append([file])
+                continue
+            current.append(file)
+            size += length
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _analyze_file(
+        self, file: tuple[str, str, str | None], skill_name: str, content_type: str
+    ) -> list[Finding]:
+        """Inspect a single markdown or code file."""
+        file_path, content, language = file
+        if content_type == "code":
+            return await self._analyze_code_content(content, skill_name, file_path, language or "")
+        return await self._analyze_prompt_content(content, skill_name, file_path, content_type)
+
+    async def _analyze_batch(
+        self, batch: list[tuple[str, str, str | None]], skill_name: str, content_type: str
+    ) -> list[Finding]:
+        """
+        Inspect a batch of files in one request.
+
+        A clean verdict covers every file in the batch. If the batch is flagged,
+        or the request fails, each file is inspected on its own so findings are
+        attributed to the file that triggered them.
+
+        Args:
+            batch: (file_path, content, language) tuples
+            skill_name: Name of the skill
+            content_type: "markdown_content" or "code"
+
+        Returns:
+            List of findings
+        """
+        if len(batch) == 1:
+            return await self._analyze_file(batch[0], skill_name, content_type)
+
+        if content_type == "code":
+            messages = [
+                {
+                    "role": "user",
+                    "content": f"# Code Analysis for {path}\n```{language}\n{content[:CODE_CONTENT_LIMIT]}\n```",
+                }
+                for path, content, language in batch
+            ]
+        else:
+            messages = [{"role": "user", "content": content[:PROMPT_CONTENT_LIMIT]} for _, content, _ in batch]
+        metadata = {
+            "source": "skill_scanner",
+            "skill_name": skill_name,
+            "file_path": ", ".join(path for path, _, _ in batch),
+            "content_type": content_type,
+        }
+        payload = self._get_payload(
+            messages, metadata, include_rules=True, rules_override=self._get_rules_for_content_type(content_type)
+        )
+
+        try:
+            response = await self._make_api_request(endpoint="/inspect/chat", payload=payload)
+        except Exception as e:
+            print(f"AI Defense batch analysis failed for {metadata['file_path']}: {e}")
+            response = None
+        if response is not None and self._is_clean(response):
+            return []
+
+        results = await asyncio.gather(*(self._analyze_file(file, skill_name, content_type) for file in batch))
+        return [finding for result in results for finding in result]
+
+    @staticmethod
+    def _is_clean(response: dict[str, Any]) -> bool:
+        """Check whether an inspection response would produce no findings."""
+        if any(c and c != "NONE_VIOLATION" for c in response.get("classifications", [])):
+            return False
+        if any(rule.get("classification", "") not in ("NONE_VIOLATION", "") for rule in response.get("rules", [])):
+            return False
+        return not (response.get("action", "").lower() == "block" and not response.get("is_safe", True))
+
     async def _analyze_prompt_content(
         self,
         content: str,
@@ -321,7 +554,7 @@ class AIDefenseAnalyzer(BaseAnalyzer):
             messages = [
                 {
                     "role": "user",
-                    "content": content[:10000],  # Limit content size
+                    "content": content[:PROMPT_CONTENT_LIMIT],  # Limit content size
                 }
             ]
             metadata = {
@@ -462,7 +695,10 @@ class AIDefenseAnalyzer(BaseAnalyzer):
             # Build request payload for code analysis using chat inspection
             # Code is analyzed as a message for potential security issues
             messages = [
-                {"role": "user", "content": f"# Code Analysis for {file_path}\n```{language}\n{content[:15000]}\n```"}
+                {
+                    "role": "user",
+                    "content": f"# Code Analysis for {file_path}\n```{language}\n{content[:CODE_CONTENT_LIMIT]}\n```",
+                }
             ]
             metadata = {
                 "source": "skill_scanner",
@@ -571,6 +807,9 @@ class AIDefenseAnalyzer(BaseAnalyzer):
 
         Handles fallback for pre-configured rules: if API returns 400 with
         "already has rules configured" error, retries without rules config.
+        Rate-limited (429) requests are retried after the server's Retry-After,
+        or with exponential backoff and jitter when it gives none. Only the
+        request itself holds a concurrency slot, not the wait before a retry.
 
         Args:
             endpoint: API endpoint path
@@ -588,7 +827,8 @@ class AIDefenseAnalyzer(BaseAnalyzer):
 
         for attempt in range(self.max_retries):
             try:
-                response = await client.post(url, json=payload)
+                async with self._get_semaphore():
+                    response = await client.post(url, json=payload)
 
                 if response.status_code == 200:
                     return response.json()
@@ -622,8 +862,11 @@ class AIDefenseAnalyzer(BaseAnalyzer):
                     return None
                 elif response.status_code == 429:
                     # Rate limited - wait and retry
-                    delay = (2**attempt) * 1.0
-                    print(f"AI Defense API rate limited, retrying in {delay}s...")
+                    if attempt == self.max_retries - 1:
+                        print(f"AI Defense API rate limited after {self.max_retries} attempts")
+                        return None
+                    delay = self._retry_delay(response, attempt)
+                    print(f"AI Defense API rate limited, retrying in {delay:.1f}s...")
                     await asyncio.sleep(delay)
                     continue
                 elif response.status_code == 401:
@@ -650,6 +893,33 @@ class AIDefenseAnalyzer(BaseAnalyzer):
 
         return None
 
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """
+        Seconds to wait before retrying a rate-limited request.
+
+        Args:
+            response: The 429 response
+            attempt: Zero-based number of the attempt that was rate limited
+
+        Returns:
+            The server's Retry-After (seconds or HTTP date, capped at
+            MAX_RETRY_AFTER_SECONDS), else 2**attempt seconds plus up to 50% jitter
+            so concurrent requests do not retry in lockstep
+        """
+        retry_after = response.headers.get("Retry-After")
+        if isinstance(retry_after, str) and retry_after.strip():
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(delay, 0.0), MAX_RETRY_AFTER_SECONDS)
+        return (2**attempt) * random.uniform(1.0, 1.5)
+
     def _convert_api_violation_to_finding(
         self,
         violation: dict[str, Any],
@@ -19,13 +19,29 @@ Base analyzer interface for skill security scanning.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any
 
 from ..models import Finding, Skill
 
 
+@dataclass
+class AnalysisOutput:
+    """Everything one analysis of a skill produced."""
+
+    findings: list[Finding]
+    # Binary files VirusTotal found clean; their BINARY_FILE_DETECTED findings are dropped
+    validated_binary_files: list[str] = field(default_factory=list)
+    # Parts of the skill analyzed with less than the full analysis (see ScanResult)
+    incomplete_analyses: list[dict[str, Any]] = field(default_factory=list)
+
+
 class BaseAnalyzer(ABC):
     """Abstract base class for all security analyzers."""
 
+    # Skills handed to run_batch at once by directory scans and batch jobs
+    batch_size = 1
+
     def __init__(self, name: str):
         """
         Initialize analyzer.
@@ -48,6 +64,42 @@ class BaseAnalyzer(ABC):
         """
         pass
 
+    def run(self, skill: Skill) -> AnalysisOutput:
+        """
+        Analyze a skill, returning its findings along with any other per-scan results.
+
+        The scanner calls this rather than analyze(). Analyzers that report more
+        than findings override it and keep those results in the return value,
+        so concurrent scans sharing one analyzer cannot see each other's.
+
+        Args:
+            skill: The skill to analyze
+
+        Returns:
+            AnalysisOutput for this skill
+        """
+        return AnalysisOutput(findings=self.analyze(skill))
+
+    def run_batch(self, skills: list[Skill]) -> list[AnalysisOutput]:
+        """
+        Analyze several skills, returning one AnalysisOutput per skill in the order given.
+
+        Directory scans and batch jobs hand each analyzer up to the largest
+        batch_size of the scanner's analyzers at a time. Analyzers that can share
+        work across skills (the LLM analyzer packs small skills into one request)
+        override this.
+
+        Args:
+            skills: The skills to analyze
+
+        Returns:
+            AnalysisOutput for each skill
+        """
+        return [self.run(skill) for skill in skills]
+
+    def close(self) -> None:  # noqa: B027 - optional hook, most analyzers hold nothing to release
+        """Release connections or threads held by the analyzer."""
+
     def get_name(self) -> str:
         """Get the analyzer name."""
         return self.name
@@ -24,6 +24,7 @@ Components:
 - AlignmentPromptBuilder: Constructs comprehensive prompts with evidence
 - AlignmentLLMClient: Handles LLM API interaction for verification
 - AlignmentResponseValidator: Validates and parses LLM responses
+- AlignmentRateLimiter: Token bucket shared by concurrent LLM requests
 - ThreatVulnerabilityClassifier: Classifies findings as threats or vulnerabilities
 
 All components use the 'alignment_' prefix to indicate they are part of
@@ -33,6 +34,7 @@ the semantic alignment verification layer.
 from .alignment_llm_client import AlignmentLLMClient
 from .alignment_orchestrator import AlignmentOrchestrator
 from .alignment_prompt_builder import AlignmentPromptBuilder
+from .alignment_rate_limiter import AlignmentRateLimiter
 from .alignment_response_validator import AlignmentResponseValidator
 from .threat_vulnerability_classifier import ThreatVulnerabilityClassifier
 
@@ -40,6 +42,7 @@ __all__ = [
     "AlignmentOrchestrator",
     "AlignmentPromptBuilder",
     "AlignmentLLMClient",
+    "AlignmentRateLimiter",
     "AlignmentResponseValidator",
     "ThreatVulnerabilityClassifier",
 ]
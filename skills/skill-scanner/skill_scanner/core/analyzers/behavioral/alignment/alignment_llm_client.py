@@ -30,6 +30,9 @@ import asyncio
 import logging
 import os
 
+from .....core.llm_cache import LLMResponseCache
+from .alignment_rate_limiter import AlignmentRateLimiter
+
 try:
     from litellm import acompletion
 
@@ -54,6 +57,13 @@ class AlignmentLLMClient:
     DEFAULT_RETRY_BASE_DELAY = 2
     PROMPT_LENGTH_THRESHOLD = 50000  # Warn if prompt exceeds this
 
+    SYSTEM_PROMPT = (
+        "You are a security expert analyzing agent skills. "
+        "You receive complete dataflow analysis and code context. "
+        "Analyze if the skill description accurately describes what the code actually does. "
+        "Respond ONLY with valid JSON. Do not include any markdown formatting or code blocks."
+    )
+
     def __init__(
         self,
         model: str = "gemini/gemini-2.0-flash",
@@ -63,6 +73,8 @@ class AlignmentLLMClient:
         temperature: float = 0.1,
         max_tokens: int = 4096,
         timeout: int = 120,
+        rate_limiter: AlignmentRateLimiter | None = None,
+        response_cache: LLMResponseCache | None = None,
     ):
         """Initialize the alignment LLM client.
 
@@ -74,6 +86,10 @@ class AlignmentLLMClient:
             temperature: Temperature for responses
             max_tokens: Max tokens for responses
             timeout: Request timeout in seconds
+            rate_limiter: Optional limiter shared with other clients; every
+                request attempt (including retries) waits for a token
+            response_cache: Optional LLM response cache; cached prompts skip
+                the rate limiter and the provider entirely
 
         Raises:
             ImportError: If litellm is not available
@@ -94,6 +110,8 @@ class AlignmentLLMClient:
         self._temperature = temperature
         self._max_tokens = max_tokens
         self._timeout = timeout
+        self._rate_limiter = rate_limiter
+        self._response_cache = response_cache
 
         self.logger = logging.getLogger(__name__)
         self.logger.debug(f"AlignmentLLMClient initialized with model: {self._model}")
@@ -155,13 +173,29 @@ class AlignmentLLMClient:
                 f"(threshold: {self.PROMPT_LENGTH_THRESHOLD}) - may be truncated by LLM"
             )
 
+        cache_key = None
+        if self._response_cache is not None:
+            cache_key = self._response_cache.make_key(
+                self._model,
+                self._messages(prompt),
+                schema=self._response_format(),
+                temperature=self._temperature,
+                max_tokens=self._max_tokens,
+            )
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # Retry logic with exponential backoff
         max_retries = self.DEFAULT_MAX_RETRIES
         base_delay = self.DEFAULT_RETRY_BASE_DELAY
 
         for attempt in range(max_retries):
             try:
-                return await self._make_llm_request(prompt)
+                response = await self._make_llm_request(prompt)
+                if cache_key is not None:
+                    self._response_cache.put(cache_key, response, model=self._model)
+                return response
             except Exception as e:
                 if attempt < max_retries - 1:
                     delay = base_delay * (2**attempt)
@@ -173,6 +207,20 @@ class AlignmentLLMClient:
                     self.logger.error(f"LLM request failed after {max_retries} attempts: {e}")
                     raise
 
+    def _messages(self, prompt: str) -> list[dict[str, str]]:
+        """Build the chat messages for an alignment prompt."""
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
+
+    def _response_format(self) -> dict[str, str] | None:
+        """Get the JSON response format, if the provider supports it."""
+        # Azure OpenAI with older API versions may not support JSON mode
+        if self._model.startswith("azure/"):
+            return None
+        return {"type": "json_object"}
+
     async def _make_llm_request(self, prompt: str) -> str:
         """Make a single LLM API request.
 
@@ -188,18 +236,7 @@ class AlignmentLLMClient:
         try:
             request_params = {
                 "model": self._model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a security expert analyzing agent skills. "
-                            "You receive complete dataflow analysis and code context. "
-                            "Analyze if the skill description accurately describes what the code actually does. "
-                            "Respond ONLY with valid JSON. Do not include any markdown formatting or code blocks."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+                "messages": self._messages(prompt),
                 "max_tokens": self._max_tokens,
                 "temperature": self._temperature,
                 "timeout": self._timeout,
@@ -210,9 +247,9 @@ class AlignmentLLMClient:
                 request_params["api_key"] = self._api_key
 
             # Only enable JSON mode for supported models/providers
-            # Azure OpenAI with older API versions may not support this
-            if not self._model.startswith("azure/"):
-                request_params["response_format"] = {"type": "json_object"}
+            response_format = self._response_format()
+            if response_format:
+                request_params["response_format"] = response_format
 
             # Add optional parameters if configured
             if self._base_url:
@@ -220,6 +257,9 @@ class AlignmentLLMClient:
             if self._api_version:
                 request_params["api_version"] = self._api_version
 
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+
             self.logger.debug(f"Sending alignment verification request to {self._model}")
             response = await acompletion(**request_params)
 
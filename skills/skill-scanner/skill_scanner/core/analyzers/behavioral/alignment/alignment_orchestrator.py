@@ -29,9 +29,11 @@ The orchestrator coordinates:
 import logging
 from typing import Any
 
+from .....core.llm_cache import LLMResponseCache
 from .....core.static_analysis.context_extractor import SkillFunctionContext
 from .alignment_llm_client import AlignmentLLMClient
 from .alignment_prompt_builder import AlignmentPromptBuilder
+from .alignment_rate_limiter import AlignmentRateLimiter
 from .alignment_response_validator import AlignmentResponseValidator
 from .threat_vulnerability_classifier import ThreatVulnerabilityClassifier
 
@@ -57,6 +59,8 @@ class AlignmentOrchestrator:
         llm_temperature: float = 0.1,
         llm_max_tokens: int = 4096,
         llm_timeout: int = 120,
+        rate_limiter: AlignmentRateLimiter | None = None,
+        response_cache: LLMResponseCache | None = None,
     ):
         """Initialize alignment orchestrator.
 
@@ -67,6 +71,9 @@ class AlignmentOrchestrator:
             llm_temperature: Temperature for LLM responses
             llm_max_tokens: Max tokens for LLM responses
             llm_timeout: Timeout for LLM requests in seconds
+            rate_limiter: Optional limiter shared by the alignment and
+                classification LLM clients
+            response_cache: Optional LLM response cache shared by both clients
 
         Raises:
             ValueError: If LLM API key is not provided
@@ -75,6 +82,7 @@ class AlignmentOrchestrator:
 
         # Initialize alignment verification components
         self.prompt_builder = AlignmentPromptBuilder()
+        self.rate_limiter = rate_limiter
         self.llm_client = AlignmentLLMClient(
             model=llm_model,
             api_key=llm_api_key,
@@ -82,12 +90,16 @@ class AlignmentOrchestrator:
             temperature=llm_temperature,
             max_tokens=llm_max_tokens,
             timeout=llm_timeout,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
         )
         self.response_validator = AlignmentResponseValidator()
         self.threat_vuln_classifier = ThreatVulnerabilityClassifier(
             model=llm_model,
             api_key=llm_api_key,
             base_url=llm_base_url,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
         )
 
         # Track analysis statistics
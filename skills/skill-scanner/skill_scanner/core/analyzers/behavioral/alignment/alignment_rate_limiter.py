@@ -0,0 +1,73 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Shared Rate Limiter for Alignment Verification Requests.
+
+Alignment checks for all functions of a skill are dispatched concurrently, so
+the LLM request rate is bounded here rather than by sequential round trips.
+One limiter is shared by every client of an orchestrator (alignment queries
+and threat/vulnerability classification), and may be shared across
+orchestrators, threads and event loops.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class AlignmentRateLimiter:
+    """Token bucket limiting how many LLM requests start per second.
+
+    Waiters reserve their start slot under a thread lock and then sleep on
+    their own event loop, so the limiter is not bound to any single loop.
+    """
+
+    def __init__(self, requests_per_second: float, burst: int | None = None):
+        """Initialize the rate limiter.
+
+        Args:
+            requests_per_second: Sustained request rate (must be positive)
+            burst: Requests allowed back to back before the rate applies
+                (defaults to one second's worth, at least 1)
+
+        Raises:
+            ValueError: If requests_per_second is not positive
+        """
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        self.requests_per_second = requests_per_second
+        self.burst = max(1, burst if burst is not None else int(requests_per_second))
+        self._interval = 1.0 / requests_per_second
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.requests_per_second)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self._interval
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
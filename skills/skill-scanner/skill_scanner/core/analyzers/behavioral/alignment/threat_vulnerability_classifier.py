@@ -29,7 +29,9 @@ import json
 import logging
 from typing import Any
 
+from .....core.llm_cache import LLMResponseCache
 from .alignment_llm_client import AlignmentLLMClient
+from .alignment_rate_limiter import AlignmentRateLimiter
 
 
 class ThreatVulnerabilityClassifier:
@@ -46,6 +48,8 @@ class ThreatVulnerabilityClassifier:
         model: str = "gemini/gemini-2.0-flash",
         api_key: str | None = None,
         base_url: str | None = None,
+        rate_limiter: AlignmentRateLimiter | None = None,
+        response_cache: LLMResponseCache | None = None,
     ):
         """Initialize the threat/vulnerability classifier.
 
@@ -53,12 +57,16 @@ class ThreatVulnerabilityClassifier:
             model: LLM model to use
             api_key: API key for the LLM provider
             base_url: Optional base URL for LLM API
+            rate_limiter: Optional limiter shared with the alignment client
+            response_cache: Optional LLM response cache
         """
         self.logger = logging.getLogger(__name__)
         self.llm_client = AlignmentLLMClient(
             model=model,
             api_key=api_key,
             base_url=base_url,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
         )
         self._classification_prompt_template = self._get_classification_prompt()
 
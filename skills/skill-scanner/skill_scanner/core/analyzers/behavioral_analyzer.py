@@ -29,12 +29,19 @@ Features:
 
 import asyncio
 import hashlib
+import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
+from ...core.llm_cache import LLMResponseCache
 from ...core.models import Finding, Severity, Skill, ThreatCategory
+from ...core.scan_cache import ScanCache
+from ...core.static_analysis.artifacts import ArtifactStore
+from ...core.static_analysis.budget import AnalysisBudget, BudgetExceeded, Deadline
 from ...core.static_analysis.context_extractor import (
     ContextExtractor,
     SkillFunctionContext,
@@ -42,10 +49,29 @@ from ...core.static_analysis.context_extractor import (
 )
 from ...core.static_analysis.interprocedural.call_graph_analyzer import CallGraphAnalyzer
 from ...core.static_analysis.interprocedural.cross_file_analyzer import CrossFileAnalyzer, CrossFileCorrelation
-from .base import BaseAnalyzer
+from .base import AnalysisOutput, BaseAnalyzer
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_ALIGNMENT_CONCURRENCY = 8
+
+# Bump when the layout of the cached per-script facts changes
+BEHAVIORAL_CACHE_VERSION = 2
+
+
+def _run_coroutine(coro):
+    """Run a coroutine to completion from synchronous code.
+
+    Uses a fresh event loop, or a worker thread when the caller is already
+    inside a running loop (where ``asyncio.run`` is not allowed).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
 
 class BehavioralAnalyzer(BaseAnalyzer):
     """
@@ -67,6 +93,11 @@ class BehavioralAnalyzer(BaseAnalyzer):
         use_alignment_verification: bool = False,
         llm_model: str | None = None,
         llm_api_key: str | None = None,
+        cache: ScanCache | None = None,
+        alignment_concurrency: int | None = None,
+        alignment_requests_per_second: float | None = None,
+        response_cache: LLMResponseCache | None = None,
+        budget: AnalysisBudget | None = None,
     ):
         """
         Initialize behavioral analyzer.
@@ -77,6 +108,16 @@ class BehavioralAnalyzer(BaseAnalyzer):
             use_alignment_verification: Enable LLM-powered alignment verification
             llm_model: LLM model for alignment verification (e.g., "gemini/gemini-2.0-flash")
             llm_api_key: API key for the LLM provider (or resolved from environment)
+            cache: Optional scan cache. When set, per-file context facts and findings
+                are reused for unchanged scripts; cross-file correlation is always
+                recomputed from those facts.
+            alignment_concurrency: Maximum alignment checks in flight at once
+                (default: SKILL_SCANNER_ALIGNMENT_CONCURRENCY or 8)
+            alignment_requests_per_second: Shared limit on alignment LLM requests;
+                0 or None disables it (default: SKILL_SCANNER_ALIGNMENT_RPS)
+            response_cache: Optional LLM response cache for alignment verification
+            budget: Per-file and per-skill analysis limits; a script over budget is
+                analyzed from parser indicators only (default: AnalysisBudget.from_env())
 
         Note:
             This analyzer currently only processes Python (.py) files.
@@ -94,21 +135,38 @@ class BehavioralAnalyzer(BaseAnalyzer):
         self.use_static_analysis = True  # Always enabled
         self.use_alignment_verification = use_alignment_verification
         self.context_extractor = ContextExtractor()  # Always initialized
+        self.cache = cache
+        self.response_cache = response_cache
+        self.budget = budget if budget is not None else AnalysisBudget.from_env()
+        self._cache_fingerprint: str | None = None
 
         # Alignment verification (LLM-powered)
+        if alignment_concurrency is None:
+            alignment_concurrency = int(
+                os.environ.get("SKILL_SCANNER_ALIGNMENT_CONCURRENCY", DEFAULT_ALIGNMENT_CONCURRENCY)
+            )
+        if alignment_requests_per_second is None:
+            alignment_requests_per_second = float(os.environ.get("SKILL_SCANNER_ALIGNMENT_RPS", 0))
+        self.alignment_concurrency = max(1, alignment_concurrency)
+        self.alignment_requests_per_second = alignment_requests_per_second
         self.alignment_orchestrator = None
         if use_alignment_verification:
             try:
-                from .behavioral.alignment import AlignmentOrchestrator
+                from .behavioral.alignment import AlignmentOrchestrator, AlignmentRateLimiter
 
                 # Resolve LLM configuration - use SKILL_SCANNER_LLM_* variables
                 model = llm_model or os.environ.get("SKILL_SCANNER_LLM_MODEL", "gemini/gemini-2.0-flash")
                 api_key = llm_api_key or os.environ.get("SKILL_SCANNER_LLM_API_KEY")
 
                 if api_key:
+                    rate_limiter = None
+                    if alignment_requests_per_second and alignment_requests_per_second > 0:
+                        rate_limiter = AlignmentRateLimiter(alignment_requests_per_second)
                     self.alignment_orchestrator = AlignmentOrchestrator(
                         llm_model=model,
                         llm_api_key=api_key,
+                        rate_limiter=rate_limiter,
+                        response_cache=response_cache,
                     )
                     logger.info("Alignment verification enabled with %s", model)
                 else:
@@ -129,19 +187,41 @@ class BehavioralAnalyzer(BaseAnalyzer):
         Returns:
             List of behavioral findings
         """
-        return self._analyze_static(skill)
+        return self.run(skill).findings
+
+    def run(self, skill: Skill) -> AnalysisOutput:
+        """
+        Analyze skill, also reporting scripts whose analysis was cut short by a budget.
 
-    def _analyze_static(self, skill: Skill) -> list[Finding]:
+        Args:
+            skill: Skill to analyze
+
+        Returns:
+            AnalysisOutput with findings and incomplete analyses
+        """
+        incomplete: list[dict[str, Any]] = []
+        findings = self._analyze_static(skill, incomplete)
+        return AnalysisOutput(findings=findings, incomplete_analyses=incomplete)
+
+    def _analyze_static(self, skill: Skill, incomplete: list[dict[str, Any]]) -> list[Finding]:
         """Analyze skill using static dataflow analysis with cross-file correlation."""
         findings = []
         cross_file = CrossFileAnalyzer()
         call_graph_analyzer = CallGraphAnalyzer()
+        # Each script is parsed once and shared by the call graph, context and alignment passes
+        artifact_store = ArtifactStore()
 
         # Get skill description for alignment verification
         skill_description = None
         if skill.manifest:
             skill_description = skill.manifest.description
 
+        # Scripts whose functions get alignment verification, checked together after the first pass
+        alignment_scripts: list[tuple[Path, str, str]] = []
+        # Script path -> relative path, for naming files in interprocedural correlations
+        file_names: dict[str, str] = {}
+        skill_deadline = self.budget.skill_deadline()
+
         # First pass: Extract context from each Python script
         for script_file in skill.get_scripts():
             if script_file.file_type != "python":
@@ -151,12 +231,39 @@ class BehavioralAnalyzer(BaseAnalyzer):
             if not content:
                 continue
 
-            # Add to call graph analyzer
-            call_graph_analyzer.add_file(script_file.path, content)
+            artifacts = artifact_store.get(content)
+
+            # Every script joins the call graph, so interprocedural summaries see cached files too
+            call_graph_analyzer.add_file(script_file.path, content, tree=artifacts.tree)
+            file_names[str(script_file.path)] = script_file.relative_path
 
-            # Extract security context
+            # Reuse facts for unchanged files when a scan cache is configured
+            context = self._get_cached_file_analysis(script_file.relative_path, str(script_file.path), content)
+            if context is not None:
+                cross_file.add_file_context(script_file.relative_path, context)
+                findings.extend(self._generate_findings_from_context(context, skill))
+                if context.dataflow_truncated:
+                    self._record_incomplete(incomplete, script_file.relative_path, "iteration_cap", "partial_dataflow")
+                if self.alignment_orchestrator:
+                    alignment_scripts.append((script_file.path, script_file.relative_path, content))
+                continue
+
+            # Extract security context, falling back to parser indicators when over budget
             try:
-                context = self.context_extractor.extract_context(script_file.path, content)
+                degraded = False
+                try:
+                    skill_deadline.check("behavioral analysis")
+                    self.budget.check_script(artifacts)
+                    context = self.context_extractor.extract_context(
+                        script_file.path, content, artifacts, deadline=self.budget.file_deadline(skill_deadline)
+                    )
+                except BudgetExceeded as e:
+                    logger.info("Analyzing %s from indicators only: %s", script_file.relative_path, e)
+                    self._record_incomplete(incomplete, script_file.relative_path, e.limit, "indicators", e.detail)
+                    context = self.context_extractor.extract_indicator_context(script_file.path, content, artifacts)
+                    degraded = True
+                if context.dataflow_truncated:
+                    self._record_incomplete(incomplete, script_file.relative_path, "iteration_cap", "partial_dataflow")
 
                 # Add to cross-file analyzer
                 cross_file.add_file_context(script_file.relative_path, context)
@@ -164,17 +271,36 @@ class BehavioralAnalyzer(BaseAnalyzer):
                 # Generate findings from individual file context
                 script_findings = self._generate_findings_from_context(context, skill)
                 findings.extend(script_findings)
+                if degraded:
+                    # A later scan with more budget should redo the full analysis
+                    continue
+                self._cache_file_analysis(script_file.relative_path, content, context)
 
-                # Alignment verification (LLM-powered)
                 if self.alignment_orchestrator:
-                    alignment_findings = self._run_alignment_verification(script_file.path, content, skill_description)
-                    findings.extend(alignment_findings)
+                    alignment_scripts.append((script_file.path, script_file.relative_path, content))
 
             except Exception as e:
                 logger.warning("Failed to analyze %s: %s", script_file.relative_path, e)
 
-        # Build call graph for cross-file analysis
+        # Alignment verification (LLM-powered), all functions of the skill at once
+        if alignment_scripts:
+            findings.extend(
+                self._run_alignment_verification(
+                    alignment_scripts, skill_description, artifact_store, skill_deadline, incomplete
+                )
+            )
+
+        # Build call graph and bottom-up function summaries for cross-file analysis
         call_graph_analyzer.build_call_graph()
+        try:
+            cross_file.add_function_summaries(
+                call_graph_analyzer.compute_function_summaries(deadline=skill_deadline), file_names
+            )
+        except BudgetExceeded as e:
+            logger.info("Skipping interprocedural function summaries: %s", e)
+            self._record_incomplete(incomplete, None, e.limit, "no_interprocedural", e.detail)
+        except Exception as e:
+            logger.warning("Interprocedural function summaries failed: %s", e)
 
         # Second pass: Analyze cross-file correlations
         correlations = cross_file.analyze_correlations()
@@ -183,53 +309,170 @@ class BehavioralAnalyzer(BaseAnalyzer):
 
         return findings
 
+    def _record_incomplete(
+        self, incomplete: list[dict[str, Any]], file: str | None, limit: str, fallback: str, detail: str = ""
+    ) -> None:
+        """Note that part of the skill was analyzed with less than the full analysis.
+
+        Args:
+            incomplete: Incomplete analyses of the current scan
+            file: Relative path of the script, or None for skill-wide passes
+            limit: Budget that was hit ("file_seconds", "skill_seconds", "ast_nodes",
+                "cfg_nodes" or "iteration_cap")
+            fallback: What was done instead ("indicators", "partial_dataflow",
+                "no_alignment" or "no_interprocedural")
+            detail: Human-readable description of the overrun
+        """
+        incomplete.append({"analyzer": self.name, "file": file, "limit": limit, "fallback": fallback, "detail": detail})
+
+    @property
+    def cache_fingerprint(self) -> str:
+        """
+        Fingerprint of everything that affects the cached per-script facts.
+
+        Covers the analyzer, the layout of the cached facts and the analysis
+        budget, whose limits decide when dataflow is cut short.
+        """
+        if self._cache_fingerprint is None:
+            settings = {"analyzer": self.name, "facts": BEHAVIORAL_CACHE_VERSION, "budget": asdict(self.budget)}
+            self._cache_fingerprint = hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()
+        return self._cache_fingerprint
+
+    def _get_cached_file_analysis(self, relative_path: str, file_path: str, content: str) -> SkillScriptContext | None:
+        """
+        Look up cached context facts for an unchanged script.
+
+        Entries are keyed on the script's path within the skill, so a checkout in
+        another directory still hits; the facts are placed at the script's
+        current path, from which its findings are regenerated.
+        """
+        if self.cache is None:
+            return None
+
+        cached = self.cache.get("behavioral:script", self.cache_fingerprint, relative_path, content)
+        if cached is None:
+            return None
+
+        facts = cached["facts"]
+        return SkillScriptContext(
+            file_path=file_path,
+            functions=[],
+            imports=facts["imports"],
+            has_network=facts["has_network"],
+            has_file_ops=facts["has_file_ops"],
+            has_subprocess=facts["has_subprocess"],
+            has_eval_exec=facts["has_eval_exec"],
+            has_credential_access=facts["has_credential_access"],
+            has_env_var_access=facts["has_env_var_access"],
+            all_function_calls=facts["all_function_calls"],
+            suspicious_urls=facts["suspicious_urls"],
+            dataflow_truncated=facts.get("dataflow_truncated", False),
+        )
+
+    def _cache_file_analysis(self, relative_path: str, content: str, context: SkillScriptContext) -> None:
+        """Store the facts per-file findings and cross-file correlation are built from."""
+        if self.cache is None:
+            return
+
+        facts = {
+            "imports": context.imports,
+            "has_network": context.has_network,
+            "has_file_ops": context.has_file_ops,
+            "has_subprocess": context.has_subprocess,
+            "has_eval_exec": context.has_eval_exec,
+            "has_credential_access": context.has_credential_access,
+            "has_env_var_access": context.has_env_var_access,
+            "all_function_calls": context.all_function_calls,
+            "suspicious_urls": context.suspicious_urls,
+            "dataflow_truncated": context.dataflow_truncated,
+        }
+        self.cache.put("behavioral:script", self.cache_fingerprint, relative_path, content, {"facts": facts})
+
     def _run_alignment_verification(
         self,
-        file_path: Path,
-        source_code: str,
+        scripts: list[tuple[Path, str, str]],
         skill_description: str | None,
+        artifact_store: ArtifactStore | None = None,
+        skill_deadline: Deadline | None = None,
+        incomplete: list[dict[str, Any]] | None = None,
     ) -> list[Finding]:
-        """Run LLM-powered alignment verification on a file.
+        """Run LLM-powered alignment verification on every function of a skill.
+
+        All function contexts are checked concurrently, bounded by
+        ``alignment_concurrency`` and the orchestrator's shared rate limiter.
+        Findings follow script order, then function order within a script.
 
         Args:
-            file_path: Path to the script file
-            source_code: Python source code
+            scripts: (path, path within the skill, source code) of each Python script to verify
             skill_description: Overall skill description from SKILL.md
+            artifact_store: Parse results already built for these scripts during this scan
+            skill_deadline: Remaining wall-clock budget of the skill; scripts whose
+                function contexts cannot be extracted in time are not verified
+            incomplete: Incomplete analyses of the current scan, noting those scripts
 
         Returns:
             List of findings from alignment verification
         """
         findings = []
+        if incomplete is None:
+            incomplete = []
 
         if not self.alignment_orchestrator:
             return findings
 
-        try:
-            # Extract function contexts for alignment verification
-            function_contexts = self.context_extractor.extract_function_contexts(file_path, source_code)
-
-            # Run alignment verification on each function
-            for func_context in function_contexts:
-                try:
-                    # Run async alignment check
-                    result = asyncio.get_event_loop().run_until_complete(
-                        self.alignment_orchestrator.check_alignment(func_context, skill_description)
-                    )
+        if artifact_store is None:
+            artifact_store = ArtifactStore()
 
-                    if result:
-                        analysis, ctx = result
-                        finding = self._create_alignment_finding(analysis, ctx, str(file_path))
-                        if finding:
-                            findings.append(finding)
+        targets: list[tuple[str, SkillFunctionContext]] = []
+        for file_path, relative_path, source_code in scripts:
+            try:
+                function_contexts = self.context_extractor.extract_function_contexts(
+                    file_path, source_code, artifact_store.get(source_code), self.budget.file_deadline(skill_deadline)
+                )
+            except BudgetExceeded as e:
+                logger.info("Skipping alignment verification for %s: %s", relative_path, e)
+                self._record_incomplete(incomplete, relative_path, e.limit, "no_alignment", e.detail)
+                continue
+            except Exception as e:
+                logger.warning("Alignment verification failed for %s: %s", relative_path, e)
+                continue
+            targets.extend((relative_path, func_context) for func_context in function_contexts)
 
-                except Exception as e:
-                    logger.warning("Alignment check failed for %s: %s", func_context.name, e)
+        if not targets:
+            return findings
 
+        try:
+            results = _run_coroutine(self._check_alignment_all(targets, skill_description))
         except Exception as e:
-            logger.warning("Alignment verification failed for %s: %s", file_path, e)
+            logger.warning("Alignment verification failed: %s", e)
+            return findings
+
+        for (file_path, func_context), result in zip(targets, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning("Alignment check failed for %s: %s", func_context.name, result)
+                continue
+            if result:
+                analysis, ctx = result
+                finding = self._create_alignment_finding(analysis, ctx, file_path)
+                if finding:
+                    findings.append(finding)
 
         return findings
 
+    async def _check_alignment_all(
+        self,
+        targets: list[tuple[str, SkillFunctionContext]],
+        skill_description: str | None,
+    ) -> list[Any]:
+        """Check all function contexts concurrently; results (or exceptions) keep input order."""
+        semaphore = asyncio.Semaphore(self.alignment_concurrency)
+
+        async def check(func_context: SkillFunctionContext) -> Any:
+            async with semaphore:
+                return await self.alignment_orchestrator.check_alignment(func_context, skill_description)
+
+        return await asyncio.gather(*(check(func_context) for _, func_context in targets), return_exceptions=True)
+
     def _create_alignment_finding(
         self,
         analysis: dict[str, Any],
@@ -241,7 +484,7 @@ class BehavioralAnalyzer(BaseAnalyzer):
         Args:
             analysis: Analysis dict from LLM
             func_context: Function context that was analyzed
-            file_path: Path to the source file
+            file_path: Path of the source file within the skill
 
         Returns:
             Finding object or None if invalid
@@ -426,6 +669,7 @@ class BehavioralAnalyzer(BaseAnalyzer):
                 "exfiltration_chain": ThreatCategory.DATA_EXFILTRATION,
                 "credential_network_separation": ThreatCategory.DATA_EXFILTRATION,
                 "env_var_exfiltration": ThreatCategory.DATA_EXFILTRATION,
+                "interprocedural_exfiltration": ThreatCategory.DATA_EXFILTRATION,
             }
             category = category_map.get(correlation.threat_type, ThreatCategory.POLICY_VIOLATION)
 
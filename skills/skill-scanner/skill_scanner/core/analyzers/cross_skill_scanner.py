@@ -22,13 +22,192 @@ to perform malicious activities, such as:
 - Data relay patterns (one skill collects data, another exfiltrates)
 - Shared external URLs across skills
 - Complementary trigger descriptions
+
+Each skill's content is read and pattern-matched once, into a SkillFeatures
+record. Detectors then group skills through inverted indexes (domain to
+skills, pattern to skills, description word to skills), so the work grows
+with the number of skills and shared facts rather than with every pair.
 """
 
+import hashlib
 import re
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
 
 from ..models import Finding, Severity, Skill, ThreatCategory
 from .base import BaseAnalyzer
 
+# Patterns that indicate data collection
+COLLECTION_PATTERNS = [
+    r"credential",
+    r"password",
+    r"secret",
+    r"api[_-]?key",
+    r"token",
+    r"\.env",
+    r"config",
+    r"ssh",
+    r"private",
+    r"\.pem",
+    r"~/.ssh",
+    r"/etc/passwd",
+    r"/etc/shadow",
+    r"keychain",
+    r"wallet",
+    r"cookie",
+]
+
+# Patterns that indicate network exfiltration
+EXFIL_PATTERNS = [
+    r"requests\.(post|put)",
+    r"urllib\.request",
+    r"httpx\.(post|put)",
+    r"socket\.send",
+    r"aiohttp.*post",
+    r"webhook",
+    r"discord\.com/api/webhooks",
+    r"ngrok",
+    r"localhost\.run",
+]
+
+# Description keywords that suggest data collection
+COLLECTION_KEYWORDS = frozenset(
+    {
+        "gather",
+        "collect",
+        "read",
+        "scan",
+        "find",
+        "search",
+        "extract",
+        "parse",
+        "load",
+        "get",
+        "fetch",
+        "retrieve",
+    }
+)
+
+# Description keywords that suggest data sending
+SENDING_KEYWORDS = frozenset(
+    {
+        "send",
+        "upload",
+        "post",
+        "submit",
+        "transfer",
+        "sync",
+        "backup",
+        "export",
+        "share",
+        "publish",
+        "notify",
+    }
+)
+
+# Words that never count as shared context between a collector and a sender
+CONTEXT_EXCLUDE_WORDS = (
+    COLLECTION_KEYWORDS
+    | SENDING_KEYWORDS
+    | {
+        "the",
+        "a",
+        "an",
+        "is",
+        "are",
+        "to",
+        "for",
+        "and",
+        "or",
+        "in",
+        "with",
+    }
+)
+
+# Suspicious code patterns, with the names they are reported under
+SUSPICIOUS_PATTERNS = [
+    (r"base64\.b64decode", "base64_decode"),
+    (r"exec\s*\(", "exec_call"),
+    (r"eval\s*\(", "eval_call"),
+    (r"\\x[0-9a-fA-F]{2}", "hex_escape"),
+    (r"chr\([0-9]+\)", "chr_call"),
+    (r"getattr\s*\([^)]+,\s*['\"][^'\"]+['\"]\s*\)", "dynamic_getattr"),
+]
+
+# Common/trusted domains; their subdomains are trusted too
+COMMON_DOMAINS = frozenset(
+    {
+        # Code hosting / package registries
+        "github.com",
+        "githubusercontent.com",
+        "gitlab.com",
+        "pypi.org",
+        "npmjs.com",
+        "python.org",
+        "crates.io",
+        "rubygems.org",
+        "packagist.org",
+        # AI providers
+        "anthropic.com",
+        "openai.com",
+        "claude.com",
+        # Cloud providers
+        "google.com",
+        "googleapis.com",
+        "microsoft.com",
+        "azure.com",
+        "amazon.com",
+        "amazonaws.com",
+        "aws.amazon.com",
+        # Documentation / references
+        "stackoverflow.com",
+        "docs.python.org",
+        "developer.mozilla.org",
+        "mdn.io",
+        # Standards organizations & licensing
+        "apache.org",
+        "www.apache.org",  # Apache license
+        "opensource.org",  # OSI licenses
+        "creativecommons.org",  # CC licenses
+        "w3.org",
+        "www.w3.org",  # W3C standards
+        "ietf.org",  # IETF standards
+        # XML/Document standards (used by Office docs)
+        "schemas.openxmlformats.org",
+        "schemas.microsoft.com",
+        "purl.org",  # Persistent URLs for standards
+        "dublincore.org",  # Metadata standard
+        "xmlsoft.org",  # libxml
+        # CDNs (common for web templates)
+        "cdnjs.cloudflare.com",
+        "cdn.jsdelivr.net",
+        "unpkg.com",
+        "ajax.googleapis.com",
+    }
+)
+
+_COLLECTION_RE = re.compile("|".join(f"(?:{p})" for p in COLLECTION_PATTERNS), re.IGNORECASE)
+_EXFIL_RE = re.compile("|".join(f"(?:{p})" for p in EXFIL_PATTERNS), re.IGNORECASE)
+_SUSPICIOUS_RES = [(re.compile(pattern), name) for pattern, name in SUSPICIOUS_PATTERNS]
+_URL_RE = re.compile(r'https?://[^\s<>"\')\]]+[^\s<>"\')\]\.,]')
+_DOMAIN_RE = re.compile(r"https?://([^/]+)")
+_WORD_RE = re.compile(r"\b[a-z]+\b")
+
+
+@dataclass(frozen=True)
+class SkillFeatures:
+    """Facts about one skill that the cross-skill detectors compare."""
+
+    name: str
+    reads_sensitive_data: bool  # Content matches a COLLECTION_PATTERNS entry
+    sends_to_network: bool  # Content matches an EXFIL_PATTERNS entry
+    domains: tuple[str, ...]  # Uncommon external domains, in order of first appearance
+    suspicious_patterns: tuple[str, ...]  # Names of matching SUSPICIOUS_PATTERNS, in list order
+    describes_collection: bool  # Description uses a COLLECTION_KEYWORDS word
+    describes_sending: bool  # Description uses a SENDING_KEYWORDS word
+    context_words: frozenset[str]  # Description words outside CONTEXT_EXCLUDE_WORDS
+
 
 class CrossSkillScanner(BaseAnalyzer):
     """
@@ -43,6 +222,7 @@ class CrossSkillScanner(BaseAnalyzer):
         """Initialize cross-skill scanner."""
         super().__init__("cross_skill_scanner")
         self._skills: list[Skill] = []
+        self._features: list[SkillFeatures] = []
 
     def analyze(self, skill: Skill) -> list[Finding]:
         """
@@ -67,6 +247,7 @@ class CrossSkillScanner(BaseAnalyzer):
             return []
 
         self._skills = skills
+        self._features = [self._extract_features(skill) for skill in skills]
         findings = []
 
         # Detection 1: Data relay patterns
@@ -91,72 +272,16 @@ class CrossSkillScanner(BaseAnalyzer):
         """
         findings = []
 
-        # Categorize skills by behavior
-        collectors: list[tuple[Skill, set[str]]] = []  # Skills that read sensitive data
-        exfiltrators: list[tuple[Skill, set[str]]] = []  # Skills with network output
-
-        # Patterns that indicate data collection
-        COLLECTION_PATTERNS = [
-            r"credential",
-            r"password",
-            r"secret",
-            r"api[_-]?key",
-            r"token",
-            r"\.env",
-            r"config",
-            r"ssh",
-            r"private",
-            r"\.pem",
-            r"~/.ssh",
-            r"/etc/passwd",
-            r"/etc/shadow",
-            r"keychain",
-            r"wallet",
-            r"cookie",
-        ]
-
-        # Patterns that indicate network exfiltration
-        EXFIL_PATTERNS = [
-            r"requests\.(post|put)",
-            r"urllib\.request",
-            r"httpx\.(post|put)",
-            r"socket\.send",
-            r"aiohttp.*post",
-            r"webhook",
-            r"discord\.com/api/webhooks",
-            r"ngrok",
-            r"localhost\.run",
-        ]
-
-        for skill in self._skills:
-            skill_content = self._get_skill_content(skill)
-
-            # Check for collection patterns
-            collection_hits = set()
-            for pattern in COLLECTION_PATTERNS:
-                if re.search(pattern, skill_content, re.IGNORECASE):
-                    collection_hits.add(pattern)
-            if collection_hits:
-                collectors.append((skill, collection_hits))
-
-            # Check for exfiltration patterns
-            exfil_hits = set()
-            for pattern in EXFIL_PATTERNS:
-                if re.search(pattern, skill_content, re.IGNORECASE):
-                    exfil_hits.add(pattern)
-            if exfil_hits:
-                exfiltrators.append((skill, exfil_hits))
+        collector_names = [f.name for f in self._features if f.reads_sensitive_data]
+        exfil_names = [f.name for f in self._features if f.sends_to_network]
 
         # Flag if we have both collectors and exfiltrators
-        if collectors and exfiltrators:
-            collector_names = [s.name for s, _ in collectors]
-            exfil_names = [s.name for s, _ in exfiltrators]
-
+        if collector_names and exfil_names:
             # Only flag if they are different skills
             if set(collector_names) != set(exfil_names):
                 findings.append(
                     Finding(
-                        id=f"CROSS_SKILL_RELAY_{hash(tuple(collector_names + exfil_names)) & 0xFFFFFFFF:08x}",
+                        id=self._generate_finding_id("CROSS_SKILL_RELAY", ",".join(collector_names + exfil_names)),
                         rule_id="CROSS_SKILL_DATA_RELAY",
                         category=ThreatCategory.DATA_EXFILTRATION,
                         severity=Severity.HIGH,
@@ -191,28 +316,19 @@ class CrossSkillScanner(BaseAnalyzer):
         """
         findings = []
 
-        # Extract URLs from each skill
-        skill_urls: dict[str, list[str]] = {}  # URL -> list of skill names
-
-        for skill in self._skills:
-            content = self._get_skill_content(skill)
-            urls = self._extract_urls(content)
-
-            for url in urls:
-                # Normalize URL (remove path, keep domain)
-                domain = self._extract_domain(url)
-                if domain and not self._is_common_domain(domain):
-                    if domain not in skill_urls:
-                        skill_urls[domain] = []
-                    if skill.name not in skill_urls[domain]:
-                        skill_urls[domain].append(skill.name)
+        # Domain -> names of the skills referencing it (a dict keeps first-seen order)
+        skill_urls: dict[str, dict[str, None]] = defaultdict(dict)
+        for features in self._features:
+            for domain in features.domains:
+                skill_urls[domain][features.name] = None
 
         # Flag domains referenced by multiple skills
-        for domain, skill_names in skill_urls.items():
+        for domain, names in skill_urls.items():
+            skill_names = list(names)
             if len(skill_names) >= 2:
                 findings.append(
                     Finding(
-                        id=f"CROSS_SKILL_URL_{hash(domain) & 0xFFFFFFFF:08x}",
+                        id=self._generate_finding_id("CROSS_SKILL_URL", domain),
                         rule_id="CROSS_SKILL_SHARED_URL",
                         category=ThreatCategory.DATA_EXFILTRATION,
                         severity=Severity.MEDIUM,
@@ -246,102 +362,47 @@ class CrossSkillScanner(BaseAnalyzer):
         """
         findings = []
 
-        # Keywords that suggest data collection
-        COLLECTION_KEYWORDS = {
-            "gather",
-            "collect",
-            "read",
-            "scan",
-            "find",
-            "search",
-            "extract",
-            "parse",
-            "load",
-            "get",
-            "fetch",
-            "retrieve",
-        }
-
-        # Keywords that suggest data sending
-        SENDING_KEYWORDS = {
-            "send",
-            "upload",
-            "post",
-            "submit",
-            "transfer",
-            "sync",
-            "backup",
-            "export",
-            "share",
-            "publish",
-            "notify",
-        }
-
-        collectors = []
-        senders = []
-
-        for skill in self._skills:
-            desc_lower = skill.description.lower()
-            desc_words = set(re.findall(r"\b[a-z]+\b", desc_lower))
-
-            if desc_words & COLLECTION_KEYWORDS:
-                collectors.append(skill)
-            if desc_words & SENDING_KEYWORDS:
-                senders.append(skill)
-
-        # Flag if we have complementary skills
-        if collectors and senders:
-            # Check for suspicious combinations
-            for collector in collectors:
-                for sender in senders:
-                    if collector.name != sender.name:
-                        # Check if they might work together
-                        coll_words = set(re.findall(r"\b[a-z]+\b", collector.description.lower()))
-                        send_words = set(re.findall(r"\b[a-z]+\b", sender.description.lower()))
-
-                        # Look for shared context words (excluding stop words and action words)
-                        EXCLUDE_WORDS = (
-                            COLLECTION_KEYWORDS
-                            | SENDING_KEYWORDS
-                            | {
-                                "the",
-                                "a",
-                                "an",
-                                "is",
-                                "are",
-                                "to",
-                                "for",
-                                "and",
-                                "or",
-                                "in",
-                                "with",
-                            }
-                        )
-                        shared_context = (coll_words & send_words) - EXCLUDE_WORDS
-
-                        if len(shared_context) >= 2:
-                            findings.append(
-                                Finding(
-                                    id=f"CROSS_SKILL_COMPLEMENTARY_{hash(collector.name + sender.name) & 0xFFFFFFFF:08x}",
-                                    rule_id="CROSS_SKILL_COMPLEMENTARY_TRIGGERS",
-                                    category=ThreatCategory.SOCIAL_ENGINEERING,
-                                    severity=Severity.LOW,
-                                    title="Skills have complementary descriptions",
-                                    description=(
-                                        f"Skill '{collector.name}' (collector) and '{sender.name}' (sender) "
-                                        f"have complementary descriptions with shared context: {', '.join(shared_context)}. "
-                                        f"This may be intentional design or could indicate coordinated behavior."
-                                    ),
-                                    file_path="(cross-skill analysis)",
-                                    remediation="Review these skills to ensure they are not designed to work together maliciously",
-                                    analyzer="cross_skill",
-                                    metadata={
-                                        "collector": collector.name,
-                                        "sender": sender.name,
-                                        "shared_context": list(shared_context),
-                                    },
-                                )
-                            )
+        collectors = [f for f in self._features if f.describes_collection]
+        senders = [f for f in self._features if f.describes_sending]
+
+        # Context word -> positions of the senders whose descriptions use it
+        senders_by_word: dict[str, list[int]] = defaultdict(list)
+        for position, sender in enumerate(senders):
+            for word in sender.context_words:
+                senders_by_word[word].append(position)
+
+        for collector in collectors:
+            # Only senders sharing at least two context words can be flagged
+            shared_counts = Counter(
+                position for word in collector.context_words for position in senders_by_word.get(word, ())
+            )
+            for position in sorted(p for p, count in shared_counts.items() if count >= 2):
+                sender = senders[position]
+                if collector.name == sender.name:
+                    continue
+                shared_context = collector.context_words & sender.context_words
+                findings.append(
+                    Finding(
+                        id=self._generate_finding_id("CROSS_SKILL_COMPLEMENTARY", collector.name + sender.name),
+                        rule_id="CROSS_SKILL_COMPLEMENTARY_TRIGGERS",
+                        category=ThreatCategory.SOCIAL_ENGINEERING,
+                        severity=Severity.LOW,
+                        title="Skills have complementary descriptions",
+                        description=(
+                            f"Skill '{collector.name}' (collector) and '{sender.name}' (sender) "
+                            f"have complementary descriptions with shared context: {', '.join(shared_context)}. "
+                            f"This may be intentional design or could indicate coordinated behavior."
+                        ),
+                        file_path="(cross-skill analysis)",
+                        remediation="Review these skills to ensure they are not designed to work together maliciously",
+                        analyzer="cross_skill",
+                        metadata={
+                            "collector": collector.name,
+                            "sender": sender.name,
+                            "shared_context": list(shared_context),
+                        },
+                    )
+                )
 
         return findings
 
@@ -354,34 +415,19 @@ class CrossSkillScanner(BaseAnalyzer):
         """
         findings = []
 
-        # Extract suspicious patterns from each skill
-        SUSPICIOUS_PATTERNS = [
-            (r"base64\.b64decode", "base64_decode"),
-            (r"exec\s*\(", "exec_call"),
-            (r"eval\s*\(", "eval_call"),
-            (r"\\x[0-9a-fA-F]{2}", "hex_escape"),
-            (r"chr\([0-9]+\)", "chr_call"),
-            (r"getattr\s*\([^)]+,\s*['\"][^'\"]+['\"]\s*\)", "dynamic_getattr"),
-        ]
-
-        skill_patterns: dict[str, list[str]] = {}  # pattern -> list of skill names
-
-        for skill in self._skills:
-            content = self._get_skill_content(skill)
-
-            for pattern, name in SUSPICIOUS_PATTERNS:
-                if re.search(pattern, content):
-                    if name not in skill_patterns:
-                        skill_patterns[name] = []
-                    if skill.name not in skill_patterns[name]:
-                        skill_patterns[name].append(skill.name)
+        # Pattern name -> names of the skills containing it (a dict keeps first-seen order)
+        skill_patterns: dict[str, dict[str, None]] = defaultdict(dict)
+        for features in self._features:
+            for name in features.suspicious_patterns:
+                skill_patterns[name][features.name] = None
 
         # Flag patterns shared by multiple skills
-        for pattern_name, skill_names in skill_patterns.items():
+        for pattern_name, names in skill_patterns.items():
+            skill_names = list(names)
             if len(skill_names) >= 2:
                 findings.append(
                     Finding(
-                        id=f"CROSS_SKILL_PATTERN_{hash(pattern_name + str(skill_names)) & 0xFFFFFFFF:08x}",
+                        id=self._generate_finding_id("CROSS_SKILL_PATTERN", pattern_name + str(skill_names)),
                         rule_id="CROSS_SKILL_SHARED_PATTERN",
                         category=ThreatCategory.OBFUSCATION,
                         severity=Severity.MEDIUM,
@@ -406,85 +452,77 @@ class CrossSkillScanner(BaseAnalyzer):
 
         return findings
 
-    def _get_skill_content(self, skill: Skill) -> str:
-        """Get all content from a skill as a single string."""
-        content_parts = [skill.description, skill.instruction_body]
+    def _generate_finding_id(self, prefix: str, context: str) -> str:
+        """Generate a finding ID that is the same in every process (built-in hash() is salted per process)."""
+        return f"{prefix}_{hashlib.sha256(context.encode()).hexdigest()[:8]}"
+
+    def _extract_features(self, skill: Skill) -> SkillFeatures:
+        """
+        Read a skill's content once and record what the detectors compare.
+
+        The description, instructions and each file are matched separately,
+        so no combined copy of the skill's content is built.
+
+        Args:
+            skill: Skill to summarize
+
+        Returns:
+            SkillFeatures for the skill
+        """
+        reads_sensitive_data = False
+        sends_to_network = False
+        domains: dict[str, None] = {}
+        suspicious: set[str] = set()
+
+        for text in self._iter_skill_text(skill):
+            reads_sensitive_data = reads_sensitive_data or _COLLECTION_RE.search(text) is not None
+            sends_to_network = sends_to_network or _EXFIL_RE.search(text) is not None
+            for url in self._extract_urls(text):
+                domain = self._extract_domain(url)
+                if domain and domain not in domains and not self._is_common_domain(domain):
+                    domains[domain] = None
+            for pattern, name in _SUSPICIOUS_RES:
+                if name not in suspicious and pattern.search(text):
+                    suspicious.add(name)
+
+        desc_words = frozenset(_WORD_RE.findall(skill.description.lower()))
+        return SkillFeatures(
+            name=skill.name,
+            reads_sensitive_data=reads_sensitive_data,
+            sends_to_network=sends_to_network,
+            domains=tuple(domains),
+            suspicious_patterns=tuple(name for _, name in SUSPICIOUS_PATTERNS if name in suspicious),
+            describes_collection=bool(desc_words & COLLECTION_KEYWORDS),
+            describes_sending=bool(desc_words & SENDING_KEYWORDS),
+            context_words=desc_words - CONTEXT_EXCLUDE_WORDS,
+        )
+
+    def _iter_skill_text(self, skill: Skill) -> Iterator[str]:
+        """Yield the description, the instructions and each readable file of a skill."""
+        yield skill.description
+        yield skill.instruction_body
 
         for skill_file in skill.files:
             try:
                 file_content = skill_file.read_content()
                 if file_content:
-                    content_parts.append(file_content)
+                    yield file_content
             except Exception:
                 pass
 
-        return "\n".join(content_parts)
-
     def _extract_urls(self, content: str) -> list[str]:
         """Extract URLs from content."""
-        url_pattern = r'https?://[^\s<>"\')\]]+[^\s<>"\')\]\.,]'
-        return re.findall(url_pattern, content)
+        return _URL_RE.findall(content)
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        match = re.match(r"https?://([^/]+)", url)
+        match = _DOMAIN_RE.match(url)
         if match:
             return match.group(1).lower()
         return ""
 
     def _is_common_domain(self, domain: str) -> bool:
         """Check if domain is a common/trusted domain."""
-        COMMON_DOMAINS = {
-            # Code hosting / package registries
-            "github.com",
-            "githubusercontent.com",
-            "gitlab.com",
-            "pypi.org",
-            "npmjs.com",
-            "python.org",
-            "crates.io",
-            "rubygems.org",
-            "packagist.org",
-            # AI providers
-            "anthropic.com",
-            "openai.com",
-            "claude.com",
-            # Cloud providers
-            "google.com",
-            "googleapis.com",
-            "microsoft.com",
-            "azure.com",
-            "amazon.com",
-            "amazonaws.com",
-            "aws.amazon.com",
-            # Documentation / references
-            "stackoverflow.com",
-            "docs.python.org",
-            "developer.mozilla.org",
-            "mdn.io",
-            # Standards organizations & licensing
-            "apache.org",
-            "www.apache.org",  # Apache license
-            "opensource.org",  # OSI licenses
-            "creativecommons.org",  # CC licenses
-            "w3.org",
-            "www.w3.org",  # W3C standards
-            "ietf.org",  # IETF standards
-            # XML/Document standards (used by Office docs)
-            "schemas.openxmlformats.org",
-            "schemas.microsoft.com",
-            "purl.org",  # Persistent URLs for standards
-            "dublincore.org",  # Metadata standard
-            "xmlsoft.org",  # libxml
-            # CDNs (common for web templates)
-            "cdnjs.cloudflare.com",
-            "cdn.jsdelivr.net",
-            "unpkg.com",
-            "ajax.googleapis.com",
-        }
-
-        # Check if domain or parent domain is common
-        for common in COMMON_DOMAINS:
-            if domain == common or domain.endswith("." + common):
-                return True
-        return False
+        # Check the domain and each parent domain
+        labels = domain.split(".")
+        return any(".".join(labels[i:]) in COMMON_DOMAINS for i in range(len(labels)))
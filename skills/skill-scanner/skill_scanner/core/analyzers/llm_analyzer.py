@@ -24,18 +24,32 @@ Production analyzer with:
 - AWS Bedrock support with IAM roles
 - Async analysis for performance
 - AITech taxonomy alignment
+- Token-budgeted prompts: oversized skills are split into concurrent requests
+  and small skills can be packed into one batched request
 """
 
 import asyncio
+import logging
+import os
+import threading
 from enum import Enum
 from typing import Any
 
+from ...core.llm_cache import LLMResponseCache
 from ...core.models import Finding, Severity, Skill, ThreatCategory
 from ...threats.threats import ThreatMapping
-from .base import BaseAnalyzer
-from .llm_prompt_builder import PromptBuilder
+from .base import AnalysisOutput, BaseAnalyzer
+from .llm_prompt_builder import (
+    BATCH_INSTRUCTIONS,
+    DEFAULT_MAX_PROMPT_CHUNKS,
+    DEFAULT_MAX_PROMPT_TOKENS,
+    PROMPT_FRAME_TOKENS,
+    PromptBuilder,
+    PromptPlan,
+    estimate_tokens,
+)
 from .llm_provider_config import ProviderConfig
-from .llm_request_handler import LLMRequestHandler
+from .llm_request_handler import LLMRequestHandler, LLMUsage
 from .llm_response_parser import ResponseParser
 
 # Export constants for backward compatibility with tests
@@ -45,6 +59,30 @@ except (ImportError, ModuleNotFoundError):
     LITELLM_AVAILABLE = False
     GOOGLE_GENAI_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# Requests in flight at once for one run_async/run_batch_async call
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+# Skills packed into one batched request, and the largest skill content (estimated tokens) that is packed
+DEFAULT_MAX_SKILLS_PER_REQUEST = 5
+SMALL_SKILL_TOKENS = 2000
+
+# System message includes context about AITech taxonomy for structured outputs
+SYSTEM_PROMPT = """You are a security expert analyzing agent skills. Follow the analysis framework provided.
+
+When selecting AITech codes for findings, use these mappings:
+- AITech-1.1: Direct prompt injection in SKILL.md (jailbreak, instruction override)
+- AITech-1.2: Indirect prompt injection - instruction manipulation (embedding malicious instructions in external sources)
+- AITech-4.3: Protocol manipulation - capability inflation (skill discovery abuse, keyword baiting, over-broad claims)
+- AITech-8.2: Data exfiltration/exposure (unauthorized access, credential theft, hardcoded secrets)
+- AITech-9.1: Model/agentic manipulation (command injection, code injection, SQL injection, obfuscation)
+- AITech-12.1: Tool exploitation (tool poisoning, shadowing, unauthorized use)
+- AITech-13.1: Disruption of Availability (resource abuse, DoS, infinite loops) - AISubtech-13.1.1: Compute Exhaustion
+- AITech-15.1: Harmful/misleading content (deceptive content, misinformation)
+
+The structured output schema will enforce these exact codes."""
+
 
 class LLMProvider(str, Enum):
     """Supported LLM providers via LiteLLM.
@@ -120,6 +158,11 @@ class LLMAnalyzer(BaseAnalyzer):
         aws_session_token: str | None = None,
         # Provider selection (can be enum or string)
         provider: str | None = None,
+        response_cache: LLMResponseCache | None = None,
+        max_prompt_tokens: int | None = None,
+        max_prompt_chunks: int = DEFAULT_MAX_PROMPT_CHUNKS,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        max_skills_per_request: int = DEFAULT_MAX_SKILLS_PER_REQUEST,
     ):
         """
         Initialize enhanced LLM analyzer.
@@ -139,6 +182,15 @@ class LLMAnalyzer(BaseAnalyzer):
             aws_session_token: AWS session token (for Bedrock)
             provider: LLM provider name (e.g., "openai", "anthropic", "aws-bedrock", etc.)
                 Can be enum or string (e.g., "openai", "anthropic", "aws-bedrock")
+            response_cache: Optional LLM response cache; identical prompts are
+                answered from disk instead of the provider
+            max_prompt_tokens: Estimated token budget of one request; larger skills are
+                split across requests (default: $SKILL_SCANNER_LLM_MAX_PROMPT_TOKENS or 32000)
+            max_prompt_chunks: Maximum requests per skill; files ranked past them are
+                reported as incomplete analyses
+            max_concurrent_requests: Requests in flight at once
+            max_skills_per_request: Maximum small skills packed into one request; directory
+                scans and batch jobs hand the analyzer this many skills at a time
         """
         super().__init__("llm_analyzer")
 
@@ -191,6 +243,7 @@ class LLMAnalyzer(BaseAnalyzer):
             max_retries=max_retries,
             rate_limit_delay=rate_limit_delay,
             timeout=timeout,
+            response_cache=response_cache,
         )
 
         self.prompt_builder = PromptBuilder()
@@ -209,6 +262,58 @@ class LLMAnalyzer(BaseAnalyzer):
         self.max_retries = max_retries
         self.rate_limit_delay = rate_limit_delay
         self.timeout = timeout
+        self.response_cache = response_cache
+
+        if max_prompt_tokens is None:
+            max_prompt_tokens = int(os.getenv("SKILL_SCANNER_LLM_MAX_PROMPT_TOKENS", DEFAULT_MAX_PROMPT_TOKENS))
+        self.max_prompt_tokens = max_prompt_tokens
+        self.max_prompt_chunks = max_prompt_chunks
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_skills_per_request = max_skills_per_request
+        self.batch_size = max(1, max_skills_per_request)
+
+        # Requests and tokens per skill directory, and across everything this analyzer sent;
+        # concurrent scans sharing the analyzer update them under the lock
+        self.usage_by_skill: dict[str, LLMUsage] = {}
+        self.total_usage = LLMUsage()
+        self._usage_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the usage lock when shipping to worker processes."""
+        state = self.__dict__.copy()
+        state["_usage_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._usage_lock = threading.Lock()
+
+    def drain_usage(self) -> tuple[dict[str, LLMUsage], LLMUsage]:
+        """
+        Return the usage recorded so far and start counting from zero.
+
+        Worker processes of a parallel directory scan send this back to the
+        parent, which merges it into its own analyzer with merge_usage.
+
+        Returns:
+            Tuple of (usage per skill directory, total usage)
+        """
+        with self._usage_lock:
+            drained = self.usage_by_skill, self.total_usage
+            self.usage_by_skill, self.total_usage = {}, LLMUsage()
+        return drained
+
+    def merge_usage(self, usage_by_skill: dict[str, LLMUsage], total_usage: LLMUsage) -> None:
+        """Add usage recorded by another copy of this analyzer (see drain_usage)."""
+        with self._usage_lock:
+            for directory, usage in usage_by_skill.items():
+                self.usage_by_skill.setdefault(directory, LLMUsage()).merge(usage)
+            self.total_usage.merge(total_usage)
+
+    @property
+    def _user_prompt_budget(self) -> int:
+        """Token budget of the user prompt, after the system message."""
+        return self.max_prompt_tokens - estimate_tokens(SYSTEM_PROMPT)
 
     def analyze(self, skill: Skill) -> list[Finding]:
         """
@@ -223,6 +328,19 @@ class LLMAnalyzer(BaseAnalyzer):
         # Run async analysis in event loop
         return asyncio.run(self.analyze_async(skill))
 
+    def run(self, skill: Skill) -> AnalysisOutput:
+        """
+        Analyze skill using LLM, returning the files left out with the findings (sync wrapper).
+
+        Args:
+            skill: Skill to analyze
+
+        Returns:
+            Findings and incomplete-analysis markers of the skill
+        """
+        # Run async analysis in event loop
+        return asyncio.run(self.run_async(skill))
+
     async def analyze_async(self, skill: Skill) -> list[Finding]:
         """
         Analyze skill using LLM (async).
@@ -233,79 +351,325 @@ class LLMAnalyzer(BaseAnalyzer):
         Returns:
             List of security findings
         """
-        findings = []
+        return (await self.run_async(skill)).findings
+
+    async def run_async(self, skill: Skill) -> AnalysisOutput:
+        """
+        Analyze skill using LLM, returning the files left out with the findings (async).
+
+        Skills over the prompt token budget are split into ranked chunks that
+        are analyzed concurrently and merged into one set of findings. Files
+        ranked past max_prompt_chunks, or in a chunk whose request failed, are
+        reported as incomplete analyses.
+
+        Args:
+            skill: Skill to analyze
+
+        Returns:
+            Findings and incomplete-analysis markers of the skill
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        usage = LLMUsage()
+        incomplete: list[dict[str, Any]] = []
 
         try:
-            # Format all skill components
-            manifest_text = self.prompt_builder.format_manifest(skill.manifest)
-            code_files_text = self.prompt_builder.format_code_files(skill)
-            referenced_files_text = self.prompt_builder.format_referenced_files(skill)
-
-            # Create protected prompt
-            prompt, injection_detected = self.prompt_builder.build_threat_analysis_prompt(
-                skill.name,
-                skill.description,
-                manifest_text,
-                skill.instruction_body[:3000],
-                code_files_text,
-                referenced_files_text,
-            )
+            plan = self.prompt_builder.plan_threat_analysis(skill, self._user_prompt_budget, self.max_prompt_chunks)
+            findings = await self._analyze_plan(skill, plan, usage, semaphore, incomplete)
+        except Exception as e:
+            print(f"LLM analysis failed for {skill.name}: {e}")
+            # Return empty findings - don't pollute results with errors
+            findings = []
 
-            # If injection detected, create immediate finding
-            if injection_detected:
-                findings.append(
-                    Finding(
-                        id=f"prompt_injection_{skill.name}",
-                        rule_id="LLM_PROMPT_INJECTION_DETECTED",
-                        category=ThreatCategory.PROMPT_INJECTION,
-                        severity=Severity.HIGH,
-                        title="Prompt injection attack detected",
-                        description="Skill content contains delimiter injection attempt",
-                        file_path="SKILL.md",
-                        remediation="Remove malicious delimiter tags from skill content",
-                        analyzer="llm",
-                    )
+        self._record_usage(skill, usage)
+        return AnalysisOutput(findings=findings, incomplete_analyses=incomplete)
+
+    def analyze_batch(self, skills: list[Skill]) -> list[list[Finding]]:
+        """
+        Analyze several skills, packing small ones into shared requests (sync wrapper).
+
+        Args:
+            skills: Skills to analyze
+
+        Returns:
+            Findings for each skill, in the order given
+        """
+        return [output.findings for output in self.run_batch(skills)]
+
+    def run_batch(self, skills: list[Skill]) -> list[AnalysisOutput]:
+        """
+        Analyze several skills, packing small ones into shared requests (sync wrapper).
+
+        Args:
+            skills: Skills to analyze
+
+        Returns:
+            Findings and incomplete-analysis markers for each skill, in the order given
+        """
+        return asyncio.run(self.run_batch_async(skills))
+
+    async def analyze_batch_async(self, skills: list[Skill]) -> list[list[Finding]]:
+        """
+        Analyze several skills, packing small ones into shared requests (async).
+
+        Args:
+            skills: Skills to analyze
+
+        Returns:
+            Findings for each skill, in the order given
+        """
+        return [output.findings for output in await self.run_batch_async(skills)]
+
+    async def run_batch_async(self, skills: list[Skill]) -> list[AnalysisOutput]:
+        """
+        Analyze several skills, packing small ones into shared requests.
+
+        Skills whose content fits in SMALL_SKILL_TOKENS are grouped, up to
+        max_skills_per_request and the prompt budget per request, so they share
+        one copy of the analysis framework. The response carries one result per
+        random skill ID and is split back per skill. Larger skills, groups of
+        one, and skills missing from a batched response (or whose batch failed)
+        are analyzed on their own.
+
+        Args:
+            skills: Skills to analyze
+
+        Returns:
+            Findings and incomplete-analysis markers for each skill, in the order given
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        usages = [LLMUsage() for _ in skills]
+        results: list[list[Finding]] = [[] for _ in skills]
+        incompletes: list[list[dict[str, Any]]] = [[] for _ in skills]
+
+        plans: list[PromptPlan | None] = []
+        for skill in skills:
+            try:
+                plans.append(
+                    self.prompt_builder.plan_threat_analysis(skill, self._user_prompt_budget, self.max_prompt_chunks)
                 )
-                return findings
+            except Exception as e:
+                print(f"LLM analysis failed for {skill.name}: {e}")
+                plans.append(None)
 
-            # Query LLM with retry logic
-            # System message includes context about AITech taxonomy for structured outputs
-            messages = [
-                {
-                    "role": "system",
-                    "content": """You are a security expert analyzing agent skills. Follow the analysis framework provided.
+        groups = self._pack_skills(plans)
+        packed = {i for group in groups for i in group}
 
-When selecting AITech codes for findings, use these mappings:
-- AITech-1.1: Direct prompt injection in SKILL.md (jailbreak, instruction override)
-- AITech-1.2: Indirect prompt injection - instruction manipulation (embedding malicious instructions in external sources)
-- AITech-4.3: Protocol manipulation - capability inflation (skill discovery abuse, keyword baiting, over-broad claims)
-- AITech-8.2: Data exfiltration/exposure (unauthorized access, credential theft, hardcoded secrets)
-- AITech-9.1: Model/agentic manipulation (command injection, code injection, SQL injection, obfuscation)
-- AITech-12.1: Tool exploitation (tool poisoning, shadowing, unauthorized use)
-- AITech-13.1: Disruption of Availability (resource abuse, DoS, infinite loops) - AISubtech-13.1.1: Compute Exhaustion
-- AITech-15.1: Harmful/misleading content (deceptive content, misinformation)
+        async def analyze_one(i: int) -> None:
+            try:
+                results[i] = await self._analyze_plan(skills[i], plans[i], usages[i], semaphore, incompletes[i])
+            except Exception as e:
+                print(f"LLM analysis failed for {skills[i].name}: {e}")
+
+        async def analyze_group(group: list[int]) -> None:
+            answered = await self._analyze_packed(
+                [skills[i] for i in group], [plans[i] for i in group], [usages[i] for i in group], semaphore
+            )
+            missing = []
+            for i, findings in zip(group, answered, strict=True):
+                if findings is None:
+                    missing.append(i)
+                else:
+                    results[i] = findings
+            await asyncio.gather(*(analyze_one(i) for i in missing))
+
+        await asyncio.gather(
+            *(analyze_one(i) for i, plan in enumerate(plans) if plan is not None and i not in packed),
+            *(analyze_group(group) for group in groups),
+        )
+
+        for skill, usage in zip(skills, usages, strict=True):
+            self._record_usage(skill, usage)
+        return [
+            AnalysisOutput(findings=findings, incomplete_analyses=incomplete)
+            for findings, incomplete in zip(results, incompletes, strict=True)
+        ]
+
+    def _pack_skills(self, plans: list[PromptPlan | None]) -> list[list[int]]:
+        """Group small single-chunk skills into batched requests, in skill order."""
+        batch_overhead = (
+            estimate_tokens(self.prompt_builder.protection_rules)
+            + estimate_tokens(self.prompt_builder.threat_analysis_prompt)
+            + estimate_tokens(BATCH_INSTRUCTIONS)
+            + PROMPT_FRAME_TOKENS
+        )
+        groups: list[list[int]] = []
+        current: list[int] = []
+        tokens = batch_overhead
+        for i, plan in enumerate(plans):
+            if plan is None or len(plan.chunks) > 1 or plan.skipped or plan.content_tokens > SMALL_SKILL_TOKENS:
+                continue
+            if current and (
+                len(current) >= self.max_skills_per_request or tokens + plan.content_tokens > self._user_prompt_budget
+            ):
+                groups.append(current)
+                current, tokens = [], batch_overhead
+            current.append(i)
+            tokens += plan.content_tokens
+        groups.append(current)
+        return [group for group in groups if len(group) > 1]
+
+    async def _analyze_plan(
+        self,
+        skill: Skill,
+        plan: PromptPlan,
+        usage: LLMUsage,
+        semaphore: asyncio.Semaphore,
+        incomplete: list[dict[str, Any]],
+    ) -> list[Finding]:
+        """
+        Analyze every chunk of a skill's prompt plan and merge the results.
+
+        Args:
+            skill: Skill being analyzed
+            plan: Prompt plan from the prompt builder
+            usage: Usage record of the skill
+            semaphore: Bounds requests in flight
+            incomplete: Collects the files left out of the analysis
+
+        Returns:
+            List of security findings
 
-The structured output schema will enforce these exact codes.""",
-                },
-                {"role": "user", "content": prompt},
+        Raises:
+            Exception: If the request for a single-chunk skill, or for every chunk, fails
+        """
+        prompts = [self.prompt_builder.build_chunk_prompt(plan, i) for i in range(len(plan.chunks))]
+
+        # If injection detected, create immediate finding
+        if any(injection_detected for _, injection_detected in prompts):
+            return [
+                Finding(
+                    id=f"prompt_injection_{skill.name}",
+                    rule_id="LLM_PROMPT_INJECTION_DETECTED",
+                    category=ThreatCategory.PROMPT_INJECTION,
+                    severity=Severity.HIGH,
+                    title="Prompt injection attack detected",
+                    description="Skill content contains delimiter injection attempt",
+                    file_path="SKILL.md",
+                    remediation="Remove malicious delimiter tags from skill content",
+                    analyzer="llm",
+                )
             ]
 
-            response_content = await self.request_handler.make_request(
-                messages, context=f"threat analysis for {skill.name}"
+        for section in plan.skipped:
+            self._note_incomplete(
+                incomplete,
+                section.path,
+                "prompt_tokens",
+                f"{skill.name}: ranked past the {self.max_prompt_chunks}-request limit for the skill",
             )
 
-            # Parse response
-            analysis_result = self.response_parser.parse(response_content)
+        context = f"threat analysis for {skill.name}"
+        parts = len(prompts)
+        results = await asyncio.gather(
+            *(
+                self._request_analysis(
+                    prompt, context if parts == 1 else f"{context} (part {i + 1} of {parts})", usage, semaphore
+                )
+                for i, (prompt, _) in enumerate(prompts)
+            ),
+            return_exceptions=True,
+        )
 
-            # Convert to findings
-            findings = self._convert_to_findings(analysis_result, skill)
+        analyses = []
+        for chunk, result in zip(plan.chunks, results, strict=True):
+            if not isinstance(result, Exception):
+                analyses.append(result)
+            elif parts > 1:
+                print(f"LLM analysis failed for part of {skill.name}: {result}")
+                for path in chunk.paths:
+                    self._note_incomplete(incomplete, path, "llm_request", f"{skill.name}: {result}")
+        if not analyses:
+            raise next(result for result in results if isinstance(result, Exception))
 
-        except Exception as e:
-            print(f"LLM analysis failed for {skill.name}: {e}")
-            # Return empty findings - don't pollute results with errors
-            return []
+        return self._convert_to_findings(_merge_analyses(analyses), skill)
 
-        return findings
+    async def _analyze_packed(
+        self,
+        skills: list[Skill],
+        plans: list[PromptPlan],
+        usages: list[LLMUsage],
+        semaphore: asyncio.Semaphore,
+    ) -> list[list[Finding] | None]:
+        """
+        Analyze several small skills in one batched request.
+
+        Args:
+            skills: Skills in the batch
+            plans: Their single-chunk prompt plans
+            usages: Their usage records, credited with a share of the request
+            semaphore: Bounds requests in flight
+
+        Returns:
+            Findings for each skill, or None for a skill that must be analyzed on
+            its own (missing from the response, or the request failed)
+        """
+        contents = [self.prompt_builder.plan_analysis_content(plan) for plan in plans]
+        prompt, skill_ids, injected = self.prompt_builder.build_batch_threat_analysis_prompt(contents)
+        if injected:
+            # Delimiter injection is reported by the single-skill path
+            return [None] * len(skills)
+
+        usage = LLMUsage()
+        try:
+            analysis = await self._request_analysis(
+                prompt,
+                f"batched threat analysis for {', '.join(skill.name for skill in skills)}",
+                usage,
+                semaphore,
+                schema=self.request_handler.batch_response_schema,
+            )
+            entries = {entry.get("skill_id"): entry for entry in analysis.get("skills", []) if isinstance(entry, dict)}
+        except Exception as e:
+            print(f"Batched LLM analysis failed, analyzing skills individually: {e}")
+            entries = {}
+        with self._usage_lock:
+            self.total_usage.batched_requests += usage.requests
+
+        content_tokens = [estimate_tokens(content) for content in contents]
+        results: list[list[Finding] | None] = []
+        for skill, skill_id, skill_usage, tokens in zip(skills, skill_ids, usages, content_tokens, strict=True):
+            skill_usage.merge(usage.share(tokens / sum(content_tokens)))
+            entry = entries.get(skill_id)
+            results.append(None if entry is None else self._convert_to_findings(entry, skill))
+        return results
+
+    async def _request_analysis(
+        self,
+        prompt: str,
+        context: str,
+        usage: LLMUsage,
+        semaphore: asyncio.Semaphore,
+        schema: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send one threat analysis prompt and parse the response."""
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
+        request_usage = LLMUsage(estimated_prompt_tokens=estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(prompt))
+        try:
+            async with semaphore:
+                response_content = await self.request_handler.make_request(
+                    messages, context=context, schema=schema, usage=request_usage
+                )
+        finally:
+            usage.merge(request_usage)
+            with self._usage_lock:
+                self.total_usage.merge(request_usage)
+
+        return self.response_parser.parse(response_content)
+
+    def _record_usage(self, skill: Skill, usage: LLMUsage) -> None:
+        """Keep and log a skill's request and token usage, keyed by its directory."""
+        with self._usage_lock:
+            self.usage_by_skill[str(skill.directory)] = usage
+        logger.info("LLM analysis of %s: %s", skill.name, usage)
+
+    def _note_incomplete(self, incomplete: list[dict[str, Any]], file: str, limit: str, detail: str) -> None:
+        """Note a file that was left out of the analysis."""
+        incomplete.append(
+            {"analyzer": self.name, "file": file, "limit": limit, "fallback": "not_analyzed", "detail": detail}
+        )
 
     def _convert_to_findings(self, analysis_result: dict[str, Any], skill: Skill) -> list[Finding]:
         """Convert LLM analysis results to Finding objects."""
@@ -437,4 +801,34 @@ The structured output schema will enforce these exact codes.""",
 
         # Relative path - check if it exists within skill directory
         full_path = skill_dir / file_path
-        return full_path.exists() and full_path.is_relative_to(skill_dir)
+        return skill.file_exists(file_path) and full_path.is_relative_to(skill_dir)
+
+
+def _merge_analyses(analyses: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Merge the analyses of a chunked skill into one.
+
+    Findings reported by more than one chunk (same AITech code, title and
+    location) are kept once; assessments and primary threats are combined.
+    """
+    if len(analyses) == 1:
+        return analyses[0]
+
+    findings = []
+    seen = set()
+    for analysis in analyses:
+        for finding in analysis.get("findings", []):
+            if isinstance(finding, dict):
+                key = (finding.get("aitech"), finding.get("title"), finding.get("location"))
+                if key in seen:
+                    continue
+                seen.add(key)
+            findings.append(finding)
+
+    assessments = [a.get("overall_assessment", "") for a in analyses]
+    threats = [threat for a in analyses for threat in a.get("primary_threats", [])]
+    return {
+        "findings": findings,
+        "overall_assessment": " ".join(dict.fromkeys(a for a in assessments if a)),
+        "primary_threats": list(dict.fromkeys(threats)),
+    }
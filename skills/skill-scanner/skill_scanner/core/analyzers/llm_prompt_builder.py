@@ -18,13 +18,107 @@
 LLM Prompt Builder.
 
 Handles prompt construction with injection protection using random delimiters.
+
+Also plans requests against a token budget: a skill whose files do not fit in
+one prompt is split into ranked chunks (scripts first, then referenced files),
+and several small skills can be packed into one batched prompt.
 """
 
 import secrets
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from ...core.models import Skill
 
+# Prompt budget (estimated tokens) for one request, including the analysis framework
+DEFAULT_MAX_PROMPT_TOKENS = 32000
+
+# Most prompts are split into a handful of chunks; files past this many are not analyzed
+DEFAULT_MAX_PROMPT_CHUNKS = 8
+
+# Characters per token for English prose and code, close enough for budgeting
+CHARS_PER_TOKEN = 4
+
+# Allowance for the labels and delimiter tags wrapped around the skill content
+PROMPT_FRAME_TOKENS = 100
+
+# Instruction body characters included in the prompt
+MAX_INSTRUCTION_CHARS = 3000
+
+BATCH_INSTRUCTIONS = """## Batched Analysis
+
+The untrusted input below contains several unrelated skills, each introduced by a
+"Skill ID:" line. Analyze every skill independently, exactly as if it were the only
+one. Return one entry in "skills" per skill, copying its skill_id verbatim, with that
+skill's findings, overall assessment and primary threats. Never attribute content
+from one skill to another."""
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Approximate token count (about CHARS_PER_TOKEN characters per token)
+    """
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+@dataclass
+class PromptSection:
+    """One file's formatted block in an analysis prompt."""
+
+    kind: str  # "code" or "referenced"
+    path: str
+    text: str
+    tokens: int
+
+
+@dataclass
+class PromptChunk:
+    """The files covered by one analysis request."""
+
+    sections: list[PromptSection] = field(default_factory=list)
+    tokens: int = 0  # Estimated tokens of the whole prompt
+
+    @property
+    def paths(self) -> list[str]:
+        """Relative paths of the files in this chunk."""
+        return [section.path for section in self.sections]
+
+
+@dataclass
+class PromptPlan:
+    """How a skill's content is split across analysis requests."""
+
+    skill_name: str
+    description: str
+    manifest_details: str
+    instruction_body: str
+    referenced_header: str | None  # None when the skill references no files
+    has_code: bool
+    framework_tokens: int  # Protection rules and analysis instructions
+    base_tokens: int  # Whole prompt without any file sections
+    chunks: list[PromptChunk] = field(default_factory=list)
+    skipped: list[PromptSection] = field(default_factory=list)  # Ranked past the chunk limit
+
+    @property
+    def estimated_tokens(self) -> int:
+        """Estimated prompt tokens across all chunks."""
+        return sum(chunk.tokens for chunk in self.chunks)
+
+    @property
+    def content_tokens(self) -> int:
+        """Estimated tokens of the skill content alone, as packed into a batched prompt."""
+        return (
+            self.base_tokens
+            - self.framework_tokens
+            + sum(section.tokens for chunk in self.chunks for section in chunk.sections)
+        )
+
 
 class PromptBuilder:
     """Builds analysis prompts with injection protection."""
@@ -68,6 +162,7 @@ class PromptBuilder:
         instruction_body: str,
         code_files: str,
         referenced_files: str,
+        part: str | None = None,
     ) -> tuple[str, bool]:
         """
         Create threat analysis prompt with prompt injection protection.
@@ -81,6 +176,8 @@ class PromptBuilder:
             instruction_body: SKILL.md content
             code_files: Formatted code files
             referenced_files: Referenced files
+            part: Position of this prompt among a chunked skill's requests
+                (e.g. "2 of 3"), or None when the skill fits in one prompt
 
         Returns:
             Tuple of (prompt, injection_detected)
@@ -91,6 +188,44 @@ class PromptBuilder:
         end_tag = f"<!---UNTRUSTED_INPUT_END_{random_id}--->"
 
         # Build comprehensive analysis content
+        analysis_content = self._analysis_content(
+            skill_name, description, manifest_details, instruction_body, code_files, referenced_files, part
+        )
+
+        # Check for delimiter injection (security violation)
+        injection_detected = start_tag in analysis_content or end_tag in analysis_content
+
+        if injection_detected:
+            print(f"WARNING: Potential prompt injection detected in skill {skill_name}")
+
+        # Replace placeholders with random tags
+        protected_rules = self.protection_rules.replace("<!---UNTRUSTED_INPUT_START--->", start_tag).replace(
+            "<!---UNTRUSTED_INPUT_END--->", end_tag
+        )
+
+        # Construct full prompt
+        prompt = f"""{protected_rules}
+
+{self.threat_analysis_prompt}
+
+{start_tag}
+{analysis_content}
+{end_tag}
+"""
+
+        return prompt.strip(), injection_detected
+
+    @staticmethod
+    def _analysis_content(
+        skill_name: str,
+        description: str,
+        manifest_details: str,
+        instruction_body: str,
+        code_files: str,
+        referenced_files: str,
+        part: str | None = None,
+    ) -> str:
+        """Lay out one skill's content for the untrusted input block."""
         analysis_content = f"""Skill Name: {skill_name}
 Description: {description}
 
@@ -106,29 +241,164 @@ Script Files (Python/Bash):
 Referenced Files:
 {referenced_files}
 """
+        if part:
+            analysis_content += f"\nAnalysis Part: {part} (the skill's other files are analyzed in separate requests)\n"
+        return analysis_content
 
-        # Check for delimiter injection (security violation)
-        injection_detected = start_tag in analysis_content or end_tag in analysis_content
+    def build_batch_threat_analysis_prompt(self, contents: list[str]) -> tuple[str, list[str], list[int]]:
+        """
+        Create one threat analysis prompt covering several small skills.
 
-        if injection_detected:
-            print(f"WARNING: Potential prompt injection detected in skill {skill_name}")
+        Each skill is introduced by a random ID that the model echoes back, so
+        results can be split per skill and one skill cannot pose as another.
+
+        Args:
+            contents: Each skill's analysis content (see plan_analysis_content)
+
+        Returns:
+            Tuple of (prompt, skill IDs in the order of contents, indices of
+            contents containing the delimiter tags)
+        """
+        random_id = secrets.token_hex(16)
+        start_tag = f"<!---UNTRUSTED_INPUT_START_{random_id}--->"
+        end_tag = f"<!---UNTRUSTED_INPUT_END_{random_id}--->"
+
+        skill_ids = [f"skill-{secrets.token_hex(4)}-{n}" for n in range(1, len(contents) + 1)]
+        injected = [i for i, content in enumerate(contents) if start_tag in content or end_tag in content]
 
-        # Replace placeholders with random tags
         protected_rules = self.protection_rules.replace("<!---UNTRUSTED_INPUT_START--->", start_tag).replace(
             "<!---UNTRUSTED_INPUT_END--->", end_tag
         )
+        skills_content = "\n".join(
+            f"Skill ID: {skill_id}\n{content}" for skill_id, content in zip(skill_ids, contents, strict=True)
+        )
 
-        # Construct full prompt
         prompt = f"""{protected_rules}
 
 {self.threat_analysis_prompt}
 
+{BATCH_INSTRUCTIONS}
+
 {start_tag}
-{analysis_content}
+{skills_content}
 {end_tag}
 """
 
-        return prompt.strip(), injection_detected
+        return prompt.strip(), skill_ids, injected
+
+    def plan_threat_analysis(
+        self,
+        skill: Skill,
+        max_prompt_tokens: int = DEFAULT_MAX_PROMPT_TOKENS,
+        max_chunks: int = DEFAULT_MAX_PROMPT_CHUNKS,
+    ) -> PromptPlan:
+        """
+        Split a skill's content into prompts that fit a token budget.
+
+        Every chunk carries the manifest and instruction body. File sections are
+        ranked scripts first, then referenced files, each in file order, and
+        filled into chunks in that order, so the first request always covers the
+        highest-ranked files. Once max_chunks are in use, sections that do not
+        fit in the last chunk are left out and listed in the plan's skipped
+        sections.
+
+        Args:
+            skill: Skill to analyze
+            max_prompt_tokens: Estimated token budget of one prompt
+            max_chunks: Maximum number of requests for the skill
+
+        Returns:
+            PromptPlan with at least one chunk
+        """
+        manifest_details = self.format_manifest(skill.manifest)
+        instruction_body = skill.instruction_body[:MAX_INSTRUCTION_CHARS]
+        code_sections = self.code_file_sections(skill)
+        referenced_header, referenced_sections = self.referenced_file_sections(skill)
+
+        framework_tokens = estimate_tokens(self.protection_rules) + estimate_tokens(self.threat_analysis_prompt)
+        base_tokens = (
+            framework_tokens
+            + PROMPT_FRAME_TOKENS
+            + estimate_tokens(skill.name + skill.description + manifest_details + instruction_body)
+            + estimate_tokens(referenced_header or "")
+        )
+        plan = PromptPlan(
+            skill_name=skill.name,
+            description=skill.description,
+            manifest_details=manifest_details,
+            instruction_body=instruction_body,
+            referenced_header=referenced_header,
+            has_code=bool(code_sections),
+            framework_tokens=framework_tokens,
+            base_tokens=base_tokens,
+        )
+
+        current = PromptChunk(tokens=base_tokens)
+        plan.chunks.append(current)
+        for section in code_sections + referenced_sections:
+            if current.sections and current.tokens + section.tokens > max_prompt_tokens:
+                if len(plan.chunks) >= max_chunks:
+                    plan.skipped.append(section)
+                    continue
+                current = PromptChunk(tokens=base_tokens)
+                plan.chunks.append(current)
+            current.sections.append(section)
+            current.tokens += section.tokens
+        return plan
+
+    def build_chunk_prompt(self, plan: PromptPlan, index: int) -> tuple[str, bool]:
+        """
+        Create the threat analysis prompt for one chunk of a plan.
+
+        Args:
+            plan: Plan from plan_threat_analysis
+            index: Chunk index
+
+        Returns:
+            Tuple of (prompt, injection_detected)
+        """
+        part = f"{index + 1} of {len(plan.chunks)}" if len(plan.chunks) > 1 else None
+        return self.build_threat_analysis_prompt(
+            plan.skill_name,
+            plan.description,
+            plan.manifest_details,
+            plan.instruction_body,
+            *self._chunk_file_texts(plan, plan.chunks[index]),
+            part=part,
+        )
+
+    def plan_analysis_content(self, plan: PromptPlan) -> str:
+        """Lay out the content of a single-chunk plan for a batched prompt."""
+        return self._analysis_content(
+            plan.skill_name,
+            plan.description,
+            plan.manifest_details,
+            plan.instruction_body,
+            *self._chunk_file_texts(plan, plan.chunks[0]),
+        )
+
+    @staticmethod
+    def _chunk_file_texts(plan: PromptPlan, chunk: PromptChunk) -> tuple[str, str]:
+        """Format the script and referenced file sections of a chunk."""
+        code = [section.text for section in chunk.sections if section.kind == "code"]
+        referenced = [section.text for section in chunk.sections if section.kind == "referenced"]
+
+        if code:
+            code_files = "\n".join(code)
+        elif plan.has_code:
+            code_files = "Script files are covered in another part of this analysis."
+        else:
+            code_files = "No script files found."
+
+        if plan.referenced_header is None:
+            referenced_files = "No referenced files."
+        elif referenced:
+            referenced_files = "\n".join([plan.referenced_header, "", *referenced])
+        else:
+            referenced_files = (
+                f"{plan.referenced_header}\n\nFile contents are covered in another part of this analysis."
+            )
+        return code_files, referenced_files
 
     def format_manifest(self, manifest) -> str:
         """Format YAML manifest for LLM analysis."""
@@ -146,7 +416,12 @@ Referenced Files:
 
     def format_code_files(self, skill: Skill) -> str:
         """Format code files for LLM analysis."""
-        lines = []
+        sections = self.code_file_sections(skill)
+        return "\n".join(section.text for section in sections) if sections else "No script files found."
+
+    def code_file_sections(self, skill: Skill) -> list[PromptSection]:
+        """Format each code file as its own prompt section."""
+        sections = []
 
         for skill_file in skill.get_scripts():
             content = skill_file.read_content()
@@ -155,13 +430,10 @@ Referenced Files:
                 if len(content) > 1500:
                     truncated += f"\n... (truncated, total {len(content)} chars)"
 
-                lines.append(f"**File: {skill_file.relative_path}**")
-                lines.append("```" + skill_file.file_type)
-                lines.append(truncated)
-                lines.append("```")
-                lines.append("")
+                lines = [f"**File: {skill_file.relative_path}**", "```" + skill_file.file_type, truncated, "```", ""]
+                sections.append(_section("code", skill_file.relative_path, lines))
 
-        return "\n".join(lines) if lines else "No script files found."
+        return sections
 
     def _is_path_within_directory(self, path: Path, directory: Path) -> bool:
         """
@@ -204,49 +476,74 @@ Referenced Files:
         Returns:
             Formatted string with referenced file contents
         """
-        if not skill.referenced_files:
+        header, sections = self.referenced_file_sections(skill, max_file_size)
+        if header is None:
             return "No referenced files."
+        return "\n".join([header, "", *(section.text for section in sections)])
 
-        lines = []
-        lines.append(f"Files referenced in instructions: {', '.join(skill.referenced_files)}")
-        lines.append("")
+    def referenced_file_sections(
+        self, skill: Skill, max_file_size: int = 2000
+    ) -> tuple[str | None, list[PromptSection]]:
+        """
+        Format each referenced file as its own prompt section.
+
+        Args:
+            skill: The skill being analyzed
+            max_file_size: Maximum characters to include per file (default 2000)
+
+        Returns:
+            Tuple of (header listing the referenced files, sections), with a
+            None header when the skill references no files
+        """
+        if not skill.referenced_files:
+            return None, []
+
+        header = f"Files referenced in instructions: {', '.join(skill.referenced_files)}"
+        sections = []
 
         for ref_file_path in skill.referenced_files:
             # Skip paths that look like path traversal attempts
             if ".." in ref_file_path or ref_file_path.startswith("/"):
-                lines.append(f"**Referenced File: {ref_file_path}** (blocked: path traversal attempt)")
-                lines.append("")
+                sections.append(
+                    _section(
+                        "referenced",
+                        ref_file_path,
+                        [f"**Referenced File: {ref_file_path}** (blocked: path traversal attempt)", ""],
+                    )
+                )
                 continue
 
-            # Try to find the file in the skill directory
-            full_path = skill.directory / ref_file_path
-            if not full_path.exists():
-                # Try alternative locations (all within skill directory)
-                alt_paths = [
-                    skill.directory / "rules" / Path(ref_file_path).name,
-                    skill.directory / "references" / ref_file_path,
-                    skill.directory / "assets" / ref_file_path,
-                    skill.directory / "templates" / ref_file_path,
-                ]
-                for alt in alt_paths:
-                    if alt.exists():
-                        full_path = alt
-                        break
-
-            if not full_path.exists():
-                lines.append(f"**Referenced File: {ref_file_path}** (not found)")
-                lines.append("")
+            # Try to find the file in the skill directory, then in alternative locations (all within it)
+            candidates = [
+                ref_file_path,
+                str(Path("rules") / Path(ref_file_path).name),
+                str(Path("references") / ref_file_path),
+                str(Path("assets") / ref_file_path),
+                str(Path("templates") / ref_file_path),
+            ]
+            relative_path = next((path for path in candidates if skill.file_exists(path)), None)
+            if relative_path is None:
+                sections.append(
+                    _section("referenced", ref_file_path, [f"**Referenced File: {ref_file_path}** (not found)", ""])
+                )
                 continue
+            full_path = skill.directory / relative_path
 
             # SECURITY: Verify the resolved path is within the skill directory
             # This prevents path traversal attacks like ../../../.env
-            if not self._is_path_within_directory(full_path, skill.directory):
-                lines.append(f"**Referenced File: {ref_file_path}** (blocked: outside skill directory)")
-                lines.append("")
+            # (archive paths are confined to the package root by the archive itself)
+            if skill.archive is None and not self._is_path_within_directory(full_path, skill.directory):
+                sections.append(
+                    _section(
+                        "referenced",
+                        ref_file_path,
+                        [f"**Referenced File: {ref_file_path}** (blocked: outside skill directory)", ""],
+                    )
+                )
                 continue
 
             try:
-                content = full_path.read_text(encoding="utf-8")
+                content = skill.read_file(relative_path)
 
                 # Truncate if too large
                 truncated = content[:max_file_size]
@@ -257,14 +554,20 @@ Referenced Files:
                 suffix = full_path.suffix.lower()
                 file_type = "markdown" if suffix in (".md", ".markdown") else "text"
 
-                lines.append(f"**Referenced File: {ref_file_path}**")
-                lines.append(f"```{file_type}")
-                lines.append(truncated)
-                lines.append("```")
-                lines.append("")
+                lines = [f"**Referenced File: {ref_file_path}**", f"```{file_type}", truncated, "```", ""]
+                sections.append(_section("referenced", ref_file_path, lines))
 
             except Exception as e:
-                lines.append(f"**Referenced File: {ref_file_path}** (error reading: {e})")
-                lines.append("")
+                sections.append(
+                    _section(
+                        "referenced", ref_file_path, [f"**Referenced File: {ref_file_path}** (error reading: {e})", ""]
+                    )
+                )
 
-        return "\n".join(lines)
+        return header, sections
+
+
+def _section(kind: str, path: str, lines: list[str]) -> PromptSection:
+    """Join a file's prompt lines into a section with its token estimate."""
+    text = "\n".join(lines)
+    return PromptSection(kind=kind, path=path, text=text, tokens=estimate_tokens(text) + 1)
@@ -25,9 +25,11 @@ Uses structured outputs (JSON schema) when available.
 import asyncio
 import json
 import warnings
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from ...core.llm_cache import LLMResponseCache
 from .llm_provider_config import ProviderConfig
 
 try:
@@ -53,6 +55,56 @@ warnings.filterwarnings("ignore", message=".*Expected `StreamingChoices`.*")
 warnings.filterwarnings("ignore", message=".*close_litellm_async_clients.*")
 
 
+@dataclass
+class LLMUsage:
+    """
+    Requests and tokens spent on LLM analysis.
+
+    For one skill, requests counts the requests made for that skill alone and
+    batched_requests the ones it shared with other skills, whose token counts
+    are split by each skill's share of the prompt. For an analyzer's totals,
+    requests counts every request sent and batched_requests how many of them
+    were batched.
+    """
+
+    requests: int = 0
+    cached_responses: int = 0  # Answered by the response cache, not counted in requests
+    batched_requests: int = 0
+    estimated_prompt_tokens: int = 0  # Planner's estimate
+    prompt_tokens: int = 0  # As reported by the provider, when it reports usage
+    completion_tokens: int = 0
+
+    def merge(self, other: "LLMUsage") -> None:
+        """Add another usage record's counters to this one."""
+        self.requests += other.requests
+        self.cached_responses += other.cached_responses
+        self.batched_requests += other.batched_requests
+        self.estimated_prompt_tokens += other.estimated_prompt_tokens
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+
+    def share(self, fraction: float) -> "LLMUsage":
+        """Return one skill's share of a batched request's usage."""
+        return LLMUsage(
+            batched_requests=self.requests + self.cached_responses,
+            estimated_prompt_tokens=round(self.estimated_prompt_tokens * fraction),
+            prompt_tokens=round(self.prompt_tokens * fraction),
+            completion_tokens=round(self.completion_tokens * fraction),
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"{self.requests} requests, {self.batched_requests} batched, {self.cached_responses} cached, "
+            f"~{self.estimated_prompt_tokens} prompt tokens estimated, "
+            f"{self.prompt_tokens} prompt / {self.completion_tokens} completion tokens reported"
+        )
+
+
+def _token_count(value: Any) -> int:
+    """Read a token count from a provider usage object, which may be missing or None."""
+    return value if isinstance(value, int) else 0
+
+
 class LLMRequestHandler:
     """Handles LLM API requests with retry logic and structured outputs."""
 
@@ -64,6 +116,7 @@ class LLMRequestHandler:
         max_retries: int = 3,
         rate_limit_delay: float = 2.0,
         timeout: int = 120,
+        response_cache: LLMResponseCache | None = None,
     ):
         """
         Initialize request handler.
@@ -75,6 +128,7 @@ class LLMRequestHandler:
             max_retries: Max retry attempts on rate limits
             rate_limit_delay: Base delay for exponential backoff
             timeout: Request timeout in seconds
+            response_cache: Optional cache serving identical requests from disk
         """
         self.provider_config = provider_config
         self.max_tokens = max_tokens
@@ -82,6 +136,7 @@ class LLMRequestHandler:
         self.max_retries = max_retries
         self.rate_limit_delay = rate_limit_delay
         self.timeout = timeout
+        self.response_cache = response_cache
 
         # Load JSON schema for structured outputs
         self.response_schema = self._load_response_schema()
@@ -122,13 +177,42 @@ class LLMRequestHandler:
 
         return sanitized
 
-    async def make_request(self, messages: list[dict[str, str]], context: str = "") -> str:
+    @property
+    def batch_response_schema(self) -> dict[str, Any] | None:
+        """Schema for a batched request: one response_schema object per skill, tagged with its skill_id."""
+        if self.response_schema is None:
+            return None
+        skill_result = {
+            "type": "object",
+            "properties": {
+                "skill_id": {"type": "string", "description": "Skill ID exactly as given in the input"},
+                **self.response_schema["properties"],
+            },
+            "required": ["skill_id", *self.response_schema.get("required", [])],
+            "additionalProperties": False,
+        }
+        return {
+            "type": "object",
+            "properties": {"skills": {"type": "array", "items": skill_result}},
+            "required": ["skills"],
+            "additionalProperties": False,
+        }
+
+    async def make_request(
+        self,
+        messages: list[dict[str, str]],
+        context: str = "",
+        schema: dict[str, Any] | None = None,
+        usage: LLMUsage | None = None,
+    ) -> str:
         """
         Make LLM request with retry logic and exponential backoff.
 
         Args:
             messages: Messages to send (should include system and user messages)
             context: Context for logging
+            schema: Structured output schema to use instead of response_schema
+            usage: Optional record to add the request and its token counts to
 
         Returns:
             Response text content
@@ -136,6 +220,37 @@ class LLMRequestHandler:
         Raises:
             Exception: If all retries exhausted
         """
+        schema = schema or self.response_schema
+        usage = usage if usage is not None else LLMUsage()
+
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.make_key(
+                self.provider_config.model,
+                messages,
+                schema=schema,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                usage.cached_responses += 1
+                return cached
+
+        usage.requests += 1
+        response = await self._make_uncached_request(messages, context, schema, usage)
+        if cache_key is not None:
+            self.response_cache.put(cache_key, response, model=self.provider_config.model)
+        return response
+
+    async def _make_uncached_request(
+        self,
+        messages: list[dict[str, str]],
+        context: str,
+        schema: dict[str, Any] | None = None,
+        usage: LLMUsage | None = None,
+    ) -> str:
+        """Send the request to the configured provider."""
         if self.provider_config.use_google_sdk:
             # For Google SDK, combine system and user messages into a single prompt
             # Google SDK doesn't have separate system/user roles like OpenAI/Anthropic
@@ -149,12 +264,19 @@ class LLMRequestHandler:
                     prompt_parts.append(f"User Request:\n{content}\n")
 
             combined_prompt = "\n".join(prompt_parts).strip()
-            return await self._make_google_sdk_request(combined_prompt)
+            return await self._make_google_sdk_request(combined_prompt, schema, usage)
         else:
-            return await self._make_litellm_request(messages, context)
+            return await self._make_litellm_request(messages, context, schema, usage)
 
-    async def _make_litellm_request(self, messages: list[dict[str, str]], context: str) -> str:
+    async def _make_litellm_request(
+        self,
+        messages: list[dict[str, str]],
+        context: str,
+        schema: dict[str, Any] | None = None,
+        usage: LLMUsage | None = None,
+    ) -> str:
         """Make request using LiteLLM with structured outputs when supported."""
+        schema = schema or self.response_schema
         last_exception = None
 
         for attempt in range(self.max_retries + 1):
@@ -172,17 +294,21 @@ class LLMRequestHandler:
                 # According to LiteLLM docs: https://docs.litellm.ai/docs/completion/json_mode
                 # Format: response_format={ "type": "json_schema", "json_schema": { "name": "...", "schema": {...}, "strict": true } }
                 # Works for: OpenAI, Anthropic Claude, Gemini (via LiteLLM), Bedrock, Vertex AI, Groq, Ollama, Databricks
-                if self.response_schema:
+                if schema:
                     request_params["response_format"] = {
                         "type": "json_schema",
                         "json_schema": {
                             "name": "security_analysis_response",
-                            "schema": self.response_schema,
+                            "schema": schema,
                             "strict": True,  # Enforce strict schema compliance - prevents extra fields
                         },
                     }
 
                 response = await acompletion(**request_params)
+                if usage is not None:
+                    response_usage = getattr(response, "usage", None)
+                    usage.prompt_tokens += _token_count(getattr(response_usage, "prompt_tokens", None))
+                    usage.completion_tokens += _token_count(getattr(response_usage, "completion_tokens", None))
                 return response.choices[0].message.content
 
             except Exception as e:
@@ -208,8 +334,11 @@ class LLMRequestHandler:
 
         raise last_exception
 
-    async def _make_google_sdk_request(self, prompt: str) -> str:
+    async def _make_google_sdk_request(
+        self, prompt: str, schema: dict[str, Any] | None = None, usage: LLMUsage | None = None
+    ) -> str:
         """Make request using Google GenAI SDK (new SDK) with structured outputs."""
+        schema = schema or self.response_schema
         last_exception = None
 
         for attempt in range(self.max_retries + 1):
@@ -228,10 +357,10 @@ class LLMRequestHandler:
                 # According to Gemini docs: https://ai.google.dev/gemini-api/docs/structured-output
                 # Format: response_mime_type="application/json" and response_schema={...}
                 # Note: Google SDK doesn't support additionalProperties in schema
-                if self.response_schema:
+                if schema:
                     config_dict["response_mime_type"] = "application/json"
                     # Remove additionalProperties for Google SDK compatibility
-                    sanitized_schema = self._sanitize_schema_for_google(self.response_schema)
+                    sanitized_schema = self._sanitize_schema_for_google(schema)
                     config_dict["response_schema"] = sanitized_schema
 
                 # Generate content using new SDK API
@@ -248,6 +377,10 @@ class LLMRequestHandler:
                     return response
 
                 response = await loop.run_in_executor(None, generate)
+                if usage is not None:
+                    usage_metadata = getattr(response, "usage_metadata", None)
+                    usage.prompt_tokens += _token_count(getattr(usage_metadata, "prompt_token_count", None))
+                    usage.completion_tokens += _token_count(getattr(usage_metadata, "candidates_token_count", None))
 
                 # Extract text from response (new SDK format)
                 # Response has .text attribute directly
@@ -42,6 +42,7 @@ from pathlib import Path
 from typing import Any
 
 from ...threats.threats import ThreatMapping
+from ..llm_cache import LLMResponseCache
 from ..models import Finding, Severity, Skill, ThreatCategory
 from .base import BaseAnalyzer
 from .llm_provider_config import ProviderConfig
@@ -243,6 +244,7 @@ class MetaAnalyzer(BaseAnalyzer):
         aws_region: str | None = None,
         aws_profile: str | None = None,
         aws_session_token: str | None = None,
+        response_cache: LLMResponseCache | None = None,
     ):
         """Initialize the Meta Analyzer.
 
@@ -258,6 +260,8 @@ class MetaAnalyzer(BaseAnalyzer):
             aws_region: AWS region (for Bedrock)
             aws_profile: AWS profile name (for Bedrock)
             aws_session_token: AWS session token (for Bedrock)
+            response_cache: Optional LLM response cache; identical meta-analysis
+                prompts are answered from disk instead of the provider
         """
         super().__init__("meta_analyzer")
 
@@ -318,6 +322,7 @@ class MetaAnalyzer(BaseAnalyzer):
         self.temperature = temperature
         self.max_retries = max_retries
         self.timeout = timeout
+        self.response_cache = response_cache
 
         # Load prompts
         self._load_prompts()
@@ -485,9 +490,8 @@ Respond with JSON containing your analysis following the required schema."""
             file_ext = Path(f.relative_path).suffix.lower()
             if file_ext in code_extensions or f.file_type in ["python", "bash", "script"]:
                 try:
-                    file_path = Path(skill.directory) / f.relative_path
-                    if file_path.exists() and file_path.is_file():
-                        content = file_path.read_text(encoding="utf-8", errors="replace")
+                    if skill.file_exists(f.relative_path):
+                        content = skill.read_file(f.relative_path, errors="replace")
 
                         # Truncate large files
                         if len(content) > max_file_size:
@@ -642,12 +646,24 @@ Respond with a JSON object following the schema in the system prompt."""
         if self.aws_profile:
             api_params["aws_profile_name"] = self.aws_profile
 
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.make_key(
+                self.model, messages, temperature=self.temperature, max_tokens=self.max_tokens
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # Retry logic with exponential backoff
         last_exception = None
         for attempt in range(self.max_retries):
             try:
                 response = await acompletion(**api_params)
-                return response.choices[0].message.content
+                content = response.choices[0].message.content
+                if cache_key is not None and content:
+                    self.response_cache.put(cache_key, content, model=self.model)
+                return content
 
             except Exception as e:
                 last_exception = e
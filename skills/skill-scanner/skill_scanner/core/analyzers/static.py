@@ -19,60 +19,26 @@ Static pattern analyzer for detecting security vulnerabilities.
 """
 
 import hashlib
+import json
 import logging
+import posixpath
 import re
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 from ...config.yara_modes import DEFAULT_YARA_MODE, YaraModeConfig
+from ...core.capabilities import CapabilityProfile
 from ...core.models import Finding, Severity, Skill, ThreatCategory
 from ...core.rules.patterns import RuleLoader, SecurityRule
 from ...core.rules.yara_scanner import YaraScanner
+from ...core.scan_cache import ScanCache
 from ...threats.threats import ThreatMapping
+from ...utils.line_index import LineIndex
 from .base import BaseAnalyzer
 
 logger = logging.getLogger(__name__)
 
-# Pre-compiled regex patterns for file operation checks
-_READ_PATTERNS = [
-    re.compile(r"open\([^)]+['\"]r['\"]"),
-    re.compile(r"open\([^)]+\)"),
-    re.compile(r"\.read\("),
-    re.compile(r"\.readline\("),
-    re.compile(r"\.readlines\("),
-    re.compile(r"Path\([^)]+\)\.read_text"),
-    re.compile(r"Path\([^)]+\)\.read_bytes"),
-    re.compile(r"with\s+open\([^)]+['\"]r"),
-]
-
-_WRITE_PATTERNS = [
-    re.compile(r"open\([^)]+['\"]w['\"]"),
-    re.compile(r"\.write\("),
-    re.compile(r"\.writelines\("),
-    re.compile(r"pathlib\.Path\([^)]+\)\.write"),
-    re.compile(r"with\s+open\([^)]+['\"]w"),
-]
-
-_GREP_PATTERNS = [
-    re.compile(r"re\.search\("),
-    re.compile(r"re\.findall\("),
-    re.compile(r"re\.match\("),
-    re.compile(r"re\.finditer\("),
-    re.compile(r"re\.sub\("),
-    re.compile(r"\.search\("),
-    re.compile(r"\.findall\("),
-    re.compile(r"grep"),
-]
-
-_GLOB_PATTERNS = [
-    re.compile(r"glob\.glob\("),
-    re.compile(r"glob\.iglob\("),
-    re.compile(r"Path\([^)]*\)\.glob\("),
-    re.compile(r"\.glob\("),
-    re.compile(r"\.rglob\("),
-    re.compile(r"fnmatch\."),
-]
-
 _EXCEPTION_PATTERNS = [
     re.compile(r"except\s+(EOFError|StopIteration|KeyboardInterrupt|Exception|BaseException)"),
     re.compile(r"except\s*:"),
@@ -88,6 +54,39 @@ _PYTHON_IMPORT_PATTERN = re.compile(r"^from\s+\.([A-Za-z0-9_.]*)\s+import", re.M
 _BASH_SOURCE_PATTERN = re.compile(r"(?:source|\.)\s+([A-Za-z0-9_\-./]+\.(?:sh|bash))")
 _RM_TARGET_PATTERN = re.compile(r"rm\s+-r[^;]*?\s+([^\s;]+)")
 
+# Referenced files are looked up as given, then under these directories
+_REFERENCE_SEARCH_DIRS = ("references", "assets", "templates", "scripts")
+# Rule set applied to a referenced file, by suffix
+_REFERENCE_FILE_TYPES = {".md": "markdown", ".markdown": "markdown", ".py": "python", ".sh": "bash", ".bash": "bash"}
+
+# Prompt-injection and suspicious-URL patterns applied to asset/template files
+_ASSET_PATTERNS = [
+    (
+        re.compile(r"ignore\s+(all\s+)?previous\s+instructions?", re.IGNORECASE),
+        "ASSET_PROMPT_INJECTION",
+        Severity.HIGH,
+        "Prompt injection pattern in asset file",
+    ),
+    (
+        re.compile(r"disregard\s+(all\s+)?prior", re.IGNORECASE),
+        "ASSET_PROMPT_INJECTION",
+        Severity.HIGH,
+        "Prompt override pattern in asset file",
+    ),
+    (
+        re.compile(r"you\s+are\s+now\s+", re.IGNORECASE),
+        "ASSET_PROMPT_INJECTION",
+        Severity.MEDIUM,
+        "Role reassignment pattern in asset file",
+    ),
+    (
+        re.compile(r"https?://[^\s]+\.(tk|ml|ga|cf|gq)/", re.IGNORECASE),
+        "ASSET_SUSPICIOUS_URL",
+        Severity.MEDIUM,
+        "Suspicious free domain URL in asset",
+    ),
+]
+
 
 class StaticAnalyzer(BaseAnalyzer):
     """Static pattern-based security analyzer."""
@@ -99,6 +98,7 @@ class StaticAnalyzer(BaseAnalyzer):
         yara_mode: YaraModeConfig | str | None = None,
         custom_yara_rules_path: str | Path | None = None,
         disabled_rules: set[str] | None = None,
+        cache: ScanCache | None = None,
     ):
         """
         Initialize static analyzer.
@@ -115,6 +115,9 @@ class StaticAnalyzer(BaseAnalyzer):
             disabled_rules: Set of rule names to disable. Rules can be YARA rule
                 names (e.g., "YARA_script_injection") or static rule IDs
                 (e.g., "COMMAND_INJECTION_EVAL").
+            cache: Optional scan cache. When set, per-file passes (instruction
+                body, script rules, YARA, asset patterns) are served from the
+                cache for files whose content is unchanged.
         """
         super().__init__("static_analyzer")
 
@@ -137,18 +140,75 @@ class StaticAnalyzer(BaseAnalyzer):
         self.custom_yara_rules_path = Path(custom_yara_rules_path) if custom_yara_rules_path else None
 
         self.use_yara = use_yara
-        self.yara_scanner = None
-        if use_yara:
-            try:
-                # Use custom rules path if provided
-                if self.custom_yara_rules_path:
-                    self.yara_scanner = YaraScanner(rules_dir=self.custom_yara_rules_path)
-                    logger.info("Using custom YARA rules from: %s", self.custom_yara_rules_path)
-                else:
-                    self.yara_scanner = YaraScanner()
-            except Exception as e:
-                logger.warning("Could not load YARA scanner: %s", e)
-                self.yara_scanner = None
+        self.yara_scanner = self._load_yara_scanner() if use_yara else None
+
+        self.cache = cache
+        self._cache_fingerprint: str | None = None
+
+    def _load_yara_scanner(self) -> YaraScanner | None:
+        """Build the YARA scanner, using custom rules if configured."""
+        try:
+            # Use custom rules path if provided
+            if self.custom_yara_rules_path:
+                scanner = YaraScanner(rules_dir=self.custom_yara_rules_path)
+                logger.info("Using custom YARA rules from: %s", self.custom_yara_rules_path)
+                return scanner
+            return YaraScanner()
+        except Exception as e:
+            logger.warning("Could not load YARA scanner: %s", e)
+            return None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop compiled YARA rules (not picklable) when shipping to worker processes."""
+        state = self.__dict__.copy()
+        state["yara_scanner"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Recompile YARA rules after unpickling."""
+        self.__dict__.update(state)
+        if self.use_yara:
+            self.yara_scanner = self._load_yara_scanner()
+
+    @property
+    def cache_fingerprint(self) -> str:
+        """
+        Fingerprint of everything that affects per-file findings.
+
+        Covers the YAML rule pack, the YARA rule sources, the YARA mode and
+        the disabled-rule set.
+        """
+        if self._cache_fingerprint is None:
+            hasher = hashlib.sha256()
+            hasher.update(Path(self.rule_loader.rules_file).read_bytes())
+            if self.yara_scanner:
+                for yara_file in sorted(self.yara_scanner.rules_dir.glob("*.yara")):
+                    hasher.update(yara_file.name.encode())
+                    hasher.update(yara_file.read_bytes())
+            mode = self.yara_mode.to_dict()
+            mode["enabled_rules"] = sorted(mode["enabled_rules"])
+            mode["disabled_rules"] = sorted(mode["disabled_rules"])
+            hasher.update(json.dumps(mode, sort_keys=True).encode())
+            hasher.update(json.dumps(sorted(self.disabled_rules)).encode())
+            hasher.update(str(self.use_yara and self.yara_scanner is not None).encode())
+            self._cache_fingerprint = hasher.hexdigest()
+        return self._cache_fingerprint
+
+    def _cached_file_pass(
+        self, pass_name: str, file_path: str, content: str, compute: Callable[[], list[Finding]]
+    ) -> list[Finding]:
+        """Run a per-file pass, serving its findings from the scan cache when possible."""
+        if self.cache is None:
+            return compute()
+
+        namespace = f"static:{pass_name}"
+        cached = self.cache.get(namespace, self.cache_fingerprint, file_path, content)
+        if cached is not None:
+            return [Finding.from_dict(data) for data in cached]
+
+        findings = compute()
+        self.cache.put(namespace, self.cache_fingerprint, file_path, content, [f.to_dict() for f in findings])
+        return findings
 
     def _is_rule_enabled(self, rule_name: str) -> bool:
         """
@@ -329,13 +389,25 @@ class StaticAnalyzer(BaseAnalyzer):
 
     def _scan_instruction_body(self, skill: Skill) -> list[Finding]:
         """Scan SKILL.md instruction body for prompt injection patterns."""
-        findings = []
+        return self._cached_file_pass(
+            "instructions",
+            "SKILL.md",
+            skill.instruction_body,
+            lambda: self._scan_content_with_rules(skill.instruction_body, "SKILL.md", "markdown"),
+        )
 
-        markdown_rules = self.rule_loader.get_rules_for_file_type("markdown")
+    def _scan_content_with_rules(self, content: str, file_path: str, file_type: str) -> list[Finding]:
+        """Apply all YAML rules for a file type to content."""
+        findings = []
+        lines: list[str] | None = None
 
-        for rule in markdown_rules:
-            matches = rule.scan_content(skill.instruction_body, "SKILL.md")
+        for rule, matches in self.rule_loader.get_rule_set(file_type).scan_content(content, file_path):
             for match in matches:
+                if rule.id == "RESOURCE_ABUSE_INFINITE_LOOP" and file_type == "python":
+                    if lines is None:
+                        lines = content.split("\n")
+                    if self._is_loop_with_exception_handler(lines, match["line_number"]):
+                        continue
                 findings.append(self._create_finding_from_match(rule, match))
 
         return findings
@@ -348,25 +420,23 @@ class StaticAnalyzer(BaseAnalyzer):
             if skill_file.file_type not in ("python", "bash"):
                 continue
 
-            rules = self.rule_loader.get_rules_for_file_type(skill_file.file_type)
-
             content = skill_file.read_content()
             if not content:
                 continue
 
-            for rule in rules:
-                matches = rule.scan_content(content, skill_file.relative_path)
-                for match in matches:
-                    if rule.id == "RESOURCE_ABUSE_INFINITE_LOOP" and skill_file.file_type == "python":
-                        if self._is_loop_with_exception_handler(content, match["line_number"]):
-                            continue
-                    findings.append(self._create_finding_from_match(rule, match))
+            findings.extend(
+                self._cached_file_pass(
+                    f"scripts:{skill_file.file_type}",
+                    skill_file.relative_path,
+                    content,
+                    lambda: self._scan_content_with_rules(content, skill_file.relative_path, skill_file.file_type),
+                )
+            )
 
         return findings
 
-    def _is_loop_with_exception_handler(self, content: str, loop_line_num: int) -> bool:
+    def _is_loop_with_exception_handler(self, lines: list[str], loop_line_num: int) -> bool:
         """Check if a while True loop has an exception handler in surrounding context."""
-        lines = content.split("\n")
         context_lines = lines[loop_line_num - 1 : min(loop_line_num + 20, len(lines))]
         context_text = "\n".join(context_lines)
 
@@ -380,7 +450,8 @@ class StaticAnalyzer(BaseAnalyzer):
         """Check for inconsistencies between manifest and actual behavior."""
         findings = []
 
-        uses_network = self._skill_uses_network(skill)
+        capabilities = skill.capabilities()
+        uses_network = capabilities.uses_external_network
         declared_network = self._manifest_declares_network(skill)
 
         if uses_network and not declared_network:
@@ -398,9 +469,9 @@ class StaticAnalyzer(BaseAnalyzer):
                 )
             )
 
-        findings.extend(self._check_allowed_tools_violations(skill))
+        findings.extend(self._check_allowed_tools_violations(skill, capabilities))
 
-        if self._check_description_mismatch(skill):
+        if self._check_description_mismatch(skill, capabilities):
             findings.append(
                 Finding(
                     id=self._generate_finding_id("DESC_BEHAVIOR_MISMATCH", skill.name),
@@ -448,6 +519,7 @@ class StaticAnalyzer(BaseAnalyzer):
             List of findings from all referenced files
         """
         findings = []
+        store = skill.get_content_store()
 
         if visited is None:
             visited = set()
@@ -478,44 +550,29 @@ class StaticAnalyzer(BaseAnalyzer):
                 continue
             visited.add(ref_file_path)
 
-            full_path = skill.directory / ref_file_path
-            if not full_path.exists():
-                alt_paths = [
-                    skill.directory / "references" / ref_file_path,
-                    skill.directory / "assets" / ref_file_path,
-                    skill.directory / "templates" / ref_file_path,
-                    skill.directory / "scripts" / ref_file_path,
-                ]
-                for alt in alt_paths:
-                    if alt.exists():
-                        full_path = alt
-                        break
-
-            if not full_path.exists():
-                continue
+            skill_file = store.resolve(ref_file_path, _REFERENCE_SEARCH_DIRS)
+            if skill_file is not None:
+                file_path, content = skill_file.path, skill_file.read_content()
+            else:
+                # The loader skips hidden files, but one the skill references is still scanned
+                unindexed = self._read_unindexed_reference(skill, ref_file_path)
+                if unindexed is None:
+                    continue
+                file_path, content = unindexed
 
             try:
-                with open(full_path, encoding="utf-8") as f:
-                    content = f.read()
-
-                suffix = full_path.suffix.lower()
-                if suffix in (".md", ".markdown"):
-                    rules = self.rule_loader.get_rules_for_file_type("markdown")
-                elif suffix == ".py":
-                    rules = self.rule_loader.get_rules_for_file_type("python")
-                elif suffix in (".sh", ".bash"):
-                    rules = self.rule_loader.get_rules_for_file_type("bash")
-                else:
-                    rules = []
-
-                for rule in rules:
-                    matches = rule.scan_content(content, ref_file_path)
+                file_type = _REFERENCE_FILE_TYPES.get(file_path.suffix.lower())
+                rule_matches = (
+                    self.rule_loader.get_rule_set(file_type).scan_content(content, ref_file_path) if file_type else []
+                )
+
+                for rule, matches in rule_matches:
                     for match in matches:
                         finding = self._create_finding_from_match(rule, match)
                         finding.metadata["reference_depth"] = current_depth
                         findings.append(finding)
 
-                nested_refs = self._extract_references_from_content(full_path, content)
+                nested_refs = self._extract_references_from_content(file_path, content)
                 if nested_refs:
                     findings.extend(
                         self._scan_references_recursive(skill, nested_refs, max_depth, current_depth + 1, visited)
@@ -526,6 +583,40 @@ class StaticAnalyzer(BaseAnalyzer):
 
         return findings
 
+    def _read_unindexed_reference(self, skill: Skill, reference: str) -> tuple[Path, str] | None:
+        """
+        Read a referenced file the loader did not index, such as a hidden file.
+
+        The reference is tried as given and then under each search directory,
+        on disk or in the skill's archive. References outside the package
+        (absolute, through ``..``, or via a symlink leaving a skill directory)
+        are refused.
+
+        Args:
+            skill: Skill being scanned
+            reference: Referenced path, relative to the skill directory
+
+        Returns:
+            The file's path and content, or None if the package has no such file
+        """
+        reference = posixpath.normpath(reference.replace("\\", "/"))
+        if reference.startswith("/") or reference == ".." or reference.startswith("../"):
+            return None
+
+        for relative_path in (reference, *(f"{directory}/{reference}" for directory in _REFERENCE_SEARCH_DIRS)):
+            path = skill.directory / relative_path
+            if skill.archive is None:
+                root = skill.directory.resolve()
+                if not path.is_file() or not path.resolve().is_relative_to(root):
+                    continue
+            elif not skill.file_exists(relative_path):
+                continue
+            try:
+                return path, skill.read_file(relative_path, errors="replace")
+            except (OSError, ValueError):
+                continue
+        return None
+
     def _extract_references_from_content(self, file_path: Path, content: str) -> list[str]:
         """
         Extract file references from content based on file type.
@@ -610,36 +701,6 @@ class StaticAnalyzer(BaseAnalyzer):
 
         return findings
 
-    def _skill_uses_network(self, skill: Skill) -> bool:
-        """Check if skill code uses network libraries for EXTERNAL communication."""
-        external_network_indicators = [
-            "import requests",
-            "from requests import",
-            "import urllib.request",
-            "from urllib.request import",
-            "import http.client",
-            "import httpx",
-            "import aiohttp",
-        ]
-
-        socket_external_indicators = ["socket.connect", "socket.create_connection"]
-        socket_localhost_indicators = ["localhost", "127.0.0.1", "::1"]
-
-        for skill_file in skill.get_scripts():
-            content = skill_file.read_content()
-
-            if any(indicator in content for indicator in external_network_indicators):
-                return True
-
-            if "import socket" in content:
-                has_socket_connect = any(ind in content for ind in socket_external_indicators)
-                is_localhost_only = any(ind in content for ind in socket_localhost_indicators)
-
-                if has_socket_connect and not is_localhost_only:
-                    return True
-
-        return False
-
     def _manifest_declares_network(self, skill: Skill) -> bool:
         """Check if manifest declares network usage."""
         if skill.manifest.compatibility:
@@ -647,18 +708,18 @@ class StaticAnalyzer(BaseAnalyzer):
             return "network" in compatibility_lower or "internet" in compatibility_lower
         return False
 
-    def _check_description_mismatch(self, skill: Skill) -> bool:
+    def _check_description_mismatch(self, skill: Skill, capabilities: CapabilityProfile) -> bool:
         """Check for description/behavior mismatch (basic heuristic)."""
         description = skill.description.lower()
 
         simple_keywords = ["calculator", "format", "template", "style", "lint"]
         if any(keyword in description for keyword in simple_keywords):
-            if self._skill_uses_network(skill):
+            if capabilities.uses_external_network:
                 return True
 
         return False
 
-    def _check_allowed_tools_violations(self, skill: Skill) -> list[Finding]:
+    def _check_allowed_tools_violations(self, skill: Skill, capabilities: CapabilityProfile) -> list[Finding]:
         """Check if code behavior violates allowed-tools restrictions."""
         findings = []
 
@@ -668,7 +729,7 @@ class StaticAnalyzer(BaseAnalyzer):
         allowed_tools_lower = [tool.lower() for tool in skill.manifest.allowed_tools]
 
         if "read" not in allowed_tools_lower:
-            if self._code_reads_files(skill):
+            if capabilities.reads_files:
                 findings.append(
                     Finding(
                         id=self._generate_finding_id("ALLOWED_TOOLS_READ_VIOLATION", skill.name),
@@ -687,7 +748,7 @@ class StaticAnalyzer(BaseAnalyzer):
                 )
 
         if "write" not in allowed_tools_lower:
-            if self._code_writes_files(skill):
+            if capabilities.writes_files:
                 findings.append(
                     Finding(
                         id=self._generate_finding_id("ALLOWED_TOOLS_WRITE_VIOLATION", skill.name),
@@ -706,7 +767,7 @@ class StaticAnalyzer(BaseAnalyzer):
                 )
 
         if "bash" not in allowed_tools_lower:
-            if self._code_executes_bash(skill):
+            if capabilities.executes_shell:
                 findings.append(
                     Finding(
                         id=self._generate_finding_id("ALLOWED_TOOLS_BASH_VIOLATION", skill.name),
@@ -728,7 +789,7 @@ class StaticAnalyzer(BaseAnalyzer):
         # If direct Python execution is a concern, COMMAND_INJECTION_EVAL catches actual risks.
 
         if "grep" not in allowed_tools_lower:
-            if self._code_uses_grep(skill):
+            if capabilities.uses_grep:
                 findings.append(
                     Finding(
                         id=self._generate_finding_id("ALLOWED_TOOLS_GREP_VIOLATION", skill.name),
@@ -744,7 +805,7 @@ class StaticAnalyzer(BaseAnalyzer):
                 )
 
         if "glob" not in allowed_tools_lower:
-            if self._code_uses_glob(skill):
+            if capabilities.uses_glob:
                 findings.append(
                     Finding(
                         id=self._generate_finding_id("ALLOWED_TOOLS_GLOB_VIOLATION", skill.name),
@@ -759,7 +820,7 @@ class StaticAnalyzer(BaseAnalyzer):
                     )
                 )
 
-        if self._code_uses_network(skill):
+        if capabilities.uses_network:
             findings.append(
                 Finding(
                     id=self._generate_finding_id("ALLOWED_TOOLS_NETWORK_USAGE", skill.name),
@@ -779,121 +840,12 @@ class StaticAnalyzer(BaseAnalyzer):
 
         return findings
 
-    def _code_reads_files(self, skill: Skill) -> bool:
-        """Check if code contains file reading operations."""
-        for skill_file in skill.get_scripts():
-            content = skill_file.read_content()
-            for pattern in _READ_PATTERNS:
-                if pattern.search(content):
-                    return True
-        return False
-
-    def _code_writes_files(self, skill: Skill) -> bool:
-        """Check if code contains file writing operations."""
-        for skill_file in skill.get_scripts():
-            content = skill_file.read_content()
-            for pattern in _WRITE_PATTERNS:
-                if pattern.search(content):
-                    return True
-        return False
-
-    def _code_executes_bash(self, skill: Skill) -> bool:
-        """Check if code executes bash/shell commands."""
-        bash_indicators = [
-            "subprocess.run",
-            "subprocess.call",
-            "subprocess.Popen",
-            "subprocess.check_output",
-            "os.system",
-            "os.popen",
-            "commands.getoutput",
-            "shell=True",
-        ]
-
-        has_bash_scripts = any(f.file_type == "bash" for f in skill.files)
-        if has_bash_scripts:
-            return True
-
-        for skill_file in skill.get_scripts():
-            content = skill_file.read_content()
-            if any(indicator in content for indicator in bash_indicators):
-                return True
-        return False
-
-    def _code_uses_grep(self, skill: Skill) -> bool:
-        """Check if code uses regex search/grep patterns."""
-        for skill_file in skill.get_scripts():
-            content = skill_file.read_content()
-            for pattern in _GREP_PATTERNS:
-                if pattern.search(content):
-                    return True
-        return False
-
-    def _code_uses_glob(self, skill: Skill) -> bool:
-        """Check if code uses glob/file pattern matching."""
-        for skill_file in skill.get_scripts():
-            content = skill_file.read_content()
-            for pattern in _GLOB_PATTERNS:
-                if pattern.search(content):
-                    return True
-        return False
-
-    def _code_uses_network(self, skill: Skill) -> bool:
-        """Check if code makes network requests."""
-        network_indicators = [
-            "requests.get",
-            "requests.post",
-            "requests.put",
-            "requests.delete",
-            "requests.patch",
-            "urllib.request",
-            "urllib.urlopen",
-            "http.client",
-            "httpx.",
-            "aiohttp.",
-            "socket.connect",
-            "socket.create_connection",
-        ]
-
-        for skill_file in skill.get_scripts():
-            content = skill_file.read_content()
-            if any(indicator in content for indicator in network_indicators):
-                return True
-        return False
-
     def _scan_asset_files(self, skill: Skill) -> list[Finding]:
         """Scan files in assets/, templates/, and references/ directories for injection patterns."""
         findings = []
 
         ASSET_DIRS = ["assets", "templates", "references", "data"]
 
-        ASSET_PATTERNS = [
-            (
-                re.compile(r"ignore\s+(all\s+)?previous\s+instructions?", re.IGNORECASE),
-                "ASSET_PROMPT_INJECTION",
-                Severity.HIGH,
-                "Prompt injection pattern in asset file",
-            ),
-            (
-                re.compile(r"disregard\s+(all\s+)?prior", re.IGNORECASE),
-                "ASSET_PROMPT_INJECTION",
-                Severity.HIGH,
-                "Prompt override pattern in asset file",
-            ),
-            (
-                re.compile(r"you\s+are\s+now\s+", re.IGNORECASE),
-                "ASSET_PROMPT_INJECTION",
-                Severity.MEDIUM,
-                "Role reassignment pattern in asset file",
-            ),
-            (
-                re.compile(r"https?://[^\s]+\.(tk|ml|ga|cf|gq)/", re.IGNORECASE),
-                "ASSET_SUSPICIOUS_URL",
-                Severity.MEDIUM,
-                "Suspicious free domain URL in asset",
-            ),
-        ]
-
         for skill_file in skill.files:
             path_parts = skill_file.relative_path.split("/")
 
@@ -913,34 +865,51 @@ class StaticAnalyzer(BaseAnalyzer):
             if not content:
                 continue
 
-            for pattern, rule_id, severity, description in ASSET_PATTERNS:
-                matches = list(pattern.finditer(content))
-
-                for match in matches:
-                    line_number = content[: match.start()].count("\n") + 1
-                    line_content = content.split("\n")[line_number - 1] if content else ""
-
-                    findings.append(
-                        Finding(
-                            id=self._generate_finding_id(rule_id, f"{skill_file.relative_path}:{line_number}"),
-                            rule_id=rule_id,
-                            category=ThreatCategory.PROMPT_INJECTION
-                            if "PROMPT" in rule_id
-                            else ThreatCategory.COMMAND_INJECTION
-                            if "CODE" in rule_id or "SCRIPT" in rule_id
-                            else ThreatCategory.OBFUSCATION
-                            if "BASE64" in rule_id
-                            else ThreatCategory.POLICY_VIOLATION,
-                            severity=severity,
-                            title=description,
-                            description=f"Pattern '{match.group()[:50]}...' detected in asset file",
-                            file_path=skill_file.relative_path,
-                            line_number=line_number,
-                            snippet=line_content[:100],
-                            remediation="Review the asset file and remove any malicious or unnecessary dynamic patterns",
-                            analyzer="static",
-                        )
+            findings.extend(
+                self._cached_file_pass(
+                    "assets",
+                    skill_file.relative_path,
+                    content,
+                    lambda: self._scan_asset_content(content, skill_file.relative_path),
+                )
+            )
+
+        return findings
+
+    def _scan_asset_content(self, content: str, relative_path: str) -> list[Finding]:
+        """Apply asset injection patterns to a single asset file."""
+        findings = []
+        line_index: LineIndex | None = None
+
+        for pattern, rule_id, severity, description in _ASSET_PATTERNS:
+            matches = list(pattern.finditer(content))
+
+            for match in matches:
+                if line_index is None:
+                    line_index = LineIndex(content)
+                line_number, line_content = line_index.line_at(match.start())
+
+                findings.append(
+                    Finding(
+                        id=self._generate_finding_id(rule_id, f"{relative_path}:{line_number}"),
+                        rule_id=rule_id,
+                        category=ThreatCategory.PROMPT_INJECTION
+                        if "PROMPT" in rule_id
+                        else ThreatCategory.COMMAND_INJECTION
+                        if "CODE" in rule_id or "SCRIPT" in rule_id
+                        else ThreatCategory.OBFUSCATION
+                        if "BASE64" in rule_id
+                        else ThreatCategory.POLICY_VIOLATION,
+                        severity=severity,
+                        title=description,
+                        description=f"Pattern '{match.group()[:50]}...' detected in asset file",
+                        file_path=relative_path,
+                        line_number=line_number,
+                        snippet=line_content[:100],
+                        remediation="Review the asset file and remove any malicious or unnecessary dynamic patterns",
+                        analyzer="static",
                     )
+                )
 
         return findings
 
@@ -984,31 +953,57 @@ class StaticAnalyzer(BaseAnalyzer):
         """Scan skill files with YARA rules."""
         findings = []
 
-        yara_matches = self.yara_scanner.scan_content(skill.instruction_body, "SKILL.md")
-        for match in yara_matches:
-            rule_name = match.get("rule_name", "")
-            # Check if rule is enabled in current mode and not explicitly disabled
-            if not self._is_rule_enabled(rule_name):
-                continue
-            findings.extend(self._create_findings_from_yara_match(match, skill))
+        def scan_instructions() -> list[Finding]:
+            instruction_findings = []
+            yara_matches = self.yara_scanner.scan_content(skill.instruction_body, "SKILL.md")
+            for match in yara_matches:
+                rule_name = match.get("rule_name", "")
+                # Check if rule is enabled in current mode and not explicitly disabled
+                if not self._is_rule_enabled(rule_name):
+                    continue
+                instruction_findings.extend(self._create_findings_from_yara_match(match, skill))
+            return instruction_findings
+
+        findings.extend(
+            self._cached_file_pass("yara:instructions", "SKILL.md", skill.instruction_body, scan_instructions)
+        )
+
+        def scan_script(content: str, relative_path: str) -> list[Finding]:
+            script_findings = []
+            line_index = LineIndex(content)
+            yara_matches = self.yara_scanner.scan_content(content, relative_path, line_index)
+            for match in yara_matches:
+                rule_name = match.get("rule_name", "")
+                if rule_name == "capability_inflation_generic":
+                    continue
+                script_findings.extend(self._create_findings_from_yara_match(match, skill, content, line_index))
+            return script_findings
 
         for skill_file in skill.get_scripts():
             content = skill_file.read_content()
             if content:
-                yara_matches = self.yara_scanner.scan_content(content, skill_file.relative_path)
-                for match in yara_matches:
-                    rule_name = match.get("rule_name", "")
-                    if rule_name == "capability_inflation_generic":
-                        continue
-                    findings.extend(self._create_findings_from_yara_match(match, skill, content))
+                findings.extend(
+                    self._cached_file_pass(
+                        "yara:scripts",
+                        skill_file.relative_path,
+                        content,
+                        lambda: scan_script(content, skill_file.relative_path),
+                    )
+                )
 
         return findings
 
     def _create_findings_from_yara_match(
-        self, match: dict[str, Any], skill: Skill, file_content: str | None = None
+        self,
+        match: dict[str, Any],
+        skill: Skill,
+        file_content: str | None = None,
+        line_index: LineIndex | None = None,
     ) -> list[Finding]:
         """Convert YARA match to Finding objects."""
         findings = []
+        if line_index is None and file_content:
+            line_index = LineIndex(file_content)
 
         rule_name = match["rule_name"]
         namespace = match["namespace"]
@@ -1095,13 +1090,10 @@ class StaticAnalyzer(BaseAnalyzer):
                 matched_data = string_match.get("matched_data", "").lower()
 
                 context_content = ""
-                if file_content:
+                if line_index is not None:
                     line_num = string_match.get("line_number", 0)
                     if line_num > 0:
-                        lines = file_content.split("\n")
-                        start_line = max(0, line_num - 4)
-                        end_line = min(len(lines), line_num + 5)
-                        context_content = "\n".join(lines[start_line:end_line]).lower()
+                        context_content = "\n".join(line_index.context(line_num, before=3, after=5)).lower()
 
                 is_safe_command = any(
                     safe_cmd in line_content or safe_cmd in matched_data or safe_cmd in context_content
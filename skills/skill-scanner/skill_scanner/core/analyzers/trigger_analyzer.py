@@ -22,6 +22,7 @@ Overly generic descriptions can cause trigger hijacking where a skill
 activates for unrelated user requests.
 """
 
+import hashlib
 import re
 
 from ..models import Finding, Severity, Skill, ThreatCategory
@@ -179,7 +180,7 @@ class TriggerAnalyzer(BaseAnalyzer):
             if pattern.match(description):
                 findings.append(
                     Finding(
-                        id=f"TRIGGER_GENERIC_{hash(description) & 0xFFFFFFFF:08x}",
+                        id=self._generate_finding_id("TRIGGER_GENERIC", description),
                         rule_id="TRIGGER_OVERLY_GENERIC",
                         category=ThreatCategory.SOCIAL_ENGINEERING,
                         severity=Severity.MEDIUM,
@@ -213,7 +214,7 @@ class TriggerAnalyzer(BaseAnalyzer):
         if len(words) < 5:
             findings.append(
                 Finding(
-                    id=f"TRIGGER_SHORT_{hash(description) & 0xFFFFFFFF:08x}",
+                    id=self._generate_finding_id("TRIGGER_SHORT", description),
                     rule_id="TRIGGER_DESCRIPTION_TOO_SHORT",
                     category=ThreatCategory.SOCIAL_ENGINEERING,
                     severity=Severity.LOW,
@@ -243,7 +244,7 @@ class TriggerAnalyzer(BaseAnalyzer):
         if generic_ratio > 0.4 and specific_count < 2:
             findings.append(
                 Finding(
-                    id=f"TRIGGER_VAGUE_{hash(description) & 0xFFFFFFFF:08x}",
+                    id=self._generate_finding_id("TRIGGER_VAGUE", description),
                     rule_id="TRIGGER_VAGUE_DESCRIPTION",
                     category=ThreatCategory.SOCIAL_ENGINEERING,
                     severity=Severity.LOW,
@@ -291,7 +292,7 @@ class TriggerAnalyzer(BaseAnalyzer):
             if unique_ratio < 0.7 or description.strip().startswith(keyword_lists[0][:20]):
                 findings.append(
                     Finding(
-                        id=f"TRIGGER_KEYWORD_BAIT_{hash(description) & 0xFFFFFFFF:08x}",
+                        id=self._generate_finding_id("TRIGGER_KEYWORD_BAIT", description),
                         rule_id="TRIGGER_KEYWORD_BAITING",
                         category=ThreatCategory.SOCIAL_ENGINEERING,
                         severity=Severity.MEDIUM,
@@ -311,6 +312,10 @@ class TriggerAnalyzer(BaseAnalyzer):
 
         return findings
 
+    def _generate_finding_id(self, prefix: str, context: str) -> str:
+        """Generate a finding ID that is the same in every process (built-in hash() is salted per process)."""
+        return f"{prefix}_{hashlib.sha256(context.encode()).hexdigest()[:8]}"
+
     def get_specificity_score(self, description: str) -> float:
         """
         Calculate a specificity score for a description.
@@ -19,19 +19,80 @@ VirusTotal analyzer for scanning binary files using hash-based lookups.
 This analyzer checks binary files (images, PDFs, archives, etc.) against
 VirusTotal's database using SHA256 hash lookups. It does NOT scan code files
 like Python, JavaScript, or Markdown files.
+
+Files are hashed and looked up on a small thread pool. Every API request
+first takes a token from a rate limiter sized to the account's quota, and
+verdicts can be kept in a local VirusTotalCache so files seen in earlier
+scans are not looked up again.
 """
 
 import hashlib
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import BinaryIO
 
 import httpx
 
-from ..models import Finding, Severity, Skill, ThreatCategory
-from .base import BaseAnalyzer
+from ..models import Finding, Severity, Skill, SkillFile, ThreatCategory
+from ..vt_cache import VirusTotalCache
+from .base import AnalysisOutput, BaseAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Public API quota; premium keys can raise it with VIRUSTOTAL_REQUESTS_PER_MINUTE
+DEFAULT_REQUESTS_PER_MINUTE = 4
+DEFAULT_MAX_WORKERS = 4
+_HASH_CHUNK_SIZE = 1024 * 1024  # hashlib releases the GIL on large updates, so files hash in parallel
+
+
+class VirusTotalRateLimiter:
+    """Token bucket limiting how many VirusTotal requests start per minute.
+
+    Safe to share across threads; callers block in acquire() until their
+    request may be sent.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int = 1):
+        """Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Sustained request rate (must be positive)
+            burst: Requests allowed back to back before the rate applies. The default
+                of 1 keeps any one-minute window within the quota.
+
+        Raises:
+            ValueError: If requests_per_minute is not positive
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.requests_per_minute = requests_per_minute
+        self.burst = max(1, burst)
+        self._rate = requests_per_minute / 60.0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
 
 class VirusTotalAnalyzer(BaseAnalyzer):
     """
@@ -135,7 +196,16 @@ class VirusTotalAnalyzer(BaseAnalyzer):
         ".tex",
     }
 
-    def __init__(self, api_key: str | None = None, enabled: bool = True, upload_files: bool = False):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        enabled: bool = True,
+        upload_files: bool = False,
+        cache: VirusTotalCache | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        requests_per_minute: float | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ):
         """
         Initialize VirusTotal analyzer.
 
@@ -144,14 +214,25 @@ class VirusTotalAnalyzer(BaseAnalyzer):
             enabled: Whether the analyzer is enabled (default: True)
             upload_files: If True, upload files to VT for scanning. If False (default),
                          only check existing hashes (more privacy-friendly)
+            cache: Optional verdict cache; hashes it knows are not looked up again
+            max_workers: Files hashed and looked up concurrently
+            requests_per_minute: API quota (default: $VIRUSTOTAL_REQUESTS_PER_MINUTE or 4,
+                the public API limit)
+            transport: HTTP transport for the API client (e.g. httpx.MockTransport in tests)
         """
         super().__init__("virustotal_analyzer")
+        if requests_per_minute is None:
+            requests_per_minute = float(os.getenv("VIRUSTOTAL_REQUESTS_PER_MINUTE", DEFAULT_REQUESTS_PER_MINUTE))
+
         self.api_key = api_key
         self.enabled = enabled and api_key is not None
         self.upload_files = upload_files
-        self.validated_binary_files = []  # Track files validated as safe by VirusTotal
+        self.verdict_cache = cache
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = VirusTotalRateLimiter(requests_per_minute)
+        self.validated_binary_files = []  # Files validated as safe by the last analyze() call
         self.base_url = "https://www.virustotal.com/api/v3"
-        self.session = httpx.Client()
+        self.session = httpx.Client(transport=transport)
 
         if not self.api_key:
             logger.warning("VirusTotal API key is missing!")
@@ -170,72 +251,140 @@ class VirusTotalAnalyzer(BaseAnalyzer):
             skill: The skill to analyze
 
         Returns:
-            List of findings for malicious files. Also stores validated file paths
-            in skill metadata to allow suppression of binary file warnings.
+            List of findings for malicious files. Files found clean are stored
+            in validated_binary_files to allow suppression of binary file warnings.
+        """
+        output = self.run(skill)
+        self.validated_binary_files = output.validated_binary_files
+        return output.findings
+
+    def run(self, skill: Skill) -> AnalysisOutput:
+        """
+        Analyze binary files in the skill, returning the files found clean with the findings.
+
+        Files are hashed concurrently, each distinct hash is looked up once
+        (from the verdict cache when possible), and unknown files are uploaded
+        if uploads are enabled. Findings are reported in file order.
+
+        Args:
+            skill: The skill to analyze
+
+        Returns:
+            Findings for malicious files and the paths of validated binary files
         """
         if not self.enabled:
-            return []
+            return AnalysisOutput(findings=[])
 
         findings = []
         validated_files = []  # Track files validated as safe
 
         # Only scan binary files
         binary_files = [f for f in skill.files if self._is_binary_file(f.relative_path)]
+        # Archive members are hashed and uploaded from the archive, never written to disk
+        sources = [f if skill.archive is not None else Path(skill.directory) / f.relative_path for f in binary_files]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            hashes = list(pool.map(self._hash_file, binary_files, sources))
+            unique_hashes = list(dict.fromkeys(h for h in hashes if h))
+            verdicts = dict(zip(unique_hashes, pool.map(self._lookup, unique_hashes), strict=True))
+
+            uploads = {}
+            if self.upload_files:
+                for file_hash, source in zip(hashes, sources, strict=True):
+                    if file_hash and verdicts.get(file_hash) == (None, False) and file_hash not in uploads:
+                        uploads[file_hash] = source
+                if uploads:
+                    logger.warning("%d hashes not found in VT database - uploading for analysis", len(uploads))
+            uploaded = dict(zip(uploads, pool.map(self._upload, uploads.values(), uploads), strict=True))
+
+        for skill_file, file_hash in zip(binary_files, hashes, strict=True):
+            verdict = verdicts.get(file_hash) if file_hash else None
+            if verdict is None:
+                continue  # Hashing or lookup failed; already logged
+            vt_result, hash_found = verdict
+
+            logger.info("Checking file: %s (SHA256: %s)", skill_file.relative_path, file_hash)
+
+            if hash_found:
+                total = vt_result.get("total_engines", 0)
+                malicious = vt_result.get("malicious", 0)
+                suspicious = vt_result.get("suspicious", 0)
+
+                if malicious > 0 or suspicious > 0:
+                    logger.warning(
+                        "Found in VT database: %d malicious, %d suspicious out of %d vendors",
+                        malicious,
+                        suspicious,
+                        total,
+                    )
+                else:
+                    logger.info("Found in VT database: %d/%d vendors flagged (file appears safe)", malicious, total)
+                    validated_files.append(skill_file.relative_path)
 
-        for skill_file in binary_files:
-            try:
-                file_path = Path(skill.directory) / skill_file.relative_path
-                file_hash = self._calculate_sha256(file_path)
-
-                logger.info("Checking file: %s (SHA256: %s)", skill_file.relative_path, file_hash)
-
-                vt_result, hash_found = self._query_virustotal(file_hash)
+                if vt_result.get("permalink"):
+                    logger.info("Report: %s", vt_result["permalink"])
 
-                if hash_found:
-                    total = vt_result.get("total_engines", 0)
-                    malicious = vt_result.get("malicious", 0)
-                    suspicious = vt_result.get("suspicious", 0)
+                if malicious > 0:
+                    findings.append(
+                        self._create_finding(skill_file=skill_file, file_hash=file_hash, vt_result=vt_result)
+                    )
+            elif self.upload_files:
+                vt_result = uploaded.get(file_hash)
 
-                    if malicious > 0 or suspicious > 0:
-                        logger.warning(
-                            "Found in VT database: %d malicious, %d suspicious out of %d vendors",
-                            malicious,
-                            suspicious,
-                            total,
+                if vt_result:
+                    if vt_result.get("malicious", 0) > 0:
+                        findings.append(
+                            self._create_finding(skill_file=skill_file, file_hash=file_hash, vt_result=vt_result)
                         )
                     else:
-                        logger.info("Found in VT database: %d/%d vendors flagged (file appears safe)", malicious, total)
                         validated_files.append(skill_file.relative_path)
+            else:
+                logger.warning("Hash not found in VT database - upload disabled, cannot scan unknown file")
 
-                    if vt_result.get("permalink"):
-                        logger.info("Report: %s", vt_result["permalink"])
+        return AnalysisOutput(findings=findings, validated_binary_files=validated_files)
 
-                    if malicious > 0:
-                        findings.append(
-                            self._create_finding(skill_file=skill_file, file_hash=file_hash, vt_result=vt_result)
-                        )
-                elif self.upload_files:
-                    logger.warning("Hash not found in VT database - uploading for analysis")
-                    vt_result = self._upload_and_scan(file_path, file_hash)
-
-                    if vt_result:
-                        if vt_result.get("malicious", 0) > 0:
-                            findings.append(
-                                self._create_finding(skill_file=skill_file, file_hash=file_hash, vt_result=vt_result)
-                            )
-                        else:
-                            validated_files.append(skill_file.relative_path)
-                else:
-                    logger.warning("Hash not found in VT database - upload disabled, cannot scan unknown file")
+    def close(self) -> None:
+        """Close the HTTP session."""
+        self.session.close()
 
-            except Exception as e:
-                logger.warning("VirusTotal scan failed for %s: %s", skill_file.relative_path, e)
-                continue
+    def _hash_file(self, skill_file: SkillFile, file_path: Path | SkillFile) -> str | None:
+        """Hash one file, logging and returning None if it cannot be read."""
+        try:
+            return self._calculate_sha256(file_path)
+        except Exception as e:
+            logger.warning("VirusTotal scan failed for %s: %s", skill_file.relative_path, e)
+            return None
 
-        # Store validated files in analyzer instance for post-processing
-        self.validated_binary_files = validated_files
+    def _lookup(self, file_hash: str) -> tuple[dict | None, bool] | None:
+        """
+        Get the verdict for a hash from the cache, or from VirusTotal.
 
-        return findings
+        Returns:
+            (stats, True) if VirusTotal knows the file, (None, False) if it does not,
+            or None if the lookup failed
+        """
+        if self.verdict_cache is not None:
+            cached = self.verdict_cache.get(file_hash)
+            if cached is not None:
+                logger.info("VirusTotal verdict for %s served from cache", file_hash)
+                return cached
+
+        try:
+            verdict = self._fetch_report(file_hash)
+        except Exception as e:
+            logger.warning("VirusTotal lookup failed for %s: %s", file_hash, e)
+            return None
+
+        if verdict is not None and self.verdict_cache is not None:
+            self.verdict_cache.put(file_hash, verdict[0])
+        return verdict
+
+    def _upload(self, file_path: Path | SkillFile, file_hash: str) -> dict | None:
+        """Upload an unknown file and cache the resulting report."""
+        vt_result = self._upload_and_scan(file_path, file_hash)
+        if vt_result and self.verdict_cache is not None:
+            self.verdict_cache.put(file_hash, vt_result)
+        return vt_result
 
     def _is_binary_file(self, file_path: str) -> bool:
         """
@@ -262,20 +411,20 @@ class VirusTotalAnalyzer(BaseAnalyzer):
         # (conservative approach to avoid scanning code files)
         return False
 
-    def _calculate_sha256(self, file_path: Path) -> str:
+    def _calculate_sha256(self, file_path: Path | SkillFile) -> str:
         """
         Calculate SHA256 hash of a file.
 
         Args:
-            file_path: Path to the file
+            file_path: Path to the file, or a SkillFile (which may live in an archive)
 
         Returns:
             SHA256 hash as hex string
         """
         sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
+        with _open_binary(file_path) as f:
             # Read file in chunks for memory efficiency
-            for byte_block in iter(lambda: f.read(4096), b""):
+            for byte_block in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
                 sha256_hash.update(byte_block)
         return sha256_hash.hexdigest()
 
@@ -292,7 +441,20 @@ class VirusTotalAnalyzer(BaseAnalyzer):
             - If hash not found (404): (None, False)
             - If error: (None, False)
         """
+        return self._fetch_report(file_hash) or (None, False)
+
+    def _fetch_report(self, file_hash: str) -> tuple[dict | None, bool] | None:
+        """
+        Fetch the file report for a hash, waiting for the rate limiter first.
+
+        Args:
+            file_hash: SHA256 hash of the file
+
+        Returns:
+            (stats_dict, True) if found, (None, False) on 404, or None on any other error
+        """
         try:
+            self.rate_limiter.acquire()
             response = self.session.get(f"{self.base_url}/files/{file_hash}", timeout=10)
 
             if response.status_code == 404:
@@ -324,33 +486,35 @@ class VirusTotalAnalyzer(BaseAnalyzer):
                 logger.warning("VirusTotal rate limit exceeded. Please wait before retrying.")
             else:
                 logger.warning("VirusTotal API returned status %d", response.status_code)
-            return None, False
+            return None
 
         except httpx.RequestError as e:
             logger.warning("VirusTotal API request failed: %s", e)
-            return None, False
+            return None
 
-    def _upload_and_scan(self, file_path: Path, file_hash: str) -> dict | None:
+    def _upload_and_scan(self, file_path: Path | SkillFile, file_hash: str) -> dict | None:
         """
         Upload file to VirusTotal for scanning.
 
         Args:
-            file_path: Path to the file to upload
+            file_path: Path to the file to upload, or a SkillFile (which may live in an archive)
             file_hash: SHA256 hash of the file
 
         Returns:
             Dictionary with detection stats or None if upload failed
         """
         try:
-            import time
-
-            file_size = file_path.stat().st_size
+            if isinstance(file_path, SkillFile):
+                file_size, file_name = file_path.size_bytes, file_path.path.name
+            else:
+                file_size, file_name = file_path.stat().st_size, file_path.name
             if file_size > 32 * 1024 * 1024:
-                logger.warning("File too large to upload to VT: %s (%d bytes)", file_path.name, file_size)
+                logger.warning("File too large to upload to VT: %s (%d bytes)", file_name, file_size)
                 return None
 
-            with open(file_path, "rb") as f:
-                files = {"file": (file_path.name, f)}
+            with _open_binary(file_path) as f:
+                files = {"file": (file_name, f)}
+                self.rate_limiter.acquire()
                 response = self.session.post(f"{self.base_url}/files", files=files, timeout=60)
 
             if response.status_code != 200:
@@ -370,6 +534,7 @@ class VirusTotalAnalyzer(BaseAnalyzer):
             for attempt in range(max_retries):
                 time.sleep(10)
 
+                self.rate_limiter.acquire()
                 analysis_response = self.session.get(f"{self.base_url}/analyses/{analysis_id}", timeout=10)
 
                 if analysis_response.status_code == 200:
@@ -461,3 +626,10 @@ class VirusTotalAnalyzer(BaseAnalyzer):
                 "file_hash": file_hash,
             },
         )
+
+
+def _open_binary(file_path: Path | SkillFile) -> BinaryIO:
+    """Open a file on disk or a SkillFile for binary reading."""
+    if isinstance(file_path, SkillFile):
+        return file_path.open_binary()
+    return open(file_path, "rb")
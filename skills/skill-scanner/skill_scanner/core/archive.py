@@ -0,0 +1,278 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Skill packages read directly from zip and tar archives.
+
+A SkillArchive lists the regular files of an archive and reads members on
+demand, one at a time, without extracting anything to disk. Limits on the
+member count, member size, total expanded size and compression ratio are
+checked against the archive headers when it is opened, and again against the
+bytes actually produced while a member is streamed, so an archive whose
+headers lie cannot expand past them.
+"""
+
+import logging
+import posixpath
+import stat
+import tarfile
+import threading
+import zipfile
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+DEFAULT_MAX_MEMBERS = 10_000
+DEFAULT_MAX_MEMBER_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_TOTAL_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_RATIO = 100
+RATIO_MIN_BYTES = 1024 * 1024  # Members and archives smaller than this are never ratio-checked
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class ArchiveError(ValueError):
+    """Raised when an archive cannot be read or exceeds one of its limits."""
+
+
+def is_archive(path: str | Path) -> bool:
+    """Check whether a file name has a supported archive suffix."""
+    return str(path).lower().endswith(ARCHIVE_SUFFIXES)
+
+
+@dataclass
+class ArchiveLimits:
+    """Limits enforced while listing and reading an archive."""
+
+    max_members: int = DEFAULT_MAX_MEMBERS
+    max_member_bytes: int = DEFAULT_MAX_MEMBER_BYTES
+    max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES
+    max_ratio: float = DEFAULT_MAX_RATIO
+
+
+@dataclass(frozen=True)
+class ArchiveMember:
+    """A regular file inside an archive."""
+
+    name: str  # Normalized POSIX path inside the archive
+    size: int  # Expanded size declared by the archive
+    compressed_size: int
+
+
+class SkillArchive:
+    """Read-only view of a zip or tar archive holding a skill package.
+
+    Paths passed to ``exists``, ``read_bytes`` and ``read_text`` are relative
+    to ``root``, the directory of the archive's SKILL.md once the loader has
+    located it.
+    """
+
+    def __init__(self, source: str | Path | BinaryIO, name: str | None = None, limits: ArchiveLimits | None = None):
+        """
+        Open an archive and list its members.
+
+        Args:
+            source: Archive path, or a seekable binary file object (not closed by this class)
+            name: Display name of the archive (default: file name of ``source``)
+            limits: Size limits (default: ArchiveLimits())
+
+        Raises:
+            ArchiveError: If the archive is not a readable zip or tar file, or exceeds a limit
+        """
+        self.limits = limits or ArchiveLimits()
+        self._owns_file = isinstance(source, str | Path)
+        self._file: BinaryIO = open(source, "rb") if self._owns_file else source
+        if name is None:
+            name = Path(source).name if self._owns_file else Path(getattr(source, "name", None) or "archive").name
+        self.name = name
+        self.root = ""
+        self._lock = threading.Lock()
+        self._zip: zipfile.ZipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        self._entries: dict[str, zipfile.ZipInfo | tarfile.TarInfo] = {}
+        self.members: dict[str, ArchiveMember] = {}
+        self.total_bytes = 0
+        self._directories: set[str] = set()
+
+        try:
+            archive_size = self._file.seek(0, 2)
+            self._file.seek(0)
+            if zipfile.is_zipfile(self._file):
+                self._file.seek(0)
+                self._zip = zipfile.ZipFile(self._file)
+                self._list_zip()
+            else:
+                self._file.seek(0)
+                self._tar = tarfile.open(fileobj=self._file, mode="r:*")
+                self._list_tar(archive_size)
+        except (zipfile.BadZipFile, tarfile.TarError, OSError, EOFError) as e:
+            self.close()
+            raise ArchiveError(f"Not a readable zip or tar archive: {e}") from e
+        except ArchiveError:
+            self.close()
+            raise
+
+    def __enter__(self) -> "SkillArchive":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the archive, and the underlying file if this archive opened it."""
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+        if self._owns_file:
+            self._file.close()
+
+    def find_skill_root(self) -> str | None:
+        """
+        Find the directory holding the package's SKILL.md, preferring the shallowest.
+
+        Returns:
+            Directory inside the archive ("" for the archive root), or None if there is no SKILL.md
+        """
+        candidates = [name for name in self.members if posixpath.basename(name) == "SKILL.md"]
+        if not candidates:
+            return None
+        best = min(candidates, key=lambda name: (name.count("/"), name))
+        return posixpath.dirname(best)
+
+    def files(self) -> Iterator[tuple[str, ArchiveMember]]:
+        """Yield (path relative to root, member) for every file under the root."""
+        prefix = f"{self.root}/" if self.root else ""
+        for name, member in self.members.items():
+            if name.startswith(prefix):
+                yield name[len(prefix) :], member
+
+    def exists(self, relative_path: str) -> bool:
+        """Check whether a file or directory exists under the root."""
+        name = self._resolve(relative_path)
+        return name is not None and (name in self.members or name in self._directories)
+
+    def read_bytes(self, relative_path: str) -> bytes:
+        """
+        Read one member, enforcing the size limits on the bytes actually produced.
+
+        Args:
+            relative_path: Path relative to the root
+
+        Returns:
+            Member content
+
+        Raises:
+            FileNotFoundError: If there is no such file
+            ArchiveError: If the member exceeds a limit or is corrupt
+        """
+        name = self._resolve(relative_path)
+        member = self.members.get(name) if name is not None else None
+        if member is None:
+            raise FileNotFoundError(f"{relative_path} not found in {self.name}")
+
+        limit = min(member.size, self.limits.max_member_bytes)
+        if member.size > self.limits.max_member_bytes:
+            raise ArchiveError(f"{name} is {member.size:,} bytes (limit {self.limits.max_member_bytes:,})")
+
+        with self._lock:
+            try:
+                data = bytearray()
+                with self._open_member(name) as stream:
+                    while chunk := stream.read(_CHUNK_SIZE):
+                        data += chunk
+                        if len(data) > limit:
+                            raise ArchiveError(f"{name} expands past its declared size of {member.size:,} bytes")
+            except (zipfile.BadZipFile, tarfile.TarError, EOFError) as e:
+                raise ArchiveError(f"Corrupt archive member {name}: {e}") from e
+        return bytes(data)
+
+    def read_text(self, relative_path: str, errors: str = "strict") -> str:
+        """Read one member as UTF-8 text."""
+        return self.read_bytes(relative_path).decode("utf-8", errors=errors)
+
+    def _open_member(self, name: str) -> BinaryIO:
+        """Open a member's content stream."""
+        entry = self._entries[name]
+        if self._zip is not None:
+            return self._zip.open(entry)
+        stream = self._tar.extractfile(entry)
+        if stream is None:
+            raise ArchiveError(f"{name} is not a regular file")
+        return stream
+
+    def _resolve(self, relative_path: str) -> str | None:
+        """Turn a path relative to the root into a member name, or None if it leaves the root."""
+        path = posixpath.normpath(relative_path.replace("\\", "/"))
+        if path.startswith("/") or path == ".." or path.startswith("../"):
+            return None
+        if path == ".":
+            return self.root
+        return posixpath.join(self.root, path) if self.root else path
+
+    def _add_member(self, raw_name: str, entry, size: int, compressed_size: int) -> None:
+        """Record one regular file, skipping names that would escape the archive."""
+        name = posixpath.normpath(raw_name.replace("\\", "/"))
+        if raw_name.startswith(("/", "\\")) or name == ".." or name.startswith("../") or name == ".":
+            logger.warning("Skipping archive member outside the package: %s", raw_name)
+            return
+
+        if len(self.members) >= self.limits.max_members:
+            raise ArchiveError(f"More than {self.limits.max_members:,} files")
+        if size > RATIO_MIN_BYTES and size > compressed_size * self.limits.max_ratio:
+            raise ArchiveError(
+                f"{name} expands {size / max(compressed_size, 1):.0f}x (limit {self.limits.max_ratio:g}x)"
+            )
+
+        self.members[name] = ArchiveMember(name=name, size=size, compressed_size=compressed_size)
+        self._entries[name] = entry
+        parent = posixpath.dirname(name)
+        while parent and parent not in self._directories:
+            self._directories.add(parent)
+            parent = posixpath.dirname(parent)
+
+        self.total_bytes += size
+        if self.total_bytes > self.limits.max_total_bytes:
+            raise ArchiveError(f"Expands to more than {self.limits.max_total_bytes:,} bytes")
+
+    def _check_ratio(self, archive_size: int) -> None:
+        """Check the overall compression ratio."""
+        total = self.total_bytes
+        if total > RATIO_MIN_BYTES and total > max(archive_size, 1) * self.limits.max_ratio:
+            raise ArchiveError(f"Expands {total / max(archive_size, 1):.0f}x (limit {self.limits.max_ratio:g}x)")
+
+    def _list_zip(self) -> None:
+        """List the regular files of a zip archive."""
+        for info in self._zip.infolist():
+            if info.is_dir() or stat.S_ISLNK(info.external_attr >> 16):
+                continue
+            self._add_member(info.filename, info, info.file_size, info.compress_size)
+        self._check_ratio(archive_size=sum(member.compressed_size for member in self.members.values()))
+
+    def _list_tar(self, archive_size: int) -> None:
+        """List the regular files of a tar archive, stopping as soon as a limit is exceeded."""
+        # Iterating (rather than getmembers()) lets a limit stop decompression early
+        for info in self._tar:
+            if not info.isreg():
+                continue
+            # Tar members are stored uncompressed; the ratio applies to the whole stream
+            self._add_member(info.name, info, info.size, info.size)
+        self._check_ratio(archive_size)
@@ -0,0 +1,182 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Capability fingerprints of skill scripts.
+
+A CapabilityProfile records what a script appears to do (read or write files,
+run shell commands, search, glob, use the network) from the same regex and
+substring indicators the static consistency and allowed-tools checks have
+always used. Each script is fingerprinted once, in one pass over all
+indicators, and the profile is cached on its SkillFile so every check reads
+the same facts instead of rescanning the scripts.
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, fields
+
+# Indicator -> patterns; any match anywhere in the script sets the indicator
+_REGEX_INDICATORS: dict[str, list[re.Pattern[str]]] = {
+    "read": [
+        re.compile(r"open\([^)]+['\"]r['\"]"),
+        re.compile(r"open\([^)]+\)"),
+        re.compile(r"\.read\("),
+        re.compile(r"\.readline\("),
+        re.compile(r"\.readlines\("),
+        re.compile(r"Path\([^)]+\)\.read_text"),
+        re.compile(r"Path\([^)]+\)\.read_bytes"),
+        re.compile(r"with\s+open\([^)]+['\"]r"),
+    ],
+    "write": [
+        re.compile(r"open\([^)]+['\"]w['\"]"),
+        re.compile(r"\.write\("),
+        re.compile(r"\.writelines\("),
+        re.compile(r"pathlib\.Path\([^)]+\)\.write"),
+        re.compile(r"with\s+open\([^)]+['\"]w"),
+    ],
+    "grep": [
+        re.compile(r"re\.search\("),
+        re.compile(r"re\.findall\("),
+        re.compile(r"re\.match\("),
+        re.compile(r"re\.finditer\("),
+        re.compile(r"re\.sub\("),
+        re.compile(r"\.search\("),
+        re.compile(r"\.findall\("),
+        re.compile(r"grep"),
+    ],
+    "glob": [
+        re.compile(r"glob\.glob\("),
+        re.compile(r"glob\.iglob\("),
+        re.compile(r"Path\([^)]*\)\.glob\("),
+        re.compile(r"\.glob\("),
+        re.compile(r"\.rglob\("),
+        re.compile(r"fnmatch\."),
+    ],
+}
+
+# Indicator -> substrings; any occurrence sets the indicator
+_SUBSTRING_INDICATORS: dict[str, tuple[str, ...]] = {
+    "shell": (
+        "subprocess.run",
+        "subprocess.call",
+        "subprocess.Popen",
+        "subprocess.check_output",
+        "os.system",
+        "os.popen",
+        "commands.getoutput",
+        "shell=True",
+    ),
+    "network_call": (
+        "requests.get",
+        "requests.post",
+        "requests.put",
+        "requests.delete",
+        "requests.patch",
+        "urllib.request",
+        "urllib.urlopen",
+        "http.client",
+        "httpx.",
+        "aiohttp.",
+        "socket.connect",
+        "socket.create_connection",
+    ),
+    "network_import": (
+        "import requests",
+        "from requests import",
+        "import urllib.request",
+        "from urllib.request import",
+        "import http.client",
+        "import httpx",
+        "import aiohttp",
+    ),
+    "socket_import": ("import socket",),
+    "socket_connect": ("socket.connect", "socket.create_connection"),
+    "localhost": ("localhost", "127.0.0.1", "::1"),
+}
+
+
+def find_indicators(content: str) -> set[str]:
+    """
+    Find which capability indicators occur in a script.
+
+    Args:
+        content: Script source
+
+    Returns:
+        Names of the indicators found
+    """
+    found = {name for name, patterns in _REGEX_INDICATORS.items() if any(p.search(content) for p in patterns)}
+    found.update(name for name, needles in _SUBSTRING_INDICATORS.items() if any(n in content for n in needles))
+    return found
+
+
+@dataclass(frozen=True)
+class CapabilityProfile:
+    """What a script, or all scripts of a skill, appear to do."""
+
+    reads_files: bool = False
+    writes_files: bool = False
+    executes_shell: bool = False
+    uses_grep: bool = False
+    uses_glob: bool = False
+    uses_network: bool = False  # Makes network requests of any kind
+    uses_external_network: bool = False  # Imports an HTTP client, or connects a socket beyond localhost
+
+    @classmethod
+    def from_content(cls, content: str, file_type: str = "python") -> "CapabilityProfile":
+        """
+        Fingerprint one script.
+
+        Args:
+            content: Script source
+            file_type: SkillFile type; bash scripts always execute shell commands
+
+        Returns:
+            CapabilityProfile of the script
+        """
+        found = find_indicators(content)
+        return cls(
+            reads_files="read" in found,
+            writes_files="write" in found,
+            executes_shell=file_type == "bash" or "shell" in found,
+            uses_grep="grep" in found,
+            uses_glob="glob" in found,
+            uses_network="network_call" in found,
+            uses_external_network="network_import" in found
+            or ({"socket_import", "socket_connect"} <= found and "localhost" not in found),
+        )
+
+    @classmethod
+    def combine(cls, profiles: Iterable["CapabilityProfile"]) -> "CapabilityProfile":
+        """
+        Combine script profiles into a skill profile; a capability of any script is a capability of the skill.
+
+        Args:
+            profiles: Profiles to combine
+
+        Returns:
+            Combined CapabilityProfile
+        """
+        flags = {f.name: False for f in fields(cls)}
+        for profile in profiles:
+            for name in flags:
+                flags[name] = flags[name] or getattr(profile, name)
+        return cls(**flags)
+
+    def to_dict(self) -> dict[str, bool]:
+        """Convert to dictionary."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
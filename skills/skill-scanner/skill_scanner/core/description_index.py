@@ -0,0 +1,359 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+MinHash/LSH index of skill descriptions for overlap detection.
+
+Each description is tokenized once into the same stop-word-filtered word set
+the overlap check has always compared, and summarized by a MinHash
+signature. Signatures are split into bands; two descriptions become a
+candidate pair when any band matches exactly, and only candidates get an
+exact Jaccard similarity. With the default 64 bands of 2 rows, a pair whose
+similarity is just above the 0.5 warning threshold is missed with
+probability below 1e-7, while pairs with little in common rarely become
+candidates.
+
+The index can be backed by a SQLite file so a catalogue built by earlier
+runs is reused: a newly scanned skill is compared against every indexed
+description without rescanning the catalogue.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+from array import array
+from collections import defaultdict
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bump when tokenization or signature layout changes
+INDEX_SCHEMA_VERSION = 1
+
+DEFAULT_NUM_BANDS = 64
+DEFAULT_ROWS_PER_BAND = 2
+DEFAULT_MIN_SIMILARITY = 0.5
+
+_SEED = 0x5C4A11ED
+_TOKEN_PATTERN = re.compile(r"\b[a-zA-Z]+\b")
+
+# Common stop words ignored when comparing descriptions
+STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "can",
+        "may",
+        "might",
+        "must",
+        "shall",
+        "to",
+        "of",
+        "in",
+        "for",
+        "on",
+        "with",
+        "at",
+        "by",
+        "from",
+        "as",
+        "into",
+        "through",
+        "and",
+        "or",
+        "but",
+        "if",
+        "then",
+        "else",
+        "when",
+        "up",
+        "down",
+        "out",
+        "that",
+        "this",
+        "these",
+        "those",
+        "it",
+        "its",
+        "they",
+        "them",
+        "their",
+    }
+)
+
+
+def description_tokens(text: str) -> frozenset[str]:
+    """
+    Tokenize a description into lowercase words, without stop words.
+
+    Args:
+        text: Description text
+
+    Returns:
+        Set of tokens
+    """
+    return frozenset(_TOKEN_PATTERN.findall(text.lower())) - STOP_WORDS
+
+
+def jaccard(tokens_a: frozenset[str], tokens_b: frozenset[str]) -> float:
+    """
+    Calculate the Jaccard similarity of two token sets.
+
+    Args:
+        tokens_a: First token set
+        tokens_b: Second token set
+
+    Returns:
+        Similarity from 0.0 to 1.0; 0.0 if either set is empty
+    """
+    if not tokens_a or not tokens_b:
+        return 0.0
+    intersection = len(tokens_a & tokens_b)
+    return intersection / (len(tokens_a) + len(tokens_b) - intersection)
+
+
+class MinHasher:
+    """Computes MinHash signatures with a fixed family of hash functions."""
+
+    def __init__(self, num_perm: int, seed: int = _SEED):
+        """
+        Initialize the hash family.
+
+        Args:
+            num_perm: Signature length
+            seed: Seed of the hash family; signatures are only comparable for equal seeds
+        """
+        self.num_perm = num_perm
+        self._salt = seed.to_bytes(8, "big")
+
+    def signature(self, tokens: frozenset[str]) -> tuple[int, ...]:
+        """
+        Compute the MinHash signature of a token set.
+
+        One SHAKE-128 digest per token supplies its value under every hash
+        function at once, which keeps the per-token work in C. Unlike hash(),
+        the digests are stable across processes, so signatures can be stored.
+
+        Args:
+            tokens: Non-empty token set
+
+        Returns:
+            Signature of ``num_perm`` values
+        """
+        size = 8 * self.num_perm
+        values = [array("Q", hashlib.shake_128(self._salt + t.encode()).digest(size)) for t in tokens]
+        return tuple(map(min, zip(*values, strict=True)))
+
+
+@dataclass
+class IndexedDescription:
+    """One description in the index."""
+
+    name: str
+    tokens: frozenset[str]
+    signature: tuple[int, ...] | None  # None when there are no tokens to compare
+
+
+class DescriptionIndex:
+    """
+    Index of skill descriptions that finds similar pairs without comparing every pair.
+
+    Example:
+        >>> index = DescriptionIndex()
+        >>> index.add("a", "pdf-tool", "Extract text and tables from PDF files")
+        >>> index.add("b", "pdf-reader", "Extract text and tables from PDF documents")
+        >>> index.similar("a")
+        [('b', 0.6666666666666666)]
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        num_bands: int = DEFAULT_NUM_BANDS,
+        rows_per_band: int = DEFAULT_ROWS_PER_BAND,
+        min_similarity: float = DEFAULT_MIN_SIMILARITY,
+    ):
+        """
+        Initialize the index, loading it from ``path`` if the file exists.
+
+        Args:
+            path: SQLite file that persists the index across runs (None keeps it in memory)
+            num_bands: Number of LSH bands
+            rows_per_band: Signature values per band
+            min_similarity: Pairs at or below this similarity are not reported
+        """
+        self.path = Path(path).expanduser() if path else None
+        self.num_bands = num_bands
+        self.rows_per_band = rows_per_band
+        self.min_similarity = min_similarity
+        self._hasher = MinHasher(num_bands * rows_per_band)
+        self._entries: dict[str, IndexedDescription] = {}
+        self._buckets: list[dict[tuple[int, ...], set[str]]] = [defaultdict(set) for _ in range(num_bands)]
+        self._dirty: set[str] = set()
+
+        if self.path is not None and self.path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def name(self, key: str) -> str:
+        """Get the skill name stored for a key."""
+        return self._entries[key].name
+
+    def add(self, key: str, name: str, description: str) -> None:
+        """
+        Add a description, replacing any earlier one under the same key.
+
+        Args:
+            key: Stable identifier of the skill (e.g. its directory)
+            name: Skill name, reported in findings
+            description: Skill description
+        """
+        tokens = description_tokens(description)
+        existing = self._entries.get(key)
+        if existing is not None and existing.name == name and existing.tokens == tokens:
+            return
+
+        self._remove(key)
+        signature = self._hasher.signature(tokens) if tokens else None
+        self._insert(key, IndexedDescription(name=name, tokens=tokens, signature=signature))
+        self._dirty.add(key)
+
+    def similar(self, key: str) -> list[tuple[str, float]]:
+        """
+        Find indexed descriptions similar to the one stored under ``key``.
+
+        Args:
+            key: Key of an indexed description
+
+        Returns:
+            (key, exact Jaccard similarity) for every other description above ``min_similarity``
+        """
+        entry = self._entries[key]
+        if entry.signature is None:
+            return []
+
+        candidates: set[str] = set()
+        for band, bucket in zip(self._buckets, self._bands(entry.signature), strict=True):
+            candidates.update(band.get(bucket, ()))
+        candidates.discard(key)
+
+        results = []
+        for other in candidates:
+            similarity = jaccard(entry.tokens, self._entries[other].tokens)
+            if similarity > self.min_similarity:
+                results.append((other, similarity))
+        return results
+
+    def save(self) -> None:
+        """Write descriptions added since the last save to the index file, if there is one."""
+        if self.path is None or not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        rows = [
+            (key, entry.name, json.dumps(sorted(entry.tokens)), json.dumps(entry.signature))
+            for key in sorted(self._dirty)
+            if (entry := self._entries.get(key)) is not None
+        ]
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            self._create_tables(conn)
+            conn.executemany(
+                "INSERT OR REPLACE INTO descriptions (key, name, tokens, signature) VALUES (?, ?, ?, ?)", rows
+            )
+        self._dirty.clear()
+
+    def _bands(self, signature: tuple[int, ...]) -> list[tuple[int, ...]]:
+        """Split a signature into its band keys."""
+        return list(zip(*[iter(signature)] * self.rows_per_band, strict=False))
+
+    def _insert(self, key: str, entry: IndexedDescription) -> None:
+        self._entries[key] = entry
+        if entry.signature is not None:
+            for band, bucket in zip(self._buckets, self._bands(entry.signature), strict=True):
+                band[bucket].add(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry.signature is not None:
+            for band, bucket in zip(self._buckets, self._bands(entry.signature), strict=True):
+                band[bucket].discard(key)
+
+    def _params(self) -> str:
+        """Identify the tokenization and hash family the stored signatures were built with."""
+        return json.dumps([INDEX_SCHEMA_VERSION, self.num_bands, self.rows_per_band, _SEED])
+
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS descriptions ("
+            "key TEXT PRIMARY KEY, name TEXT NOT NULL, tokens TEXT NOT NULL, signature TEXT)"
+        )
+        stored = conn.execute("SELECT value FROM meta WHERE key = 'params'").fetchone()
+        if stored is None or stored[0] != self._params():
+            # Signatures from other parameters cannot be compared; keep the tokens and re-sign
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('params', ?)", (self._params(),))
+            for key, tokens in conn.execute("SELECT key, tokens FROM descriptions").fetchall():
+                token_set = frozenset(json.loads(tokens))
+                signature = self._hasher.signature(token_set) if token_set else None
+                conn.execute("UPDATE descriptions SET signature = ? WHERE key = ?", (json.dumps(signature), key))
+
+    def _load(self) -> None:
+        """Load the index file."""
+        try:
+            with closing(sqlite3.connect(self.path)) as conn, conn:
+                self._create_tables(conn)
+                rows = conn.execute("SELECT key, name, tokens, signature FROM descriptions").fetchall()
+        except sqlite3.Error as e:
+            logger.warning("Could not read description index %s: %s", self.path, e)
+            return
+
+        for key, name, tokens, signature in rows:
+            signature = json.loads(signature) if signature else None
+            self._insert(
+                key,
+                IndexedDescription(
+                    name=name,
+                    tokens=frozenset(json.loads(tokens)),
+                    signature=tuple(signature) if signature else None,
+                ),
+            )
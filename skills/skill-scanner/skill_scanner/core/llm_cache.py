@@ -0,0 +1,260 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Content-addressed cache of LLM responses.
+
+Responses are stored in SQLite, keyed by the model, a hash of the prompt
+messages, a hash of the response schema, the temperature and any other
+request parameters that change the answer. Identical requests on re-scans
+(LLM analyzer, meta-analysis, alignment verification) are served from disk,
+which makes repeated runs cheap and their output reproducible. Prompt
+builders wrap untrusted input in delimiter tags with a fresh random ID per
+request; the ID is left out of the key, so a re-scan of an unchanged skill
+still hits. The cache
+is capped in size (least recently used entries are evicted first) and
+entries expire after a TTL.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .scan_cache import CacheStats, SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+# Bump when the key derivation or stored layout changes
+LLM_CACHE_SCHEMA_VERSION = 2
+
+LLM_CACHE_DB_NAME = "llm_cache.sqlite3"
+DEFAULT_MAX_SIZE_MB = 256
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+
+
+# Random ID in delimiter tags such as <!---UNTRUSTED_INPUT_START_<32 hex chars>--->
+_DELIMITER_ID = re.compile(r"(<!---[A-Z_]+_)[0-9a-f]{32}(--->)")
+
+
+def _hash_json(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _hash_messages(messages: list[dict[str, Any]] | str) -> str:
+    """Hash prompt messages with the random delimiter IDs taken out."""
+    text = _DELIMITER_ID.sub(r"\1\2", json.dumps(messages, sort_keys=True, default=str))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def llm_cache_enabled() -> bool:
+    """Check whether SKILL_SCANNER_LLM_CACHE turns the response cache on."""
+    return os.getenv("SKILL_SCANNER_LLM_CACHE", "").lower() in ("true", "1")
+
+
+@dataclass
+class LLMCacheStats(CacheStats):
+    """Hit/miss counters for the LLM response cache, plus writes and removals."""
+
+    writes: int = 0
+    evictions: int = 0
+    expired: int = 0
+
+    def merge(self, other: "CacheStats") -> None:
+        """Add another set of counters to this one."""
+        super().merge(other)
+        if isinstance(other, LLMCacheStats):
+            self.writes += other.writes
+            self.evictions += other.evictions
+            self.expired += other.expired
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**super().to_dict(), "writes": self.writes, "evictions": self.evictions, "expired": self.expired}
+
+
+class LLMResponseCache(SQLiteCache):
+    """
+    SQLite-backed, size-capped cache of LLM responses.
+
+    Safe to share across threads and, via SQLite WAL mode, across worker
+    processes. Lookups refresh an entry's access time, which drives LRU
+    eviction once the stored responses exceed ``max_size_mb``.
+
+    Example:
+        >>> cache = LLMResponseCache()
+        >>> key = cache.make_key(model, messages, schema=schema, temperature=0.0)
+        >>> response = cache.get(key)
+        >>> if response is None:
+        ...     response = await call_llm(messages)
+        ...     cache.put(key, response, model=model)
+    """
+
+    db_name = LLM_CACHE_DB_NAME
+    table = "responses"
+    stats_class = LLMCacheStats
+    stats: LLMCacheStats
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_size_mb: float | None = None,
+        ttl_seconds: float | None = None,
+    ):
+        """
+        Initialize LLM response cache.
+
+        Args:
+            cache_dir: Directory holding the cache database. Defaults to
+                $SKILL_SCANNER_CACHE_DIR or ~/.cache/skill-scanner.
+            max_size_mb: Total response size kept before evicting least recently
+                used entries (default: $SKILL_SCANNER_LLM_CACHE_MAX_MB or 256)
+            ttl_seconds: Age after which entries are discarded; 0 keeps them
+                forever (default: $SKILL_SCANNER_LLM_CACHE_TTL or 30 days)
+        """
+        if max_size_mb is None:
+            max_size_mb = float(os.getenv("SKILL_SCANNER_LLM_CACHE_MAX_MB", DEFAULT_MAX_SIZE_MB))
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("SKILL_SCANNER_LLM_CACHE_TTL", DEFAULT_TTL_SECONDS))
+
+        super().__init__(cache_dir)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.ttl_seconds = ttl_seconds
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, model TEXT NOT NULL, response TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: list[dict[str, Any]] | str,
+        schema: dict[str, Any] | None = None,
+        temperature: float | None = None,
+        **params: Any,
+    ) -> str:
+        """
+        Build the cache key for one LLM request.
+
+        Args:
+            model: Model identifier
+            messages: Chat messages (or a single prompt string)
+            schema: Structured-output schema or response format, if any
+            temperature: Sampling temperature
+            **params: Other parameters that change the response (e.g. max_tokens)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        combined = "\0".join(
+            [
+                str(LLM_CACHE_SCHEMA_VERSION),
+                model,
+                _hash_messages(messages),
+                _hash_json(schema) if schema is not None else "",
+                repr(temperature),
+                _hash_json(params) if params else "",
+            ]
+        )
+        return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            The cached response text, or None on a miss or expired entry
+        """
+        now = time.time()
+        response = None
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None and self.ttl_seconds > 0 and row[1] < now - self.ttl_seconds:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    conn.commit()
+                    self.stats.expired += 1
+                elif row is not None:
+                    conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                    conn.commit()
+                    response = row[0]
+        except sqlite3.Error as e:
+            logger.warning("LLM cache lookup failed: %s", e)
+
+        self._count_lookup(response is not None)
+        return response
+
+    def put(self, key: str, response: str, model: str = "") -> None:
+        """Store a response, then evict expired and least recently used entries as needed."""
+        if not response:
+            return
+        size = len(response.encode("utf-8", errors="surrogatepass"))
+        if size > self.max_size_bytes:
+            logger.debug("LLM response of %d bytes exceeds the cache size cap", size)
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, response, size, now, now),
+                )
+                self.stats.writes += 1
+                self._evict(conn, now)
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("LLM cache write failed: %s", e)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then the least recently used ones until under the size cap."""
+        if self.ttl_seconds > 0:
+            self.stats.expired += conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)
+            ).rowcount
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        evict_keys = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at, created_at"):
+            evict_keys.append((key,))
+            total -= size
+            if total <= self.max_size_bytes:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", evict_keys)
+        self.stats.evictions += len(evict_keys)
+
+    def size_bytes(self) -> int:
+        """Total size of the stored responses."""
+        with self._lock:
+            return self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
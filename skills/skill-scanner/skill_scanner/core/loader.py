@@ -19,11 +19,13 @@ Skill package loader and SKILL.md parser.
 """
 
 import re
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO
 
 import frontmatter
 
-from .models import Skill, SkillFile, SkillManifest
+from .archive import ArchiveError, ArchiveLimits, SkillArchive
+from .models import Skill, SkillContentStore, SkillFile, SkillManifest
 
 
 class SkillLoadError(Exception):
@@ -101,8 +103,65 @@ class SkillLoader:
             instruction_body=instruction_body,
             files=files,
             referenced_files=referenced_files,
+            content_store=SkillContentStore(files),
         )
 
+    def load_skill_archive(
+        self, source: str | Path | BinaryIO, name: str | None = None, limits: ArchiveLimits | None = None
+    ) -> Skill:
+        """
+        Load a skill package directly from a zip or tar archive, without extracting it.
+
+        The package root is the directory of the archive's shallowest SKILL.md.
+        Text files are read one member at a time; binary and oversized members
+        are left unread and streamed only if an analyzer asks for them. The
+        returned Skill's ``directory`` is a virtual path (archive name plus
+        package root) used for display; its files are read through ``Skill.archive``.
+
+        Args:
+            source: Archive path, or a seekable binary file object (e.g. an upload stream)
+            name: Display name of the archive (default: file name of ``source``)
+            limits: Archive size limits (default: ArchiveLimits())
+
+        Returns:
+            Parsed Skill object
+
+        Raises:
+            SkillLoadError: If the archive cannot be read, exceeds a limit, or holds no valid skill
+        """
+        try:
+            archive = SkillArchive(source, name=name, limits=limits)
+        except (ArchiveError, OSError) as e:
+            raise SkillLoadError(f"Failed to open archive: {e}")
+
+        try:
+            root = archive.find_skill_root()
+            if root is None:
+                raise SkillLoadError(f"SKILL.md not found in {archive.name}")
+            archive.root = root
+
+            skill_directory = Path(archive.name) / root
+            try:
+                skill_md = archive.read_text("SKILL.md")
+            except (ArchiveError, UnicodeDecodeError) as e:
+                raise SkillLoadError(f"Failed to read SKILL.md: {e}")
+            manifest, instruction_body = self._parse_skill_md_content(skill_md)
+
+            files = self._discover_archive_files(archive, skill_directory)
+            return Skill(
+                directory=skill_directory,
+                manifest=manifest,
+                skill_md_path=skill_directory / "SKILL.md",
+                instruction_body=instruction_body,
+                files=files,
+                referenced_files=self._extract_referenced_files(instruction_body),
+                archive=archive,
+                content_store=SkillContentStore(files),
+            )
+        except Exception:
+            archive.close()
+            raise
+
     def _parse_skill_md(self, skill_md_path: Path) -> tuple[SkillManifest, str]:
         """
         Parse SKILL.md file with YAML frontmatter.
@@ -122,6 +181,21 @@ class SkillLoader:
         except (OSError, UnicodeDecodeError) as e:
             raise SkillLoadError(f"Failed to read SKILL.md: {e}")
 
+        return self._parse_skill_md_content(content)
+
+    def _parse_skill_md_content(self, content: str) -> tuple[SkillManifest, str]:
+        """
+        Parse SKILL.md content with YAML frontmatter.
+
+        Args:
+            content: SKILL.md text
+
+        Returns:
+            Tuple of (SkillManifest, instruction_body)
+
+        Raises:
+            SkillLoadError: If parsing fails
+        """
         # Parse with python-frontmatter
         try:
             post = frontmatter.loads(content)
@@ -232,6 +306,55 @@ class SkillLoader:
 
         return files
 
+    def _discover_archive_files(self, archive: SkillArchive, skill_directory: Path) -> list[SkillFile]:
+        """
+        Discover all files under the root of a skill archive.
+
+        Applies the same skip and binary rules as ``_discover_files``.
+
+        Args:
+            archive: Open archive with its root set
+            skill_directory: Virtual directory of the skill
+
+        Returns:
+            List of SkillFile objects
+        """
+        files = []
+
+        for relative_path, member in archive.files():
+            rel_parts = PurePosixPath(relative_path).parts
+            if any(part.startswith(".") for part in rel_parts):
+                continue
+            if "__pycache__" in rel_parts:
+                continue
+
+            path = skill_directory / relative_path
+            file_type = self._determine_file_type(path)
+
+            # Read text members one at a time; binary and oversized ones stay in the archive
+            content = None
+            if member.size < self.max_file_size_bytes and file_type != "binary":
+                try:
+                    content = archive.read_text(relative_path)
+                except UnicodeDecodeError:
+                    # Treat as binary if can't read as text
+                    file_type = "binary"
+                except ArchiveError as e:
+                    raise SkillLoadError(f"Failed to read {relative_path}: {e}")
+
+            files.append(
+                SkillFile(
+                    path=path,
+                    relative_path=relative_path,
+                    file_type=file_type,
+                    content=content,
+                    size_bytes=member.size,
+                    archive=archive,
+                )
+            )
+
+        return files
+
     def _determine_file_type(self, path: Path) -> str:
         """
         Determine the type of a file based on extension.
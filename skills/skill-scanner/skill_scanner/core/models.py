@@ -18,11 +18,16 @@
 Data models for agent skills and security findings.
 """
 
+import io
+import posixpath
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+from .archive import SkillArchive
+from .capabilities import CapabilityProfile
 
 
 class Severity(str, Enum):
@@ -105,10 +110,17 @@ class SkillFile:
     file_type: str  # 'markdown', 'python', 'bash', 'binary', 'other'
     content: str | None = None
     size_bytes: int = 0
+    archive: SkillArchive | None = field(default=None, repr=False, compare=False)  # Set for files read from archives
+    _capabilities: CapabilityProfile | None = field(default=None, init=False, repr=False, compare=False)
 
     def read_content(self) -> str:
         """Read file content if not already loaded."""
-        if self.content is None and self.path.exists():
+        if self.content is None and self.archive is not None:
+            try:
+                self.content = self.archive.read_text(self.relative_path)
+            except (OSError, ValueError):
+                self.content = ""  # Binary, oversized or unreadable member
+        elif self.content is None and self.path.exists():
             try:
                 with open(self.path, encoding="utf-8") as f:
                     self.content = f.read()
@@ -116,6 +128,83 @@ class SkillFile:
                 self.content = ""  # Binary or unreadable file
         return self.content or ""
 
+    def open_binary(self) -> BinaryIO:
+        """
+        Open the file's raw bytes for reading.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If an archive member exceeds the archive's limits
+        """
+        if self.archive is not None:
+            return io.BytesIO(self.archive.read_bytes(self.relative_path))
+        return open(self.path, "rb")
+
+    def capabilities(self) -> CapabilityProfile:
+        """Get the capability fingerprint of this file's content, computed once."""
+        if self._capabilities is None:
+            self._capabilities = CapabilityProfile.from_content(self.read_content(), self.file_type)
+        return self._capabilities
+
+
+class SkillContentStore:
+    """Path index over a skill's files.
+
+    Lets analyzers resolve a path or reference to the SkillFile the loader
+    already holds, instead of probing and re-reading the file system. Content
+    is read through ``SkillFile.read_content``, so each file is read and
+    decoded at most once per scan however many passes use it.
+    """
+
+    def __init__(self, files: list[SkillFile]):
+        """
+        Index files by their normalized relative path.
+
+        Args:
+            files: Files of the skill package
+        """
+        self._files: dict[str, SkillFile] = {}
+        for skill_file in files:
+            key = self._normalize(skill_file.relative_path)
+            if key is not None:
+                self._files[key] = skill_file
+
+    @staticmethod
+    def _normalize(relative_path: str) -> str | None:
+        """Normalize a relative path to POSIX form, or None if it leaves the package."""
+        path = posixpath.normpath(relative_path.replace("\\", "/"))
+        if path.startswith("/") or path == ".." or path.startswith("../"):
+            return None
+        return path
+
+    def get(self, relative_path: str) -> SkillFile | None:
+        """Get the file at a path relative to the skill directory."""
+        key = self._normalize(relative_path)
+        return self._files.get(key) if key is not None else None
+
+    def resolve(self, reference: str, search_dirs: tuple[str, ...] = ()) -> SkillFile | None:
+        """
+        Resolve a file reference, trying it as given and then under each search directory.
+
+        Args:
+            reference: Referenced path, relative to the skill directory
+            search_dirs: Directories to try next, in order
+
+        Returns:
+            The first matching SkillFile, or None
+        """
+        skill_file = self.get(reference)
+        for directory in search_dirs:
+            if skill_file is not None:
+                break
+            skill_file = self.get(f"{directory}/{reference}")
+        return skill_file
+
+    def read(self, relative_path: str) -> str | None:
+        """Get the decoded content of a file, or None if the package has no such file."""
+        skill_file = self.get(relative_path)
+        return skill_file.read_content() if skill_file is not None else None
+
 
 @dataclass
 class Skill:
@@ -135,6 +224,8 @@ class Skill:
     instruction_body: str
     files: list[SkillFile] = field(default_factory=list)
     referenced_files: list[str] = field(default_factory=list)
+    archive: SkillArchive | None = field(default=None, repr=False, compare=False)  # Set for skills read from archives
+    content_store: SkillContentStore | None = field(default=None, repr=False, compare=False)
 
     @property
     def name(self) -> str:
@@ -148,6 +239,38 @@ class Skill:
         """Get all script files (Python, Bash)."""
         return [f for f in self.files if f.file_type in ("python", "bash")]
 
+    def get_content_store(self) -> SkillContentStore:
+        """Get the path index over the skill's files, building it on first use if the loader did not."""
+        if self.content_store is None:
+            self.content_store = SkillContentStore(self.files)
+        return self.content_store
+
+    def capabilities(self) -> CapabilityProfile:
+        """Get the combined capability fingerprint of all scripts."""
+        return CapabilityProfile.combine(f.capabilities() for f in self.get_scripts())
+
+    def file_exists(self, relative_path: str) -> bool:
+        """Check whether a file or directory exists in the package, on disk or in its archive."""
+        if self.archive is not None:
+            return self.archive.exists(relative_path)
+        return (self.directory / relative_path).exists()
+
+    def read_file(self, relative_path: str, errors: str = "strict") -> str:
+        """
+        Read a package file as UTF-8 text, on disk or from the skill's archive.
+
+        Args:
+            relative_path: Path relative to the skill directory
+            errors: How to handle undecodable bytes, as for bytes.decode()
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid UTF-8, or an archive member exceeds the archive's limits
+        """
+        if self.archive is not None:
+            return self.archive.read_text(relative_path, errors=errors)
+        return (self.directory / relative_path).read_text(encoding="utf-8", errors=errors)
+
     def get_markdown_files(self) -> list[SkillFile]:
         """Get all markdown files."""
         return [f for f in self.files if f.file_type == "markdown"]
@@ -187,6 +310,24 @@ class Finding:
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Finding":
+        """Create a finding from the output of to_dict()."""
+        return cls(
+            id=data["id"],
+            rule_id=data["rule_id"],
+            category=ThreatCategory(data["category"]),
+            severity=Severity(data["severity"]),
+            title=data["title"],
+            description=data["description"],
+            file_path=data.get("file_path"),
+            line_number=data.get("line_number"),
+            snippet=data.get("snippet"),
+            remediation=data.get("remediation"),
+            analyzer=data.get("analyzer"),
+            metadata=data.get("metadata") or {},
+        )
+
 
 @dataclass
 class ScanResult:
@@ -198,6 +339,8 @@ class ScanResult:
     scan_duration_seconds: float = 0.0
     analyzers_used: list[str] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.now)
+    # Parts of the scan cut short by an analysis budget (see AnalysisBudget)
+    incomplete_analyses: list[dict[str, Any]] = field(default_factory=list)
 
     @property
     def is_safe(self) -> bool:
@@ -216,6 +359,11 @@ class ScanResult:
                 return severity
         return Severity.SAFE
 
+    @property
+    def analysis_incomplete(self) -> bool:
+        """Check if any analyzer fell back to a cheaper analysis for part of the skill."""
+        return bool(self.incomplete_analyses)
+
     def get_findings_by_severity(self, severity: Severity) -> list[Finding]:
         """Get all findings of a specific severity."""
         return [f for f in self.findings if f.severity == severity]
@@ -241,6 +389,8 @@ class ScanResult:
             "scan_duration_seconds": self.scan_duration_seconds,
             "duration_ms": int(self.scan_duration_seconds * 1000),  # Plugin expects duration_ms
             "analyzers_used": self.analyzers_used,
+            "analysis_incomplete": self.analysis_incomplete,
+            "incomplete_analyses": self.incomplete_analyses,
             "timestamp": self.timestamp.isoformat(),
         }
 
@@ -263,6 +413,10 @@ class Report:
     def add_scan_result(self, result: ScanResult):
         """Add a scan result and update counters."""
         self.scan_results.append(result)
+        self.count_scan_result(result)
+
+    def count_scan_result(self, result: ScanResult):
+        """Update counters for a scan result without keeping it (for streamed output)."""
         self.total_skills_scanned += 1
         self.total_findings += len(result.findings)
 
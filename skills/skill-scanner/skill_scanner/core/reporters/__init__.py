@@ -20,7 +20,8 @@ Report generation modules for different output formats.
 
 from .json_reporter import JSONReporter
 from .markdown_reporter import MarkdownReporter
+from .ndjson_reporter import NDJSONReporter
 from .sarif_reporter import SARIFReporter
 from .table_reporter import TableReporter
 
-__all__ = ["JSONReporter", "MarkdownReporter", "TableReporter", "SARIFReporter"]
+__all__ = ["JSONReporter", "MarkdownReporter", "NDJSONReporter", "TableReporter", "SARIFReporter"]
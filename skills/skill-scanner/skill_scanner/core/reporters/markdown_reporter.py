@@ -63,6 +63,10 @@ class MarkdownReporter:
         lines.append(f"**Max Severity:** {result.max_severity.value}")
         lines.append(f"**Scan Duration:** {result.scan_duration_seconds:.2f}s")
         lines.append(f"**Timestamp:** {result.timestamp.isoformat()}")
+        if result.analysis_incomplete:
+            lines.append(
+                f"**Analysis:** incomplete - {len(result.incomplete_analyses)} part(s) exceeded an analysis budget"
+            )
         lines.append("")
 
         # Summary
@@ -0,0 +1,107 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Streaming NDJSON reporter for scan results.
+
+Each scan result is written as one JSON line as soon as it is available,
+followed by a summary line, so output starts with the first skill and memory
+use does not grow with the number of skills scanned.
+"""
+
+import json
+from typing import Any, TextIO
+
+from ...core.models import Finding, Report, ScanResult
+
+
+def result_record(result: ScanResult) -> dict[str, Any]:
+    """Build the NDJSON record for one skill's scan result."""
+    return {"type": "result", "result": result.to_dict()}
+
+
+def cross_skill_record(findings: list[Finding]) -> dict[str, Any]:
+    """Build the NDJSON record for findings that span several skills."""
+    return {"type": "cross_skill", "findings": [finding.to_dict() for finding in findings]}
+
+
+def summary_record(report: Report) -> dict[str, Any]:
+    """Build the trailing NDJSON summary record."""
+    return {"type": "summary", "summary": report.to_dict()["summary"]}
+
+
+class NDJSONReporter:
+    """
+    Writes scan results as newline-delimited JSON.
+
+    Only summary counters are kept between results; each result is
+    serialized, written and flushed as soon as it is passed in.
+
+    Example:
+        >>> reporter = NDJSONReporter(sys.stdout)
+        >>> for _, result in scanner.iter_scan_directory(skills_dir):
+        ...     reporter.write_result(result)
+        >>> reporter.write_summary()
+    """
+
+    def __init__(self, stream: TextIO | None = None):
+        """
+        Initialize NDJSON reporter.
+
+        Args:
+            stream: Text stream to write records to (required for write_* methods)
+        """
+        self.stream = stream
+        self.summary = Report()
+
+    def _write(self, record: dict[str, Any]) -> None:
+        if self.stream is None:
+            raise ValueError("NDJSONReporter needs a stream to write records")
+        self.stream.write(json.dumps(record, default=str) + "\n")
+        self.stream.flush()
+
+    def write_result(self, result: ScanResult) -> None:
+        """Write one scan result and add it to the summary counters."""
+        self.summary.count_scan_result(result)
+        self._write(result_record(result))
+
+    def write_cross_skill(self, findings: list[Finding]) -> None:
+        """Write findings from cross-skill checks."""
+        if findings:
+            self._write(cross_skill_record(findings))
+
+    def write_summary(self) -> None:
+        """Write the trailing summary record."""
+        self._write(summary_record(self.summary))
+
+    def generate_report(self, data: ScanResult | Report) -> str:
+        """
+        Generate an NDJSON report for results that are already in memory.
+
+        Args:
+            data: ScanResult or Report object
+
+        Returns:
+            NDJSON string: one line per result, then a summary line
+        """
+        if isinstance(data, ScanResult):
+            report = Report()
+            report.add_scan_result(data)
+        else:
+            report = data
+        records = [result_record(result) for result in report.scan_results]
+        records.append(summary_record(report))
+        return "".join(json.dumps(record, default=str) + "\n" for record in records)
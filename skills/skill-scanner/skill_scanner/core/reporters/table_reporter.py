@@ -70,6 +70,8 @@ class TableReporter:
             ["Total Findings", len(result.findings)],
             ["Scan Duration", f"{result.scan_duration_seconds:.2f}s"],
         ]
+        if result.analysis_incomplete:
+            summary_data.append(["Analysis", f"INCOMPLETE ({len(result.incomplete_analyses)} over budget)"])
         lines.append(tabulate(summary_data, tablefmt=self.format_style))
         lines.append("")
 
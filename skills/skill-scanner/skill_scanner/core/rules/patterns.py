@@ -18,13 +18,38 @@
 Pattern matching utilities for security rules.
 """
 
+import functools
 import re
+import warnings
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from ...core.models import Severity, ThreatCategory
+from ...utils.line_index import LineIndex
+
+# The literal-anchor prefilter walks the parse trees of the stdlib's private
+# regex parser. Where it is missing or has changed shape, rule sets run every
+# pattern on every line instead (see _prefilter_available).
+try:
+    try:
+        from re import _parser as sre_parse  # Python 3.11+
+    except ImportError:  # pragma: no cover - Python 3.10
+        import sre_parse  # type: ignore[no-redef]
+
+    _REPEAT_OPS = tuple(
+        op for op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, getattr(sre_parse, "POSSESSIVE_REPEAT", None)) if op
+    )
+    _BACKREF_OPS = (sre_parse.GROUPREF, sre_parse.GROUPREF_EXISTS)
+except (ImportError, AttributeError):  # pragma: no cover
+    sre_parse = None  # type: ignore[assignment]
+    _REPEAT_OPS = ()
+    _BACKREF_OPS = ()
+_LEADING_FLAGS = re.compile(r"^\(\?[aiLmsux]+\)")
+_FLAG_LETTERS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.ASCII, "a"))
 
 
 class SecurityRule:
@@ -66,13 +91,36 @@ class SecurityRule:
         """
         Scan content for rule violations.
 
+        Returns:
+            List of matches with line numbers and snippets
+        """
+        return self.scan_lines(content.split("\n"), file_path)
+
+    def scan_lines(
+        self,
+        lines: Sequence[str],
+        file_path: str | None = None,
+        candidates: Iterable[int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Scan pre-split content for rule violations.
+
+        Args:
+            lines: Content split on newlines
+            file_path: Path reported in matches
+            candidates: Zero-based indices of lines that may match. Lines not
+                listed are skipped; None scans every line.
+
         Returns:
             List of matches with line numbers and snippets
         """
         matches = []
-        lines = content.split("\n")
+        indices = range(len(lines)) if candidates is None else candidates
+
+        for index in indices:
+            line = lines[index]
+            line_num = index + 1
 
-        for line_num, line in enumerate(lines, start=1):
             # Check exclude patterns first
             excluded = False
             for exclude_pattern in self.compiled_exclude_patterns:
@@ -99,6 +147,290 @@ class SecurityRule:
         return matches
 
 
+def _required_literals(parsed: Any) -> set[str] | None:
+    """
+    Find literal strings of which at least one must occur in any match.
+
+    Walks a parsed regex and returns the most selective set of alternatives
+    (e.g. ``{"eval"}`` for ``\\beval\\s*\\(`` or ``{"sudo"}`` for
+    ``sudo\\s+apt-get``). Returns None when no such anchor can be proven.
+    """
+    best: set[str] | None = None
+    run: list[str] = []
+
+    def consider(candidate: set[str] | None) -> None:
+        nonlocal best
+        if not candidate or not all(candidate):
+            return
+        if best is None or min(map(len, candidate)) > min(map(len, best)):
+            best = candidate
+
+    def flush() -> None:
+        if run:
+            consider({"".join(run)})
+            run.clear()
+
+    for op, av in parsed:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        flush()
+        if op is sre_parse.SUBPATTERN:
+            _group, add_flags, del_flags, sub = av
+            if not add_flags and not del_flags:
+                consider(_required_literals(sub))
+        elif op is sre_parse.BRANCH:
+            branches = [_required_literals(branch) for branch in av[1]]
+            if all(branches):
+                consider(set().union(*branches))
+        elif op in _REPEAT_OPS:
+            low, _high, sub = av
+            if low >= 1:
+                consider(_required_literals(sub))
+    flush()
+
+    return best
+
+
+def _contains_backreference(parsed: Any) -> bool:
+    """Check whether a parsed regex refers back to its own groups."""
+    for op, av in parsed:
+        if op in _BACKREF_OPS:
+            return True
+        if op is sre_parse.SUBPATTERN and _contains_backreference(av[-1]):
+            return True
+        if op in _REPEAT_OPS and _contains_backreference(av[2]):
+            return True
+        if op is sre_parse.BRANCH and any(_contains_backreference(branch) for branch in av[1]):
+            return True
+        if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT) and _contains_backreference(av[1]):
+            return True
+    return False
+
+
+def _scoped_pattern(pattern: re.Pattern) -> str | None:
+    """
+    Rewrite a pattern so it can be embedded in a larger alternation.
+
+    Leading global flags such as ``(?i)`` become a scoped group
+    ``(?i:...)``. Returns None for patterns that cannot be embedded without
+    changing their meaning (backreferences, verbose mode, inline flags that
+    are not at the start).
+    """
+    if pattern.flags & (re.VERBOSE | re.LOCALE):
+        return None
+
+    try:
+        if _contains_backreference(sre_parse.parse(pattern.pattern, pattern.flags)):
+            return None
+    except Exception:
+        return None
+
+    body = pattern.pattern
+    while match := _LEADING_FLAGS.match(body):
+        body = body[match.end() :]
+
+    letters = "".join(letter for flag, letter in _FLAG_LETTERS if pattern.flags & flag)
+    scoped = f"(?{letters}:{body})" if letters else f"(?:{body})"
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            if re.compile(scoped).groups != pattern.groups:
+                return None
+    except (re.error, Warning):
+        return None
+
+    return scoped
+
+
+def _pattern_anchors(pattern: re.Pattern) -> set[str] | None:
+    """Get literals of which one must occur on any line the pattern matches, or None."""
+    try:
+        literals = _required_literals(sre_parse.parse(pattern.pattern, pattern.flags))
+    except Exception:
+        return None
+    if not literals or any("\n" in literal for literal in literals):
+        return None
+    return literals
+
+
+@functools.cache
+def _prefilter_available() -> bool:
+    """Check that the regex parser imported and still yields the anchors the prefilter relies on."""
+    return sre_parse is not None and _pattern_anchors(re.compile(r"\beval\s*\(")) == {"eval"}
+
+
+class _Anchor:
+    """Literals of which one must occur on a line for a pattern to match it."""
+
+    __slots__ = ("literals", "ignorecase", "folded", "regex")
+
+    def __init__(self, literals: set[str], flags: int):
+        self.literals = tuple(sorted(literals))
+        self.ignorecase = bool(flags & re.IGNORECASE)
+        # Lowercasing is only equivalent to IGNORECASE matching for ASCII text
+        self.folded = tuple(literal.lower() for literal in self.literals) if all(map(str.isascii, literals)) else None
+        self.regex = re.compile("|".join(map(re.escape, self.literals)), flags & (re.IGNORECASE | re.ASCII))
+
+    def add_hits(self, content: str, lowered: str | None, line_starts: list[int], hits: set[int]) -> None:
+        """Add the index of every line containing one of the literals."""
+        if not self.ignorecase:
+            haystack, literals = content, self.literals
+        elif lowered is not None and self.folded is not None:
+            haystack, literals = lowered, self.folded
+        else:
+            self._add_regex_hits(content, line_starts, hits)
+            return
+
+        last_line = len(line_starts) - 1
+        for literal in literals:
+            position = haystack.find(literal)
+            while position != -1:
+                index = bisect_right(line_starts, position) - 1
+                hits.add(index)
+                if index == last_line:
+                    break
+                # One hit per line is enough; resume at the next line
+                position = haystack.find(literal, line_starts[index + 1])
+
+    def _add_regex_hits(self, content: str, line_starts: list[int], hits: set[int]) -> None:
+        last_line = len(line_starts) - 1
+        match = self.regex.search(content)
+        while match:
+            index = bisect_right(line_starts, match.start()) - 1
+            hits.add(index)
+            if index == last_line:
+                break
+            match = self.regex.search(content, line_starts[index + 1])
+
+
+class _RuleFilter:
+    """Selects the lines on which one rule's patterns may match."""
+
+    __slots__ = ("anchors", "line_filters")
+
+    def __init__(self, rule: SecurityRule):
+        self.anchors: list[_Anchor] = []
+        unanchored = []
+        for pattern in rule.compiled_patterns:
+            literals = _pattern_anchors(pattern)
+            if literals is None:
+                unanchored.append(pattern)
+            else:
+                self.anchors.append(_Anchor(literals, pattern.flags))
+        self.line_filters = _build_line_filters(unanchored)
+
+    def candidate_lines(self, content: str, lowered: str | None, lines: list[str], line_starts: list[int]) -> set[int]:
+        hits: set[int] = set()
+        for anchor in self.anchors:
+            anchor.add_hits(content, lowered, line_starts, hits)
+        if self.line_filters:
+            for index, line in enumerate(lines):
+                if index not in hits and any(line_filter.search(line) for line_filter in self.line_filters):
+                    hits.add(index)
+        return hits
+
+
+def _rule_filter(rule: SecurityRule) -> _RuleFilter | None:
+    """Build the line prefilter of a rule, or None to run its patterns on every line."""
+    if not _prefilter_available():
+        return None
+    try:
+        return _RuleFilter(rule)
+    except Exception:
+        return None
+
+
+def _build_line_filters(patterns: list[re.Pattern]) -> list[re.Pattern]:
+    """Combine patterns into as few line-selection regexes as possible."""
+    scoped = []
+    standalone = []
+    for pattern in patterns:
+        embedded = _scoped_pattern(pattern)
+        if embedded is None:
+            standalone.append(pattern)
+        else:
+            scoped.append(embedded)
+
+    filters = []
+    if len(scoped) == 1:
+        filters.append(re.compile(scoped[0]))
+    elif scoped:
+        try:
+            filters.append(re.compile("|".join(scoped)))
+        except re.error:
+            # e.g. the same group name used by two patterns
+            filters = [re.compile(p) for p in scoped]
+    return filters + standalone
+
+
+class CompiledRuleSet:
+    """
+    Single-pass matcher for a group of security rules.
+
+    Splits content once and avoids running every rule's patterns on every
+    line:
+
+    1. Each pattern is reduced to the literal anchors any match must contain
+       (e.g. ``eval`` for ``\\beval\\s*\\(``). The anchors are located with
+       substring search over the whole file, which maps straight to the
+       lines a rule can possibly match.
+    2. Patterns without anchors are joined into a single alternation per
+       rule and tried line by line.
+    3. Only a rule's candidate lines are dispatched to its exclude and match
+       patterns; rules without candidates are skipped.
+
+    Each step only discards work that cannot produce a match, so results are
+    identical to calling SecurityRule.scan_content for each rule in order.
+    Rules whose prefilter cannot be built (e.g. the regex parser is
+    unavailable) have every line dispatched to their patterns.
+    """
+
+    def __init__(self, rules: list[SecurityRule]):
+        """
+        Initialize compiled rule set.
+
+        Args:
+            rules: Rules to match, in reporting order
+        """
+        self.rules = list(rules)
+        self._filters = [_rule_filter(rule) for rule in self.rules]
+
+    def scan_content(
+        self, content: str, file_path: str | None = None
+    ) -> list[tuple[SecurityRule, list[dict[str, Any]]]]:
+        """
+        Scan content against every rule in the set.
+
+        Args:
+            content: Content to scan
+            file_path: Path reported in matches
+
+        Returns:
+            (rule, matches) pairs in rule order, for rules with at least one match
+        """
+        if not self.rules:
+            return []
+
+        line_index = LineIndex(content)
+        lines, line_starts = line_index.lines, line_index.line_starts
+        lowered = content.lower() if content.isascii() else None
+
+        results = []
+        for rule, rule_filter in zip(self.rules, self._filters, strict=True):
+            if rule_filter is None:
+                matches = rule.scan_lines(lines, file_path)
+            else:
+                candidates = rule_filter.candidate_lines(content, lowered, lines, line_starts)
+                if not candidates:
+                    continue
+                matches = rule.scan_lines(lines, file_path, sorted(candidates))
+            if matches:
+                results.append((rule, matches))
+        return results
+
+
 class RuleLoader:
     """Loads security rules from YAML files."""
 
@@ -119,6 +451,7 @@ class RuleLoader:
         self.rules: list[SecurityRule] = []
         self.rules_by_id: dict[str, SecurityRule] = {}
         self.rules_by_category: dict[ThreatCategory, list[SecurityRule]] = {}
+        self._rule_sets: dict[str, CompiledRuleSet] = {}
 
     def load_rules(self) -> list[SecurityRule]:
         """
@@ -136,6 +469,7 @@ class RuleLoader:
         self.rules = []
         self.rules_by_id = {}
         self.rules_by_category = {}
+        self._rule_sets = {}
 
         for rule_data in rules_data:
             try:
@@ -160,6 +494,14 @@ class RuleLoader:
         """Get all rules that apply to a specific file type."""
         return [rule for rule in self.rules if rule.matches_file_type(file_type)]
 
+    def get_rule_set(self, file_type: str) -> CompiledRuleSet:
+        """Get the compiled single-pass matcher for a file type (built on first use)."""
+        rule_set = self._rule_sets.get(file_type)
+        if rule_set is None:
+            rule_set = CompiledRuleSet(self.get_rules_for_file_type(file_type))
+            self._rule_sets[file_type] = rule_set
+        return rule_set
+
     def get_rules_for_category(self, category: ThreatCategory) -> list[SecurityRule]:
         """Get all rules in a specific threat category."""
         return self.rules_by_category.get(category, [])
@@ -18,21 +18,72 @@
 YARA rule scanner for detecting malicious patterns in agent skills.
 """
 
+import hashlib
+import logging
+import os
+import tempfile
 from pathlib import Path
 from typing import Any
 
 import yara
 
+from ...utils.line_index import LineIndex
+from ..scan_cache import default_cache_dir
+
+logger = logging.getLogger(__name__)
+
+YARA_BUNDLE_SUFFIX = ".yarc"
+
+
+def default_bundle_dir() -> Path:
+    """Get the directory holding precompiled YARA rule bundles, honouring SKILL_SCANNER_YARA_BUNDLE_DIR."""
+    env_dir = os.getenv("SKILL_SCANNER_YARA_BUNDLE_DIR")
+    return Path(env_dir).expanduser() if env_dir else default_cache_dir() / "yara"
+
+
+def rules_fingerprint(rules_dir: Path) -> str:
+    """
+    Hash the YARA rule sources in a directory.
+
+    The hash covers every .yara file's name and content plus the YARA
+    version, so a bundle is never loaded by a libyara that did not build it.
+
+    Args:
+        rules_dir: Directory containing .yara files
+
+    Returns:
+        Hex digest identifying this exact rule set
+    """
+    hasher = hashlib.sha256()
+    hasher.update(f"yara {yara.YARA_VERSION}\0".encode())
+    for yara_file in sorted(Path(rules_dir).glob("*.yara")):
+        hasher.update(yara_file.name.encode() + b"\0")
+        hasher.update(yara_file.read_bytes())
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
 
 class YaraScanner:
     """Scanner that uses YARA rules to detect malicious patterns."""
 
-    def __init__(self, rules_dir: Path | None = None):
+    def __init__(
+        self,
+        rules_dir: Path | None = None,
+        bundle_dir: Path | None = None,
+        use_bundle_cache: bool = True,
+        load_rules: bool = True,
+    ):
         """
         Initialize YARA scanner.
 
         Args:
             rules_dir: Path to directory containing .yara files
+            bundle_dir: Directory for precompiled rule bundles. Defaults to
+                the "yara" folder of the scan cache directory.
+            use_bundle_cache: Load rules from a precompiled bundle when one
+                matches the rule sources, and save one after compiling.
+            load_rules: Load the rules now. False leaves them unloaded until
+                compile_bundle() is called.
         """
         if rules_dir is None:
             # Default to yara_rules directory
@@ -41,11 +92,14 @@ class YaraScanner:
             rules_dir = YARA_RULES_DIR
 
         self.rules_dir = Path(rules_dir)
+        self.bundle_dir = Path(bundle_dir) if bundle_dir else default_bundle_dir()
+        self.use_bundle_cache = use_bundle_cache and os.getenv("SKILL_SCANNER_YARA_CACHE", "1") != "0"
         self.rules = None
-        self._load_rules()
+        if load_rules:
+            self._load_rules()
 
-    def _load_rules(self):
-        """Load all YARA rules from directory."""
+    def _collect_rule_files(self) -> dict[str, str]:
+        """Map namespace (file stem) to path for every .yara file in the rules directory."""
         if not self.rules_dir.exists():
             raise FileNotFoundError(f"YARA rules directory not found: {self.rules_dir}")
 
@@ -54,24 +108,84 @@ class YaraScanner:
         if not yara_files:
             raise FileNotFoundError(f"No .yara files found in {self.rules_dir}")
 
-        # Compile all rules
-        rules_dict = {}
-        for yara_file in yara_files:
-            namespace = yara_file.stem  # Use filename as namespace
-            rules_dict[namespace] = str(yara_file)
+        return {yara_file.stem: str(yara_file) for yara_file in yara_files}
+
+    @property
+    def bundle_path(self) -> Path:
+        """Path of the precompiled bundle matching the current rule sources."""
+        return self.bundle_dir / f"{rules_fingerprint(self.rules_dir)}{YARA_BUNDLE_SUFFIX}"
+
+    def _load_rules(self):
+        """Load all YARA rules from directory, via the precompiled bundle when available."""
+        rules_dict = self._collect_rule_files()
+
+        bundle_path = self.bundle_path if self.use_bundle_cache else None
+        if bundle_path is not None and bundle_path.exists():
+            try:
+                self.rules = yara.load(filepath=str(bundle_path))
+                logger.debug("Loaded precompiled YARA rules from %s", bundle_path)
+                return
+            except yara.Error as e:
+                logger.warning("Ignoring unreadable YARA bundle %s: %s", bundle_path, e)
 
         try:
             self.rules = yara.compile(filepaths=rules_dict)
         except yara.SyntaxError as e:
             raise RuntimeError(f"Failed to compile YARA rules: {e}")
 
-    def scan_content(self, content: str, file_path: str | None = None) -> list[dict[str, Any]]:
+        if bundle_path is not None:
+            self._save_bundle(bundle_path)
+
+    def _save_bundle(self, bundle_path: Path) -> bool:
+        """Write compiled rules atomically; a read-only cache only costs a recompile next time."""
+        try:
+            bundle_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=bundle_path.parent, suffix=".tmp")
+            os.close(fd)
+            try:
+                self.rules.save(filepath=tmp_name)
+                os.replace(tmp_name, bundle_path)
+            finally:
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+        except (OSError, yara.Error) as e:
+            logger.debug("Could not save YARA bundle to %s: %s", bundle_path, e)
+            return False
+
+        logger.debug("Saved precompiled YARA rules to %s", bundle_path)
+        return True
+
+    def compile_bundle(self) -> Path:
+        """
+        Compile the rule sources and write the bundle, replacing any existing one.
+
+        Returns:
+            Path of the written bundle
+
+        Raises:
+            RuntimeError: If the rules fail to compile or the bundle cannot be written
+        """
+        try:
+            self.rules = yara.compile(filepaths=self._collect_rule_files())
+        except yara.SyntaxError as e:
+            raise RuntimeError(f"Failed to compile YARA rules: {e}")
+
+        bundle_path = self.bundle_path
+        if not self._save_bundle(bundle_path):
+            raise RuntimeError(f"Could not write YARA bundle to {bundle_path}")
+        return bundle_path
+
+    def scan_content(
+        self, content: str, file_path: str | None = None, line_index: LineIndex | None = None
+    ) -> list[dict[str, Any]]:
         """
         Scan content with YARA rules.
 
         Args:
             content: Text content to scan
             file_path: Optional file path for context
+            line_index: Optional prebuilt line index for content, shared with
+                callers that also need line lookups
 
         Returns:
             List of matches with metadata
@@ -98,12 +212,10 @@ class YaraScanner:
                 for string in match.strings:
                     for instance in string.instances:
                         # Find line number for this match
-                        line_num = content[: instance.offset].count("\n") + 1
-                        line_start = content.rfind("\n", 0, instance.offset) + 1
-                        line_end = content.find("\n", instance.offset)
-                        if line_end == -1:
-                            line_end = len(content)
-                        line_content = content[line_start:line_end].strip()
+                        if line_index is None:
+                            line_index = LineIndex(content)
+                        line_num, line_text = line_index.line_at(instance.offset)
+                        line_content = line_text.strip()
 
                         matched_strings.append(
                             {
@@ -0,0 +1,260 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Content-hash incremental scan cache.
+
+Stores per-file analysis results in SQLite, keyed by the file's content hash,
+its path within the skill and a fingerprint of the analyzer configuration
+(rule packs, YARA rules, mode, scanner version). Unchanged files are served
+from the cache on re-scans; skill-level checks are always recomputed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ClassVar
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of cached payloads changes
+CACHE_SCHEMA_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "skill-scanner"
+CACHE_DB_NAME = "scan_cache.sqlite3"
+
+
+def default_cache_dir() -> Path:
+    """Get the cache directory, honouring SKILL_SCANNER_CACHE_DIR."""
+    env_dir = os.getenv("SKILL_SCANNER_CACHE_DIR")
+    return Path(env_dir).expanduser() if env_dir else DEFAULT_CACHE_DIR
+
+
+def content_hash(content: str | bytes) -> str:
+    """Compute the SHA-256 hex digest of file content."""
+    if isinstance(content, str):
+        content = content.encode("utf-8", errors="surrogatepass")
+    return hashlib.sha256(content).hexdigest()
+
+
+def scanner_version() -> str:
+    """Get the installed scanner version, used as part of every cache key."""
+    try:
+        from .. import __version__
+
+        return __version__
+    except ImportError:
+        return "unknown"
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a scan cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def merge(self, other: "CacheStats") -> None:
+        """Add another set of counters to this one."""
+        self.hits += other.hits
+        self.misses += other.misses
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": round(self.hit_rate, 4)}
+
+    def __str__(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses ({self.hit_rate:.0%} hit rate)"
+
+
+class SQLiteCache:
+    """
+    Base for the SQLite-backed caches.
+
+    Owns the connection (opened lazily in WAL mode, so worker processes can
+    share the database), the lock guarding it and the hit/miss counters.
+    Subclasses name their database file and table and create their schema.
+    """
+
+    db_name: ClassVar[str]
+    table: ClassVar[str]
+    stats_class: ClassVar[type[CacheStats]] = CacheStats
+
+    def __init__(self, cache_dir: str | Path | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache database. Defaults to
+                $SKILL_SCANNER_CACHE_DIR or ~/.cache/skill-scanner.
+        """
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else default_cache_dir()
+        self.db_path = self.cache_dir / self.db_name
+        self.stats = self.stats_class()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the live connection and lock when shipping to worker processes."""
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_lock"] = None
+        state["stats"] = self.stats_class()
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the cache's tables and indexes if they do not exist yet."""
+        raise NotImplementedError
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema(conn)
+            self._conn = conn
+        return self._conn
+
+    def _count_lookup(self, hit: bool) -> None:
+        """Record a hit or miss, under the lock since threads sharing the cache look up at once."""
+        with self._lock:
+            if hit:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+
+    def drain_stats(self) -> CacheStats:
+        """Return the current counters and reset them."""
+        with self._lock:
+            stats, self.stats = self.stats, self.stats_class()
+        return stats
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class ScanCache(SQLiteCache):
+    """
+    SQLite-backed cache of per-file analysis results.
+
+    Payloads are JSON documents (e.g. serialized findings or extracted file
+    facts); nothing is unpickled from disk. The cache is safe to share across
+    threads and, via SQLite WAL mode, across worker processes.
+
+    Example:
+        >>> cache = ScanCache()
+        >>> payload = cache.get("static:scripts", fingerprint, "scripts/run.py", content)
+        >>> if payload is None:
+        ...     payload = compute()
+        ...     cache.put("static:scripts", fingerprint, "scripts/run.py", content, payload)
+    """
+
+    db_name = CACHE_DB_NAME
+    table = "entries"
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, namespace TEXT NOT NULL, payload TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+
+    @staticmethod
+    def make_key(namespace: str, fingerprint: str, file_path: str, content: str | bytes) -> str:
+        """Build the cache key for one file under one analyzer configuration."""
+        combined = "\0".join(
+            [str(CACHE_SCHEMA_VERSION), scanner_version(), namespace, fingerprint, file_path, content_hash(content)]
+        )
+        return hashlib.sha256(combined.encode()).hexdigest()
+
+    def get(self, namespace: str, fingerprint: str, file_path: str, content: str | bytes) -> Any | None:
+        """
+        Look up a cached payload.
+
+        Args:
+            namespace: Analysis pass name (e.g. "static:scripts")
+            fingerprint: Analyzer configuration fingerprint
+            file_path: Path of the file within the skill
+            content: File content
+
+        Returns:
+            Decoded payload, or None on a miss
+        """
+        key = self.make_key(namespace, fingerprint, file_path, content)
+        row = None
+        try:
+            with self._lock:
+                row = self._connect().execute("SELECT payload FROM entries WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Scan cache lookup failed: %s", e)
+
+        payload = None
+        if row is not None:
+            try:
+                payload = json.loads(row[0])
+            except json.JSONDecodeError:
+                row = None
+
+        self._count_lookup(row is not None)
+        return payload
+
+    def put(self, namespace: str, fingerprint: str, file_path: str, content: str | bytes, payload: Any) -> None:
+        """Store a JSON-serializable payload for a file."""
+        key = self.make_key(namespace, fingerprint, file_path, content)
+        try:
+            encoded = json.dumps(payload, default=str)
+        except (TypeError, ValueError) as e:
+            logger.debug("Payload for %s is not cacheable: %s", file_path, e)
+            return
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, namespace, payload, created_at) VALUES (?, ?, ?, ?)",
+                    (key, namespace, encoded, time.time()),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Scan cache write failed: %s", e)
@@ -18,80 +18,28 @@
 Core scanner engine for orchestrating skill analysis.
 """
 
+import hashlib
 import logging
+import pickle
 import re
 import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from .analyzers.base import BaseAnalyzer
 from .analyzers.static import StaticAnalyzer
 from .analyzers.virustotal_analyzer import VirusTotalAnalyzer
+from .description_index import DescriptionIndex
 from .loader import SkillLoader, SkillLoadError
 from .models import Finding, Report, ScanResult, Severity, Skill, ThreatCategory
+from .scan_cache import CacheStats, SQLiteCache
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from .analyzers.llm_request_handler import LLMUsage
 
-# Common stop words for Jaccard similarity - created once at module level
-_STOP_WORDS = frozenset(
-    {
-        "the",
-        "a",
-        "an",
-        "is",
-        "are",
-        "was",
-        "were",
-        "be",
-        "been",
-        "being",
-        "have",
-        "has",
-        "had",
-        "do",
-        "does",
-        "did",
-        "will",
-        "would",
-        "could",
-        "should",
-        "can",
-        "may",
-        "might",
-        "must",
-        "shall",
-        "to",
-        "of",
-        "in",
-        "for",
-        "on",
-        "with",
-        "at",
-        "by",
-        "from",
-        "as",
-        "into",
-        "through",
-        "and",
-        "or",
-        "but",
-        "if",
-        "then",
-        "else",
-        "when",
-        "up",
-        "down",
-        "out",
-        "that",
-        "this",
-        "these",
-        "those",
-        "it",
-        "its",
-        "they",
-        "them",
-        "their",
-    }
-)
+logger = logging.getLogger(__name__)
 
 
 class SkillScanner:
@@ -103,6 +51,7 @@ class SkillScanner:
         use_virustotal: bool = False,
         virustotal_api_key: str | None = None,
         virustotal_upload_files: bool = False,
+        description_index: DescriptionIndex | None = None,
     ):
         """
         Initialize scanner with analyzers.
@@ -113,6 +62,8 @@ class SkillScanner:
             virustotal_api_key: VirusTotal API key (required if use_virustotal=True)
             virustotal_upload_files: If True, upload unknown files to VT. If False (default),
                                     only check existing hashes
+            description_index: Persistent description index. When set, every scanned skill is
+                checked for description overlap against the skills indexed by earlier runs.
         """
         if analyzers is None:
             self.analyzers: list[BaseAnalyzer] = [StaticAnalyzer()]
@@ -126,6 +77,7 @@ class SkillScanner:
             self.analyzers = analyzers
 
         self.loader = SkillLoader()
+        self.description_index = description_index
 
     def scan_skill(self, skill_directory: Path) -> ScanResult:
         """
@@ -148,27 +100,9 @@ class SkillScanner:
         # Load the skill
         skill = self.loader.load_skill(skill_directory)
 
-        # Run all analyzers
-        all_findings = []
-        analyzer_names = []
-        validated_binary_files = set()
-
-        for analyzer in self.analyzers:
-            findings = analyzer.analyze(skill)
-            all_findings.extend(findings)
-            analyzer_names.append(analyzer.get_name())
-
-            if hasattr(analyzer, "validated_binary_files"):
-                validated_binary_files.update(analyzer.validated_binary_files)
-
-        # Post-process findings: Suppress BINARY_FILE_DETECTED for VirusTotal-validated files
-        if validated_binary_files:
-            filtered_findings = []
-            for finding in all_findings:
-                if finding.rule_id == "BINARY_FILE_DETECTED" and finding.file_path in validated_binary_files:
-                    continue
-                filtered_findings.append(finding)
-            all_findings = filtered_findings
+        all_findings, analyzer_names, incomplete = _run_analyzers(self.analyzers, skill)
+        if self.description_index is not None:
+            all_findings.extend(self._check_description_overlap([skill]))
 
         scan_duration = time.time() - start_time
 
@@ -178,11 +112,90 @@ class SkillScanner:
             findings=all_findings,
             scan_duration_seconds=scan_duration,
             analyzers_used=analyzer_names,
+            incomplete_analyses=incomplete,
         )
 
         return result
 
-    def scan_directory(self, skills_directory: Path, recursive: bool = False, check_overlap: bool = False) -> Report:
+    def scan_archive(self, source: str | Path | BinaryIO, name: str | None = None) -> ScanResult:
+        """
+        Scan a skill package packed in a zip or tar archive, without extracting it.
+
+        Args:
+            source: Archive path, or a seekable binary file object (e.g. an upload stream)
+            name: Display name of the archive (default: file name of ``source``)
+
+        Returns:
+            ScanResult with findings; ``skill_directory`` is the archive name plus the package root
+
+        Raises:
+            SkillLoadError: If the archive cannot be read, exceeds a limit, or holds no valid skill
+        """
+        start_time = time.time()
+
+        skill = self.loader.load_skill_archive(source, name=name)
+        try:
+            all_findings, analyzer_names, incomplete = _run_analyzers(self.analyzers, skill)
+            if self.description_index is not None:
+                all_findings.extend(self._check_description_overlap([skill]))
+        finally:
+            skill.archive.close()
+
+        return ScanResult(
+            skill_name=skill.name,
+            skill_directory=str(skill.directory),
+            findings=all_findings,
+            scan_duration_seconds=time.time() - start_time,
+            analyzers_used=analyzer_names,
+            incomplete_analyses=incomplete,
+        )
+
+    def scan_skill_batch(self, skill_directories: list[Path]) -> list[ScanResult | Exception]:
+        """
+        Scan several skill packages together.
+
+        Each analyzer sees the whole group at once (see BaseAnalyzer.run_batch),
+        so the LLM analyzer can pack small skills into shared requests.
+
+        Args:
+            skill_directories: Paths to skill directories
+
+        Returns:
+            A ScanResult for each directory in the order given, or the exception
+            raised while loading it
+        """
+        loaded: list[tuple[Path, Skill]] = []
+        errors: dict[int, Exception] = {}
+        for position, skill_directory in enumerate(skill_directories):
+            try:
+                loaded.append((Path(skill_directory), self.loader.load_skill(Path(skill_directory))))
+            except Exception as e:
+                errors[position] = e
+
+        results = iter(self._scan_loaded(loaded))
+        outcomes: list[ScanResult | Exception] = []
+        for position in range(len(skill_directories)):
+            if position in errors:
+                outcomes.append(errors[position])
+                continue
+            skill, result = next(results)
+            if self.description_index is not None:
+                result.findings.extend(self._check_description_overlap([skill]))
+            outcomes.append(result)
+        return outcomes
+
+    @property
+    def batch_size(self) -> int:
+        """Skills scanned together by directory scans and batch jobs: the largest analyzer batch_size."""
+        return max((analyzer.batch_size for analyzer in self.analyzers), default=1)
+
+    def scan_directory(
+        self,
+        skills_directory: Path,
+        recursive: bool = False,
+        check_overlap: bool = False,
+        workers: int = 1,
+    ) -> Report:
         """
         Scan all skill packages in a directory.
 
@@ -190,10 +203,50 @@ class SkillScanner:
             skills_directory: Directory containing skill packages
             recursive: If True, search recursively for SKILL.md files
             check_overlap: If True, check for description overlap between skills
+            workers: Number of worker processes used to load and analyze skills.
+                1 (default) scans sequentially in the current process. Results keep
+                the same ordering and finding IDs regardless of the worker count.
 
         Returns:
             Report with results from all skills
         """
+        report = Report()
+
+        # Keep track of loaded skills for cross-skill analysis
+        loaded_skills: list[Skill] = []
+
+        for skill, result in self.iter_scan_directory(skills_directory, recursive=recursive, workers=workers):
+            report.add_scan_result(result)
+
+            # Store skill for cross-skill analysis if needed
+            if check_overlap:
+                loaded_skills.append(skill)
+
+        # Perform cross-skill analysis if requested
+        if check_overlap and (len(loaded_skills) > 1 or (loaded_skills and self.description_index is not None)):
+            cross_findings = self.check_cross_skill(loaded_skills)
+            if cross_findings and report.scan_results:
+                report.scan_results[0].findings.extend(cross_findings)
+
+        return report
+
+    def iter_scan_directory(
+        self, skills_directory: Path, recursive: bool = False, workers: int = 1
+    ) -> Iterator[tuple[Skill, ScanResult]]:
+        """
+        Scan skill packages in a directory, yielding each result as soon as it is ready.
+
+        Unlike scan_directory, nothing is accumulated, so memory use does not
+        grow with the number of skills. Results come in directory order.
+
+        Args:
+            skills_directory: Directory containing skill packages
+            recursive: If True, search recursively for SKILL.md files
+            workers: Number of worker processes (1 = sequential)
+
+        Yields:
+            (skill, result) pairs
+        """
         if not isinstance(skills_directory, Path):
             skills_directory = Path(skills_directory)
 
@@ -201,83 +254,159 @@ class SkillScanner:
             raise FileNotFoundError(f"Directory does not exist: {skills_directory}")
 
         skill_dirs = self._find_skill_directories(skills_directory, recursive)
-        report = Report()
 
-        # Keep track of loaded skills for cross-skill analysis
-        loaded_skills: list[Skill] = []
+        if workers > 1 and len(skill_dirs) > 1:
+            yield from self._scan_skills_parallel(skill_dirs, workers)
+        else:
+            yield from self._scan_skills_sequential(skill_dirs)
 
-        for skill_dir in skill_dirs:
-            try:
-                # Load skill once for both scanning and cross-skill analysis
-                skill = self.loader.load_skill(skill_dir)
+    def check_cross_skill(self, skills: list[Skill]) -> list[Finding]:
+        """
+        Run cross-skill checks: description overlap and multi-skill attack patterns.
 
-                # Run all analyzers on the already-loaded skill
-                start_time = time.time()
-                all_findings = []
-                analyzer_names = []
-                validated_binary_files = set()
+        Args:
+            skills: Loaded skills from one directory scan
 
-                for analyzer in self.analyzers:
-                    findings = analyzer.analyze(skill)
-                    all_findings.extend(findings)
-                    analyzer_names.append(analyzer.get_name())
+        Returns:
+            Findings that concern more than one skill
+        """
+        findings = self._check_description_overlap(skills)
 
-                    if hasattr(analyzer, "validated_binary_files"):
-                        validated_binary_files.update(analyzer.validated_binary_files)
+        # Full cross-skill attack pattern detection
+        try:
+            from .analyzers.cross_skill_scanner import CrossSkillScanner
 
-                # Post-process findings
-                if validated_binary_files:
-                    all_findings = [
-                        f
-                        for f in all_findings
-                        if not (f.rule_id == "BINARY_FILE_DETECTED" and f.file_path in validated_binary_files)
-                    ]
+            cross_analyzer = CrossSkillScanner()
+            findings.extend(cross_analyzer.analyze_skill_set(skills))
+        except ImportError:
+            pass
 
-                scan_duration = time.time() - start_time
+        return findings
+
+    def _scan_skills_sequential(self, skill_dirs: list[Path]) -> Iterator[tuple[Skill, ScanResult]]:
+        """Load and analyze skills in the current process, batch_size skills at a time."""
+        for group in _batches(skill_dirs, self.batch_size):
+            loaded: list[tuple[Path, Skill]] = []
+            for skill_dir in group:
+                try:
+                    # Load skill once for both scanning and cross-skill analysis
+                    loaded.append((skill_dir, self.loader.load_skill(skill_dir)))
+                except SkillLoadError as e:
+                    logger.warning("Failed to scan %s: %s", skill_dir, e)
+            yield from self._scan_loaded(loaded)
+
+    def _scan_loaded(self, loaded: list[tuple[Path, Skill]]) -> list[tuple[Skill, ScanResult]]:
+        """Analyze a group of loaded skills together; the group's scan time is shared evenly between them."""
+        if not loaded:
+            return []
+        skills = [skill for _, skill in loaded]
+
+        start_time = time.time()
+        analyzed = _run_analyzers_batch(self.analyzers, skills)
+        scan_duration = (time.time() - start_time) / len(skills)
 
-                result = ScanResult(
+        return [
+            (
+                skill,
+                ScanResult(
                     skill_name=skill.name,
                     skill_directory=str(skill_dir.absolute()),
                     findings=all_findings,
                     scan_duration_seconds=scan_duration,
                     analyzers_used=analyzer_names,
-                )
-
-                report.add_scan_result(result)
+                    incomplete_analyses=incomplete,
+                ),
+            )
+            for (skill_dir, skill), (all_findings, analyzer_names, incomplete) in zip(loaded, analyzed, strict=True)
+        ]
 
-                # Store skill for cross-skill analysis if needed
-                if check_overlap:
-                    loaded_skills.append(skill)
-
-            except SkillLoadError as e:
-                logger.warning("Failed to scan %s: %s", skill_dir, e)
-                continue
-
-        # Perform cross-skill analysis if requested
-        if check_overlap and len(loaded_skills) > 1:
-            overlap_findings = self._check_description_overlap(loaded_skills)
-            if overlap_findings and report.scan_results:
-                report.scan_results[0].findings.extend(overlap_findings)
-
-            # Full cross-skill attack pattern detection
-            try:
-                from .analyzers.cross_skill_scanner import CrossSkillScanner
-
-                cross_analyzer = CrossSkillScanner()
-                cross_findings = cross_analyzer.analyze_skill_set(loaded_skills)
-                if cross_findings and report.scan_results:
-                    report.scan_results[0].findings.extend(cross_findings)
-            except ImportError:
-                pass
+    def _scan_skills_parallel(self, skill_dirs: list[Path], workers: int) -> Iterator[tuple[Skill, ScanResult]]:
+        """
+        Load and analyze skills across a pool of worker processes.
+
+        Analyzers that can be pickled (static, behavioral, trigger, ...) are shipped
+        once to every worker and run there alongside skill loading, batch_size
+        skills per task. Analyzers holding live clients or other unpicklable state
+        run afterwards in this process on the skills returned by the worker.
+        Per-analyzer findings are recombined in the configured analyzer order and
+        results are yielded in directory order, so the output is identical to a
+        sequential scan. Cache counters and LLM usage recorded in the workers are
+        merged into this process's analyzers.
+        """
+        pooled_indices = [i for i, analyzer in enumerate(self.analyzers) if _is_picklable(analyzer)]
+        pooled_analyzers = [self.analyzers[i] for i in pooled_indices]
+        local_indices = [i for i in range(len(self.analyzers)) if i not in pooled_indices]
+        local_analyzers = [self.analyzers[i] for i in local_indices]
+
+        if local_indices:
+            logger.info(
+                "Running %d analyzer(s) in the main process: %s",
+                len(local_indices),
+                ", ".join(analyzer.get_name() for analyzer in local_analyzers),
+            )
+
+        groups = list(_batches(skill_dirs, self.batch_size))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_scan_worker,
+            initargs=(pooled_analyzers, self.loader),
+        ) as executor:
+            for group, (outcomes, worker_cache_stats, worker_usage) in zip(
+                groups, executor.map(_scan_skills_in_worker, groups), strict=True
+            ):
+                # Fold cache counters and LLM usage from the worker into the parent's analyzers
+                for cache, stats in zip(_analyzer_caches(pooled_analyzers), worker_cache_stats, strict=True):
+                    cache.stats.merge(stats)
+                for analyzer, usage in zip(_usage_analyzers(pooled_analyzers), worker_usage, strict=True):
+                    analyzer.merge_usage(*usage)
+
+                loaded = []
+                for skill_dir, outcome in zip(group, outcomes, strict=True):
+                    if isinstance(outcome, str):
+                        logger.warning("Failed to scan %s: %s", skill_dir, outcome)
+                    else:
+                        loaded.append((skill_dir, outcome))
+                if not loaded:
+                    continue
 
-        return report
+                start_time = time.time()
+                local_outputs = [
+                    analyzer.run_batch([outcome[0] for _, outcome in loaded]) for analyzer in local_analyzers
+                ]
+                local_duration = (time.time() - start_time) / len(loaded)
+
+                for position, (skill_dir, outcome) in enumerate(loaded):
+                    skill, pooled_findings, pooled_validated, pooled_incomplete, worker_duration = outcome
+                    per_analyzer: dict[int, list[Finding]] = dict(zip(pooled_indices, pooled_findings, strict=True))
+                    validated_binary_files = set(pooled_validated)
+                    incomplete = list(pooled_incomplete)
+                    for i, outputs in zip(local_indices, local_outputs, strict=True):
+                        per_analyzer[i] = outputs[position].findings
+                        validated_binary_files.update(outputs[position].validated_binary_files)
+                        incomplete.extend(outputs[position].incomplete_analyses)
+
+                    all_findings = [f for i in range(len(self.analyzers)) for f in per_analyzer[i]]
+                    all_findings = _suppress_validated_binaries(all_findings, validated_binary_files)
+
+                    result = ScanResult(
+                        skill_name=skill.name,
+                        skill_directory=str(skill_dir.absolute()),
+                        findings=all_findings,
+                        scan_duration_seconds=worker_duration + local_duration,
+                        analyzers_used=[analyzer.get_name() for analyzer in self.analyzers],
+                        incomplete_analyses=incomplete,
+                    )
+                    yield skill, result
 
     def _check_description_overlap(self, skills: list[Skill]) -> list[Finding]:
         """
         Check for description overlap between skills.
 
         Similar descriptions could cause trigger hijacking where one skill
-        steals requests intended for another.
+        steals requests intended for another. Descriptions are indexed with
+        MinHash/LSH so only likely-similar pairs are compared exactly. With a
+        persistent ``description_index``, skills are also compared against
+        every skill indexed by earlier runs, and added to it.
 
         Args:
             skills: List of loaded skills to compare
@@ -285,86 +414,83 @@ class SkillScanner:
         Returns:
             List of findings for overlapping descriptions
         """
-        findings = []
+        persistent = self.description_index is not None
+        index = self.description_index if persistent else DescriptionIndex()
 
-        for i, skill_a in enumerate(skills):
-            for skill_b in skills[i + 1 :]:
-                similarity = self._jaccard_similarity(skill_a.description, skill_b.description)
-
-                if similarity > 0.7:
-                    findings.append(
-                        Finding(
-                            id=f"OVERLAP_{hash(skill_a.name + skill_b.name) & 0xFFFFFFFF:08x}",
-                            rule_id="TRIGGER_OVERLAP_RISK",
-                            category=ThreatCategory.SOCIAL_ENGINEERING,
-                            severity=Severity.MEDIUM,
-                            title="Skills have overlapping descriptions",
-                            description=(
-                                f"Skills '{skill_a.name}' and '{skill_b.name}' have {similarity:.0%} "
-                                f"similar descriptions. This may cause confusion about which skill "
-                                f"should handle a request, or enable trigger hijacking attacks."
-                            ),
-                            file_path=f"{skill_a.name}/SKILL.md",
-                            remediation=(
-                                "Make skill descriptions more distinct by clearly specifying "
-                                "the unique capabilities, file types, or use cases for each skill."
-                            ),
-                            metadata={
-                                "skill_a": skill_a.name,
-                                "skill_b": skill_b.name,
-                                "similarity": similarity,
-                            },
-                        )
-                    )
-                elif similarity > 0.5:
-                    findings.append(
-                        Finding(
-                            id=f"OVERLAP_WARN_{hash(skill_a.name + skill_b.name) & 0xFFFFFFFF:08x}",
-                            rule_id="TRIGGER_OVERLAP_WARNING",
-                            category=ThreatCategory.SOCIAL_ENGINEERING,
-                            severity=Severity.LOW,
-                            title="Skills have somewhat similar descriptions",
-                            description=(
-                                f"Skills '{skill_a.name}' and '{skill_b.name}' have {similarity:.0%} "
-                                f"similar descriptions. Consider making descriptions more distinct."
-                            ),
-                            file_path=f"{skill_a.name}/SKILL.md",
-                            remediation="Consider making skill descriptions more distinct",
-                            metadata={
-                                "skill_a": skill_a.name,
-                                "skill_b": skill_b.name,
-                                "similarity": similarity,
-                            },
-                        )
-                    )
+        keys = []
+        for position, skill in enumerate(skills):
+            key = str(Path(skill.directory).absolute()) if persistent else str(position)
+            index.add(key, skill.name, skill.description)
+            keys.append(key)
+        index.save()
+        positions = {key: position for position, key in enumerate(keys)}
+
+        findings = []
+        for position, (skill_a, key) in enumerate(zip(skills, keys, strict=True)):
+            # Pairs within this scan are reported once, from the earlier skill; catalogue skills come last
+            matches = [
+                (positions.get(other, len(skills)), other, similarity)
+                for other, similarity in index.similar(key)
+                if positions.get(other, len(skills)) > position
+            ]
+            for other_position, other, similarity in sorted(matches):
+                name_b = skills[other_position].name if other_position < len(skills) else index.name(other)
+                findings.append(self._overlap_finding(skill_a.name, name_b, similarity))
 
         return findings
 
-    def _jaccard_similarity(self, text_a: str, text_b: str) -> float:
+    def _overlap_finding(self, name_a: str, name_b: str, similarity: float) -> Finding:
         """
-        Calculate Jaccard similarity between two text strings.
+        Build the finding for two skills with similar descriptions.
 
         Args:
-            text_a: First text
-            text_b: Second text
+            name_a: Name of the skill the finding is reported on
+            name_b: Name of the other skill
+            similarity: Jaccard similarity of the descriptions, above 0.5
 
         Returns:
-            Similarity score from 0.0 to 1.0
+            TRIGGER_OVERLAP_RISK above 0.7, otherwise TRIGGER_OVERLAP_WARNING
         """
-        tokens_a = set(re.findall(r"\b[a-zA-Z]+\b", text_a.lower()))
-        tokens_b = set(re.findall(r"\b[a-zA-Z]+\b", text_b.lower()))
-
-        # Remove common stop words (using module-level constant)
-        tokens_a = tokens_a - _STOP_WORDS
-        tokens_b = tokens_b - _STOP_WORDS
-
-        if not tokens_a or not tokens_b:
-            return 0.0
-
-        intersection = len(tokens_a & tokens_b)
-        union = len(tokens_a | tokens_b)
+        metadata = {"skill_a": name_a, "skill_b": name_b, "similarity": similarity}
+
+        if similarity > 0.7:
+            return Finding(
+                id=self._generate_finding_id("OVERLAP", name_a + name_b),
+                rule_id="TRIGGER_OVERLAP_RISK",
+                category=ThreatCategory.SOCIAL_ENGINEERING,
+                severity=Severity.MEDIUM,
+                title="Skills have overlapping descriptions",
+                description=(
+                    f"Skills '{name_a}' and '{name_b}' have {similarity:.0%} "
+                    f"similar descriptions. This may cause confusion about which skill "
+                    f"should handle a request, or enable trigger hijacking attacks."
+                ),
+                file_path=f"{name_a}/SKILL.md",
+                remediation=(
+                    "Make skill descriptions more distinct by clearly specifying "
+                    "the unique capabilities, file types, or use cases for each skill."
+                ),
+                metadata=metadata,
+            )
+
+        return Finding(
+            id=self._generate_finding_id("OVERLAP_WARN", name_a + name_b),
+            rule_id="TRIGGER_OVERLAP_WARNING",
+            category=ThreatCategory.SOCIAL_ENGINEERING,
+            severity=Severity.LOW,
+            title="Skills have somewhat similar descriptions",
+            description=(
+                f"Skills '{name_a}' and '{name_b}' have {similarity:.0%} "
+                f"similar descriptions. Consider making descriptions more distinct."
+            ),
+            file_path=f"{name_a}/SKILL.md",
+            remediation="Consider making skill descriptions more distinct",
+            metadata=metadata,
+        )
 
-        return intersection / union if union > 0 else 0.0
+    def _generate_finding_id(self, prefix: str, context: str) -> str:
+        """Generate a finding ID that is the same in every process (built-in hash() is salted per process)."""
+        return f"{prefix}_{hashlib.sha256(context.encode()).hexdigest()[:8]}"
 
     def _find_skill_directories(self, directory: Path, recursive: bool) -> list[Path]:
         """
@@ -395,11 +521,177 @@ class SkillScanner:
         """Add an analyzer to the scanner."""
         self.analyzers.append(analyzer)
 
+    def close(self) -> None:
+        """Release the connections and threads held by the scanner's analyzers."""
+        for analyzer in self.analyzers:
+            analyzer.close()
+
     def list_analyzers(self) -> list[str]:
         """Get names of all configured analyzers."""
         return [analyzer.get_name() for analyzer in self.analyzers]
 
 
+def _run_analyzers(
+    analyzers: list[BaseAnalyzer], skill: Skill
+) -> tuple[list[Finding], list[str], list[dict[str, Any]]]:
+    """
+    Run analyzers over a loaded skill and merge their findings.
+
+    Args:
+        analyzers: Analyzers to run, in order
+        skill: Loaded skill
+
+    Returns:
+        Tuple of (findings, analyzer names, analyses cut short by a budget)
+    """
+    all_findings = []
+    analyzer_names = []
+    validated_binary_files = set()
+    incomplete: list[dict[str, Any]] = []
+
+    for analyzer in analyzers:
+        # Per-scan results come back with the findings, so analyzers can be shared by concurrent scans
+        output = analyzer.run(skill)
+        all_findings.extend(output.findings)
+        analyzer_names.append(analyzer.get_name())
+        validated_binary_files.update(output.validated_binary_files)
+        incomplete.extend(output.incomplete_analyses)
+
+    return _suppress_validated_binaries(all_findings, validated_binary_files), analyzer_names, incomplete
+
+
+def _run_analyzers_batch(
+    analyzers: list[BaseAnalyzer], skills: list[Skill]
+) -> list[tuple[list[Finding], list[str], list[dict[str, Any]]]]:
+    """
+    Run analyzers over a group of loaded skills, each analyzer seeing the whole group at once.
+
+    Args:
+        analyzers: Analyzers to run, in order
+        skills: Loaded skills
+
+    Returns:
+        For each skill, a tuple of (findings, analyzer names, analyses cut short by a budget)
+    """
+    analyzer_names = [analyzer.get_name() for analyzer in analyzers]
+    outputs = [analyzer.run_batch(skills) for analyzer in analyzers]
+
+    results = []
+    for position in range(len(skills)):
+        all_findings = []
+        validated_binary_files = set()
+        incomplete: list[dict[str, Any]] = []
+        for analyzer_outputs in outputs:
+            output = analyzer_outputs[position]
+            all_findings.extend(output.findings)
+            validated_binary_files.update(output.validated_binary_files)
+            incomplete.extend(output.incomplete_analyses)
+        results.append(
+            (_suppress_validated_binaries(all_findings, validated_binary_files), list(analyzer_names), incomplete)
+        )
+    return results
+
+
+def _batches(items: list[Path], size: int) -> Iterator[list[Path]]:
+    """Split items into consecutive groups of at most size."""
+    for start in range(0, len(items), max(1, size)):
+        yield items[start : start + size]
+
+
+def _suppress_validated_binaries(findings: list[Finding], validated_binary_files: set[str]) -> list[Finding]:
+    """Drop BINARY_FILE_DETECTED findings for files VirusTotal has validated as clean."""
+    if not validated_binary_files:
+        return findings
+    return [f for f in findings if not (f.rule_id == "BINARY_FILE_DETECTED" and f.file_path in validated_binary_files)]
+
+
+def _is_picklable(obj: object) -> bool:
+    """Check whether an object can be shipped to a worker process."""
+    try:
+        pickle.dumps(obj)
+        return True
+    except Exception:
+        return False
+
+
+# Per-process state for parallel directory scans, set up by _init_scan_worker
+_worker_analyzers: list[BaseAnalyzer] = []
+_worker_loader: SkillLoader | None = None
+
+
+def _init_scan_worker(analyzers: list[BaseAnalyzer], loader: SkillLoader) -> None:
+    """Install the analyzers and loader used by this worker process."""
+    global _worker_analyzers, _worker_loader
+    _worker_analyzers = analyzers
+    _worker_loader = loader
+
+
+def _analyzer_caches(analyzers: list[BaseAnalyzer]) -> list[SQLiteCache]:
+    """Get the distinct scan, LLM response and VirusTotal verdict caches used by analyzers, in analyzer order."""
+    caches: list[SQLiteCache] = []
+    for analyzer in analyzers:
+        for attribute in ("cache", "response_cache", "verdict_cache"):
+            cache = getattr(analyzer, attribute, None)
+            if isinstance(cache, SQLiteCache) and not any(cache is seen for seen in caches):
+                caches.append(cache)
+    return caches
+
+
+def _usage_analyzers(analyzers: list[BaseAnalyzer]) -> list[BaseAnalyzer]:
+    """Get the analyzers that record LLM usage (see LLMAnalyzer.drain_usage), in analyzer order."""
+    return [analyzer for analyzer in analyzers if hasattr(analyzer, "drain_usage")]
+
+
+# One skill scanned in a worker: the skill, findings per pooled analyzer, validated
+# binary files, analyses cut short by a budget and scan duration
+_WorkerOutcome = tuple[Skill, list[list[Finding]], set[str], list[dict[str, Any]], float]
+
+
+def _scan_skills_in_worker(
+    skill_dirs: list[Path],
+) -> tuple[list[_WorkerOutcome | str], list[CacheStats], list[tuple[dict[str, "LLMUsage"], "LLMUsage"]]]:
+    """
+    Load and analyze a group of skills together inside a worker process.
+
+    Returns:
+        Tuple of (an outcome for each skill, or an error message if it could not
+        be loaded; scan cache counters; LLM usage of each usage-recording analyzer)
+    """
+    loader = _worker_loader or SkillLoader()
+    loaded: list[Skill] = []
+    errors: dict[int, str] = {}
+    for position, skill_dir in enumerate(skill_dirs):
+        try:
+            loaded.append(loader.load_skill(skill_dir))
+        except SkillLoadError as e:
+            errors[position] = str(e)
+
+    start_time = time.time()
+    outputs = [analyzer.run_batch(loaded) for analyzer in _worker_analyzers] if loaded else []
+    duration = (time.time() - start_time) / max(1, len(loaded))
+
+    per_skill = iter((skill, [analyzer_outputs[i] for analyzer_outputs in outputs]) for i, skill in enumerate(loaded))
+    outcomes: list[_WorkerOutcome | str] = []
+    for position in range(len(skill_dirs)):
+        if position in errors:
+            outcomes.append(errors[position])
+            continue
+        skill, skill_outputs = next(per_skill)
+        outcomes.append(
+            (
+                skill,
+                [output.findings for output in skill_outputs],
+                {path for output in skill_outputs for path in output.validated_binary_files},
+                [entry for output in skill_outputs for entry in output.incomplete_analyses],
+                duration,
+            )
+        )
+
+    cache_stats = [cache.drain_stats() for cache in _analyzer_caches(_worker_analyzers)]
+    usage = [analyzer.drain_usage() for analyzer in _usage_analyzers(_worker_analyzers)]
+    return outcomes, cache_stats, usage
+
+
 def scan_skill(skill_directory: Path, analyzers: list[BaseAnalyzer] | None = None) -> ScanResult:
     """
     Convenience function to scan a single skill.
@@ -420,6 +712,7 @@ def scan_directory(
     recursive: bool = False,
     analyzers: list[BaseAnalyzer] | None = None,
     check_overlap: bool = False,
+    workers: int = 1,
 ) -> Report:
     """
     Convenience function to scan multiple skills.
@@ -429,9 +722,10 @@ def scan_directory(
         recursive: Search recursively
         analyzers: Optional list of analyzers
         check_overlap: If True, check for description overlap between skills
+        workers: Number of worker processes (1 = sequential)
 
     Returns:
         Report with all results
     """
     scanner = SkillScanner(analyzers=analyzers)
-    return scanner.scan_directory(skills_directory, recursive=recursive, check_overlap=check_overlap)
+    return scanner.scan_directory(skills_directory, recursive=recursive, check_overlap=check_overlap, workers=workers)
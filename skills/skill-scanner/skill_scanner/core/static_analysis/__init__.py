@@ -16,6 +16,8 @@
 
 """Static analysis modules for behavioral analyzer."""
 
+from .artifacts import ArtifactStore, ScriptArtifacts
+from .budget import AnalysisBudget, BudgetExceeded, Deadline
 from .context_extractor import ContextExtractor, SkillFunctionContext, SkillScriptContext
 from .parser.python_parser import PythonParser
 
@@ -24,4 +26,9 @@ __all__ = [
     "ContextExtractor",
     "SkillScriptContext",
     "SkillFunctionContext",
+    "ArtifactStore",
+    "ScriptArtifacts",
+    "AnalysisBudget",
+    "BudgetExceeded",
+    "Deadline",
 ]
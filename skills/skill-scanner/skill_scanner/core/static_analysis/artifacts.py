@@ -0,0 +1,147 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Parse-once artifacts for skill scripts.
+
+The behavioral analyzer reads each Python script from several places: the
+call graph, the script context, the per-function contexts used for
+alignment verification and the dataflow analyses behind them. An
+ArtifactStore keeps one ScriptArtifacts per distinct source, keyed by a
+content hash, so a script is parsed once per skill scan and each CFG is
+built once.
+"""
+
+import ast
+import hashlib
+
+from .cfg.builder import ControlFlowGraph, DataFlowAnalyzer
+from .parser.python_parser import PythonParser
+from .semantic.name_resolver import NameResolver
+
+
+class ScriptArtifacts:
+    """Parsed artifacts of one script source, each built on first use.
+
+    Consumers must treat the AST, parser results and CFGs as read-only,
+    since every consumer of the same source shares them.
+    """
+
+    def __init__(self, source_code: str):
+        """
+        Initialize artifacts for a source.
+
+        Args:
+            source_code: Python source code
+        """
+        self.source_code = source_code
+        self._parser: PythonParser | None = None
+        self._parse_ok = False
+        self._cfgs: dict[int, tuple[ast.AST, ControlFlowGraph]] = {}
+        self._name_resolver: NameResolver | None = None
+        self._ast_node_count: int | None = None
+
+    @property
+    def parser(self) -> PythonParser | None:
+        """PythonParser with parse() already run, or None if the source does not parse."""
+        if self._parser is None:
+            self._parser = PythonParser(self.source_code)
+            self._parse_ok = self._parser.parse()
+        return self._parser if self._parse_ok else None
+
+    @property
+    def tree(self) -> ast.Module | None:
+        """Module AST, or None if the source does not parse."""
+        parser = self.parser
+        return parser.tree if parser else None
+
+    @property
+    def ast_node_count(self) -> int:
+        """Number of nodes in the module AST (0 if the source does not parse)."""
+        if self._ast_node_count is None:
+            tree = self.tree
+            self._ast_node_count = sum(1 for _ in ast.walk(tree)) if tree is not None else 0
+        return self._ast_node_count
+
+    def cfg(self, root: ast.AST | None = None) -> ControlFlowGraph | None:
+        """
+        Get the Control Flow Graph of the module or of one function.
+
+        A function's graph is built for a module holding only that function,
+        which is the graph parsing the function's own source would give.
+
+        Args:
+            root: Node of this source's AST to build the graph for (the module if None)
+
+        Returns:
+            Control Flow Graph, or None if the source does not parse
+        """
+        parser = self.parser
+        if parser is None:
+            return None
+
+        root = root if root is not None else parser.tree
+        cached = self._cfgs.get(id(root))
+        if cached is None:
+            graph_root = root
+            if isinstance(root, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                graph_root = ast.Module(body=[root], type_ignores=[])
+            # Keep the node with its graph so its id() cannot be reused while cached
+            cached = (root, DataFlowAnalyzer(parser, root=graph_root).build_cfg())
+            self._cfgs[id(root)] = cached
+        return cached[1]
+
+    def name_resolver(self) -> NameResolver | None:
+        """Name-resolution scopes of the module, or None if the source does not parse."""
+        if self._name_resolver is None:
+            tree = self.tree
+            if tree is None:
+                return None
+            self._name_resolver = NameResolver(tree)
+            self._name_resolver.resolve()
+        return self._name_resolver
+
+
+class ArtifactStore:
+    """Per-skill store of ScriptArtifacts keyed by source content hash."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._artifacts: dict[str, ScriptArtifacts] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._artifacts)
+
+    def get(self, source_code: str) -> ScriptArtifacts:
+        """
+        Get the artifacts for a source, creating them if this content is new.
+
+        Args:
+            source_code: Python source code
+
+        Returns:
+            Shared ScriptArtifacts for the source
+        """
+        key = hashlib.sha256(source_code.encode("utf-8", errors="surrogatepass")).hexdigest()
+        artifacts = self._artifacts.get(key)
+        if artifacts is None:
+            self.misses += 1
+            artifacts = self._artifacts[key] = ScriptArtifacts(source_code)
+        else:
+            self.hits += 1
+        return artifacts
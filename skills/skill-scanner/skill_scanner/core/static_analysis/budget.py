@@ -0,0 +1,148 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Analysis budgets for behavioral scans.
+
+Bounds the work spent on one script and on one skill: wall time, AST size
+and CFG size. Size limits are checked before the expensive analyses start;
+wall time is a Deadline that the CFG dataflow solver, context extraction and
+function summaries check as they go. Exceeding a budget raises
+BudgetExceeded so the caller can fall back to a cheaper analysis.
+"""
+
+import math
+import os
+import time
+from dataclasses import dataclass
+
+from .artifacts import ScriptArtifacts
+
+DEFAULT_MAX_FILE_SECONDS = 30.0
+DEFAULT_MAX_SKILL_SECONDS = 120.0
+DEFAULT_MAX_AST_NODES = 200_000
+DEFAULT_MAX_CFG_NODES = 50_000
+
+
+class BudgetExceeded(Exception):
+    """Raised when an analysis goes past one of its budgets."""
+
+    def __init__(self, limit: str, detail: str):
+        """
+        Initialize the error.
+
+        Args:
+            limit: Budget that was exceeded ("file_seconds", "skill_seconds", "ast_nodes" or "cfg_nodes")
+            detail: What was being analyzed and by how much the budget was exceeded
+        """
+        super().__init__(f"{limit} budget exceeded: {detail}")
+        self.limit = limit
+        self.detail = detail
+
+
+class Deadline:
+    """Wall-clock budget checked cooperatively by long-running analyses."""
+
+    def __init__(self, seconds: float | None = None, limit: str = "file_seconds", parent: "Deadline | None" = None):
+        """
+        Initialize a deadline starting now.
+
+        Args:
+            seconds: Time allowed; 0 or None means no limit of its own
+            limit: Budget name reported when this deadline expires
+            parent: Enclosing deadline (e.g. the skill's), which also bounds this one
+        """
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + seconds if seconds else math.inf
+        self.limit = limit
+        if parent is not None and parent.expires_at < self.expires_at:
+            self.expires_at = parent.expires_at
+            self.limit = parent.limit
+
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+    def check(self, stage: str) -> None:
+        """
+        Raise if the deadline has passed.
+
+        Args:
+            stage: Analysis being run, for the error detail
+
+        Raises:
+            BudgetExceeded: If the deadline has passed
+        """
+        if self.expired():
+            elapsed = time.monotonic() - self.started_at
+            raise BudgetExceeded(self.limit, f"{stage} stopped after {elapsed:.1f}s")
+
+
+@dataclass
+class AnalysisBudget:
+    """Per-file and per-skill limits for behavioral analysis; 0 disables a limit."""
+
+    max_file_seconds: float = DEFAULT_MAX_FILE_SECONDS
+    max_skill_seconds: float = DEFAULT_MAX_SKILL_SECONDS
+    max_ast_nodes: int = DEFAULT_MAX_AST_NODES
+    max_cfg_nodes: int = DEFAULT_MAX_CFG_NODES
+
+    @classmethod
+    def from_env(cls) -> "AnalysisBudget":
+        """
+        Read limits from SKILL_SCANNER_MAX_FILE_SECONDS, SKILL_SCANNER_MAX_SKILL_SECONDS,
+        SKILL_SCANNER_MAX_AST_NODES and SKILL_SCANNER_MAX_CFG_NODES, with defaults for unset ones.
+
+        Returns:
+            AnalysisBudget
+        """
+        return cls(
+            max_file_seconds=float(os.environ.get("SKILL_SCANNER_MAX_FILE_SECONDS", DEFAULT_MAX_FILE_SECONDS)),
+            max_skill_seconds=float(os.environ.get("SKILL_SCANNER_MAX_SKILL_SECONDS", DEFAULT_MAX_SKILL_SECONDS)),
+            max_ast_nodes=int(os.environ.get("SKILL_SCANNER_MAX_AST_NODES", DEFAULT_MAX_AST_NODES)),
+            max_cfg_nodes=int(os.environ.get("SKILL_SCANNER_MAX_CFG_NODES", DEFAULT_MAX_CFG_NODES)),
+        )
+
+    def skill_deadline(self) -> Deadline:
+        """Start the wall-clock budget for one skill."""
+        return Deadline(self.max_skill_seconds, limit="skill_seconds")
+
+    def file_deadline(self, skill_deadline: Deadline | None = None) -> Deadline:
+        """Start the wall-clock budget for one file, bounded by the skill's remaining time."""
+        return Deadline(self.max_file_seconds, limit="file_seconds", parent=skill_deadline)
+
+    def check_script(self, artifacts: ScriptArtifacts) -> None:
+        """
+        Check a script's AST and CFG sizes before running dataflow on it.
+
+        The AST is checked first so an oversized script never has its CFG built.
+
+        Args:
+            artifacts: Parse results of the script
+
+        Raises:
+            BudgetExceeded: If the AST or the module CFG is over its limit
+        """
+        if artifacts.tree is None:
+            return
+
+        if self.max_ast_nodes and artifacts.ast_node_count > self.max_ast_nodes:
+            raise BudgetExceeded("ast_nodes", f"{artifacts.ast_node_count:,} AST nodes (limit {self.max_ast_nodes:,})")
+
+        if self.max_cfg_nodes:
+            cfg = artifacts.cfg()
+            if cfg is not None and len(cfg.nodes) > self.max_cfg_nodes:
+                raise BudgetExceeded("cfg_nodes", f"{len(cfg.nodes):,} CFG nodes (limit {self.max_cfg_nodes:,})")
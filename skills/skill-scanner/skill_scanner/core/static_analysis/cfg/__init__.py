@@ -16,6 +16,6 @@
 
 """Control Flow Graph (CFG) building for dataflow analysis."""
 
-from .builder import CFGNode, ControlFlowGraph, DataFlowAnalyzer
+from .builder import CFGNode, ControlFlowGraph, DataFlowAnalyzer, DataFlowStats
 
-__all__ = ["CFGNode", "ControlFlowGraph", "DataFlowAnalyzer"]
+__all__ = ["CFGNode", "ControlFlowGraph", "DataFlowAnalyzer", "DataFlowStats"]
@@ -21,13 +21,22 @@ analysis through control structures (if/else, loops, functions).
 """
 
 import ast
+import heapq
 import logging
-from typing import Any, Generic, TypeVar
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from ..parser.python_parser import PythonParser
 
+if TYPE_CHECKING:
+    from ..budget import Deadline
+
 T = TypeVar("T")
 
+# Solver iterations between wall-clock deadline checks
+DEADLINE_CHECK_INTERVAL = 256
+
 
 class CFGNode:
     """Control Flow Graph node."""
@@ -108,30 +117,160 @@ class ControlFlowGraph:
         """
         return node.predecessors
 
+    def reverse_postorder(self, forward: bool = True) -> list[CFGNode]:
+        """Order nodes by reverse postorder of a depth-first search.
+
+        Outside of loops every node comes before the nodes it flows into.
+        The search starts at the entry (exit for backward analysis) and then
+        from every node not reached yet, so disconnected parts of the graph
+        (e.g. function bodies) are ordered too.
+
+        Args:
+            forward: Follow successor edges (True) or predecessor edges (False)
+
+        Returns:
+            All nodes in reverse postorder
+        """
+        edges = _edges(forward)
+        start = self.entry if forward else self.exit
+        roots = ([start] if start is not None else []) + self.nodes
+
+        visited: set[int] = set()
+        postorder: list[CFGNode] = []
+        for root in roots:
+            if root.id in visited:
+                continue
+            visited.add(root.id)
+            stack = [(root, iter(edges(root)))]
+            while stack:
+                node, pending = stack[-1]
+                for nxt in pending:
+                    if nxt.id not in visited:
+                        visited.add(nxt.id)
+                        stack.append((nxt, iter(edges(nxt))))
+                        break
+                else:
+                    stack.pop()
+                    postorder.append(node)
+
+        postorder.reverse()
+        return postorder
+
+    def strongly_connected_components(self, forward: bool = True) -> list[list[CFGNode]]:
+        """Group nodes into strongly connected components (loops).
+
+        Args:
+            forward: Follow successor edges (True) or predecessor edges (False)
+
+        Returns:
+            Components in topological order (a component only flows into later
+            ones); nodes within a component are in reverse postorder
+        """
+        order = self.reverse_postorder(forward)
+        rpo_index = {node.id: i for i, node in enumerate(order)}
+        reverse_edges = _edges(not forward)
+
+        # Kosaraju: searching the reversed graph in reverse postorder yields
+        # components in topological order of the original graph
+        assigned: set[int] = set()
+        components: list[list[CFGNode]] = []
+        for root in order:
+            if root.id in assigned:
+                continue
+            assigned.add(root.id)
+            component = []
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                component.append(node)
+                for nxt in reverse_edges(node):
+                    if nxt.id not in assigned:
+                        assigned.add(nxt.id)
+                        stack.append(nxt)
+            component.sort(key=lambda node: rpo_index[node.id])
+            components.append(component)
+        return components
+
+
+def _edges(forward: bool) -> Callable[[CFGNode], list[CFGNode]]:
+    """Get the edge accessor for an analysis direction."""
+    if forward:
+        return lambda node: node.successors
+    return lambda node: node.predecessors
+
+
+@dataclass
+class DataFlowStats:
+    """Work done by one DataFlowAnalyzer.analyze() run."""
+
+    cfg_nodes: int = 0
+    components: int = 0
+    loop_heads: int = 0
+    iterations: int = 0
+    nodes_visited: int = 0
+    widenings: int = 0
+    max_iterations: int = 0
+    hit_iteration_cap: bool = False
+
+    @property
+    def converged(self) -> bool:
+        """Whether the analysis reached its fixpoint before the iteration cap."""
+        return not self.hit_iteration_cap
 
-class DataFlowAnalyzer(Generic[T]):
-    """Generic dataflow analysis framework."""
 
-    def __init__(self, parser: PythonParser) -> None:
+class DataFlowAnalyzer(Generic[T]):
+    """Generic dataflow analysis framework.
+
+    The worklist solver visits nodes in order of their strongly connected
+    component (topological) and reverse postorder within it, so each loop is
+    iterated to its fixpoint before its results flow onwards. Facts at loop
+    heads go through widen() once a head has been evaluated more than
+    ``widening_delay`` times.
+    """
+
+    # Evaluations of a loop head before widen() is applied to its incoming fact
+    widening_delay = 2
+
+    def __init__(
+        self,
+        parser: PythonParser,
+        root: ast.AST | None = None,
+        cfg: ControlFlowGraph | None = None,
+        deadline: "Deadline | None" = None,
+    ) -> None:
         """Initialize dataflow analyzer.
 
         Args:
             parser: Python parser instance
+            root: AST node to analyze, such as one function (defaults to the parser's module tree)
+            cfg: Control Flow Graph already built for ``root``, reused instead of building one
+            deadline: Wall-clock budget checked while solving; analyze() raises
+                BudgetExceeded once it has passed
         """
         self.parser = parser
-        self.cfg: ControlFlowGraph | None = None
+        self.root = root
+        self.cfg: ControlFlowGraph | None = cfg
+        self.deadline = deadline
         self.in_facts: dict[int, T] = {}
         self.out_facts: dict[int, T] = {}
+        self.stats = DataFlowStats()
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def ast_root(self) -> ast.AST | None:
+        """AST node the analysis runs on: ``root`` if given, else the parser's module tree."""
+        if self.root is not None:
+            return self.root
+        # PythonParser keeps the module AST in self.tree
+        return getattr(self.parser, "tree", None)
+
     def build_cfg(self) -> ControlFlowGraph:
         """Build Control Flow Graph from AST.
 
         Returns:
             Control Flow Graph
         """
-        # Get AST from parser (PythonParser uses self.tree)
-        ast_root = getattr(self.parser, "tree", None)
+        ast_root = self.ast_root
         if not ast_root:
             self.logger.warning("Cannot build CFG: no AST available. Call parser.parse() first.")
             return ControlFlowGraph()
@@ -301,7 +440,13 @@ class DataFlowAnalyzer(Generic[T]):
             return cfg.create_node(node, type(node).__name__)
 
     def analyze(self, initial_fact: T, forward: bool = True, max_iteration_multiplier: int = 1000) -> None:
-        """Run dataflow analysis using worklist algorithm.
+        """Run dataflow analysis using a priority worklist algorithm.
+
+        Work counters, including whether the iteration cap was hit, are
+        recorded in ``self.stats``.
+
+        Raises:
+            BudgetExceeded: If ``self.deadline`` passes before the fixpoint is reached
 
         Args:
             initial_fact: Initial dataflow fact
@@ -314,6 +459,7 @@ class DataFlowAnalyzer(Generic[T]):
             self.build_cfg()
 
         if not self.cfg or not self.cfg.nodes:
+            self.stats = DataFlowStats()
             return
 
         # Clear facts dictionaries to ensure clean state (defensive programming)
@@ -325,8 +471,27 @@ class DataFlowAnalyzer(Generic[T]):
             self.in_facts[node.id] = initial_fact
             self.out_facts[node.id] = initial_fact
 
-        worklist = list(self.cfg.nodes)
-        in_worklist = {node.id for node in worklist}
+        # Priority = (component in topological order, reverse postorder index), so a
+        # loop reaches its fixpoint before anything downstream of it is evaluated
+        rpo_index = {node.id: i for i, node in enumerate(self.cfg.reverse_postorder(forward))}
+        components = self.cfg.strongly_connected_components(forward)
+        priority: dict[int, tuple[int, int]] = {}
+        loop_heads: set[int] = set()
+        for component_index, component in enumerate(components):
+            members = {node.id for node in component}
+            for node in component:
+                priority[node.id] = (component_index, rpo_index[node.id])
+                # Loop head: target of a back edge from inside its own loop
+                incoming = node.predecessors if forward else node.successors
+                if any(src.id in members and rpo_index[src.id] >= rpo_index[node.id] for src in incoming):
+                    loop_heads.add(node.id)
+
+        nodes_by_id = {node.id: node for node in self.cfg.nodes}
+        worklist = [(priority[node.id], node.id) for node in self.cfg.nodes]
+        heapq.heapify(worklist)
+        in_worklist = set(nodes_by_id)
+        head_visits: dict[int, int] = {}
+        visited: set[int] = set()
 
         iteration_count = 0
         cfg_size = len(self.cfg.nodes)
@@ -348,22 +513,36 @@ class DataFlowAnalyzer(Generic[T]):
             effective_multiplier = int(max_iteration_multiplier * 0.3)  # 300
         max_iterations = cfg_size * effective_multiplier  # Safety limit
 
-        while worklist:
-            iteration_count += 1
+        stats = DataFlowStats(
+            cfg_nodes=cfg_size,
+            components=len(components),
+            loop_heads=len(loop_heads),
+            max_iterations=max_iterations,
+        )
+        self.stats = stats
 
+        while worklist:
             # Safety check to prevent infinite loops
-            if iteration_count > max_iterations:
-                # Log at debug level to reduce noise - this is expected for complex files
-                # The analysis still completes, it just stops early at the safety limit
+            if iteration_count >= max_iterations:
+                stats.hit_iteration_cap = True
                 self.logger.debug(
                     f"Dataflow analysis exceeded max iterations ({max_iterations:,} iterations, "
-                    f"CFG size: {cfg_size} nodes). Analysis stopped at safety limit. "
-                    f"This is normal for complex control flow and analysis may be incomplete."
+                    f"CFG size: {cfg_size} nodes). Analysis stopped at safety limit and may be incomplete."
                 )
                 break
 
-            node = worklist.pop(0)
-            in_worklist.discard(node.id)
+            if self.deadline is not None and iteration_count % DEADLINE_CHECK_INTERVAL == 0:
+                self.deadline.check(f"dataflow over {cfg_size} CFG nodes")
+
+            iteration_count += 1
+            _, node_id = heapq.heappop(worklist)
+            in_worklist.discard(node_id)
+            visited.add(node_id)
+            node = nodes_by_id[node_id]
+            widen = False
+            if node_id in loop_heads:
+                head_visits[node_id] = head_visits.get(node_id, 0) + 1
+                widen = head_visits[node_id] > self.widening_delay
 
             if forward:
                 pred_facts = [self.out_facts[pred.id] for pred in node.predecessors]
@@ -371,6 +550,9 @@ class DataFlowAnalyzer(Generic[T]):
                     in_fact = self.merge(pred_facts)
                 else:
                     in_fact = initial_fact
+                if widen:
+                    in_fact = self.widen(self.in_facts[node_id], in_fact)
+                    stats.widenings += 1
 
                 self.in_facts[node.id] = in_fact
 
@@ -381,7 +563,7 @@ class DataFlowAnalyzer(Generic[T]):
 
                     for succ in node.successors:
                         if succ.id not in in_worklist:
-                            worklist.append(succ)
+                            heapq.heappush(worklist, (priority[succ.id], succ.id))
                             in_worklist.add(succ.id)
             else:
                 succ_facts = [self.in_facts[succ.id] for succ in node.successors]
@@ -389,6 +571,9 @@ class DataFlowAnalyzer(Generic[T]):
                     out_fact = self.merge(succ_facts)
                 else:
                     out_fact = initial_fact
+                if widen:
+                    out_fact = self.widen(self.out_facts[node_id], out_fact)
+                    stats.widenings += 1
 
                 self.out_facts[node.id] = out_fact
 
@@ -399,9 +584,12 @@ class DataFlowAnalyzer(Generic[T]):
 
                     for pred in node.predecessors:
                         if pred.id not in in_worklist:
-                            worklist.append(pred)
+                            heapq.heappush(worklist, (priority[pred.id], pred.id))
                             in_worklist.add(pred.id)
 
+        stats.iterations = iteration_count
+        stats.nodes_visited = len(visited)
+
     def transfer(self, node: CFGNode, in_fact: T) -> T:
         """Transfer function for dataflow analysis.
 
@@ -414,6 +602,22 @@ class DataFlowAnalyzer(Generic[T]):
         """
         return in_fact
 
+    def widen(self, previous: T, current: T) -> T:
+        """Widen the fact entering a loop head to force convergence.
+
+        Called with the fact from the head's previous evaluation and the newly
+        merged one. The default keeps the new fact; analyses whose facts can
+        keep changing around a loop should return an upper bound of both.
+
+        Args:
+            previous: Fact from the previous evaluation of the loop head
+            current: Newly merged fact
+
+        Returns:
+            Widened fact
+        """
+        return current
+
     def merge(self, facts: list[T]) -> T:
         """Merge multiple dataflow facts.
 
@@ -21,11 +21,14 @@ Extracts comprehensive security context from skill scripts for LLM analysis.
 """
 
 import ast
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from .dataflow.forward_analysis import ForwardDataflowAnalysis
+from .artifacts import ScriptArtifacts
+from .budget import BudgetExceeded, Deadline
+from .dataflow.forward_analysis import FlowPath, ForwardDataflowAnalysis
 from .parser.python_parser import FunctionInfo, PythonParser
 
 
@@ -56,6 +59,9 @@ class SkillScriptContext:
     all_string_literals: list[str] = field(default_factory=list)
     suspicious_urls: list[str] = field(default_factory=list)
 
+    # Script-level dataflow stopped at its iteration cap, so flows may be missing
+    dataflow_truncated: bool = False
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for LLM prompt."""
         return {
@@ -88,6 +94,7 @@ class SkillScriptContext:
                 for f in self.functions
             ],
             "suspicious_urls": self.suspicious_urls,
+            "dataflow_truncated": self.dataflow_truncated,
         }
 
 
@@ -138,6 +145,212 @@ class SkillFunctionContext:
     dataflow_summary: dict[str, Any] = field(default_factory=dict)
 
 
+class FunctionFactsVisitor(ast.NodeVisitor):
+    """Collects the AST facts of a SkillFunctionContext in one traversal.
+
+    ``collect()`` visits every node of a function once, in ``ast.walk()``
+    (breadth-first) order, so each list comes out in the same order as a
+    separate walk per fact would give. Values that several facts need, such
+    as call names and unparsed assignment values, are computed once.
+    """
+
+    FILE_PATTERNS = ["open", "read", "write", "path", "file", "os.remove", "shutil"]
+    NETWORK_PATTERNS = ["requests", "urllib", "http", "socket", "post", "get", "fetch"]
+    SUBPROCESS_PATTERNS = ["subprocess", "os.system", "os.popen", "shell", "exec"]
+    EVAL_CALLS = ["eval", "exec", "compile", "__import__"]
+
+    def __init__(self, get_call_name: Callable[[ast.Call], str]):
+        """
+        Initialize the visitor.
+
+        Args:
+            get_call_name: Returns the dotted name of a call
+        """
+        self._get_call_name = get_call_name
+
+        self.function_calls: list[dict[str, Any]] = []
+        self.assignments: list[dict[str, Any]] = []
+        self.constants: dict[str, Any] = {}
+        self.variable_dependencies: dict[str, list[str]] = {}
+        self.string_literals: list[str] = []
+        self.return_expressions: list[str] = []
+        self.exception_handlers: list[dict[str, Any]] = []
+        self.env_var_access: list[str] = []
+        self.attribute_access: list[dict[str, Any]] = []
+
+        self.has_file_operations = False
+        self.has_network_operations = False
+        self.has_subprocess_calls = False
+        self.has_eval_exec = False
+
+        self.has_if = False
+        self.has_loops = False
+        self.has_try = False
+        self.total_statements = 0
+        self.total_expressions = 0
+        self.complexity = 1
+
+        self._seen_literals: set[str] = set()
+        self._global_names: set[str] = set()
+        # (variable, value, line) of assignments to plain names, filtered by global declarations at the end
+        self._name_writes: list[tuple[str, str, int]] = []
+
+    def collect(self, node: ast.AST) -> "FunctionFactsVisitor":
+        """
+        Visit every node under ``node`` (including itself) once.
+
+        Args:
+            node: Function AST node
+
+        Returns:
+            This visitor, with all facts filled in
+        """
+        for child in ast.walk(node):
+            if isinstance(child, ast.stmt):
+                self.total_statements += 1
+            elif isinstance(child, ast.expr):
+                self.total_expressions += 1
+            self.visit(child)
+        return self
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Do not recurse; collect() already reaches every node."""
+
+    def control_flow(self) -> dict[str, Any]:
+        """Control flow structure summary."""
+        return {
+            "has_conditionals": self.has_if,
+            "has_loops": self.has_loops,
+            "has_exception_handling": self.has_try,
+        }
+
+    def global_writes(self) -> list[dict[str, Any]]:
+        """Assignments to names the function declares ``global``."""
+        return [
+            {"variable": name, "value": value, "line": line}
+            for name, value, line in self._name_writes
+            if name in self._global_names
+        ]
+
+    def dataflow_summary(self) -> dict[str, Any]:
+        """Statement and expression counts plus cyclomatic complexity."""
+        return {
+            "total_statements": self.total_statements,
+            "total_expressions": self.total_expressions,
+            "complexity": self.complexity,
+        }
+
+    def visit_Call(self, node: ast.Call) -> None:
+        call_name = self._get_call_name(node)
+
+        args_list = []
+        for arg in node.args:
+            try:
+                args_list.append(ast.unparse(arg))
+            except (AttributeError, TypeError, ValueError):
+                args_list.append("<complex>")
+        self.function_calls.append(
+            {"name": call_name, "args": args_list, "line": node.lineno if hasattr(node, "lineno") else 0}
+        )
+
+        call_lower = call_name.lower()
+        if any(pattern in call_lower for pattern in self.FILE_PATTERNS):
+            self.has_file_operations = True
+        if any(pattern in call_lower for pattern in self.NETWORK_PATTERNS):
+            self.has_network_operations = True
+        if any(pattern in call_lower for pattern in self.SUBPROCESS_PATTERNS):
+            self.has_subprocess_calls = True
+        if call_name in self.EVAL_CALLS:
+            self.has_eval_exec = True
+
+        if "environ" in call_name or "getenv" in call_name:
+            if node.args and isinstance(node.args[0], ast.Constant):
+                self.env_var_access.append(f"{call_name}('{node.args[0].value}')")
+            else:
+                self.env_var_access.append(call_name)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        value_str: str | None = None
+        dependencies: list[str] | None = None
+
+        for target in node.targets:
+            if isinstance(target, (ast.Name, ast.Attribute)) and value_str is None:
+                try:
+                    value_str = ast.unparse(node.value)
+                except (AttributeError, TypeError, ValueError):
+                    value_str = "<complex>"
+
+            if isinstance(target, ast.Name):
+                self.assignments.append(
+                    {"variable": target.id, "value": value_str, "line": node.lineno if hasattr(node, "lineno") else 0}
+                )
+                if isinstance(node.value, ast.Constant):
+                    self.constants[target.id] = node.value.value
+                if dependencies is None:
+                    dependencies = [n.id for n in ast.walk(node.value) if isinstance(n, ast.Name)]
+                self.variable_dependencies[target.id] = list(dependencies)
+                self._name_writes.append((target.id, value_str[:100], node.lineno))
+
+            elif isinstance(target, ast.Attribute):
+                self.attribute_access.append(
+                    {
+                        "type": "write",
+                        "object": target.value.id if isinstance(target.value, ast.Name) else "",
+                        "attribute": target.attr,
+                        "value": value_str[:100],
+                        "line": node.lineno,
+                    }
+                )
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        if isinstance(node.value, str):
+            literal = node.value[:200]
+            if literal and literal not in self._seen_literals:
+                self._seen_literals.add(literal)
+                self.string_literals.append(literal)
+
+    def visit_Return(self, node: ast.Return) -> None:
+        if node.value:
+            try:
+                self.return_expressions.append(ast.unparse(node.value)[:100])
+            except (AttributeError, TypeError, ValueError):
+                self.return_expressions.append("<unparseable>")
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
+        self.complexity += 1
+        self.exception_handlers.append(
+            {
+                "line": node.lineno,
+                "exception_type": ast.unparse(node.type) if node.type else "Exception",
+                "is_silent": len(node.body) == 1 and isinstance(node.body[0], ast.Pass),
+            }
+        )
+
+    def visit_Global(self, node: ast.Global) -> None:
+        self._global_names.update(node.names)
+
+    def visit_If(self, node: ast.If) -> None:
+        self.has_if = True
+        self.complexity += 1
+
+    def visit_For(self, node: ast.For) -> None:
+        self.has_loops = True
+        self.complexity += 1
+
+    def visit_AsyncFor(self, node: ast.AsyncFor) -> None:
+        self.has_loops = True
+
+    def visit_While(self, node: ast.While) -> None:
+        self.has_loops = True
+        self.complexity += 1
+
+    def visit_Try(self, node: ast.Try) -> None:
+        self.has_try = True
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> None:
+        self.complexity += len(node.values) - 1
+
+
 class ContextExtractor:
     """Extract comprehensive security context from skill scripts."""
 
@@ -250,39 +463,96 @@ class ContextExtractor:
         # - sendgrid.com (email tracking/download)
     ]
 
-    def extract_context(self, file_path: Path, source_code: str) -> SkillScriptContext:
+    def extract_context(
+        self,
+        file_path: Path,
+        source_code: str,
+        artifacts: ScriptArtifacts | None = None,
+        deadline: Deadline | None = None,
+    ) -> SkillScriptContext:
         """
         Extract complete security context from a script.
 
         Args:
             file_path: Path to the script file
             source_code: Python source code
+            artifacts: Shared parse results for ``source_code`` (parsed here if None)
+            deadline: Wall-clock budget for the dataflow analysis (unbounded if None)
 
         Returns:
             SkillScriptContext with extracted information
+
+        Raises:
+            BudgetExceeded: If ``deadline`` passes during the dataflow analysis
         """
+        if artifacts is None:
+            artifacts = ScriptArtifacts(source_code)
+
         # Parse with AST parser
-        parser = PythonParser(source_code)
-        if not parser.parse():
+        parser = artifacts.parser
+        if parser is None:
             # Return empty context if parsing fails
             return SkillScriptContext(file_path=str(file_path), functions=[], imports=[], dataflows=[])
 
-        # Aggregate security indicators
-        has_network = any(f.has_network_calls for f in parser.functions)
-        has_file_ops = any(f.has_file_operations for f in parser.functions)
-        has_subprocess = any(f.has_subprocess for f in parser.functions)
-        has_eval_exec = any(f.has_eval_exec for f in parser.functions)
-
         # Use CFG-based ForwardDataflowAnalysis for script-level source detection and flow tracking
+        truncated = False
         try:
-            forward_analyzer = ForwardDataflowAnalysis(parser, parameter_names=[], detect_sources=True)
+            forward_analyzer = ForwardDataflowAnalysis(
+                parser, parameter_names=[], detect_sources=True, cfg=artifacts.cfg(), deadline=deadline
+            )
             script_flows = forward_analyzer.analyze_forward_flows()
+            truncated = forward_analyzer.stats.hit_iteration_cap
+        except BudgetExceeded:
+            raise
         except Exception as e:
             import logging
 
             logging.getLogger(__name__).warning(f"CFG-based script-level analysis failed: {e}")
             script_flows = []
 
+        return self._build_script_context(file_path, parser, script_flows, dataflow_truncated=truncated)
+
+    def extract_indicator_context(
+        self, file_path: Path, source_code: str, artifacts: ScriptArtifacts | None = None
+    ) -> SkillScriptContext:
+        """
+        Extract a script's context from parser indicators only, without dataflow.
+
+        Used when a script is over its analysis budget: the network, file,
+        subprocess and eval flags, calls and suspicious URLs are kept, but no
+        source-to-sink flows or chains are reported.
+
+        Args:
+            file_path: Path to the script file
+            source_code: Python source code
+            artifacts: Shared parse results for ``source_code`` (parsed here if None)
+
+        Returns:
+            SkillScriptContext without dangerous flows
+        """
+        if artifacts is None:
+            artifacts = ScriptArtifacts(source_code)
+
+        parser = artifacts.parser
+        if parser is None:
+            return SkillScriptContext(file_path=str(file_path), functions=[], imports=[], dataflows=[])
+
+        return self._build_script_context(file_path, parser, [])
+
+    def _build_script_context(
+        self,
+        file_path: Path,
+        parser: PythonParser,
+        script_flows: list[FlowPath],
+        dataflow_truncated: bool = False,
+    ) -> SkillScriptContext:
+        """Build a script context from parser indicators and script-level flows."""
+        # Aggregate security indicators
+        has_network = any(f.has_network_calls for f in parser.functions)
+        has_file_ops = any(f.has_file_operations for f in parser.functions)
+        has_subprocess = any(f.has_subprocess for f in parser.functions)
+        has_eval_exec = any(f.has_eval_exec for f in parser.functions)
+
         # Extract credential/env access from detected sources
         has_credential_access = any(flow.parameter_name.startswith("credential_file:") for flow in script_flows)
         has_env_var_access = any(flow.parameter_name.startswith("env_var:") for flow in script_flows)
@@ -370,11 +640,18 @@ class ContextExtractor:
             all_function_calls=list(set(all_calls)),
             all_string_literals=all_strings,
             suspicious_urls=suspicious_urls,
+            dataflow_truncated=dataflow_truncated,
         )
 
         return context
 
-    def extract_function_contexts(self, file_path: Path, source_code: str) -> list[SkillFunctionContext]:
+    def extract_function_contexts(
+        self,
+        file_path: Path,
+        source_code: str,
+        artifacts: ScriptArtifacts | None = None,
+        deadline: Deadline | None = None,
+    ) -> list[SkillFunctionContext]:
         """Extract detailed context for each function in the source code.
 
         Used by the alignment verification layer to analyze individual functions.
@@ -382,36 +659,47 @@ class ContextExtractor:
         Args:
             file_path: Path to the script file
             source_code: Python source code
+            artifacts: Shared parse results for ``source_code`` (parsed here if None)
+            deadline: Wall-clock budget for the whole extraction (unbounded if None)
 
         Returns:
             List of SkillFunctionContext for each function
+
+        Raises:
+            BudgetExceeded: If ``deadline`` passes before every function is analyzed
         """
         contexts = []
 
-        try:
-            tree = ast.parse(source_code)
-        except SyntaxError:
-            return contexts
+        if artifacts is None:
+            artifacts = ScriptArtifacts(source_code)
 
         # Parse with AST parser
-        parser = PythonParser(source_code)
-        if not parser.parse():
+        parser = artifacts.parser
+        if parser is None:
             return contexts
 
         # Extract module-level imports
         imports = parser.imports
 
         # Process each function
-        for node in ast.walk(tree):
+        for node in ast.walk(parser.tree):
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                context = self._extract_function_context(node, imports, source_code, file_path)
+                if deadline is not None:
+                    deadline.check(f"function context extraction at {node.name}")
+                context = self._extract_function_context(node, imports, source_code, file_path, artifacts, deadline)
                 if context:
                     contexts.append(context)
 
         return contexts
 
     def _extract_function_context(
-        self, node: ast.FunctionDef, imports: list[str], source_code: str, file_path: Path
+        self,
+        node: ast.FunctionDef,
+        imports: list[str],
+        source_code: str,
+        file_path: Path,
+        artifacts: ScriptArtifacts,
+        deadline: Deadline | None = None,
     ) -> SkillFunctionContext:
         """Extract detailed context for a single function.
 
@@ -420,6 +708,8 @@ class ContextExtractor:
             imports: Module-level imports
             source_code: Full source code
             file_path: Path to the file
+            artifacts: Parse results of the source ``node`` belongs to
+            deadline: Wall-clock budget for the parameter flow analysis
 
         Returns:
             SkillFunctionContext with extracted information
@@ -431,38 +721,11 @@ class ContextExtractor:
         return_type = self._extract_return_type(node)
         line_number = node.lineno
 
-        # Code structure
-        function_calls = self._extract_function_calls(node)
-        assignments = self._extract_assignments(node)
-        control_flow = self._analyze_control_flow(node)
+        # Everything else is collected in one traversal of the function
+        facts = FunctionFactsVisitor(self._get_call_name).collect(node)
 
         # Parameter flow analysis
-        parameter_flows = self._analyze_parameter_flows(node, parameters)
-
-        # Constants
-        constants = self._extract_constants(node)
-
-        # Variable dependencies
-        var_deps = self._analyze_variable_dependencies(node)
-
-        # Behavioral patterns
-        has_file_ops = self._has_file_operations(node)
-        has_network_ops = self._has_network_operations(node)
-        has_subprocess = self._has_subprocess_calls(node)
-        has_eval_exec = self._has_eval_exec(node)
-
-        # High-value security indicators
-        string_literals = self._extract_string_literals(node)
-        return_expressions = self._extract_return_expressions(node)
-        exception_handlers = self._extract_exception_handlers(node)
-        env_var_access = self._extract_env_var_access(node)
-
-        # State manipulation
-        global_writes = self._extract_global_writes(node)
-        attribute_access = self._extract_attribute_access(node)
-
-        # Dataflow summary
-        dataflow_summary = self._create_dataflow_summary(node)
+        parameter_flows = self._analyze_parameter_flows(node, parameters, artifacts, deadline)
 
         return SkillFunctionContext(
             name=name,
@@ -471,23 +734,23 @@ class ContextExtractor:
             return_type=return_type,
             line_number=line_number,
             imports=imports,
-            function_calls=function_calls,
-            assignments=assignments,
-            control_flow=control_flow,
+            function_calls=facts.function_calls,
+            assignments=facts.assignments,
+            control_flow=facts.control_flow(),
             parameter_flows=parameter_flows,
-            constants=constants,
-            variable_dependencies=var_deps,
-            has_file_operations=has_file_ops,
-            has_network_operations=has_network_ops,
-            has_subprocess_calls=has_subprocess,
-            has_eval_exec=has_eval_exec,
-            string_literals=string_literals,
-            return_expressions=return_expressions,
-            exception_handlers=exception_handlers,
-            env_var_access=env_var_access,
-            global_writes=global_writes,
-            attribute_access=attribute_access,
-            dataflow_summary=dataflow_summary,
+            constants=facts.constants,
+            variable_dependencies=facts.variable_dependencies,
+            has_file_operations=facts.has_file_operations,
+            has_network_operations=facts.has_network_operations,
+            has_subprocess_calls=facts.has_subprocess_calls,
+            has_eval_exec=facts.has_eval_exec,
+            string_literals=facts.string_literals[:20],
+            return_expressions=facts.return_expressions,
+            exception_handlers=facts.exception_handlers,
+            env_var_access=facts.env_var_access,
+            global_writes=facts.global_writes(),
+            attribute_access=facts.attribute_access[:20],
+            dataflow_summary=facts.dataflow_summary(),
         )
 
     def _extract_parameters(self, node: ast.FunctionDef) -> list[dict[str, Any]]:
@@ -512,26 +775,6 @@ class ContextExtractor:
                 return "<unknown>"
         return None
 
-    def _extract_function_calls(self, node: ast.FunctionDef) -> list[dict[str, Any]]:
-        """Extract all function calls with arguments."""
-        calls = []
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                args_list = []
-                for arg in child.args:
-                    try:
-                        args_list.append(ast.unparse(arg))
-                    except (AttributeError, TypeError, ValueError):
-                        args_list.append("<complex>")
-
-                call_info = {
-                    "name": self._get_call_name(child),
-                    "args": args_list,
-                    "line": child.lineno if hasattr(child, "lineno") else 0,
-                }
-                calls.append(call_info)
-        return calls
-
     def _get_call_name(self, node: ast.Call) -> str:
         """Get function call name."""
         if isinstance(node.func, ast.Name):
@@ -550,44 +793,19 @@ class ContextExtractor:
         except (AttributeError, TypeError, ValueError):
             return "<unknown>"
 
-    def _extract_assignments(self, node: ast.FunctionDef) -> list[dict[str, Any]]:
-        """Extract all assignments."""
-        assignments = []
-        for child in ast.walk(node):
-            if isinstance(child, ast.Assign):
-                for target in child.targets:
-                    if isinstance(target, ast.Name):
-                        try:
-                            value_str = ast.unparse(child.value)
-                        except (AttributeError, TypeError, ValueError):
-                            value_str = "<complex>"
-                        assignments.append(
-                            {
-                                "variable": target.id,
-                                "value": value_str,
-                                "line": child.lineno if hasattr(child, "lineno") else 0,
-                            }
-                        )
-        return assignments
-
-    def _analyze_control_flow(self, node: ast.FunctionDef) -> dict[str, Any]:
-        """Analyze control flow structure."""
-        has_if = any(isinstance(n, ast.If) for n in ast.walk(node))
-        has_for = any(isinstance(n, (ast.For, ast.AsyncFor)) for n in ast.walk(node))
-        has_while = any(isinstance(n, ast.While) for n in ast.walk(node))
-        has_try = any(isinstance(n, ast.Try) for n in ast.walk(node))
-
-        return {
-            "has_conditionals": has_if,
-            "has_loops": has_for or has_while,
-            "has_exception_handling": has_try,
-        }
-
-    def _analyze_parameter_flows(self, node: ast.FunctionDef, parameters: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def _analyze_parameter_flows(
+        self,
+        node: ast.FunctionDef,
+        parameters: list[dict[str, Any]],
+        artifacts: ScriptArtifacts,
+        deadline: Deadline | None = None,
+    ) -> list[dict[str, Any]]:
         """Analyze how parameters flow through the function using CFG-based analysis.
 
         Uses proper control flow graph and fixpoint analysis for accurate tracking
-        through branches, loops, and function calls.
+        through branches, loops, and function calls. The analysis runs on the
+        function's node in the shared module AST, so operation lines are lines
+        of the script.
         """
         flows = []
         param_names = [p["name"] for p in parameters]
@@ -595,25 +813,14 @@ class ContextExtractor:
         if not param_names:
             return flows
 
-        # Extract function source code for parser
-        try:
-            func_source = ast.unparse(node) if hasattr(ast, "unparse") else None
-        except (AttributeError, TypeError, ValueError):
-            # Reconstruct from AST if unparse fails
-
-            param_str = ", ".join(p["name"] for p in parameters)
-            func_source = f"def {node.name}({param_str}):\n    pass"
-
-        if not func_source:
-            return flows
-
-        # Create parser and run CFG-based forward analysis
-        parser = PythonParser(func_source)
-        if not parser.parse():
+        parser = artifacts.parser
+        if parser is None:
             return flows
 
         try:
-            forward_analyzer = ForwardDataflowAnalysis(parser, param_names)
+            forward_analyzer = ForwardDataflowAnalysis(
+                parser, param_names, root=node, cfg=artifacts.cfg(node), deadline=deadline
+            )
             flow_paths = forward_analyzer.analyze_forward_flows()
 
             # Convert FlowPath objects to dict format
@@ -628,6 +835,8 @@ class ContextExtractor:
                         "reaches_external": flow_path.reaches_external,
                     }
                 )
+        except BudgetExceeded:
+            raise
         except Exception as e:
             # Log error but return empty flows (no fallback)
             import logging
@@ -636,181 +845,3 @@ class ContextExtractor:
             return flows
 
         return flows
-
-    def _extract_constants(self, node: ast.FunctionDef) -> dict[str, Any]:
-        """Extract constant values."""
-        constants = {}
-        for child in ast.walk(node):
-            if isinstance(child, ast.Assign):
-                for target in child.targets:
-                    if isinstance(target, ast.Name) and isinstance(child.value, ast.Constant):
-                        constants[target.id] = child.value.value
-        return constants
-
-    def _analyze_variable_dependencies(self, node: ast.FunctionDef) -> dict[str, list[str]]:
-        """Analyze variable dependencies."""
-        dependencies = {}
-        for child in ast.walk(node):
-            if isinstance(child, ast.Assign):
-                for target in child.targets:
-                    if isinstance(target, ast.Name):
-                        deps = []
-                        for name_node in ast.walk(child.value):
-                            if isinstance(name_node, ast.Name):
-                                deps.append(name_node.id)
-                        dependencies[target.id] = deps
-        return dependencies
-
-    def _has_file_operations(self, node: ast.FunctionDef) -> bool:
-        """Check for file operations."""
-        file_patterns = ["open", "read", "write", "path", "file", "os.remove", "shutil"]
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                call_name = self._get_call_name(child).lower()
-                if any(pattern in call_name for pattern in file_patterns):
-                    return True
-        return False
-
-    def _has_network_operations(self, node: ast.FunctionDef) -> bool:
-        """Check for network operations."""
-        network_patterns = ["requests", "urllib", "http", "socket", "post", "get", "fetch"]
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                call_name = self._get_call_name(child).lower()
-                if any(pattern in call_name for pattern in network_patterns):
-                    return True
-        return False
-
-    def _has_subprocess_calls(self, node: ast.FunctionDef) -> bool:
-        """Check for subprocess calls."""
-        subprocess_patterns = ["subprocess", "os.system", "os.popen", "shell", "exec"]
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                call_name = self._get_call_name(child).lower()
-                if any(pattern in call_name for pattern in subprocess_patterns):
-                    return True
-        return False
-
-    def _has_eval_exec(self, node: ast.FunctionDef) -> bool:
-        """Check for eval/exec calls."""
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                call_name = self._get_call_name(child)
-                if call_name in ["eval", "exec", "compile", "__import__"]:
-                    return True
-        return False
-
-    def _extract_string_literals(self, node: ast.FunctionDef) -> list[str]:
-        """Extract all string literals from function."""
-        literals = []
-        for child in ast.walk(node):
-            if isinstance(child, ast.Constant) and isinstance(child.value, str):
-                literal = child.value[:200]
-                if literal and literal not in literals:
-                    literals.append(literal)
-        return literals[:20]
-
-    def _extract_return_expressions(self, node: ast.FunctionDef) -> list[str]:
-        """Extract return expressions from function."""
-        returns = []
-        for child in ast.walk(node):
-            if isinstance(child, ast.Return) and child.value:
-                try:
-                    return_expr = ast.unparse(child.value)[:100]
-                    returns.append(return_expr)
-                except (AttributeError, TypeError, ValueError):
-                    returns.append("<unparseable>")
-        return returns
-
-    def _extract_exception_handlers(self, node: ast.FunctionDef) -> list[dict[str, Any]]:
-        """Extract exception handling details."""
-        handlers = []
-        for child in ast.walk(node):
-            if isinstance(child, ast.ExceptHandler):
-                handler_info = {
-                    "line": child.lineno,
-                    "exception_type": ast.unparse(child.type) if child.type else "Exception",
-                    "is_silent": len(child.body) == 1 and isinstance(child.body[0], ast.Pass),
-                }
-                handlers.append(handler_info)
-        return handlers
-
-    def _extract_env_var_access(self, node: ast.FunctionDef) -> list[str]:
-        """Extract environment variable accesses."""
-        env_accesses = []
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                call_name = self._get_call_name(child)
-                if "environ" in call_name or "getenv" in call_name:
-                    if child.args and isinstance(child.args[0], ast.Constant):
-                        key = child.args[0].value
-                        env_accesses.append(f"{call_name}('{key}')")
-                    else:
-                        env_accesses.append(call_name)
-        return env_accesses
-
-    def _extract_global_writes(self, node: ast.FunctionDef) -> list[dict[str, Any]]:
-        """Extract global variable writes."""
-        global_writes = []
-        global_vars = set()
-
-        for child in ast.walk(node):
-            if isinstance(child, ast.Global):
-                global_vars.update(child.names)
-
-        for child in ast.walk(node):
-            if isinstance(child, ast.Assign):
-                for target in child.targets:
-                    if isinstance(target, ast.Name) and target.id in global_vars:
-                        try:
-                            value_str = ast.unparse(child.value)[:100]
-                        except (AttributeError, TypeError, ValueError):
-                            value_str = "<complex>"
-                        global_writes.append({"variable": target.id, "value": value_str, "line": child.lineno})
-
-        return global_writes
-
-    def _extract_attribute_access(self, node: ast.FunctionDef) -> list[dict[str, Any]]:
-        """Extract attribute access patterns."""
-        attribute_ops = []
-
-        for child in ast.walk(node):
-            if isinstance(child, ast.Assign):
-                for target in child.targets:
-                    if isinstance(target, ast.Attribute):
-                        obj_name = ""
-                        if isinstance(target.value, ast.Name):
-                            obj_name = target.value.id
-                        try:
-                            value_str = ast.unparse(child.value)[:100]
-                        except (AttributeError, TypeError, ValueError):
-                            value_str = "<complex>"
-                        attribute_ops.append(
-                            {
-                                "type": "write",
-                                "object": obj_name,
-                                "attribute": target.attr,
-                                "value": value_str,
-                                "line": child.lineno,
-                            }
-                        )
-
-        return attribute_ops[:20]
-
-    def _create_dataflow_summary(self, node: ast.FunctionDef) -> dict[str, Any]:
-        """Create dataflow summary."""
-        return {
-            "total_statements": len([n for n in ast.walk(node) if isinstance(n, ast.stmt)]),
-            "total_expressions": len([n for n in ast.walk(node) if isinstance(n, ast.expr)]),
-            "complexity": self._calculate_complexity(node),
-        }
-
-    def _calculate_complexity(self, node: ast.FunctionDef) -> int:
-        """Calculate cyclomatic complexity."""
-        complexity = 1
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.For, ast.While, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-        return complexity
@@ -27,9 +27,39 @@ import ast
 from dataclasses import dataclass, field
 from typing import Any
 
-from ..cfg.builder import CFGNode, DataFlowAnalyzer
+from ..budget import Deadline
+from ..cfg.builder import CFGNode, ControlFlowGraph, DataFlowAnalyzer
 from ..parser.python_parser import PythonParser
-from ..taint.tracker import ShapeEnvironment, Taint, TaintStatus
+from ..taint.tracker import LabelTable, ShapeEnvironment, Taint, TaintStatus
+
+CREDENTIAL_FILES = [".aws/credentials", ".ssh/id_rsa", ".ssh/id_dsa", ".kube/config", ".netrc"]
+ENV_VAR_PATTERNS = ["API_KEY", "SECRET", "TOKEN", "PASSWORD", "CREDENTIAL"]
+
+
+def classify_source_call(call_name: str, call_node: ast.Call) -> tuple[str, str] | None:
+    """Check if a call reads a sensitive source (credential file, secret env var).
+
+    Args:
+        call_name: Dotted name of the called function
+        call_node: Call node
+
+    Returns:
+        (source_type, source_name) if source, None otherwise
+    """
+    # Check for env var access
+    if call_name in ["os.getenv", "os.environ.get", "getenv"]:
+        for arg in call_node.args:
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                if any(pattern in arg.value.upper() for pattern in ENV_VAR_PATTERNS):
+                    return ("env_var", arg.value)
+
+    # Check for credential file access
+    for arg in call_node.args:
+        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+            if any(cred in arg.value for cred in CREDENTIAL_FILES):
+                return ("credential_file", arg.value)
+
+    return None
 
 
 @dataclass
@@ -57,18 +87,39 @@ class FlowPath:
 
 @dataclass
 class ForwardFlowFact:
-    """Dataflow fact tracking parameter flows."""
+    """Dataflow fact tracking parameter flows.
+
+    ``copy()`` shares the shape environment and the flow paths with the
+    original; use ``writable_flow()`` to get a flow path that is safe to
+    modify.
+    """
 
     shape_env: ShapeEnvironment = field(default_factory=ShapeEnvironment)
     parameter_flows: dict[str, FlowPath] = field(default_factory=dict)
+    _owned_flows: set[str] = field(default_factory=set, init=False, repr=False)
 
     def copy(self) -> "ForwardFlowFact":
-        """Create a deep copy."""
+        """Create a copy-on-write copy."""
+        self._owned_flows.clear()
         return ForwardFlowFact(
             shape_env=self.shape_env.copy(),
-            parameter_flows={k: v.copy() for k, v in self.parameter_flows.items()},
+            parameter_flows=dict(self.parameter_flows),
         )
 
+    def writable_flow(self, name: str) -> FlowPath:
+        """Get a flow path owned by this fact, copying it if it may be shared.
+
+        Args:
+            name: Tracked parameter or source name (must be present)
+
+        Returns:
+            Flow path that can be modified in place
+        """
+        if name not in self._owned_flows:
+            self.parameter_flows[name] = self.parameter_flows[name].copy()
+            self._owned_flows.add(name)
+        return self.parameter_flows[name]
+
     def __eq__(self, other: object) -> bool:
         """Check equality for fixpoint detection."""
         if not isinstance(other, ForwardFlowFact):
@@ -77,13 +128,15 @@ class ForwardFlowFact:
         if self.shape_env != other.shape_env:
             return False
 
-        if set(self.parameter_flows.keys()) != set(other.parameter_flows.keys()):
+        if self.parameter_flows.keys() != other.parameter_flows.keys():
             return False
 
         # Compare flow paths
         for param in self.parameter_flows:
             self_flow = self.parameter_flows[param]
             other_flow = other.parameter_flows[param]
+            if self_flow is other_flow:
+                continue
 
             if (
                 len(self_flow.operations) != len(other_flow.operations)
@@ -105,19 +158,31 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
     their flows to sinks (network, eval, subprocess).
     """
 
-    def __init__(self, parser: PythonParser, parameter_names: list[str] | None = None, detect_sources: bool = True):
+    def __init__(
+        self,
+        parser: PythonParser,
+        parameter_names: list[str] | None = None,
+        detect_sources: bool = True,
+        root: ast.AST | None = None,
+        cfg: ControlFlowGraph | None = None,
+        deadline: Deadline | None = None,
+    ):
         """Initialize forward flow tracker.
 
         Args:
             parser: Python parser instance
             parameter_names: Names of function parameters to track (None for script-level only)
             detect_sources: Whether to detect script-level sources (credential files, env vars)
+            root: AST node to analyze, such as one function (defaults to the parser's module tree)
+            cfg: Control Flow Graph already built for ``root``
+            deadline: Wall-clock budget; analyze_forward_flows() raises BudgetExceeded once it has passed
         """
-        super().__init__(parser)
+        super().__init__(parser, root=root, cfg=cfg, deadline=deadline)
         self.parameter_names = parameter_names or []
         self.detect_sources = detect_sources
         self.all_flows: list[FlowPath] = []
         self.script_sources: list[str] = []  # Detected script-level sources
+        self.label_table = LabelTable()  # Interns taint labels for this analysis
 
     def analyze_forward_flows(self) -> list[FlowPath]:
         """Run forward flow analysis from parameters and script-level sources.
@@ -130,7 +195,8 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
         self.all_flows.clear()
         self.script_sources.clear()
 
-        self.build_cfg()
+        if self.cfg is None:
+            self.build_cfg()
 
         # Detect script-level sources if enabled
         if self.detect_sources:
@@ -141,7 +207,7 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
 
         # Track function parameters
         for param_name in self.parameter_names:
-            taint = Taint(status=TaintStatus.TAINTED)
+            taint = Taint(status=TaintStatus.TAINTED, table=self.label_table)
             taint.add_label(f"param:{param_name}")
             initial_fact.shape_env.set_taint(param_name, taint)
             initial_fact.parameter_flows[param_name] = FlowPath(parameter_name=param_name)
@@ -149,7 +215,7 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
         # Track script-level sources (credential files, env vars)
         for source_name in self.script_sources:
             source_type = self._get_source_type(source_name)
-            taint = Taint(status=TaintStatus.TAINTED)
+            taint = Taint(status=TaintStatus.TAINTED, table=self.label_table)
             taint.add_label(f"source:{source_type}:{source_name}")
             # Use a synthetic variable name for tracking
             var_name = f"__source_{source_type}_{len(self.all_flows)}"
@@ -165,14 +231,7 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
 
     def _detect_script_sources(self) -> None:
         """Detect script-level sources (credential files, env vars)."""
-        tree = getattr(self.parser, "tree", None)
-        if not tree:
-            return
-
-        CREDENTIAL_FILES = [".aws/credentials", ".ssh/id_rsa", ".ssh/id_dsa", ".kube/config", ".netrc"]
-        ENV_VAR_PATTERNS = ["API_KEY", "SECRET", "TOKEN", "PASSWORD", "CREDENTIAL"]
-
-        tree = getattr(self.parser, "tree", None)
+        tree = self.ast_root
         if not tree:
             return
 
@@ -281,7 +340,7 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
                         source_info = self._check_source_call(node.value)
                         if source_info:
                             source_type, source_name = source_info
-                            rhs_taint = Taint(status=TaintStatus.TAINTED)
+                            rhs_taint = Taint(status=TaintStatus.TAINTED, table=self.label_table)
                             rhs_taint.add_label(f"source:{source_type}:{source_name}")
                             # Add to script sources if not already there
                             full_source_name = f"{source_type}:{source_name}"
@@ -305,6 +364,7 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
                                     # Deduplicate: Check if this assignment was already recorded
                                     assignment_str = f"{target.id} = {self._unparse_safe(node.value)}"
                                     if assignment_str not in flow.reaches_assignments:
+                                        flow = fact.writable_flow(tracked_name)
                                         flow.reaches_assignments.append(assignment_str)
 
                                     # Deduplicate operations by creating a key
@@ -316,18 +376,9 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
                                         None,  # argument
                                         node.lineno if hasattr(node, "lineno") else 0,
                                     )
-                                    existing_op_keys = {
-                                        (
-                                            op.get("type"),
-                                            op.get("target"),
-                                            op.get("value"),
-                                            op.get("function"),
-                                            op.get("argument"),
-                                            op.get("line"),
-                                        )
-                                        for op in flow.operations
-                                    }
+                                    existing_op_keys = {_op_key(op) for op in flow.operations}
                                     if op_key not in existing_op_keys:
+                                        flow = fact.writable_flow(tracked_name)
                                         flow.operations.append(
                                             {
                                                 "type": "assignment",
@@ -341,8 +392,10 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
                                     if isinstance(node.value, ast.Call):
                                         call_name = self._get_call_name(node.value)
                                         if call_name not in flow.reaches_calls:
+                                            flow = fact.writable_flow(tracked_name)
                                             flow.reaches_calls.append(call_name)
-                                        if self._is_external_operation(call_name):
+                                        if not flow.reaches_external and self._is_external_operation(call_name):
+                                            flow = fact.writable_flow(tracked_name)
                                             flow.reaches_external = True
                     else:
                         # Clear taint if RHS is not tainted
@@ -364,6 +417,7 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
 
                                 # Deduplicate: Check if this call was already recorded
                                 if call_name not in flow.reaches_calls:
+                                    flow = fact.writable_flow(tracked_name)
                                     flow.reaches_calls.append(call_name)
 
                                 # Deduplicate operations
@@ -375,18 +429,9 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
                                     self._unparse_safe(arg),
                                     node.lineno if hasattr(node, "lineno") else 0,
                                 )
-                                existing_op_keys = {
-                                    (
-                                        op.get("type"),
-                                        op.get("target"),
-                                        op.get("value"),
-                                        op.get("function"),
-                                        op.get("argument"),
-                                        op.get("line"),
-                                    )
-                                    for op in flow.operations
-                                }
+                                existing_op_keys = {_op_key(op) for op in flow.operations}
                                 if op_key not in existing_op_keys:
+                                    flow = fact.writable_flow(tracked_name)
                                     flow.operations.append(
                                         {
                                             "type": "function_call",
@@ -396,7 +441,8 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
                                         }
                                     )
 
-                                if self._is_external_operation(call_name):
+                                if not flow.reaches_external and self._is_external_operation(call_name):
+                                    flow = fact.writable_flow(tracked_name)
                                     flow.reaches_external = True
 
         # Track returns
@@ -408,14 +454,19 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
                     for tracked_name in all_tracked:
                         if self._expr_uses_var(node.value, tracked_name, fact):
                             if tracked_name in fact.parameter_flows:
-                                fact.parameter_flows[tracked_name].reaches_returns = True
-                                fact.parameter_flows[tracked_name].operations.append(
-                                    {
-                                        "type": "return",
-                                        "value": self._unparse_safe(node.value),
-                                        "line": node.lineno if hasattr(node, "lineno") else 0,
-                                    }
-                                )
+                                flow = fact.parameter_flows[tracked_name]
+
+                                # Deduplicate so re-evaluating a return inside a loop reaches a fixpoint
+                                return_op = {
+                                    "type": "return",
+                                    "value": self._unparse_safe(node.value),
+                                    "line": node.lineno if hasattr(node, "lineno") else 0,
+                                }
+                                if not flow.reaches_returns or return_op not in flow.operations:
+                                    flow = fact.writable_flow(tracked_name)
+                                    flow.reaches_returns = True
+                                    if return_op not in flow.operations:
+                                        flow.operations.append(return_op)
 
     def _eval_expr_taint(self, expr: ast.AST, fact: ForwardFlowFact) -> Taint:
         """Evaluate taint of an expression.
@@ -434,7 +485,7 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
             if isinstance(expr.value, ast.Name):
                 obj_name = expr.value.id
                 field_name = expr.attr
-                shape = fact.shape_env.get(obj_name)
+                shape = fact.shape_env.lookup(obj_name)
                 return shape.get_field(field_name)
             else:
                 return self._eval_expr_taint(expr.value, fact)
@@ -442,7 +493,7 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
         elif isinstance(expr, ast.Subscript):
             if isinstance(expr.value, ast.Name):
                 arr_name = expr.value.id
-                shape = fact.shape_env.get(arr_name)
+                shape = fact.shape_env.lookup(arr_name)
                 return shape.get_element()
             else:
                 return self._eval_expr_taint(expr.value, fact)
@@ -491,9 +542,8 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
         Returns:
             True if expression uses the variable
         """
-        target_shape = fact.shape_env.get(var_name)
-        target_taint = target_shape.get_taint()
-        target_labels = target_taint.labels if target_taint.is_tainted() else set()
+        target_taint = fact.shape_env.lookup(var_name).get_taint()
+        target_tainted = target_taint.is_tainted()
         expected_label = f"param:{var_name}"
 
         for node in ast.walk(expr):
@@ -502,26 +552,24 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
                     return True
 
                 # Check transitive dependencies with source sensitivity
-                node_shape = fact.shape_env.get(node.id)
+                node_shape = fact.shape_env.lookup(node.id)
                 node_taint = node_shape.get_taint()
 
                 if node_taint.is_tainted():
-                    if expected_label in node_taint.labels:
+                    if node_taint.has_label(expected_label):
                         return True
 
-                    if target_labels and node_taint.labels & target_labels:
+                    if target_tainted and node_taint.shares_labels(target_taint):
                         return True
 
                     # Check structural shapes
                     if node_shape.is_object:
                         for field_name, field_shape in node_shape.fields.items():
-                            field_taint = field_shape.get_taint()
-                            if expected_label in field_taint.labels:
+                            if field_shape.get_taint().has_label(expected_label):
                                 return True
 
                     if node_shape.is_array and node_shape.element_shape:
-                        elem_taint = node_shape.element_shape.get_taint()
-                        if expected_label in elem_taint.labels:
+                        if node_shape.element_shape.get_taint().has_label(expected_label):
                             return True
 
         return False
@@ -596,31 +644,7 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
         Returns:
             (source_type, source_name) if source, None otherwise
         """
-        call_name = self._get_call_name(call_node)
-        CREDENTIAL_FILES = [".aws/credentials", ".ssh/id_rsa", ".ssh/id_dsa", ".kube/config", ".netrc"]
-        ENV_VAR_PATTERNS = ["API_KEY", "SECRET", "TOKEN", "PASSWORD", "CREDENTIAL"]
-
-        # Check for env var access
-        if call_name in ["os.getenv", "os.environ.get", "getenv"]:
-            for arg in call_node.args:
-                if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
-                    if any(pattern in arg.value.upper() for pattern in ENV_VAR_PATTERNS):
-                        return ("env_var", arg.value)
-
-        # Check for credential file access
-        for arg in call_node.args:
-            if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
-                if any(cred in arg.value for cred in CREDENTIAL_FILES):
-                    return ("credential_file", arg.value)
-
-        # Check for os.path.expanduser with credential paths
-        if call_name == "os.path.expanduser":
-            for arg in call_node.args:
-                if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
-                    if any(cred in arg.value for cred in CREDENTIAL_FILES):
-                        return ("credential_file", arg.value)
-
-        return None
+        return classify_source_call(self._get_call_name(call_node), call_node)
 
     def _is_source_assignment(self, expr: ast.AST, source_name: str) -> bool:
         """Check if expression is an assignment from a source."""
@@ -643,6 +667,18 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
             for param_name, flow in exit_fact.parameter_flows.items():
                 self.all_flows.append(flow)
 
+    def widen(self, previous: ForwardFlowFact, current: ForwardFlowFact) -> ForwardFlowFact:
+        """Join the loop head's previous and new facts so flows only accumulate around loops.
+
+        Args:
+            previous: Fact from the previous evaluation of the loop head
+            current: Newly merged fact
+
+        Returns:
+            Merged fact
+        """
+        return self.merge([current, previous])
+
     def merge(self, facts: list[ForwardFlowFact]) -> ForwardFlowFact:
         """Merge multiple flow facts.
 
@@ -665,51 +701,59 @@ class ForwardDataflowAnalysis(DataFlowAnalyzer[ForwardFlowFact]):
 
             # Merge parameter flows
             for param_name, flow in fact.parameter_flows.items():
-                if param_name in result.parameter_flows:
-                    # Deduplicate operations by checking if already present
-                    # Operations are dicts, so we compare by content
-                    existing_ops = result.parameter_flows[param_name].operations
-                    existing_ops_set = {
-                        (
-                            op.get("type"),
-                            op.get("target"),
-                            op.get("value"),
-                            op.get("function"),
-                            op.get("argument"),
-                            op.get("line"),
-                        )
-                        for op in existing_ops
-                    }
-
-                    for op in flow.operations:
-                        op_key = (
-                            op.get("type"),
-                            op.get("target"),
-                            op.get("value"),
-                            op.get("function"),
-                            op.get("argument"),
-                            op.get("line"),
-                        )
-                        if op_key not in existing_ops_set:
-                            existing_ops.append(op)
-                            existing_ops_set.add(op_key)
-
-                    # Deduplicate reaches_calls and reaches_assignments using sets
-                    result.parameter_flows[param_name].reaches_calls = list(
-                        set(result.parameter_flows[param_name].reaches_calls + flow.reaches_calls)
-                    )
-                    result.parameter_flows[param_name].reaches_assignments = list(
-                        set(result.parameter_flows[param_name].reaches_assignments + flow.reaches_assignments)
-                    )
-
-                    # Boolean flags use OR (idempotent)
-                    result.parameter_flows[param_name].reaches_returns = (
-                        result.parameter_flows[param_name].reaches_returns or flow.reaches_returns
-                    )
-                    result.parameter_flows[param_name].reaches_external = (
-                        result.parameter_flows[param_name].reaches_external or flow.reaches_external
-                    )
-                else:
+                current = result.parameter_flows.get(param_name)
+                if current is None:
                     result.parameter_flows[param_name] = flow
+                    continue
+                if current is flow:
+                    continue
+
+                # Deduplicate operations by checking if already present
+                # Operations are dicts, so we compare by content
+                existing_ops_set = {_op_key(op) for op in current.operations}
+                new_ops = []
+                for op in flow.operations:
+                    op_key = _op_key(op)
+                    if op_key not in existing_ops_set:
+                        new_ops.append(op)
+                        existing_ops_set.add(op_key)
+                new_calls = [call for call in flow.reaches_calls if call not in current.reaches_calls]
+                new_assignments = [
+                    assignment
+                    for assignment in flow.reaches_assignments
+                    if assignment not in current.reaches_assignments
+                ]
+
+                # Boolean flags use OR (idempotent)
+                reaches_returns = current.reaches_returns or flow.reaches_returns
+                reaches_external = current.reaches_external or flow.reaches_external
+
+                if (
+                    not new_ops
+                    and not new_calls
+                    and not new_assignments
+                    and reaches_returns == current.reaches_returns
+                    and reaches_external == current.reaches_external
+                ):
+                    continue
+
+                merged_flow = result.writable_flow(param_name)
+                merged_flow.operations.extend(new_ops)
+                merged_flow.reaches_calls.extend(new_calls)
+                merged_flow.reaches_assignments.extend(new_assignments)
+                merged_flow.reaches_returns = reaches_returns
+                merged_flow.reaches_external = reaches_external
 
         return result
+
+
+def _op_key(op: dict[str, Any]) -> tuple:
+    """Key identifying a flow operation by content."""
+    return (
+        op.get("type"),
+        op.get("target"),
+        op.get("value"),
+        op.get("function"),
+        op.get("argument"),
+        op.get("line"),
+    )
@@ -17,5 +17,6 @@
 """Interprocedural analysis for cross-file function tracking."""
 
 from .call_graph_analyzer import CallGraph, CallGraphAnalyzer
+from .function_summaries import FunctionSummary, FunctionSummaryEngine, TaintFlow
 
-__all__ = ["CallGraph", "CallGraphAnalyzer"]
+__all__ = ["CallGraph", "CallGraphAnalyzer", "FunctionSummary", "FunctionSummaryEngine", "TaintFlow"]
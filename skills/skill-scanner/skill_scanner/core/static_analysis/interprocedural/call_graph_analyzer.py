@@ -23,7 +23,12 @@ This enables detection of data exfiltration patterns that span multiple scripts.
 import ast
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from .function_summaries import FunctionSummary, FunctionSummaryEngine
+
+if TYPE_CHECKING:
+    from ..budget import Deadline
 
 
 class CallGraph:
@@ -35,8 +40,11 @@ class CallGraph:
     def __init__(self) -> None:
         """Initialize call graph."""
         self.functions: dict[str, Any] = {}  # full_name -> function node
+        self.function_files: dict[str, Path] = {}  # full_name -> file defining it
         self.calls: list[tuple] = []  # (caller, callee) pairs
         self.entry_points: set[str] = set()  # Skill entry point functions
+        self._callees: dict[str, list[str]] = {}  # caller -> callees, in call order
+        self._by_file: dict[tuple[str, str], str] = {}  # (file, name) -> full_name
 
     def add_function(self, name: str, node: Any, file_path: Path, is_entry_point: bool = False) -> None:
         """Add a function definition.
@@ -49,6 +57,8 @@ class CallGraph:
         """
         full_name = f"{file_path}::{name}"
         self.functions[full_name] = node
+        self.function_files[full_name] = file_path
+        self._by_file[(str(file_path), name)] = full_name
         if is_entry_point:
             self.entry_points.add(full_name)
 
@@ -60,6 +70,7 @@ class CallGraph:
             callee: Callee function name
         """
         self.calls.append((caller, callee))
+        self._callees.setdefault(caller, []).append(callee)
 
     def get_callees(self, func_name: str) -> list[str]:
         """Get functions called by a function.
@@ -70,7 +81,77 @@ class CallGraph:
         Returns:
             List of callee function names
         """
-        return [callee for caller, callee in self.calls if caller == func_name]
+        return list(self._callees.get(func_name, ()))
+
+    def lookup(self, file_path: Path, name: str) -> str | None:
+        """Get the full name of a function defined in a file.
+
+        Args:
+            file_path: File defining the function
+            name: Function name, or ``Class.method`` for methods
+
+        Returns:
+            Full function name, or None if the file defines no such function
+        """
+        return self._by_file.get((str(file_path), name))
+
+    def strongly_connected_components(self) -> list[list[str]]:
+        """Group the skill's functions into strongly connected components (recursion).
+
+        Only calls between functions defined in the skill are edges.
+
+        Returns:
+            Components with callees first: a component only calls functions
+            in itself or in earlier components
+        """
+
+        def callees(name: str) -> list[str]:
+            return [callee for callee in self._callees.get(name, ()) if callee in self.functions]
+
+        # Postorder of a depth-first search along call edges
+        visited: set[str] = set()
+        postorder: list[str] = []
+        for root in self.functions:
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(callees(root)))]
+            while stack:
+                name, pending = stack[-1]
+                for callee in pending:
+                    if callee not in visited:
+                        visited.add(callee)
+                        stack.append((callee, iter(callees(callee))))
+                        break
+                else:
+                    stack.pop()
+                    postorder.append(name)
+
+        callers: dict[str, list[str]] = {}
+        for caller in self.functions:
+            for callee in callees(caller):
+                callers.setdefault(callee, []).append(caller)
+
+        # Kosaraju: searching caller edges in reverse postorder yields components callers first
+        assigned: set[str] = set()
+        components: list[list[str]] = []
+        for root in reversed(postorder):
+            if root in assigned:
+                continue
+            assigned.add(root)
+            component = []
+            stack = [root]
+            while stack:
+                name = stack.pop()
+                component.append(name)
+                for caller in callers.get(name, ()):
+                    if caller not in assigned:
+                        assigned.add(caller)
+                        stack.append(caller)
+            components.append(component)
+
+        components.reverse()
+        return components
 
     def get_entry_points(self) -> set[str]:
         """Get all entry point functions.
@@ -93,26 +174,34 @@ class CallGraphAnalyzer:
         self.call_graph = CallGraph()
         self.analyzers: dict[Path, ast.Module] = {}  # file -> AST
         self.import_map: dict[Path, list[Path]] = {}  # file -> imported files
+        self._imported_modules: dict[Path, list[str]] = {}  # file -> imported module names
         self.logger = logging.getLogger(__name__)
+        self._calls_extracted: set[Path] = set()  # files whose calls are in the call graph
+        self._summaries: dict[str, FunctionSummary] | None = None
 
-    def add_file(self, file_path: Path, source_code: str) -> None:
+    def add_file(self, file_path: Path, source_code: str, tree: ast.Module | None = None) -> None:
         """Add a file to the analysis.
 
         Args:
             file_path: Path to the file
             source_code: Source code content
+            tree: Already-parsed AST of ``source_code`` (parsed here if None)
         """
-        try:
-            tree = ast.parse(source_code)
-            self.analyzers[file_path] = tree
+        if tree is None:
+            try:
+                tree = ast.parse(source_code)
+            except SyntaxError as e:
+                self.logger.debug(f"Skipping unparseable file {file_path}: {e}")
+                return
 
-            # Extract function definitions
-            self._extract_functions(file_path, tree)
+        self.analyzers[file_path] = tree
+        self._summaries = None
 
-            # Extract imports
-            self._extract_imports(file_path, tree)
-        except SyntaxError as e:
-            self.logger.debug(f"Skipping unparseable file {file_path}: {e}")
+        # Extract function definitions
+        self._extract_functions(file_path, tree)
+
+        # Extract imports
+        self._extract_imports(file_path, tree)
 
     def _extract_functions(self, file_path: Path, tree: ast.Module) -> None:
         """Extract function definitions from Python file.
@@ -164,31 +253,38 @@ class CallGraphAnalyzer:
         return False
 
     def _extract_imports(self, file_path: Path, tree: ast.Module) -> None:
-        """Extract import relationships.
+        """Extract imported module names; they are resolved to files in build_call_graph().
 
         Args:
             file_path: File path
             tree: AST tree
         """
-        imported_files = []
+        module_names = []
 
         for node in ast.walk(tree):
             if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module_name = alias.name
-                    imported_file = self._resolve_import(file_path, module_name)
-                    if imported_file:
-                        imported_files.append(imported_file)
+                module_names.extend(alias.name for alias in node.names)
             elif isinstance(node, ast.ImportFrom):
                 if node.module:
-                    imported_file = self._resolve_import(file_path, node.module)
-                    if imported_file:
-                        imported_files.append(imported_file)
+                    module_names.append(node.module)
+
+        self._imported_modules[file_path] = module_names
 
-        self.import_map[file_path] = imported_files
+    def _resolve_imports(self) -> None:
+        """Map every added file to the added files it imports, whatever order they were added in."""
+        for file_path, module_names in self._imported_modules.items():
+            imported_files = []
+            for module_name in module_names:
+                imported_file = self._resolve_import(file_path, module_name)
+                if imported_file:
+                    imported_files.append(imported_file)
+            self.import_map[file_path] = imported_files
 
     def _resolve_import(self, from_file: Path, module_name: str) -> Path | None:
-        """Resolve Python import to file path.
+        """Resolve Python import to a file added to the analysis.
+
+        Files are matched by path among the added files rather than looked up
+        on disk, so skills loaded from archives resolve the same way.
 
         Args:
             from_file: File doing the import
@@ -206,12 +302,12 @@ class CallGraphAnalyzer:
 
             # Try as file
             py_file = potential_path.with_suffix(".py")
-            if py_file.exists():
+            if py_file in self.analyzers:
                 return py_file
 
             # Try as package
             init_file = potential_path / "__init__.py"
-            if init_file.exists():
+            if init_file in self.analyzers:
                 return init_file
 
         return None
@@ -219,15 +315,50 @@ class CallGraphAnalyzer:
     def build_call_graph(self) -> CallGraph:
         """Build the complete call graph.
 
+        Calls are extracted once per file, so this can be called again after
+        adding more files.
+
         Returns:
             Call graph
         """
+        self._resolve_imports()
+
         # Extract function calls from each file
         for file_path, tree in self.analyzers.items():
+            if file_path in self._calls_extracted:
+                continue
+            self._calls_extracted.add(file_path)
             self._extract_calls(file_path, tree)
 
         return self.call_graph
 
+    def compute_function_summaries(self, deadline: "Deadline | None" = None) -> dict[str, FunctionSummary]:
+        """Compute the interprocedural taint summary of every function, once.
+
+        Builds the call graph if needed. Summaries are recomputed only after
+        another file is added.
+
+        Args:
+            deadline: Wall-clock budget for the summaries (unbounded if None)
+
+        Returns:
+            Function summaries keyed by full function name
+
+        Raises:
+            BudgetExceeded: If ``deadline`` passes before every function is summarized
+        """
+        if self._summaries is None:
+            self.build_call_graph()
+            engine = FunctionSummaryEngine(self, deadline=deadline)
+            self._summaries = engine.summarize()
+            self.logger.debug(
+                "Summarized %d functions in %d passes, %d call sites reused a summary",
+                len(self._summaries),
+                engine.summaries_computed,
+                engine.summary_reuses,
+            )
+        return self._summaries
+
     def _extract_calls(self, file_path: Path, tree: ast.Module) -> None:
         """Extract function calls from Python file.
 
@@ -307,20 +438,30 @@ class CallGraphAnalyzer:
             Full qualified name or None
         """
         # Check if it's defined in the same file
-        for func_name in self.call_graph.functions.keys():
-            if func_name.endswith(f"::{call_name}"):
-                if func_name.startswith(str(file_path)):
-                    return func_name
+        full_name = self.call_graph.lookup(file_path, call_name)
+        if full_name:
+            return full_name
 
         # Check imported files
-        if file_path in self.import_map:
-            for imported_file in self.import_map[file_path]:
-                potential_name = f"{imported_file}::{call_name}"
-                if potential_name in self.call_graph.functions:
-                    return potential_name
+        for imported_file in self.import_map.get(file_path, ()):
+            full_name = self.call_graph.lookup(imported_file, call_name)
+            if full_name:
+                return full_name
 
         return None
 
+    def resolve_call(self, file_path: Path, node: ast.Call) -> str | None:
+        """Resolve a call expression to the function it calls, if defined in the skill.
+
+        Args:
+            file_path: File where the call occurs
+            node: Call node
+
+        Returns:
+            Full qualified name of the callee, or None for calls outside the skill
+        """
+        return self._resolve_call_target(file_path, self._get_call_name(node))
+
     def get_reachable_functions(self, start_func: str) -> list[str]:
         """Get all functions reachable from a starting function.
 
@@ -353,47 +494,71 @@ class CallGraphAnalyzer:
     def analyze_parameter_flow_across_files(self, entry_point: str, param_names: list[str]) -> dict[str, Any]:
         """Analyze how parameters flow across files from an entry point.
 
+        A callee is parameter-influenced when a tracked parameter actually
+        reaches one of its arguments, according to the function summaries.
+
         Args:
             entry_point: Entry point function name
             param_names: Parameter names to track
 
         Returns:
-            Dictionary with cross-file flow information
+            Dictionary with cross-file flow information, including the sinks
+            the tracked parameters reach
         """
         # Get all reachable functions
         reachable = self.get_reachable_functions(entry_point)
+        summaries = self.compute_function_summaries()
 
-        # Track parameter-influenced functions
-        param_influenced_funcs = set()
+        # Follow tainted arguments through each function's call bindings, taking
+        # each callee's parameters from its summary instead of re-analyzing it
+        influenced: dict[str, set[str]] = {entry_point: set(param_names)}
         cross_file_flows = []
+        seen_edges: set[tuple[str, str]] = set()
+        worklist = [entry_point]
 
-        for func_name in reachable:
-            if func_name == entry_point:
+        while worklist:
+            caller = worklist.pop()
+            summary = summaries.get(caller)
+            if summary is None:
                 continue
 
-            # Check if this function is called from entry point or influenced functions
-            for caller, callee in self.call_graph.calls:
-                if callee == func_name and (caller == entry_point or caller in param_influenced_funcs):
-                    param_influenced_funcs.add(func_name)
-
-                    # Extract file information
-                    caller_file = caller.split("::")[0] if "::" in caller else "unknown"
-                    callee_file = callee.split("::")[0] if "::" in callee else "unknown"
-
-                    if caller_file != callee_file:
-                        cross_file_flows.append(
-                            {
-                                "from_function": caller,
-                                "to_function": callee,
-                                "from_file": caller_file,
-                                "to_file": callee_file,
-                            }
-                        )
+            tainted = {f"param:{name}" for name in influenced[caller]}
+            for binding in summary.call_bindings.values():
+                if not tainted & binding.origins:
+                    continue
+
+                callee = binding.callee
+                callee_params = influenced.setdefault(callee, set())
+                if binding.parameter not in callee_params:
+                    callee_params.add(binding.parameter)
+                    worklist.append(callee)
+
+                # Extract file information
+                caller_file = caller.split("::")[0] if "::" in caller else "unknown"
+                callee_file = callee.split("::")[0] if "::" in callee else "unknown"
+
+                if caller_file != callee_file and (caller, callee) not in seen_edges:
+                    seen_edges.add((caller, callee))
+                    cross_file_flows.append(
+                        {
+                            "from_function": caller,
+                            "to_function": callee,
+                            "from_file": caller_file,
+                            "to_file": callee_file,
+                        }
+                    )
+
+        entry_summary = summaries.get(entry_point)
+        reaches_sinks = []
+        if entry_summary is not None:
+            for name in param_names:
+                reaches_sinks.extend(flow.to_dict() for flow in entry_summary.parameter_sinks(name))
 
         return {
             "reachable_functions": reachable,
-            "param_influenced_functions": list(param_influenced_funcs),
+            "param_influenced_functions": [name for name in influenced if name != entry_point],
             "cross_file_flows": cross_file_flows,
+            "reaches_sinks": reaches_sinks,
             "total_files_involved": len(set(f.split("::")[0] for f in reachable if "::" in f)),
         }
 
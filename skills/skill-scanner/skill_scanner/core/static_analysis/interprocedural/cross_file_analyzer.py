@@ -21,9 +21,11 @@ Tracks how data flows across multiple Python files in a skill package.
 """
 
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 from ..context_extractor import SkillScriptContext
+from .function_summaries import FunctionSummary, TaintFlow
 
 
 @dataclass
@@ -49,12 +51,26 @@ class CrossFileAnalyzer:
 
     def __init__(self):
         self.file_contexts: dict[str, SkillScriptContext] = {}
+        self.function_summaries: dict[str, FunctionSummary] = {}
+        self.file_names: dict[str, str] = {}  # script path -> name used in correlations
         self.correlations: list[CrossFileCorrelation] = []
 
     def add_file_context(self, file_name: str, context: SkillScriptContext):
         """Add a file's context for correlation analysis."""
         self.file_contexts[file_name] = context
 
+    def add_function_summaries(self, summaries: dict[str, FunctionSummary], file_names: dict[str, str] | None = None):
+        """
+        Add the interprocedural taint summaries of the skill's functions.
+
+        Args:
+            summaries: Function summaries keyed by full function name
+            file_names: Name to report for each script path (defaults to the path)
+        """
+        self.function_summaries.update(summaries)
+        if file_names:
+            self.file_names.update(file_names)
+
     def analyze_correlations(self) -> list[CrossFileCorrelation]:
         """
         Analyze all files together to find multi-step attack patterns.
@@ -73,6 +89,9 @@ class CrossFileAnalyzer:
         # Pattern 3: Environment harvesting + Network transmission
         self._detect_env_var_exfiltration_chain()
 
+        # Pattern 4: Source data passed through calls across files into a network sink
+        self._detect_interprocedural_exfiltration()
+
         return self.correlations
 
     def _detect_exfiltration_chain(self):
@@ -185,6 +204,61 @@ class CrossFileAnalyzer:
             )
             self.correlations.append(correlation)
 
+    def _detect_interprocedural_exfiltration(self):
+        """
+        Detect sensitive sources reaching network calls through functions in different files.
+
+        Unlike the patterns above, this needs actual dataflow: the function
+        summaries connect the source and the sink through arguments and return
+        values. Each source/sink pair is judged by its shortest path, so calling
+        a function that exfiltrates within one file is not reported as a
+        cross-file chain.
+        """
+        shortest: dict[tuple[str, str], tuple[str, TaintFlow]] = {}
+        for name, summary in self.function_summaries.items():
+            for flow in summary.source_sinks():
+                if flow.sink != "network":
+                    continue
+                key = (flow.origin, flow.call)
+                if key not in shortest or len(flow.path) < len(shortest[key][1].path):
+                    shortest[key] = (name, flow)
+
+        flows = []
+        files_involved: list[str] = []
+        for name, flow in shortest.values():
+            functions = [name, *flow.path]
+            files = list(dict.fromkeys(self._file_name(function) for function in functions))
+            if len(files) < 2:
+                continue
+
+            files_involved.extend(file_name for file_name in files if file_name not in files_involved)
+            flows.append(
+                {
+                    "source": flow.origin.removeprefix("source:"),
+                    "sink": flow.call,
+                    "functions": [f"{self._file_name(function)}::{function.split('::')[-1]}" for function in functions],
+                    "files": files,
+                }
+            )
+
+        if flows:
+            first = flows[0]
+            more = f" (+{len(flows) - 1} more)" if len(flows) > 1 else ""
+            correlation = CrossFileCorrelation(
+                threat_type="interprocedural_exfiltration",
+                severity="CRITICAL",
+                files_involved=files_involved,
+                evidence={"flows": flows},
+                description=f"Sensitive data ({first['source']}) flows through function calls across {', '.join(first['files'])} into network call {first['sink']}{more}",
+            )
+            self.correlations.append(correlation)
+
+    def _file_name(self, function: str) -> str:
+        """Get the reported file name of a function."""
+        summary = self.function_summaries.get(function)
+        path = str(summary.file_path) if summary else function.split("::")[0]
+        return self.file_names.get(path, Path(path).name)
+
     def get_critical_correlations(self) -> list[CrossFileCorrelation]:
         """Get only CRITICAL severity correlations."""
         return [c for c in self.correlations if c.severity == "CRITICAL"]
@@ -0,0 +1,344 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Bottom-up function summaries for interprocedural taint.
+
+Each function in the call graph gets one summary of which parameters reach
+its return value, which sensitive sources it returns and which parameters or
+sources reach a sink (network, subprocess, eval), either directly or through
+the functions it calls. Summaries are computed callee-first over the strongly
+connected components of the call graph, re-running a recursive component
+until its summaries stop changing, and are then reused at every call site.
+
+Within a function the analysis is flow-insensitive: a variable carries
+everything assigned to it anywhere in the function. This over-approximates
+in the same way the call graph does, and keeps each summary a small fixpoint
+over assignments instead of a CFG solve per calling context.
+"""
+
+import ast
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..dataflow.forward_analysis import classify_source_call
+from ..parser.python_parser import PythonParser
+
+if TYPE_CHECKING:
+    from ..budget import Deadline
+    from .call_graph_analyzer import CallGraphAnalyzer
+
+# Taint origins of a value: "param:<name>" or "source:<type>:<name>" -> functions the value came through
+Origins = dict[str, tuple[str, ...]]
+
+
+def sink_kind(call_name: str) -> str | None:
+    """Classify a call outside the skill as a sink.
+
+    Args:
+        call_name: Dotted name of the called function
+
+    Returns:
+        "network", "subprocess" or "eval", or None if the call is not a sink
+    """
+    if any(net in call_name for net in PythonParser.NETWORK_MODULES):
+        return "network"
+    if any(sub in call_name for sub in PythonParser.SUBPROCESS_PATTERNS):
+        return "subprocess"
+    if call_name in PythonParser.DANGEROUS_FUNCTIONS:
+        return "eval"
+    return None
+
+
+@dataclass(frozen=True)
+class TaintFlow:
+    """A parameter or sensitive source reaching a sink."""
+
+    origin: str  # "param:<name>" or "source:<type>:<name>"
+    sink: str  # "network", "subprocess" or "eval"
+    call: str  # Sink call name
+    path: tuple[str, ...] = ()  # Other functions the flow passes through, from origin to sink
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {"origin": self.origin, "sink": self.sink, "call": self.call, "path": list(self.path)}
+
+
+@dataclass(frozen=True)
+class CallBinding:
+    """Taint passed to one parameter of a callee at the calls in a function."""
+
+    callee: str
+    parameter: str
+    origins: frozenset[str]
+
+
+@dataclass
+class FunctionSummary:
+    """Interprocedural taint summary of one function."""
+
+    name: str
+    file_path: Path
+    parameters: list[str]
+    returns_parameters: set[str] = field(default_factory=set)
+    returns_sources: Origins = field(default_factory=dict)
+    sink_flows: dict[tuple[str, str, str], TaintFlow] = field(default_factory=dict)  # (origin, sink, call) -> flow
+    call_bindings: dict[tuple[str, str], CallBinding] = field(default_factory=dict)  # (callee, parameter) -> binding
+
+    def parameter_sinks(self, parameter: str) -> list[TaintFlow]:
+        """Flows from a parameter to sinks."""
+        origin = f"param:{parameter}"
+        return [flow for flow in self.sink_flows.values() if flow.origin == origin]
+
+    def source_sinks(self) -> list[TaintFlow]:
+        """Flows from sensitive sources read in this function or its callees to sinks."""
+        return [flow for flow in self.sink_flows.values() if flow.origin.startswith("source:")]
+
+    def add_flow(self, flow: TaintFlow) -> None:
+        """Record a flow, keeping the first path found for each origin and sink call."""
+        self.sink_flows.setdefault((flow.origin, flow.sink, flow.call), flow)
+
+    def add_binding(self, callee: str, parameter: str, origins: Origins) -> None:
+        """Record taint passed to a callee parameter."""
+        key = (callee, parameter)
+        existing = self.call_bindings.get(key)
+        labels = frozenset(origins) | (existing.origins if existing else frozenset())
+        self.call_bindings[key] = CallBinding(callee, parameter, labels)
+
+    def state(self) -> tuple:
+        """Everything callers can observe, for detecting a fixpoint."""
+        return (
+            frozenset(self.returns_parameters),
+            frozenset(self.returns_sources),
+            frozenset(self.sink_flows),
+            frozenset(self.call_bindings.values()),
+        )
+
+
+class FunctionSummaryEngine:
+    """Computes a FunctionSummary for every function of a call graph, callees first."""
+
+    def __init__(self, analyzer: "CallGraphAnalyzer", deadline: "Deadline | None" = None) -> None:
+        """Initialize the engine.
+
+        Args:
+            analyzer: Call graph analyzer with all files added and the call graph built
+            deadline: Wall-clock budget checked before each function pass (unbounded if None)
+        """
+        self.analyzer = analyzer
+        self.deadline = deadline
+        self.call_graph = analyzer.call_graph
+        self.summaries: dict[str, FunctionSummary] = {}
+        self.summaries_computed = 0  # Function passes, including re-runs within recursive components
+        self.summary_reuses = 0  # Call sites answered from a callee's stored summary
+        self._targets: dict[int, str] = {}  # id(Call node) -> callee defined in the skill
+
+    def summarize(self) -> dict[str, FunctionSummary]:
+        """Summarize every function.
+
+        Returns:
+            Summaries keyed by full function name
+
+        Raises:
+            BudgetExceeded: If the deadline passes before every function is summarized
+        """
+        for component in self.call_graph.strongly_connected_components():
+            self._summarize_component(component)
+        return self.summaries
+
+    def _summarize_component(self, component: list[str]) -> None:
+        """Summarize one strongly connected component, iterating if it is recursive."""
+        recursive = len(component) > 1 or component[0] in self.call_graph.get_callees(component[0])
+        for name in component:
+            self.summaries[name] = FunctionSummary(
+                name=name,
+                file_path=self.call_graph.function_files[name],
+                parameters=_parameter_names(self.call_graph.functions[name]),
+            )
+
+        changed = True
+        while changed:
+            changed = False
+            for name in component:
+                summary = self._summarize_function(name)
+                if summary.state() != self.summaries[name].state():
+                    changed = True
+                self.summaries[name] = summary
+            changed = changed and recursive
+
+    def _summarize_function(self, name: str) -> FunctionSummary:
+        """Summarize one function against the current summaries of its callees."""
+        if self.deadline is not None:
+            self.deadline.check(f"function summaries at {name}")
+        self.summaries_computed += 1
+        node = self.call_graph.functions[name]
+        file_path = self.call_graph.function_files[name]
+        summary = FunctionSummary(name=name, file_path=file_path, parameters=_parameter_names(node))
+
+        calls = [child for child in ast.walk(node) if isinstance(child, ast.Call)]
+        for call in calls:
+            callee = self.analyzer.resolve_call(file_path, call)
+            if callee is not None:
+                self._targets[id(call)] = callee
+
+        # Flow-insensitive fixpoint over every assignment in the function
+        env: dict[str, Origins] = {param: {f"param:{param}": ()} for param in summary.parameters}
+        assignments = list(_assignments(node))
+        changed = True
+        while changed:
+            changed = False
+            for targets, value in assignments:
+                origins = self._eval(value, env)
+                if not origins:
+                    continue
+                for target in targets:
+                    changed |= _union(env.setdefault(target, {}), origins)
+
+        for child in ast.walk(node):
+            if isinstance(child, (ast.Return, ast.Yield, ast.YieldFrom)) and child.value is not None:
+                for label, path in self._eval(child.value, env).items():
+                    if label.startswith("param:"):
+                        summary.returns_parameters.add(label[len("param:") :])
+                    else:
+                        summary.returns_sources.setdefault(label, path)
+
+        for call in calls:
+            callee = self._targets.get(id(call))
+            callee_summary = self.summaries.get(callee) if callee is not None else None
+            if callee_summary is not None:
+                self.summary_reuses += 1
+                for parameter, arg in _bind(call, callee_summary.parameters):
+                    origins = self._eval(arg, env)
+                    if not origins:
+                        continue
+                    summary.add_binding(callee, parameter, origins)
+                    for flow in callee_summary.parameter_sinks(parameter):
+                        for label, path in origins.items():
+                            summary.add_flow(TaintFlow(label, flow.sink, flow.call, path + (callee,) + flow.path))
+                for flow in callee_summary.source_sinks():
+                    summary.add_flow(TaintFlow(flow.origin, flow.sink, flow.call, (callee,) + flow.path))
+            elif callee is None:
+                call_name = self.analyzer._get_call_name(call)
+                kind = sink_kind(call_name)
+                if kind is None:
+                    continue
+                for arg in [*call.args, *(keyword.value for keyword in call.keywords)]:
+                    for label, path in self._eval(arg, env).items():
+                        summary.add_flow(TaintFlow(label, kind, call_name, path))
+
+        return summary
+
+    def _eval(self, expr: ast.AST, env: dict[str, Origins]) -> Origins:
+        """Get the taint origins of an expression."""
+        if isinstance(expr, ast.Name):
+            return dict(env.get(expr.id, {}))
+
+        if isinstance(expr, ast.Attribute) and _dotted_name(expr) == "os.environ":
+            return {"source:env_var:os.environ": ()}
+
+        if isinstance(expr, ast.Lambda):
+            return {}
+
+        result: Origins = {}
+        if isinstance(expr, ast.Call):
+            source = classify_source_call(self.analyzer._get_call_name(expr), expr)
+            if source:
+                return {f"source:{source[0]}:{source[1]}": ()}
+
+            callee = self._targets.get(id(expr))
+            callee_summary = self.summaries.get(callee) if callee is not None else None
+            if callee_summary is not None:
+                # Only the parameters the callee returns, plus the sources it returns
+                for parameter, arg in _bind(expr, callee_summary.parameters):
+                    if parameter in callee_summary.returns_parameters:
+                        _union(result, self._eval(arg, env))
+                for label, path in callee_summary.returns_sources.items():
+                    result.setdefault(label, (callee,) + path)
+                return result
+
+        for child in ast.iter_child_nodes(expr):
+            _union(result, self._eval(child, env))
+        return result
+
+
+def _union(into: Origins, other: Origins) -> bool:
+    """Add the labels of ``other`` missing from ``into``; True if any were added."""
+    changed = False
+    for label, path in other.items():
+        if label not in into:
+            into[label] = path
+            changed = True
+    return changed
+
+
+def _parameter_names(node: ast.AST) -> list[str]:
+    """Get all parameter names of a function, in declaration order."""
+    args = node.args
+    names = [arg.arg for arg in [*args.posonlyargs, *args.args, *args.kwonlyargs]]
+    if args.vararg:
+        names.append(args.vararg.arg)
+    if args.kwarg:
+        names.append(args.kwarg.arg)
+    return names
+
+
+def _bind(call: ast.Call, parameters: list[str]) -> list[tuple[str, ast.AST]]:
+    """Pair call arguments with the callee parameters they are passed to."""
+    bound = []
+    for parameter, arg in zip(parameters, call.args, strict=False):
+        if isinstance(arg, ast.Starred):
+            break
+        bound.append((parameter, arg))
+    for keyword in call.keywords:
+        if keyword.arg in parameters:
+            bound.append((keyword.arg, keyword.value))
+    return bound
+
+
+def _assignments(node: ast.AST):
+    """Yield (target names, value) for every binding in a function."""
+    for child in ast.walk(node):
+        if isinstance(child, ast.Assign):
+            yield [name for target in child.targets for name in _target_names(target)], child.value
+        elif isinstance(child, (ast.AnnAssign, ast.AugAssign, ast.NamedExpr)) and child.value is not None:
+            yield _target_names(child.target), child.value
+        elif isinstance(child, (ast.For, ast.AsyncFor, ast.comprehension)):
+            yield _target_names(child.target), child.iter
+        elif isinstance(child, ast.withitem) and child.optional_vars is not None:
+            yield _target_names(child.optional_vars), child.context_expr
+
+
+def _target_names(target: ast.AST) -> list[str]:
+    """Get the variables an assignment target writes (the base object for attributes and items)."""
+    if isinstance(target, ast.Name):
+        return [target.id]
+    if isinstance(target, (ast.Tuple, ast.List)):
+        return [name for elt in target.elts for name in _target_names(elt)]
+    if isinstance(target, (ast.Starred, ast.Attribute, ast.Subscript)):
+        return _target_names(target.value)
+    return []
+
+
+def _dotted_name(node: ast.AST) -> str:
+    """Get a dotted name like 'os.environ', or '' if the expression is not one."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return ""
+    parts.append(node.id)
+    return ".".join(reversed(parts))
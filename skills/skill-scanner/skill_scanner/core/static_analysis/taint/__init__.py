@@ -16,6 +16,6 @@
 
 """Taint tracking for dataflow analysis."""
 
-from .tracker import ShapeEnvironment, Taint, TaintShape, TaintStatus
+from .tracker import LabelTable, ShapeEnvironment, Taint, TaintShape, TaintStatus
 
-__all__ = ["Taint", "TaintStatus", "TaintShape", "ShapeEnvironment"]
+__all__ = ["Taint", "TaintStatus", "TaintShape", "ShapeEnvironment", "LabelTable"]
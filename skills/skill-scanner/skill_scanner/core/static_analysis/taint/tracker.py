@@ -21,7 +21,7 @@ Tracks taint status and labels for variables to enable accurate
 dataflow tracking through control structures.
 """
 
-from dataclasses import dataclass, field
+from collections.abc import Iterable
 from enum import Enum
 
 
@@ -33,12 +33,90 @@ class TaintStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+class LabelTable:
+    """Interns taint labels as bit positions.
+
+    Each analysis owns one table, so label masks stay small and tables do
+    not grow across the scripts of a long-running scan.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty label table."""
+        self._bits: dict[str, int] = {}
+        self._labels: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def mask(self, labels: Iterable[str]) -> int:
+        """Get the bitmask for labels, interning any new ones.
+
+        Args:
+            labels: Label strings
+
+        Returns:
+            Bitmask with one bit per label
+        """
+        mask = 0
+        for label in labels:
+            bit = self._bits.get(label)
+            if bit is None:
+                bit = self._bits[label] = 1 << len(self._labels)
+                self._labels.append(label)
+            mask |= bit
+        return mask
+
+    def bit(self, label: str) -> int:
+        """Get the bit for a label without interning it (0 if unknown)."""
+        return self._bits.get(label, 0)
+
+    def labels(self, mask: int) -> frozenset[str]:
+        """Decode a bitmask back into label strings."""
+        labels = []
+        while mask:
+            low = mask & -mask
+            labels.append(self._labels[low.bit_length() - 1])
+            mask ^= low
+        return frozenset(labels)
+
+
+# Table used by taints created without one
+DEFAULT_LABEL_TABLE = LabelTable()
+
+
 class Taint:
-    """Taint information with labels and sources."""
+    """Taint information with labels and sources.
+
+    Labels are stored as a bitmask over a LabelTable, so merging is an
+    integer OR and equality an integer compare. ``labels`` decodes the
+    mask into label strings for callers that need them.
+    """
+
+    __slots__ = ("status", "mask", "table")
 
-    status: TaintStatus = TaintStatus.UNTAINTED
-    labels: set[str] = field(default_factory=set)
+    def __init__(
+        self,
+        status: TaintStatus = TaintStatus.UNTAINTED,
+        labels: Iterable[str] = (),
+        table: LabelTable | None = None,
+        mask: int = 0,
+    ):
+        """Initialize taint.
+
+        Args:
+            status: Taint status
+            labels: Label strings
+            table: Label table the mask refers to (DEFAULT_LABEL_TABLE if None)
+            mask: Label bitmask in ``table``, combined with ``labels``
+        """
+        self.status = status
+        self.table = table if table is not None else DEFAULT_LABEL_TABLE
+        self.mask = mask | self.table.mask(labels) if labels else mask
+
+    @property
+    def labels(self) -> frozenset[str]:
+        """Label strings of this taint."""
+        return self.table.labels(self.mask)
 
     def is_tainted(self) -> bool:
         """Check if tainted."""
@@ -46,36 +124,86 @@ class Taint:
 
     def add_label(self, label: str) -> None:
         """Add a taint label."""
-        self.labels.add(label)
+        self.mask |= self.table.mask((label,))
 
     def has_label(self, label: str) -> bool:
         """Check if has a specific label."""
-        return label in self.labels
+        return bool(self.mask & self.table.bit(label))
+
+    def shares_labels(self, other: "Taint") -> bool:
+        """Check if this taint has any label in common with another."""
+        return bool(self.mask & self._mask_in_table(other))
+
+    def _mask_in_table(self, other: "Taint") -> int:
+        """Get the other taint's mask in this taint's label table."""
+        if other.table is self.table or not other.mask:
+            return other.mask
+        return self.table.mask(other.labels)
 
     def merge(self, other: "Taint") -> "Taint":
         """Merge two taints."""
         if not self.is_tainted() and not other.is_tainted():
-            return Taint(status=TaintStatus.UNTAINTED)
+            return Taint(status=TaintStatus.UNTAINTED, table=self.table)
+        if not self.mask:
+            return Taint(status=TaintStatus.TAINTED, table=other.table, mask=other.mask)
 
         return Taint(
             status=TaintStatus.TAINTED,
-            labels=self.labels | other.labels,
+            table=self.table,
+            mask=self.mask | self._mask_in_table(other),
         )
 
     def copy(self) -> "Taint":
         """Create a copy."""
-        return Taint(
-            status=self.status,
-            labels=self.labels.copy(),
-        )
+        return Taint(status=self.status, table=self.table, mask=self.mask)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare status and labels."""
+        if not isinstance(other, Taint):
+            return NotImplemented
+        return self.status == other.status and self.mask == self._mask_in_table(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Taint(status={self.status}, labels={set(self.labels)})"
 
 
 class ShapeEnvironment:
-    """Environment for tracking taint shapes of variables."""
+    """Environment for tracking taint shapes of variables.
+
+    Copies are copy-on-write: ``copy()`` shares the variable table with the
+    original and the table is duplicated on the first write. Shapes are
+    replaced rather than modified when they may be shared, so unchanged
+    variables are shared between the facts of neighbouring CFG nodes.
+    Taints stored in an environment are treated as immutable.
+    """
 
     def __init__(self) -> None:
         """Initialize shape environment."""
         self._shapes: dict[str, TaintShape] = {}
+        self._shared = False
+        # Variables whose shape object belongs to this environment alone
+        self._owned: set[str] = set()
+
+    def _own_table(self) -> dict[str, "TaintShape"]:
+        """Return the variable table, duplicating it first if it is shared."""
+        if self._shared:
+            self._shapes = dict(self._shapes)
+            self._shared = False
+        return self._shapes
+
+    def lookup(self, var_name: str) -> "TaintShape":
+        """Get taint shape for a variable without modifying the environment.
+
+        Args:
+            var_name: Variable name
+
+        Returns:
+            Taint shape (an empty shape if not set); must not be modified
+        """
+        shape = self._shapes.get(var_name)
+        return shape if shape is not None else _EMPTY_SHAPE
 
     def get(self, var_name: str) -> "TaintShape":
         """Get taint shape for a variable.
@@ -84,11 +212,17 @@ class ShapeEnvironment:
             var_name: Variable name
 
         Returns:
-            Taint shape (creates new if not exists)
+            Taint shape owned by this environment (creates new if not exists)
         """
-        if var_name not in self._shapes:
-            self._shapes[var_name] = TaintShape()
-        return self._shapes[var_name]
+        if var_name in self._owned:
+            return self._shapes[var_name]
+
+        shapes = self._own_table()
+        shape = shapes.get(var_name)
+        shape = shape.copy() if shape is not None else TaintShape()
+        shapes[var_name] = shape
+        self._owned.add(var_name)
+        return shape
 
     def set_taint(self, var_name: str, taint: Taint) -> None:
         """Set taint for a variable.
@@ -97,8 +231,19 @@ class ShapeEnvironment:
             var_name: Variable name
             taint: Taint to set
         """
-        shape = self.get(var_name)
-        shape.set_taint(taint)
+        if var_name in self._owned:
+            self._shapes[var_name].set_taint(taint)
+            return
+
+        shapes = self._own_table()
+        shape = shapes.get(var_name)
+        if shape is None or shape.is_scalar():
+            shape = TaintShape(taint)
+        else:
+            shape = shape.copy()
+            shape.set_taint(taint)
+        shapes[var_name] = shape
+        self._owned.add(var_name)
 
     def get_taint(self, var_name: str) -> Taint:
         """Get taint for a variable.
@@ -114,32 +259,69 @@ class ShapeEnvironment:
         return Taint(status=TaintStatus.UNTAINTED)
 
     def copy(self) -> "ShapeEnvironment":
-        """Create a copy of the environment."""
+        """Create a copy of the environment that shares storage until either side is written."""
         new_env = ShapeEnvironment()
-        for var_name, shape in self._shapes.items():
-            new_env._shapes[var_name] = shape.copy()
+        new_env._shapes = self._shapes
+        new_env._shared = self._shared = True
+        self._owned.clear()
         return new_env
 
     def merge(self, other: "ShapeEnvironment") -> "ShapeEnvironment":
         """Merge two environments.
 
+        Variables whose merged taint equals their current shape keep that
+        shape, so only variables that actually change are written.
+
         Args:
             other: Other environment to merge
 
         Returns:
             Merged environment
         """
-        merged = ShapeEnvironment()
+        merged = self.copy()
+        if other._shapes is self._shapes and all(_merges_to_itself(shape) for shape in self._shapes.values()):
+            return merged
+
+        for var_name in self._shapes.keys() | other._shapes.keys():
+            mine = self._shapes.get(var_name)
+            theirs = other._shapes.get(var_name)
+            if mine is theirs and _merges_to_itself(mine):
+                continue
+
+            taint = (mine or _EMPTY_SHAPE).scalar_taint.merge((theirs or _EMPTY_SHAPE).scalar_taint)
+            if mine is not None and mine.is_scalar() and mine.scalar_taint == taint:
+                continue
+            if mine is None and theirs is not None and theirs.is_scalar() and theirs.scalar_taint == taint:
+                merged._own_table()[var_name] = theirs
+                continue
+            merged._own_table()[var_name] = TaintShape(taint)
+            merged._owned.add(var_name)
 
-        # Get all variable names from both
-        all_vars = set(self._shapes.keys()) | set(other._shapes.keys())
+        return merged
 
-        for var_name in all_vars:
-            self_taint = self.get_taint(var_name)
-            other_taint = other.get_taint(var_name)
-            merged.set_taint(var_name, self_taint.merge(other_taint))
+    def __eq__(self, other: object) -> bool:
+        """Compare environments by content, for fixpoint detection.
+
+        Variables that were only looked up (and so hold an empty shape) are
+        equal to variables that are absent.
+        """
+        if not isinstance(other, ShapeEnvironment):
+            return NotImplemented
+        if self._shapes is other._shapes:
+            return True
+
+        for var_name in self._shapes.keys() | other._shapes.keys():
+            if self._shapes.get(var_name, _EMPTY_SHAPE) != other._shapes.get(var_name, _EMPTY_SHAPE):
+                return False
+        return True
+
+    __hash__ = None  # type: ignore[assignment]
 
-        return merged
+
+def _merges_to_itself(shape: "TaintShape") -> bool:
+    """Whether merging a shape with itself yields an equal shape."""
+    taint = shape.scalar_taint
+    return shape.is_scalar() and (taint.is_tainted() or not taint.mask)
 
 
 class TaintShape:
@@ -236,6 +418,27 @@ class TaintShape:
 
         self.element_shape.set_taint(taint)
 
+    def is_scalar(self) -> bool:
+        """Check if this shape carries only a scalar taint (no fields or elements)."""
+        return not (self.is_object or self.is_array or self.fields or self.element_shape)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare shapes by content."""
+        if not isinstance(other, TaintShape):
+            return NotImplemented
+        if self is other:
+            return True
+
+        return (
+            self.scalar_taint == other.scalar_taint
+            and self.is_object == other.is_object
+            and self.is_array == other.is_array
+            and self.fields == other.fields
+            and self.element_shape == other.element_shape
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
     def copy(self) -> "TaintShape":
         """Create a copy."""
         new_shape = TaintShape(taint=self.scalar_taint.copy(), depth=self.depth)
@@ -250,3 +453,7 @@ class TaintShape:
             new_shape.element_shape = self.element_shape.copy()
 
         return new_shape
+
+
+# Shared read-only shape for variables that are not set
+_EMPTY_SHAPE = TaintShape()
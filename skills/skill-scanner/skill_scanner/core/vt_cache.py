@@ -0,0 +1,146 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Local cache of VirusTotal verdicts, keyed by file SHA-256.
+
+The same vendored binaries (shared libraries, images, fonts) show up in
+skill after skill and run after run. Remembering VirusTotal's answer for a
+hash saves a request against the API quota each time one is seen again.
+Reports expire after a TTL so detections added later are picked up; "not
+found" answers expire sooner, since unknown files are often submitted by
+someone else soon after.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from .scan_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+VT_CACHE_DB_NAME = "virustotal_cache.sqlite3"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_NOT_FOUND_TTL_SECONDS = 24 * 3600
+
+
+def vt_cache_enabled() -> bool:
+    """Check whether SKILL_SCANNER_VT_CACHE turns the verdict cache on."""
+    return os.getenv("SKILL_SCANNER_VT_CACHE", "").lower() in ("true", "1")
+
+
+class VirusTotalCache(SQLiteCache):
+    """
+    SQLite-backed cache of VirusTotal file reports.
+
+    Safe to share across threads and, via SQLite WAL mode, across worker
+    processes.
+
+    Example:
+        >>> cache = VirusTotalCache()
+        >>> cached = cache.get(sha256)
+        >>> if cached is None:
+        ...     report, found = query_virustotal(sha256)
+        ...     cache.put(sha256, report if found else None)
+    """
+
+    db_name = VT_CACHE_DB_NAME
+    table = "verdicts"
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        ttl_seconds: float | None = None,
+        not_found_ttl_seconds: float | None = None,
+    ):
+        """
+        Initialize VirusTotal verdict cache.
+
+        Args:
+            cache_dir: Directory holding the cache database. Defaults to
+                $SKILL_SCANNER_CACHE_DIR or ~/.cache/skill-scanner.
+            ttl_seconds: Age after which reports are looked up again; 0 keeps them
+                forever (default: $SKILL_SCANNER_VT_CACHE_TTL or 7 days)
+            not_found_ttl_seconds: Age after which "not found" answers are looked up
+                again (default: $SKILL_SCANNER_VT_CACHE_NOT_FOUND_TTL or 1 day)
+        """
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("SKILL_SCANNER_VT_CACHE_TTL", DEFAULT_TTL_SECONDS))
+        if not_found_ttl_seconds is None:
+            not_found_ttl_seconds = float(
+                os.getenv("SKILL_SCANNER_VT_CACHE_NOT_FOUND_TTL", DEFAULT_NOT_FOUND_TTL_SECONDS)
+            )
+
+        super().__init__(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.not_found_ttl_seconds = not_found_ttl_seconds
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts (sha256 TEXT PRIMARY KEY, report TEXT, created_at REAL NOT NULL)"
+        )
+
+    def get(self, sha256: str) -> tuple[dict[str, Any] | None, bool] | None:
+        """
+        Look up the cached verdict for a file hash.
+
+        Args:
+            sha256: SHA-256 hex digest of the file
+
+        Returns:
+            (report, True) for a file VirusTotal knows, (None, False) for one it
+            did not, or None on a miss or expired entry
+        """
+        now = time.time()
+        verdict = None
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute("SELECT report, created_at FROM verdicts WHERE sha256 = ?", (sha256,)).fetchone()
+            if row is not None:
+                report, created_at = row
+                ttl = self.ttl_seconds if report is not None else self.not_found_ttl_seconds
+                if ttl <= 0 or created_at >= now - ttl:
+                    verdict = (json.loads(report), True) if report is not None else (None, False)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("VirusTotal cache lookup failed: %s", e)
+
+        self._count_lookup(verdict is not None)
+        return verdict
+
+    def put(self, sha256: str, report: dict[str, Any] | None) -> None:
+        """
+        Store a verdict.
+
+        Args:
+            sha256: SHA-256 hex digest of the file
+            report: Detection stats, or None if VirusTotal does not know the file
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO verdicts (sha256, report, created_at) VALUES (?, ?, ?)",
+                    (sha256, json.dumps(report) if report is not None else None, time.time()),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("VirusTotal cache write failed: %s", e)
@@ -41,7 +41,8 @@ Configuration:
     {
         "severity_threshold": "high",  # block on: critical, high, medium, low
         "skills_path": ".claude/skills",
-        "fail_fast": true
+        "fail_fast": true,
+        "use_cache": true
     }
 """
 
@@ -58,6 +59,8 @@ DEFAULT_CONFIG = {
     "fail_fast": True,
     "use_behavioral": False,
     "use_trigger": True,
+    "use_cache": True,  # Reuse results for unchanged files (see core/scan_cache.py)
+    "cache_dir": None,  # Defaults to $SKILL_SCANNER_CACHE_DIR or ~/.cache/skill-scanner
 }
 
 # Severity levels (higher number = more severe)
@@ -156,13 +159,32 @@ def get_affected_skills(staged_files: list[str], skills_path: str) -> set[Path]:
     return affected_skills
 
 
-def scan_skill(skill_dir: Path, config: dict) -> dict:
+def create_cache(config: dict):
+    """
+    Create the incremental scan cache if enabled in config.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        ScanCache instance, or None if caching is disabled
+    """
+    if not config.get("use_cache"):
+        return None
+
+    from ..core.scan_cache import ScanCache
+
+    return ScanCache(cache_dir=config.get("cache_dir"))
+
+
+def scan_skill(skill_dir: Path, config: dict, cache=None) -> dict:
     """
     Scan a skill directory and return findings.
 
     Args:
         skill_dir: Path to skill directory
         config: Configuration dictionary
+        cache: Optional ScanCache shared across skills
 
     Returns:
         Scan results as dictionary
@@ -172,14 +194,14 @@ def scan_skill(skill_dir: Path, config: dict) -> dict:
         from ..core.analyzers.static import StaticAnalyzer
         from ..core.scanner import SkillScanner
 
-        analyzers: list[BaseAnalyzer] = [StaticAnalyzer()]
+        analyzers: list[BaseAnalyzer] = [StaticAnalyzer(cache=cache)]
 
         # Add optional analyzers based on config
         if config.get("use_behavioral"):
             try:
                 from ..core.analyzers.behavioral_analyzer import BehavioralAnalyzer
 
-                analyzers.append(BehavioralAnalyzer(use_static_analysis=True))
+                analyzers.append(BehavioralAnalyzer(use_static_analysis=True, cache=cache))
             except ImportError:
                 pass
 
@@ -339,6 +361,8 @@ def main(args: list[str] | None = None) -> int:
 
     print(f"Scanning {len(affected_skills)} skill(s)...")
 
+    cache = create_cache(config)
+
     # Scan each affected skill
     blocked = False
     all_findings = []
@@ -346,7 +370,7 @@ def main(args: list[str] | None = None) -> int:
     for skill_dir in sorted(affected_skills):
         print(f"\n📦 {skill_dir.name}")
 
-        result = scan_skill(skill_dir, config)
+        result = scan_skill(skill_dir, config, cache=cache)
 
         if result.get("error"):
             print(f"  ⚠️  Error: {result['error']}", file=sys.stderr)
@@ -375,6 +399,8 @@ def main(args: list[str] | None = None) -> int:
 
     # Summary
     print(f"\n{'=' * 50}")
+    if cache:
+        print(f"Scan cache: {cache.stats}")
     if blocked:
         print("❌ Commit BLOCKED - fix security issues before committing")
         print(f"   Threshold: {config['severity_threshold'].upper()} and above")
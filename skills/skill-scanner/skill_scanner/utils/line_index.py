@@ -0,0 +1,90 @@
+# Copyright 2026 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Offset-to-line mapping for match reporting.
+"""
+
+from bisect import bisect_right
+from itertools import accumulate
+
+
+class LineIndex:
+    """
+    Maps character offsets in a text to line numbers and line content.
+
+    Newline offsets are computed once; each lookup is a binary search, so
+    resolving many matches in a large file stays O((n + m) log n) instead of
+    rescanning the prefix of the file for every match.
+
+    Example:
+        >>> index = LineIndex("a = 1\\nb = eval(x)\\n")
+        >>> index.line_number(10)
+        2
+        >>> index.line_text(2)
+        'b = eval(x)'
+    """
+
+    __slots__ = ("content", "lines", "line_starts")
+
+    def __init__(self, content: str):
+        """
+        Build the index.
+
+        Args:
+            content: Text to index
+        """
+        self.content = content
+        self.lines = content.split("\n")
+        # line_starts[i] is the offset of the first character of line i + 1
+        self.line_starts = list(accumulate((len(line) + 1 for line in self.lines[:-1]), initial=0))
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines (a trailing newline starts an empty last line)."""
+        return len(self.lines)
+
+    def line_number(self, offset: int) -> int:
+        """
+        Get the 1-based line number containing a character offset.
+
+        Matches ``content[:offset].count("\\n") + 1``.
+        """
+        return bisect_right(self.line_starts, offset)
+
+    def line_text(self, line_number: int) -> str:
+        """Get the text of a 1-based line, without its newline."""
+        return self.lines[line_number - 1]
+
+    def line_at(self, offset: int) -> tuple[int, str]:
+        """Get the 1-based line number and line text for a character offset."""
+        line_number = self.line_number(offset)
+        return line_number, self.lines[line_number - 1]
+
+    def context(self, line_number: int, before: int = 0, after: int = 0) -> list[str]:
+        """
+        Get the lines surrounding a 1-based line.
+
+        Args:
+            line_number: Center line
+            before: Number of lines to include before it
+            after: Number of lines to include after it
+
+        Returns:
+            Lines from ``line_number - before`` to ``line_number + after``, clipped to the file
+        """
+        start = max(0, line_number - 1 - before)
+        return self.lines[start : min(len(self.lines), line_number + after)]
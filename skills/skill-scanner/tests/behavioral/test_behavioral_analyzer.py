@@ -20,7 +20,9 @@ Comprehensive tests for Behavioral Analyzer.
 Tests the static dataflow analysis-based behavioral analyzer.
 """
 
+import asyncio
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -456,3 +458,126 @@ def exfiltrate():
             assert finding_dict["analyzer"] == "behavioral", (
                 f"Expected analyzer='behavioral', got '{finding_dict['analyzer']}'"
             )
+
+
+class FakeAlignmentOrchestrator:
+    """Stands in for the LLM-backed orchestrator; every function is a mismatch."""
+
+    def __init__(self, delay=0.05, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def check_alignment(self, func_context, skill_description=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later functions answer first, so ordering comes from the analyzer
+            await asyncio.sleep(self.delay / (func_context.line_number or 1))
+            if func_context.name in self.fail:
+                raise RuntimeError("LLM unavailable")
+            return {"threat_name": "HIDDEN FUNCTIONALITY", "severity": "HIGH"}, func_context
+        finally:
+            self.in_flight -= 1
+
+
+class TestAlignmentVerificationConcurrency:
+    """Test concurrent alignment verification across a skill's functions."""
+
+    def _skill(self):
+        files = []
+        for name in ("a", "b"):
+            code = "\n".join(f"def {name}_{i}():\n    return {i}\n" for i in range(6))
+            files.append(
+                SkillFile(
+                    path=Path(f"/tmp/{name}.py"),
+                    relative_path=f"{name}.py",
+                    file_type="python",
+                    content=code,
+                    size_bytes=len(code),
+                )
+            )
+        return Skill(
+            directory=Path("/tmp"),
+            manifest=SkillManifest(name="align", description="Adds numbers"),
+            skill_md_path=Path("/tmp/SKILL.md"),
+            instruction_body="test",
+            files=files,
+            referenced_files=[],
+        )
+
+    def _alignment_functions(self, findings):
+        return [f.metadata["function_name"] for f in findings if f.rule_id.startswith("BEHAVIOR_ALIGNMENT_")]
+
+    def test_functions_checked_concurrently_in_stable_order(self):
+        analyzer = BehavioralAnalyzer(alignment_concurrency=4)
+        analyzer.alignment_orchestrator = FakeAlignmentOrchestrator()
+
+        start = time.perf_counter()
+        findings = analyzer.analyze(self._skill())
+        elapsed = time.perf_counter() - start
+
+        expected = [f"{name}_{i}" for name in ("a", "b") for i in range(6)]
+        assert self._alignment_functions(findings) == expected
+        assert analyzer.alignment_orchestrator.max_in_flight == 4
+        assert elapsed < 12 * 0.05
+
+    def test_failed_function_does_not_drop_others(self):
+        analyzer = BehavioralAnalyzer(alignment_concurrency=8)
+        analyzer.alignment_orchestrator = FakeAlignmentOrchestrator(delay=0.01, fail={"a_2", "b_0"})
+
+        functions = self._alignment_functions(analyzer.analyze(self._skill()))
+
+        assert "a_2" not in functions and "b_0" not in functions
+        assert len(functions) == 10
+
+    def test_findings_and_markers_name_paths_within_skill(self):
+        from skill_scanner.core.static_analysis import BudgetExceeded
+
+        analyzer = BehavioralAnalyzer()
+        analyzer.alignment_orchestrator = FakeAlignmentOrchestrator(delay=0.01)
+        extract = analyzer.context_extractor.extract_function_contexts
+
+        def extract_or_time_out(file_path, *args, **kwargs):
+            if file_path.name == "b.py":
+                raise BudgetExceeded("file_seconds", "b.py took too long")
+            return extract(file_path, *args, **kwargs)
+
+        with patch.object(analyzer.context_extractor, "extract_function_contexts", side_effect=extract_or_time_out):
+            output = analyzer.run(self._skill())
+
+        alignment = [f for f in output.findings if f.rule_id.startswith("BEHAVIOR_ALIGNMENT_")]
+        assert {f.file_path for f in alignment} == {"a.py"}
+        assert [(entry["file"], entry["fallback"]) for entry in output.incomplete_analyses] == [
+            ("b.py", "no_alignment")
+        ]
+
+    def test_runs_inside_running_event_loop(self):
+        analyzer = BehavioralAnalyzer()
+        analyzer.alignment_orchestrator = FakeAlignmentOrchestrator(delay=0.01)
+
+        async def scan():
+            return analyzer.analyze(self._skill())
+
+        assert len(self._alignment_functions(asyncio.run(scan()))) == 12
+
+    def test_concurrency_from_environment(self):
+        with patch.dict("os.environ", {"SKILL_SCANNER_ALIGNMENT_CONCURRENCY": "3"}):
+            assert BehavioralAnalyzer().alignment_concurrency == 3
+
+    def test_rate_limiter_spaces_requests(self):
+        from skill_scanner.core.analyzers.behavioral.alignment import AlignmentRateLimiter
+
+        limiter = AlignmentRateLimiter(requests_per_second=50, burst=2)
+
+        async def acquire_all():
+            await asyncio.gather(*(limiter.acquire() for _ in range(7)))
+
+        start = time.perf_counter()
+        asyncio.run(acquire_all())
+        # Two requests go out immediately, the other five wait one interval (20 ms) each
+        assert time.perf_counter() - start >= 0.09
+
+        with pytest.raises(ValueError):
+            AlignmentRateLimiter(requests_per_second=0)
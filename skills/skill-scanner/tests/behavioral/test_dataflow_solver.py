@@ -0,0 +1,350 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the CFG dataflow worklist solver: node ordering, loop handling,
+convergence, work counters, copy-on-write facts and taint labels.
+"""
+
+import ast
+
+from skill_scanner.core.static_analysis.cfg import ControlFlowGraph, DataFlowAnalyzer
+from skill_scanner.core.static_analysis.dataflow import ForwardDataflowAnalysis
+from skill_scanner.core.static_analysis.dataflow.forward_analysis import FlowPath, ForwardFlowFact
+from skill_scanner.core.static_analysis.parser.python_parser import PythonParser
+from skill_scanner.core.static_analysis.taint import LabelTable, ShapeEnvironment, Taint, TaintStatus
+
+
+def _loop_graph():
+    """entry -> head <-> body, head -> after -> exit."""
+    cfg = ControlFlowGraph()
+    entry, head, body, after, exit_node = (
+        cfg.create_node(None, label) for label in ("entry", "head", "body", "after", "exit")
+    )
+    cfg.entry, cfg.exit = entry, exit_node
+    for src, dst in [(entry, head), (head, body), (body, head), (head, after), (after, exit_node)]:
+        cfg.add_edge(src, dst)
+    return cfg
+
+
+def _parse(source):
+    parser = PythonParser(source)
+    assert parser.parse()
+    return parser
+
+
+class CountingAnalyzer(DataFlowAnalyzer[frozenset]):
+    """Collects labels of visited nodes; facts only grow, so it always converges."""
+
+    def __init__(self, cfg):
+        super().__init__(_parse("pass"))
+        self.cfg = cfg
+        self.order = []
+
+    def transfer(self, node, in_fact):
+        self.order.append(node.label)
+        return in_fact | {node.label}
+
+    def merge(self, facts):
+        return frozenset().union(*facts)
+
+
+class TestGraphOrdering:
+    """Test reverse postorder and strongly connected components."""
+
+    def test_reverse_postorder_puts_nodes_before_successors(self):
+        cfg = _loop_graph()
+        order = [node.label for node in cfg.reverse_postorder()]
+
+        assert order.index("entry") < order.index("head") < order.index("body")
+        assert order.index("head") < order.index("after") < order.index("exit")
+        assert [node.label for node in cfg.reverse_postorder(forward=False)][0] == "exit"
+
+    def test_components_in_topological_order(self):
+        components = [[node.label for node in component] for component in _loop_graph().strongly_connected_components()]
+
+        assert components == [["entry"], ["head", "body"], ["after"], ["exit"]]
+
+    def test_unreachable_nodes_are_ordered(self):
+        cfg = _loop_graph()
+        orphan = cfg.create_node(None, "orphan")
+        cfg.add_edge(orphan, cfg.exit)
+
+        assert len(cfg.reverse_postorder()) == len(cfg.nodes)
+        assert orphan in [node for component in cfg.strongly_connected_components() for node in component]
+
+
+class TestWorklistSolver:
+    """Test solver convergence and statistics."""
+
+    def test_loop_settles_before_downstream_nodes(self):
+        analyzer = CountingAnalyzer(_loop_graph())
+        analyzer.analyze(frozenset())
+
+        # The loop is iterated to its fixpoint before "after" and "exit" run, once each
+        assert analyzer.order.count("after") == 1
+        assert analyzer.order.count("exit") == 1
+        assert analyzer.order.index("after") > max(i for i, label in enumerate(analyzer.order) if label == "body")
+        assert analyzer.out_facts[analyzer.cfg.exit.id] == frozenset({"entry", "head", "body", "after", "exit"})
+
+    def test_stats_recorded(self):
+        analyzer = CountingAnalyzer(_loop_graph())
+        analyzer.analyze(frozenset())
+
+        stats = analyzer.stats
+        assert stats.converged
+        assert stats.cfg_nodes == 5
+        assert stats.components == 4
+        assert stats.loop_heads == 1
+        assert stats.nodes_visited == 5
+        assert stats.iterations == len(analyzer.order)
+
+    def test_cap_is_reported(self):
+        class Diverging(CountingAnalyzer):
+            def transfer(self, node, in_fact):
+                # A fresh fact on every visit, so the loop never settles
+                self.order.append(node.label)
+                return frozenset({len(self.order)})
+
+        analyzer = Diverging(_loop_graph())
+        analyzer.analyze(frozenset(), max_iteration_multiplier=2)
+
+        assert analyzer.stats.hit_iteration_cap
+        assert not analyzer.stats.converged
+        assert analyzer.stats.iterations == analyzer.stats.max_iterations == 10
+
+    def test_widening_applied_at_loop_heads(self):
+        class Widening(CountingAnalyzer):
+            widened = 0
+
+            def widen(self, previous, current):
+                self.widened += 1
+                return previous | current
+
+        analyzer = Widening(_loop_graph())
+        analyzer.widening_delay = 0
+        analyzer.analyze(frozenset())
+
+        assert analyzer.widened == analyzer.stats.widenings > 0
+
+
+class TestForwardAnalysisConvergence:
+    """Test that real analyses reach their fixpoint instead of the cap."""
+
+    def _function_with_loops(self, loops):
+        lines = ["import os, requests", "def handler(data, url):", "    token = os.getenv('API_TOKEN')"]
+        for i in range(loops):
+            lines += [
+                "    for item in data:",
+                f"        value{i} = item + token",
+                f"        if value{i}:",
+                f"            requests.post(url, value{i})",
+                f"            return value{i}",
+                "        while data:",
+                f"            data = value{i}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def test_many_loops_converge(self):
+        source = self._function_with_loops(40)
+        tree = ast.parse(source)
+        func = next(node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef))
+
+        analyzer = ForwardDataflowAnalysis(_parse(ast.unparse(func)), ["data", "url"])
+        analyzer.analyze_forward_flows()
+
+        assert analyzer.stats.converged
+        assert analyzer.stats.nodes_visited == analyzer.stats.cfg_nodes
+        assert analyzer.stats.iterations < 3 * analyzer.stats.cfg_nodes
+
+    def test_return_in_loop_recorded_once(self):
+        source = "def f(x):\n    while x:\n        return x\n"
+        analyzer = ForwardDataflowAnalysis(_parse(source), ["x"])
+        analyzer.analyze_forward_flows()
+
+        assert analyzer.stats.converged
+        for fact in analyzer.out_facts.values():
+            for flow in fact.parameter_flows.values():
+                returns = [op for op in flow.operations if op["type"] == "return"]
+                assert len(returns) <= 1
+
+
+class TestShapeEnvironmentEquality:
+    """Test content equality used for fixpoint detection."""
+
+    def test_equal_by_content(self):
+        first, second = ShapeEnvironment(), ShapeEnvironment()
+        first.set_taint("x", Taint(status=TaintStatus.TAINTED, labels={"param:x"}))
+        second.set_taint("x", Taint(status=TaintStatus.TAINTED, labels={"param:x"}))
+
+        assert first == second
+        assert first.copy() == first
+
+        second.set_taint("x", Taint(status=TaintStatus.TAINTED, labels={"param:y"}))
+        assert first != second
+
+    def test_looked_up_variables_do_not_change_equality(self):
+        env = ShapeEnvironment()
+        env.get("unused")
+
+        assert env == ShapeEnvironment()
+
+
+def _tainted(label):
+    return Taint(status=TaintStatus.TAINTED, labels={label})
+
+
+class TestCopyOnWriteFacts:
+    """Test that copies share unchanged state and never leak writes."""
+
+    def test_copy_shares_until_written(self):
+        env = ShapeEnvironment()
+        env.set_taint("x", _tainted("param:x"))
+        env.set_taint("y", _tainted("param:y"))
+
+        copy = env.copy()
+        assert copy.lookup("x") is env.lookup("x")
+
+        copy.set_taint("x", Taint(status=TaintStatus.UNTAINTED))
+        assert env.get_taint("x").is_tainted()
+        assert not copy.get_taint("x").is_tainted()
+        assert copy.lookup("y") is env.lookup("y")
+
+    def test_get_returns_private_shape(self):
+        env = ShapeEnvironment()
+        env.set_taint("obj", Taint(status=TaintStatus.UNTAINTED))
+        copy = env.copy()
+
+        copy.get("obj").set_field("secret", _tainted("param:obj"))
+
+        assert env.lookup("obj").get_field("secret").is_tainted() is False
+        assert copy.lookup("obj").get_field("secret").is_tainted()
+
+    def test_lookup_does_not_add_variables(self):
+        env = ShapeEnvironment()
+
+        assert not env.lookup("missing").get_taint().is_tainted()
+        assert "missing" not in env._shapes
+
+    def test_merge_reuses_unchanged_shapes(self):
+        base = ShapeEnvironment()
+        base.set_taint("x", _tainted("param:x"))
+        left, right = base.copy(), base.copy()
+        right.set_taint("y", _tainted("param:y"))
+
+        merged = left.merge(right)
+
+        assert merged.lookup("x") is base.lookup("x")
+        assert merged.get_taint("y").labels == {"param:y"}
+        assert "y" not in left._shapes
+
+    def test_merge_joins_labels(self):
+        left, right = ShapeEnvironment(), ShapeEnvironment()
+        left.set_taint("x", _tainted("param:a"))
+        right.set_taint("x", _tainted("param:b"))
+
+        merged = left.merge(right)
+
+        assert merged.get_taint("x").labels == {"param:a", "param:b"}
+        assert left.get_taint("x").labels == {"param:a"}
+
+    def test_writable_flow_isolates_copies(self):
+        fact = ForwardFlowFact(parameter_flows={"x": FlowPath(parameter_name="x")})
+        copy = fact.copy()
+
+        copy.writable_flow("x").reaches_calls.append("eval")
+
+        assert fact.parameter_flows["x"].reaches_calls == []
+        assert copy.parameter_flows["x"].reaches_calls == ["eval"]
+        assert copy != fact
+
+    def test_transfer_does_not_modify_input_fact(self):
+        source = "def f(x):\n    y = x\n    eval(y)\n"
+        parser = PythonParser(source)
+        assert parser.parse()
+        analyzer = ForwardDataflowAnalysis(parser, ["x"])
+        analyzer.analyze_forward_flows()
+
+        for node in analyzer.cfg.nodes:
+            in_fact = analyzer.in_facts[node.id]
+            before = {name: flow.copy() for name, flow in in_fact.parameter_flows.items()}
+            taints = {name: in_fact.shape_env.get_taint(name) for name in in_fact.shape_env._shapes}
+
+            analyzer.transfer(node, in_fact)
+
+            assert in_fact.parameter_flows == before
+            assert {name: in_fact.shape_env.get_taint(name) for name in in_fact.shape_env._shapes} == taints
+
+
+class TestTaintLabels:
+    """Test interned bitset labels behind the Taint API."""
+
+    def test_labels_are_interned_as_bits(self):
+        table = LabelTable()
+        taint = Taint(status=TaintStatus.TAINTED, labels={"param:x", "env_var:HOME"}, table=table)
+        taint.add_label("param:x")
+
+        assert len(table) == 2
+        assert taint.labels == {"param:x", "env_var:HOME"}
+        assert taint.has_label("env_var:HOME")
+        assert not taint.has_label("param:y")
+        assert len(table) == 2
+
+    def test_merge_and_equality(self):
+        table = LabelTable()
+        a = Taint(status=TaintStatus.TAINTED, labels={"param:a"}, table=table)
+        b = Taint(status=TaintStatus.TAINTED, labels={"param:b"}, table=table)
+
+        merged = a.merge(b)
+
+        assert merged.mask == a.mask | b.mask
+        assert merged == Taint(status=TaintStatus.TAINTED, labels={"param:b", "param:a"}, table=table)
+        assert merged != a
+        assert merged.shares_labels(a) and not a.shares_labels(b)
+        assert not Taint().merge(Taint()).is_tainted()
+
+    def test_taints_from_different_tables(self):
+        first, second = LabelTable(), LabelTable()
+        second.mask(["param:other"])
+        a = Taint(status=TaintStatus.TAINTED, labels={"param:x"}, table=first)
+        b = Taint(status=TaintStatus.TAINTED, labels={"param:x"}, table=second)
+
+        assert a == b
+        assert a.shares_labels(b)
+        assert a.merge(Taint(status=TaintStatus.TAINTED, labels={"param:y"}, table=second)).labels == {
+            "param:x",
+            "param:y",
+        }
+
+    def test_untainted_merge_keeps_tainted_table(self):
+        table = LabelTable()
+        tainted = Taint(status=TaintStatus.TAINTED, labels={"param:x"}, table=table)
+
+        merged = Taint(status=TaintStatus.UNTAINTED).merge(tainted)
+
+        assert merged.table is table
+        assert merged.labels == {"param:x"}
+
+    def test_analysis_uses_its_own_table(self):
+        parser = PythonParser("def f(x, y):\n    z = x\n    w = eval(z)\n")
+        assert parser.parse()
+        analyzer = ForwardDataflowAnalysis(parser, ["x", "y"])
+
+        flows = {flow.parameter_name: flow for flow in analyzer.analyze_forward_flows()}
+
+        assert len(analyzer.label_table) == 2
+        assert "eval" in flows["x"].reaches_calls
+        assert "eval" not in flows["y"].reaches_calls
@@ -0,0 +1,139 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for single-traversal function context extraction.
+"""
+
+import ast
+from pathlib import Path
+
+from skill_scanner.core.static_analysis import ContextExtractor
+from skill_scanner.core.static_analysis.context_extractor import FunctionFactsVisitor
+
+SOURCE = """import os
+import subprocess
+
+COUNTER = 0
+
+
+def collect(path, retries):
+    global COUNTER
+    token = os.getenv("API_TOKEN")
+    home = os.environ.get(path)
+    limit = 3
+    self_ref = token
+    config.endpoint = "https://example.invalid/upload"
+    for attempt in range(retries):
+        if attempt > limit and token or home:
+            COUNTER = COUNTER + 1
+    while False:
+        pass
+    try:
+        data = open(path).read()
+    except OSError:
+        pass
+    except (ValueError, KeyError) as e:
+        raise RuntimeError("bad data") from e
+    result = eval(data)
+    out = subprocess.run(["ls", "-la"])
+    return result, "bad data"
+"""
+
+
+def _collect():
+    function = ast.parse(SOURCE).body[3]
+    return FunctionFactsVisitor(ContextExtractor()._get_call_name).collect(function)
+
+
+class TestFunctionFactsVisitor:
+    """Test the facts gathered by one FunctionFactsVisitor pass."""
+
+    def test_calls_and_indicators(self):
+        facts = _collect()
+
+        # Breadth-first: calls nested deeper in the function come later
+        names = [call["name"] for call in facts.function_calls]
+        assert names == [
+            "os.getenv",
+            "os.environ.get",
+            "range",
+            "eval",
+            "subprocess.run",
+            "read",
+            "RuntimeError",
+            "open",
+        ]
+        assert facts.function_calls[0] == {"name": "os.getenv", "args": ["'API_TOKEN'"], "line": 9}
+        assert facts.env_var_access == ["os.getenv('API_TOKEN')", "os.environ.get"]
+        assert facts.has_file_operations
+        assert facts.has_network_operations
+        assert facts.has_subprocess_calls
+        assert facts.has_eval_exec
+
+    def test_assignments_constants_and_dependencies(self):
+        facts = _collect()
+
+        assert [a["variable"] for a in facts.assignments] == [
+            "token",
+            "home",
+            "limit",
+            "self_ref",
+            "result",
+            "out",
+            "data",
+            "COUNTER",
+        ]
+        assert facts.constants == {"limit": 3}
+        assert facts.variable_dependencies["self_ref"] == ["token"]
+        assert facts.variable_dependencies["COUNTER"] == ["COUNTER"]
+        assert facts.global_writes() == [{"variable": "COUNTER", "value": "COUNTER + 1", "line": 16}]
+        assert facts.attribute_access == [
+            {
+                "type": "write",
+                "object": "config",
+                "attribute": "endpoint",
+                "value": "'https://example.invalid/upload'",
+                "line": 13,
+            }
+        ]
+
+    def test_control_flow_and_summary(self):
+        facts = _collect()
+
+        assert facts.control_flow() == {
+            "has_conditionals": True,
+            "has_loops": True,
+            "has_exception_handling": True,
+        }
+        assert facts.exception_handlers == [
+            {"line": 21, "exception_type": "OSError", "is_silent": True},
+            {"line": 23, "exception_type": "(ValueError, KeyError)", "is_silent": False},
+        ]
+        # 1 + for + if + while + 2 handlers + (and: 1) + (or: 1)
+        assert facts.dataflow_summary()["complexity"] == 8
+        assert facts.string_literals == ["https://example.invalid/upload", "API_TOKEN", "bad data", "ls", "-la"]
+        assert facts.return_expressions == ["(result, 'bad data')"]
+
+    def test_function_context_uses_single_pass_facts(self):
+        context = ContextExtractor().extract_function_contexts(Path("script.py"), SOURCE)[0]
+        facts = _collect()
+
+        assert context.function_calls == facts.function_calls
+        assert context.assignments == facts.assignments
+        assert context.global_writes == facts.global_writes()
+        assert context.dataflow_summary == facts.dataflow_summary()
+        assert context.string_literals == facts.string_literals[:20]
@@ -315,6 +315,62 @@ class TestBatchScanEndpoint:
         assert result_data["scan_id"] == scan_id
         assert result_data["status"] in ["processing", "completed"]
 
+    def test_batch_scan_stream(self, client, test_skills_dir):
+        """Test streaming batch results as NDJSON until the scan finishes."""
+        import json
+
+        response = client.post("/scan-batch", json={"skills_directory": str(test_skills_dir), "recursive": True})
+        scan_id = response.json()["scan_id"]
+
+        stream_response = client.get(f"/scan-batch/{scan_id}", params={"stream": True})
+
+        assert stream_response.status_code == 200
+        assert stream_response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in stream_response.text.splitlines()]
+        assert lines[-1]["type"] == "status"
+        assert lines[-1]["status"] == "completed"
+        assert len([line for line in lines if line["type"] == "result"]) == lines[-1]["progress"]["completed"]
+
+        result_data = client.get(f"/scan-batch/{scan_id}").json()
+        assert result_data["progress"]["pending"] == 0
+        assert result_data["result"]["summary"]["total_skills_scanned"] == lines[-1]["progress"]["completed"]
+
+    @pytest.mark.parametrize("stream_format", ["ndjson", "sse"])
+    def test_batch_scan_stream_endpoint(self, client, test_skills_dir, stream_format):
+        """Test POST /scan-batch/stream emits each result and a trailing status record."""
+        import json
+
+        response = client.post(
+            "/scan-batch/stream",
+            params={"format": stream_format},
+            json={"skills_directory": str(test_skills_dir), "recursive": True},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["x-scan-id"]
+        if stream_format == "sse":
+            assert response.headers["content-type"].startswith("text/event-stream")
+            records = [
+                json.loads(line[len("data: ") :]) for line in response.text.splitlines() if line.startswith("data: ")
+            ]
+        else:
+            records = [json.loads(line) for line in response.text.splitlines()]
+        assert records[-1]["type"] == "status"
+        assert records[-1]["scan_id"] == response.headers["x-scan-id"]
+        results = [record for record in records if record["type"] == "result"]
+        assert len(results) == records[-1]["summary"]["total_skills_scanned"] > 1
+
+    def test_batch_scan_cancel(self, client, test_skills_dir):
+        """Test cancelling a batch scan."""
+        response = client.post("/scan-batch", json={"skills_directory": str(test_skills_dir)})
+        scan_id = response.json()["scan_id"]
+
+        cancel_response = client.post(f"/scan-batch/{scan_id}/cancel")
+
+        assert cancel_response.status_code == 200
+        assert cancel_response.json()["status"] in ["processing", "cancelled", "completed"]
+        assert client.post("/scan-batch/nonexistent-id-12345/cancel").status_code == 404
+
     def test_batch_scan_nonexistent_id_returns_404(self, client):
         """Test retrieving nonexistent scan ID returns 404."""
         response = client.get("/scan-batch/nonexistent-id-12345")
@@ -378,6 +434,84 @@ class TestAnalyzersEndpoint:
             assert name in analyzer_names, f"Missing analyzer: {name}"
 
 
+# =============================================================================
+# Analyzer Pool Tests
+# =============================================================================
+@pytest.mark.skipif(not API_AVAILABLE, reason="FastAPI not installed")
+class TestAnalyzerPool:
+    """Test analyzer reuse across requests and rule hot-reload."""
+
+    def test_static_analyzer_reused_per_config(self):
+        """Test the same configuration returns the same analyzer instance."""
+        from skill_scanner.api.analyzer_pool import AnalyzerConfig, AnalyzerPool
+
+        pool = AnalyzerPool(max_workers=2)
+        try:
+            default = pool.get_static_analyzer(AnalyzerConfig.create())
+            assert pool.get_static_analyzer(AnalyzerConfig.create("BALANCED")) is default
+            strict = pool.get_static_analyzer(
+                AnalyzerConfig.create("strict", disabled_rules=["COMMAND_INJECTION_EVAL"])
+            )
+            assert strict is not default
+            assert "COMMAND_INJECTION_EVAL" in strict.disabled_rules
+        finally:
+            pool.shutdown()
+
+    def test_least_recently_used_config_evicted(self):
+        """Test the pool keeps at most max_configs static analyzers."""
+        from skill_scanner.api.analyzer_pool import AnalyzerConfig, AnalyzerPool
+
+        pool = AnalyzerPool(max_workers=1, max_configs=1)
+        try:
+            pool.get_static_analyzer(AnalyzerConfig.create("strict"))
+            pool.get_static_analyzer(AnalyzerConfig.create("permissive"))
+            assert pool.stats()["static_configurations"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_reload_replaces_analyzers(self):
+        """Test reload rebuilds cached analyzers and bumps the generation."""
+        from skill_scanner.api.analyzer_pool import AnalyzerConfig, AnalyzerPool
+
+        pool = AnalyzerPool(max_workers=1)
+        try:
+            before = pool.get_static_analyzer(AnalyzerConfig.create("strict"))
+            summary = pool.reload()
+            assert summary["generation"] == 1
+            assert summary["configurations"] == [AnalyzerConfig.create("strict").to_dict()]
+            assert pool.get_static_analyzer(AnalyzerConfig.create("strict")) is not before
+        finally:
+            pool.shutdown()
+
+    def test_reload_endpoint(self, client):
+        """Test POST /analyzers/reload."""
+        response = client.post("/analyzers/reload")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "reloaded"
+        assert data["generation"] >= 1
+        assert data["configurations"]
+
+    def test_scan_with_yara_mode_and_disabled_rules(self, client, safe_skill_dir):
+        """Test scan options select a pooled analyzer configuration."""
+        request_data = {
+            "skill_directory": str(safe_skill_dir),
+            "yara_mode": "strict",
+            "disabled_rules": ["YARA_script_injection"],
+        }
+
+        response = client.post("/scan", json=request_data)
+
+        assert response.status_code == 200
+
+    def test_scan_with_unknown_yara_mode_returns_400(self, client, safe_skill_dir):
+        """Test an invalid YARA mode is reported as a bad request."""
+        response = client.post("/scan", json={"skill_directory": str(safe_skill_dir), "yara_mode": "paranoid"})
+
+        assert response.status_code == 400
+
+
 # =============================================================================
 # Upload Endpoint Tests
 # =============================================================================
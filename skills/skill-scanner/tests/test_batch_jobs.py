@@ -0,0 +1,283 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for API batch scan jobs: progress, streaming, cancellation,
+eviction and persistence of results.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from skill_scanner.api.jobs import (
+    JOB_CANCELLED,
+    JOB_COMPLETED,
+    JOB_ERROR,
+    BatchJob,
+    BatchJobManager,
+    BatchScanTask,
+    MemoryResultStore,
+    SQLiteResultStore,
+)
+from skill_scanner.core.analyzers.static import StaticAnalyzer
+from skill_scanner.core.models import ScanResult
+
+TEST_SKILLS_DIR = Path(__file__).parent.parent / "evals" / "test_skills"
+
+
+class FakeTask:
+    """Batch task over made-up skill directories; scans block until released."""
+
+    def __init__(self, names, fail=(), release=None, batch_size=1):
+        self.names = names
+        self.fail = set(fail)
+        self.release = release
+        self.batch_size = batch_size
+        self.started = []
+        self.groups = []
+        self.closed = False
+
+    def prepare(self):
+        return [Path(name) for name in self.names]
+
+    def scan_batch(self, skill_dirs):
+        self.groups.append([skill_dir.name for skill_dir in skill_dirs])
+        outcomes = []
+        for skill_dir in skill_dirs:
+            self.started.append(skill_dir.name)
+            if self.release is not None:
+                self.release.wait(timeout=10)
+            if skill_dir.name in self.fail:
+                outcomes.append(ValueError(f"cannot load {skill_dir.name}"))
+            else:
+                outcomes.append(ScanResult(skill_name=skill_dir.name, skill_directory=str(skill_dir)))
+        return outcomes
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryResultStore()
+    return SQLiteResultStore(tmp_path / "jobs.sqlite3")
+
+
+def _wait_finished(manager, job_id, timeout=30.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.store.get(job_id)
+        if job.finished:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_job_records_progress_and_report(store):
+    manager = BatchJobManager(store=store, skill_concurrency=2)
+    task = FakeTask(["a", "b", "c", "d"], fail=["c"])
+    try:
+        job = manager.submit(task, params={"recursive": False})
+        job = _wait_finished(manager, job.job_id)
+
+        assert job.status == JOB_COMPLETED
+        assert job.progress() == {"total": 4, "completed": 3, "failed": 1, "pending": 0}
+        assert job.params == {"recursive": False}
+
+        events = [event for _, event in manager.events(job.job_id)]
+        assert sorted(event["position"] for event in events) == [0, 1, 2, 3]
+        assert [event["error"] for event in events if event["type"] == "error"] == ["cannot load c"]
+
+        report = manager.describe(job)["result"]
+        assert [result["skill_name"] for result in report["results"]] == ["a", "b", "d"]
+        assert report["summary"]["total_skills_scanned"] == 3
+    finally:
+        manager.shutdown()
+    # The coordinator has exited, so the job's analyzers have been released
+    assert task.closed
+
+
+def test_skills_scanned_in_groups_of_batch_size():
+    class PartlyBrokenTask(FakeTask):
+        def scan_batch(self, skill_dirs):
+            if "e" in [skill_dir.name for skill_dir in skill_dirs]:
+                raise RuntimeError("provider error")
+            return super().scan_batch(skill_dirs)
+
+    manager = BatchJobManager(store=MemoryResultStore(), skill_concurrency=4)
+    task = PartlyBrokenTask(["a", "b", "c", "d", "e", "f"], fail=["c"], batch_size=2)
+    try:
+        job = _wait_finished(manager, manager.submit(task).job_id)
+
+        assert sorted(task.groups) == [["a", "b"], ["c", "d"]]
+        events = sorted((event for _, event in manager.events(job.job_id)), key=lambda event: event["position"])
+        assert [event["type"] for event in events] == ["result", "result", "error", "result", "error", "error"]
+        # A failed group fails each of its skills
+        assert [event["error"] for event in events[4:]] == ["provider error", "provider error"]
+        assert job.progress() == {"total": 6, "completed": 3, "failed": 3, "pending": 0}
+    finally:
+        manager.shutdown()
+
+
+def test_results_visible_before_job_finishes():
+    release = threading.Event()
+    manager = BatchJobManager(store=MemoryResultStore(), skill_concurrency=1)
+    task = FakeTask(["a", "b"], release=release)
+    try:
+        job = manager.submit(task)
+        deadline = time.time() + 10
+        while task.started != ["a"] and time.time() < deadline:
+            time.sleep(0.01)
+        release.set()
+        job = _wait_finished(manager, job.job_id)
+
+        first = manager.describe(job, after=1)
+        assert [event["result"]["skill_name"] for event in first["events"]] == ["b"]
+        assert first["next_cursor"] == 2
+    finally:
+        manager.shutdown()
+
+
+def test_stream_yields_each_result_then_status():
+    release = threading.Event()
+    manager = BatchJobManager(store=MemoryResultStore(), skill_concurrency=1)
+    try:
+        job = manager.submit(FakeTask(["a", "b", "c"], release=release))
+        release.set()
+
+        async def collect():
+            return [json.loads(line) async for line in manager.stream(job.job_id, poll_interval=0.01)]
+
+        lines = asyncio.run(collect())
+
+        assert [line["type"] for line in lines] == ["result", "result", "result", "status"]
+        assert [line["cursor"] for line in lines[:-1]] == [1, 2, 3]
+        assert lines[-1]["status"] == JOB_COMPLETED
+        assert lines[-1]["summary"]["total_skills_scanned"] == 3
+    finally:
+        manager.shutdown()
+
+
+def test_cancel_stops_new_skills(store):
+    release = threading.Event()
+    manager = BatchJobManager(store=store, skill_concurrency=1)
+    task = FakeTask(["a", "b", "c", "d"], release=release)
+    try:
+        job = manager.submit(task)
+        deadline = time.time() + 10
+        while not task.started and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert manager.cancel(job.job_id).cancel_requested
+        release.set()
+        job = _wait_finished(manager, job.job_id)
+
+        assert job.status == JOB_CANCELLED
+        assert task.started == ["a"]
+        assert job.progress() == {"total": 4, "completed": 1, "failed": 0, "pending": 3}
+        assert [result["skill_name"] for result in manager.report(job)["results"]] == ["a"]
+        assert manager.cancel("missing") is None
+    finally:
+        manager.shutdown()
+
+
+def test_prepare_error_fails_job():
+    class BrokenTask(FakeTask):
+        def prepare(self):
+            raise ValueError("AI Defense API key required")
+
+    manager = BatchJobManager(store=MemoryResultStore())
+    try:
+        job = _wait_finished(manager, manager.submit(BrokenTask([])).job_id)
+
+        assert job.status == JOB_ERROR
+        assert manager.describe(job)["error"] == "AI Defense API key required"
+    finally:
+        manager.shutdown()
+
+
+def test_eviction_by_ttl_and_least_recently_read(store):
+    manager = BatchJobManager(store=store, ttl_seconds=3600, max_finished_jobs=3)
+    now = time.time()
+    try:
+        for job_id, finished_at, accessed_at in [
+            ("expired", now - 7200, now),
+            ("old-read", now - 60, now - 50),
+            ("recent-read", now - 60, now - 10),
+            ("newest", now - 10, now - 5),
+        ]:
+            store.create(
+                BatchJob(
+                    job_id=job_id,
+                    status=JOB_COMPLETED,
+                    finished_at=finished_at,
+                    updated_at=finished_at,
+                    accessed_at=accessed_at,
+                )
+            )
+        store.create(BatchJob(job_id="abandoned", updated_at=now - 2 * manager.stale_after_seconds))
+
+        assert manager.evict() == 2
+
+        assert store.get("expired") is None
+        assert store.get("old-read") is None
+        assert store.get("recent-read") is not None
+        assert store.get("newest") is not None
+        assert store.get("abandoned").status == JOB_ERROR
+    finally:
+        manager.shutdown()
+
+
+def test_sqlite_results_survive_restart(tmp_path):
+    db_path = tmp_path / "jobs.sqlite3"
+    manager = BatchJobManager(store=SQLiteResultStore(db_path))
+    job_id = manager.submit(FakeTask(["a", "b"])).job_id
+    _wait_finished(manager, job_id)
+    manager.shutdown()
+
+    restarted = BatchJobManager(store=SQLiteResultStore(db_path))
+    try:
+        job = restarted.get(job_id)
+        assert job.status == JOB_COMPLETED
+        assert [result["skill_name"] for result in restarted.report(job)["results"]] == ["a", "b"]
+    finally:
+        restarted.shutdown()
+
+
+def test_batch_scan_task_matches_scan_directory():
+    from skill_scanner.core.scanner import SkillScanner
+
+    analyzer = StaticAnalyzer()
+    manager = BatchJobManager(store=MemoryResultStore())
+    try:
+        task = BatchScanTask(TEST_SKILLS_DIR, True, lambda: [analyzer])
+        job = _wait_finished(manager, manager.submit(task).job_id)
+        expected = SkillScanner(analyzers=[analyzer]).scan_directory(TEST_SKILLS_DIR, recursive=True).to_dict()
+
+        result = manager.report(job)
+        assert [r["skill_name"] for r in result["results"]] == [r["skill_name"] for r in expected["results"]]
+        assert [r["findings_count"] for r in result["results"]] == [r["findings_count"] for r in expected["results"]]
+        assert result["summary"]["total_findings"] == expected["summary"]["total_findings"]
+    finally:
+        manager.shutdown()
@@ -217,6 +217,38 @@ class TestCustomRules:
         assert "not found" in stderr.lower() or "could not load" in stderr.lower()
 
 
+# =============================================================================
+# Rules Compile Command Tests
+# =============================================================================
+class TestRulesCompile:
+    """Tests for the rules compile command."""
+
+    def test_compile_builtin_rules(self, tmp_path):
+        """Test precompiling the built-in YARA rules."""
+        stdout, stderr, code = run_cli(["rules", "compile", "--bundle-dir", str(tmp_path)])
+        assert code == 0, f"CLI failed: {stderr}"
+        assert "[OK] Compiled" in stdout
+        assert list(tmp_path.glob("*.yarc"))
+
+    def test_compile_custom_rules(self, tmp_path, custom_rules_dir):
+        """Test precompiling a custom rules directory."""
+        bundle_dir = tmp_path / "bundles"
+        stdout, stderr, code = run_cli(
+            ["rules", "compile", "--custom-rules", str(custom_rules_dir), "--bundle-dir", str(bundle_dir)]
+        )
+        assert code == 0, f"CLI failed: {stderr}"
+        assert str(custom_rules_dir) in stdout
+        assert len(list(bundle_dir.glob("*.yarc"))) == 1
+
+    def test_compile_invalid_path_fails(self, tmp_path):
+        """Test compiling a missing rules directory reports an error."""
+        stdout, stderr, code = run_cli(
+            ["rules", "compile", "--custom-rules", "/nonexistent/rules", "--bundle-dir", str(tmp_path)]
+        )
+        assert code == 1
+        assert "[FAIL]" in stderr
+
+
 # =============================================================================
 # Scan-all Command Tests
 # =============================================================================
@@ -341,6 +341,17 @@ class TestMultiSkillFormats:
         # Should have multi-skill structure
         assert "skills" in data or "results" in data or "total_skills_scanned" in data
 
+    def test_ndjson_format_scan_all(self, test_skills_dir):
+        """Test NDJSON format streams one result per line, then a summary."""
+        stdout, stderr, code = run_cli(["scan-all", str(test_skills_dir), "--recursive", "--format", "ndjson"])
+        assert code == 0, f"CLI failed: {stderr}"
+
+        records = [json.loads(line) for line in stdout.splitlines()]
+        assert records[-1]["type"] == "summary"
+        results = [r for r in records if r["type"] == "result"]
+        assert len(results) == records[-1]["summary"]["total_skills_scanned"] > 1
+        assert all("skill_name" in r["result"] for r in results)
+
     def test_sarif_format_scan_all(self, test_skills_dir):
         """Test SARIF format with scan-all command."""
         # Use the safe subdirectory which has skills at root level
@@ -0,0 +1,202 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the MinHash/LSH description index behind the overlap check.
+"""
+
+import sqlite3
+from itertools import combinations
+from pathlib import Path
+
+import pytest
+
+from skill_scanner.core.analyzers.static import StaticAnalyzer
+from skill_scanner.core.description_index import DescriptionIndex, description_tokens, jaccard
+from skill_scanner.core.models import Skill, SkillManifest
+from skill_scanner.core.scanner import SkillScanner
+
+PDF_TOOL = "Extract text and tables from PDF files"
+PDF_READER = "Extract text and tables from PDF documents"  # 4 of 6 tokens shared with PDF_TOOL
+PDF_COPY = "Extract the text and the tables from PDF files"  # same tokens as PDF_TOOL
+WEATHER = "Show the weather forecast for a city"
+
+
+def _skill(name: str, description: str, directory: str | None = None) -> Skill:
+    directory = Path(directory or f"/skills/{name}")
+    return Skill(
+        directory=directory,
+        manifest=SkillManifest(name=name, description=description),
+        skill_md_path=directory / "SKILL.md",
+        instruction_body="",
+    )
+
+
+def _write_skill(root: Path, name: str, description: str) -> Path:
+    skill_dir = root / name
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n")
+    return skill_dir
+
+
+class TestTokens:
+    """Test tokenization and exact similarity."""
+
+    def test_stop_words_and_case_ignored(self):
+        assert description_tokens("Read THE files, and 42 PDFs") == {"read", "files", "pdfs"}
+
+    def test_jaccard(self):
+        assert jaccard(description_tokens(PDF_TOOL), description_tokens(PDF_READER)) == pytest.approx(4 / 6)
+        assert jaccard(frozenset(), frozenset({"a"})) == 0.0
+
+
+class TestDescriptionIndex:
+    """Test candidate lookup."""
+
+    def test_similar_pairs_found(self):
+        index = DescriptionIndex()
+        index.add("a", "pdf-tool", PDF_TOOL)
+        index.add("b", "pdf-reader", PDF_READER)
+        index.add("c", "weather", WEATHER)
+
+        assert index.similar("a") == [("b", pytest.approx(4 / 6))]
+        assert index.similar("c") == []
+
+    def test_dissimilar_pairs_not_reported(self):
+        index = DescriptionIndex()
+        index.add("a", "one", "alpha beta gamma delta epsilon")
+        index.add("b", "two", "alpha beta zeta theta iota kappa")  # 2 of 9 tokens shared
+
+        assert index.similar("a") == []
+
+    def test_empty_description(self):
+        index = DescriptionIndex()
+        index.add("a", "empty", "the and of")
+        index.add("b", "also-empty", "")
+
+        assert index.similar("a") == []
+        assert len(index) == 2
+
+    def test_replacing_an_entry(self):
+        index = DescriptionIndex()
+        index.add("a", "pdf-tool", PDF_TOOL)
+        index.add("b", "pdf-reader", PDF_READER)
+        index.add("b", "weather", WEATHER)
+
+        assert index.similar("a") == []
+        assert index.name("b") == "weather"
+
+    def test_matches_pairwise_comparison(self):
+        words = [f"w{chr(97 + i)}{chr(97 + j)}" for i in range(6) for j in range(6)]
+        descriptions = {
+            str(n): " ".join(words[(n * 7) % 30 : (n * 7) % 30 + 4 + n % 5] + words[: n % 3]) for n in range(40)
+        }
+        index = DescriptionIndex()
+        for key, description in descriptions.items():
+            index.add(key, key, description)
+
+        expected = set()
+        for a, b in combinations(descriptions, 2):
+            if jaccard(description_tokens(descriptions[a]), description_tokens(descriptions[b])) > 0.5:
+                expected.add(frozenset((a, b)))
+        found = {frozenset((key, other)) for key in descriptions for other, _ in index.similar(key)}
+
+        assert expected
+        assert found == expected
+
+
+class TestPersistence:
+    """Test the SQLite-backed index."""
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "index.db"
+        index = DescriptionIndex(path)
+        index.add("a", "pdf-tool", PDF_TOOL)
+        index.save()
+
+        reloaded = DescriptionIndex(path)
+        reloaded.add("b", "pdf-reader", PDF_READER)
+
+        assert "a" in reloaded
+        assert reloaded.name("a") == "pdf-tool"
+        assert reloaded.similar("b") == [("a", pytest.approx(4 / 6))]
+
+    def test_changed_parameters_re_sign_entries(self, tmp_path):
+        path = tmp_path / "index.db"
+        index = DescriptionIndex(path, num_bands=16, rows_per_band=4)
+        index.add("a", "pdf-tool", PDF_TOOL)
+        index.save()
+
+        reloaded = DescriptionIndex(path)
+        reloaded.add("b", "pdf-copy", PDF_COPY)
+
+        assert reloaded.similar("b") == [("a", 1.0)]
+
+    def test_unreadable_file_ignored(self, tmp_path):
+        path = tmp_path / "index.db"
+        path.write_text("not a database")
+
+        assert len(DescriptionIndex(path)) == 0
+
+    def test_only_changed_entries_written(self, tmp_path):
+        path = tmp_path / "index.db"
+        index = DescriptionIndex(path)
+        index.add("a", "pdf-tool", PDF_TOOL)
+        index.save()
+        with sqlite3.connect(path) as conn:
+            conn.execute("UPDATE descriptions SET name = 'edited'")
+
+        index.add("a", "pdf-tool", PDF_TOOL)
+        index.save()
+
+        assert DescriptionIndex(path).name("a") == "edited"
+
+
+class TestOverlapCheck:
+    """Test the scanner's overlap findings."""
+
+    def test_findings(self):
+        skills = [_skill("pdf-tool", PDF_TOOL), _skill("weather", WEATHER), _skill("pdf-reader", PDF_READER)]
+        skills.append(_skill("pdf-copy", PDF_COPY))
+
+        findings = SkillScanner(analyzers=[])._check_description_overlap(skills)
+
+        assert [(f.rule_id, f.metadata["skill_a"], f.metadata["skill_b"]) for f in findings] == [
+            ("TRIGGER_OVERLAP_WARNING", "pdf-tool", "pdf-reader"),
+            ("TRIGGER_OVERLAP_RISK", "pdf-tool", "pdf-copy"),
+            ("TRIGGER_OVERLAP_WARNING", "pdf-reader", "pdf-copy"),
+        ]
+        assert findings[1].file_path == "pdf-tool/SKILL.md"
+
+    def test_single_skill_compared_with_catalogue(self, tmp_path):
+        index = DescriptionIndex(tmp_path / "index.db")
+        scanner = SkillScanner(analyzers=[StaticAnalyzer()], description_index=index)
+        scanner.scan_skill(_write_skill(tmp_path, "pdf-tool", PDF_TOOL))
+
+        later = SkillScanner(analyzers=[StaticAnalyzer()], description_index=DescriptionIndex(tmp_path / "index.db"))
+        result = later.scan_skill(_write_skill(tmp_path, "pdf-copy", PDF_COPY))
+
+        overlap = [f for f in result.findings if f.rule_id == "TRIGGER_OVERLAP_RISK"]
+        assert [(f.metadata["skill_a"], f.metadata["skill_b"]) for f in overlap] == [("pdf-copy", "pdf-tool")]
+
+    def test_rescanning_a_skill_does_not_match_itself(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "pdf-tool", PDF_TOOL)
+        scanner = SkillScanner(analyzers=[], description_index=DescriptionIndex(tmp_path / "index.db"))
+
+        scanner.scan_skill(skill_dir)
+        result = scanner.scan_skill(skill_dir)
+
+        assert not [f for f in result.findings if f.rule_id.startswith("TRIGGER_OVERLAP")]
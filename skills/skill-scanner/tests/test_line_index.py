@@ -0,0 +1,65 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for offset-to-line resolution used when reporting matches.
+"""
+
+import pytest
+
+from skill_scanner.core.rules.yara_scanner import YaraScanner
+from skill_scanner.utils.line_index import LineIndex
+
+
+@pytest.mark.parametrize("content", ["", "single line", "a\nbb\n\nccc", "trailing\n", "\n\n\n"])
+def test_line_number_matches_prefix_count(content):
+    index = LineIndex(content)
+
+    for offset in range(len(content) + 1):
+        line_number, line_text = index.line_at(offset)
+        assert line_number == content[:offset].count("\n") + 1
+        line_start = content.rfind("\n", 0, offset) + 1
+        line_end = content.find("\n", offset)
+        assert line_text == content[line_start : len(content) if line_end == -1 else line_end]
+
+
+def test_line_count_and_text():
+    index = LineIndex("a = 1\nb = eval(x)\n")
+
+    assert index.line_count == 3
+    assert index.line_text(2) == "b = eval(x)"
+    assert index.line_text(3) == ""
+
+
+def test_context_is_clipped_to_file():
+    index = LineIndex("\n".join(f"line {n}" for n in range(1, 11)))
+
+    assert index.context(5, before=1, after=2) == ["line 4", "line 5", "line 6", "line 7"]
+    assert index.context(1, before=3, after=1) == ["line 1", "line 2"]
+    assert index.context(10, before=1, after=5) == ["line 9", "line 10"]
+
+
+def test_yara_matches_report_same_lines():
+    content = "".join("x = 1\n" if n % 4 else f"result_{n} = eval(user_input)\n" for n in range(200))
+
+    matches = YaraScanner().scan_content(content, "generated.py")
+
+    assert matches
+    for match in matches:
+        for string in match["strings"]:
+            offset = string["offset"]
+            assert string["line_number"] == content[:offset].count("\n") + 1
+            assert string["line_content"] == content.splitlines()[string["line_number"] - 1].strip()
@@ -0,0 +1,218 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for the persistent LLM response cache.
+"""
+
+import asyncio
+import pickle
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from skill_scanner.core.llm_cache import LLMCacheStats, LLMResponseCache
+
+MESSAGES = [{"role": "system", "content": "You are a scanner."}, {"role": "user", "content": "Analyze this."}]
+
+
+def _completion(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMResponseCache(cache_dir=tmp_path)
+    yield cache
+    cache.close()
+
+
+def test_key_covers_model_prompt_schema_and_temperature():
+    key = LLMResponseCache.make_key("gpt-4o", MESSAGES, schema={"type": "object"}, temperature=0.0)
+
+    assert key == LLMResponseCache.make_key("gpt-4o", MESSAGES, schema={"type": "object"}, temperature=0.0)
+    assert key != LLMResponseCache.make_key("gpt-4o-mini", MESSAGES, schema={"type": "object"}, temperature=0.0)
+    assert key != LLMResponseCache.make_key("gpt-4o", MESSAGES[:1], schema={"type": "object"}, temperature=0.0)
+    assert key != LLMResponseCache.make_key("gpt-4o", MESSAGES, schema={"type": "array"}, temperature=0.0)
+    assert key != LLMResponseCache.make_key("gpt-4o", MESSAGES, schema={"type": "object"}, temperature=0.5)
+    assert key != LLMResponseCache.make_key(
+        "gpt-4o", MESSAGES, schema={"type": "object"}, temperature=0.0, max_tokens=100
+    )
+
+
+def test_hit_miss_and_persistence(cache, tmp_path):
+    key = cache.make_key("gpt-4o", MESSAGES, temperature=0.0)
+
+    assert cache.get(key) is None
+    cache.put(key, '{"findings": []}', model="gpt-4o")
+    assert cache.get(key) == '{"findings": []}'
+    assert cache.stats.to_dict() == {
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+        "writes": 1,
+        "evictions": 0,
+        "expired": 0,
+    }
+
+    reopened = LLMResponseCache(cache_dir=tmp_path)
+    assert reopened.get(key) == '{"findings": []}'
+    reopened.close()
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = LLMResponseCache(cache_dir=tmp_path, ttl_seconds=60)
+    key = cache.make_key("gpt-4o", MESSAGES)
+    cache.put(key, "old")
+
+    with patch("skill_scanner.core.llm_cache.time.time", return_value=time.time() + 120):
+        assert cache.get(key) is None
+    assert cache.stats.expired == 1
+    cache.close()
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path):
+    cache = LLMResponseCache(cache_dir=tmp_path, max_size_mb=2500 / (1024 * 1024))
+    keys = [cache.make_key("gpt-4o", f"prompt {i}") for i in range(3)]
+
+    cache.put(keys[0], "a" * 1000)
+    cache.put(keys[1], "b" * 1000)
+    time.sleep(0.01)
+    assert cache.get(keys[0]) is not None  # keys[1] is now least recently used
+    cache.put(keys[2], "c" * 1000)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == "a" * 1000
+    assert cache.get(keys[2]) == "c" * 1000
+    assert cache.stats.evictions == 1
+    assert cache.size_bytes() == 2000
+    cache.close()
+
+
+def test_pickles_without_connection(cache):
+    cache.get(cache.make_key("gpt-4o", MESSAGES))
+    restored = pickle.loads(pickle.dumps(cache))
+
+    assert restored.get(cache.make_key("gpt-4o", MESSAGES)) is None
+    assert restored.stats.misses == 1
+    restored.close()
+
+
+def test_counters_change_under_lock(cache):
+    class LockCheckedStats(LLMCacheStats):
+        def __setattr__(self, name, value):
+            # Concurrent LLM requests share the cache; unguarded increments lose updates
+            assert cache._lock.locked(), f"{name} changed outside the cache lock"
+            super().__setattr__(name, value)
+
+    cache.stats.__class__ = LockCheckedStats
+    cache.put(cache.make_key("gpt-4o", MESSAGES), "cached")
+
+    cache.get(cache.make_key("gpt-4o", MESSAGES))
+    cache.get(cache.make_key("gpt-4o-mini", MESSAGES))
+
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.writes) == (1, 1, 1)
+    assert type(cache.drain_stats()) is LockCheckedStats
+    assert type(cache.stats) is LLMCacheStats
+
+
+def test_request_handler_serves_repeat_prompts_from_cache(cache):
+    from skill_scanner.core.analyzers.llm_provider_config import ProviderConfig
+    from skill_scanner.core.analyzers.llm_request_handler import LLMRequestHandler
+
+    handler = LLMRequestHandler(ProviderConfig(model="gpt-4o", api_key="test-key"), response_cache=cache)
+    completion = AsyncMock(return_value=_completion('{"findings": []}'))
+
+    with patch("skill_scanner.core.analyzers.llm_request_handler.acompletion", completion):
+        first = asyncio.run(handler.make_request(MESSAGES, context="a"))
+        second = asyncio.run(handler.make_request(MESSAGES, context="b"))
+
+    assert first == second == '{"findings": []}'
+    assert completion.await_count == 1
+    assert cache.stats.hits == 1
+
+
+def test_meta_analyzer_serves_repeat_prompts_from_cache(cache):
+    completion = AsyncMock(return_value=_completion('{"validated_findings": []}'))
+
+    with patch("skill_scanner.core.analyzers.meta_analyzer.LITELLM_AVAILABLE", True):
+        with patch("skill_scanner.core.analyzers.meta_analyzer.acompletion", completion):
+            from skill_scanner.core.analyzers.meta_analyzer import MetaAnalyzer
+
+            meta = MetaAnalyzer(model="gpt-4o", api_key="test-key", response_cache=cache)
+            for _ in range(3):
+                assert asyncio.run(meta._make_llm_request("system", "user")) == '{"validated_findings": []}'
+
+    assert completion.await_count == 1
+    assert cache.stats.hits == 2
+
+
+def test_alignment_client_skips_llm_on_cache_hit(cache):
+    pytest.importorskip("litellm")
+    from skill_scanner.core.analyzers.behavioral.alignment import AlignmentLLMClient
+
+    client = AlignmentLLMClient(model="gpt-4o", api_key="test-key", response_cache=cache)
+    completion = AsyncMock(return_value=_completion('{"mismatch_detected": false}'))
+
+    with patch("skill_scanner.core.analyzers.behavioral.alignment.alignment_llm_client.acompletion", completion):
+        for _ in range(2):
+            assert asyncio.run(client.verify_alignment("prompt")) == '{"mismatch_detected": false}'
+
+    assert completion.await_count == 1
+
+
+def _write_skill(root):
+    skill_dir = root / "skill"
+    (skill_dir / "scripts").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text("---\nname: notes\ndescription: Take notes\n---\n\n# Notes\n")
+    (skill_dir / "scripts" / "save.py").write_text("open('notes.txt', 'w').write('hi')\n")
+    return skill_dir
+
+
+def test_delimiter_ids_left_out_of_key(tmp_path):
+    from skill_scanner.core.analyzers.llm_prompt_builder import PromptBuilder
+    from skill_scanner.core.loader import SkillLoader
+
+    skill = SkillLoader().load_skill(_write_skill(tmp_path))
+    builder = PromptBuilder()
+
+    def key(instruction_body):
+        prompt, _ = builder.build_threat_analysis_prompt(
+            skill.name, skill.description, "", instruction_body, builder.format_code_files(skill), ""
+        )
+        return LLMResponseCache.make_key("gpt-4o", [{"role": "user", "content": prompt}])
+
+    assert key(skill.instruction_body) == key(skill.instruction_body)
+    assert key(skill.instruction_body) != key(skill.instruction_body + " changed")
+
+
+def test_llm_analyzer_rescan_served_from_cache(cache, tmp_path):
+    from skill_scanner.core.analyzers.llm_analyzer import LLMAnalyzer
+    from skill_scanner.core.loader import SkillLoader
+
+    skill = SkillLoader().load_skill(_write_skill(tmp_path))
+    completion = AsyncMock(
+        return_value=_completion('{"findings": [], "overall_assessment": "Safe", "primary_threats": []}')
+    )
+
+    with patch("skill_scanner.core.analyzers.llm_request_handler.acompletion", completion):
+        for _ in range(2):
+            LLMAnalyzer(model="gpt-4o", api_key="test-key", response_cache=cache).analyze(skill)
+
+    assert completion.await_count == 1
+    assert cache.stats.hits == 1
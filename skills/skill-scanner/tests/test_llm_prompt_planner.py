@@ -0,0 +1,362 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for token-budgeted LLM prompts: chunking large skills and packing small ones.
+
+A fake make_request answers from the prompt text, so no requests leave the
+process.
+"""
+
+import asyncio
+import json
+import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from skill_scanner.api.jobs import BatchScanTask
+from skill_scanner.core.analyzers.llm_analyzer import SYSTEM_PROMPT, LLMAnalyzer
+from skill_scanner.core.analyzers.llm_prompt_builder import PromptBuilder, estimate_tokens
+from skill_scanner.core.analyzers.llm_request_handler import LLMUsage
+from skill_scanner.core.loader import SkillLoader
+from skill_scanner.core.scanner import SkillScanner, _init_scan_worker, _scan_skills_in_worker
+
+EXEC_FINDING = {
+    "severity": "HIGH",
+    "aitech": "AITech-9.1",
+    "title": "Command execution",
+    "description": "Runs shell commands",
+    "location": "SKILL.md",
+}
+
+
+def _load_skill(root, name, scripts=0, script_chars=1200, body="Take notes."):
+    skill_dir = root / name
+    (skill_dir / "scripts").mkdir(parents=True)
+    (skill_dir / "notes.md").write_text("# Notes\n\nMore notes.\n")
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: The {name} skill\n---\n\n{body}\n\nSee [notes](notes.md).\n"
+    )
+    for n in range(scripts):
+        (skill_dir / "scripts" / f"tool{n}.py").write_text(f"# tool {n}\n" + "x = 1\n" * (script_chars // 6))
+    return SkillLoader().load_skill(skill_dir)
+
+
+def _budget_for(skill, sections_per_chunk):
+    """A prompt budget fitting the skill's base prompt plus a number of script sections."""
+    plan = PromptBuilder().plan_threat_analysis(skill, 10**6)
+    section = plan.chunks[0].sections[0].tokens
+    return plan.base_tokens + estimate_tokens(SYSTEM_PROMPT) + section * sections_per_chunk + section // 2
+
+
+class FakeLLM:
+    """Answers threat analysis prompts; flags every chunk and records requests in flight."""
+
+    def __init__(self, delay=0.0, unanswered=(), fail=None):
+        self.delay = delay
+        self.unanswered = set(unanswered)
+        self.fail = fail
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, messages, context="", schema=None, usage=None):
+        prompt = messages[1]["content"]
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if usage is not None:
+            usage.requests += 1
+            usage.prompt_tokens += 1000
+            usage.completion_tokens += 100
+        if self.fail and self.fail in prompt:
+            raise RuntimeError("provider error")
+
+        batched = re.findall(r"^Skill ID: (\S+)\nSkill Name: (\S+)$", prompt, re.MULTILINE)
+        if batched:
+            # Answer in reverse order, titling each finding with the skill it belongs to
+            return json.dumps(
+                {
+                    "skills": [
+                        {
+                            "skill_id": skill_id,
+                            "findings": [{**EXEC_FINDING, "title": name}],
+                            "overall_assessment": "Risky",
+                            "primary_threats": [],
+                        }
+                        for skill_id, name in reversed(batched)
+                        if name not in self.unanswered
+                    ]
+                }
+            )
+        part = re.search(r"^Analysis Part: (\d+) of", prompt, re.MULTILINE)
+        findings = [EXEC_FINDING]
+        if part:
+            findings = findings + [{**EXEC_FINDING, "title": f"Part {part.group(1)}"}]
+        return json.dumps({"findings": findings, "overall_assessment": "Risky", "primary_threats": ["exec"]})
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    def install(**kwargs):
+        fake = FakeLLM(**kwargs)
+        monkeypatch.setattr(
+            "skill_scanner.core.analyzers.llm_request_handler.LLMRequestHandler.make_request",
+            lambda self, *args, **kw: fake(*args, **kw),
+        )
+        return fake
+
+    return install
+
+
+class TestPromptPlanner:
+    """Test splitting a skill's content against a token budget."""
+
+    def test_small_skill_matches_single_prompt(self, tmp_path):
+        skill = _load_skill(tmp_path, "small", scripts=2)
+        builder = PromptBuilder()
+
+        plan = builder.plan_threat_analysis(skill)
+        prompt, injected = builder.build_chunk_prompt(plan, 0)
+
+        assert len(plan.chunks) == 1
+        assert not injected
+        assert builder.format_code_files(skill) in prompt
+        assert builder.format_referenced_files(skill) in prompt
+        assert "Analysis Part" not in prompt
+
+    def test_large_skill_split_scripts_first(self, tmp_path):
+        skill = _load_skill(tmp_path, "large", scripts=5)
+        budget = _budget_for(skill, 2)
+
+        plan = PromptBuilder().plan_threat_analysis(skill, budget - estimate_tokens(SYSTEM_PROMPT))
+
+        scripts = [f.relative_path for f in skill.get_scripts()]
+        assert [chunk.paths for chunk in plan.chunks] == [scripts[0:2], scripts[2:4], [scripts[4], "notes.md"]]
+        assert all(chunk.tokens <= budget for chunk in plan.chunks)
+        assert plan.skipped == []
+
+    def test_sections_past_chunk_limit_skipped(self, tmp_path):
+        skill = _load_skill(tmp_path, "large", scripts=5)
+
+        plan = PromptBuilder().plan_threat_analysis(
+            skill, _budget_for(skill, 2) - estimate_tokens(SYSTEM_PROMPT), max_chunks=2
+        )
+
+        # The small referenced file still fills the room left in the last chunk
+        assert plan.chunks[-1].paths[-1] == "notes.md"
+        assert [section.path for section in plan.skipped] == [skill.get_scripts()[4].relative_path]
+
+    def test_chunk_prompt_notes_other_parts(self, tmp_path):
+        skill = _load_skill(tmp_path, "large", scripts=5)
+        builder = PromptBuilder()
+        plan = builder.plan_threat_analysis(skill, _budget_for(skill, 2) - estimate_tokens(SYSTEM_PROMPT))
+
+        prompt, _ = builder.build_chunk_prompt(plan, 1)
+
+        assert "Analysis Part: 2 of 3" in prompt
+        assert plan.chunks[1].paths[0] in prompt and plan.chunks[0].paths[0] not in prompt
+        assert "File contents are covered in another part of this analysis." in prompt
+
+
+class TestChunkedAnalysis:
+    """Test concurrent analysis of a chunked skill."""
+
+    def test_chunks_run_concurrently_and_merge(self, tmp_path, fake_llm):
+        skill = _load_skill(tmp_path, "large", scripts=5)
+        fake = fake_llm(delay=0.05)
+        analyzer = LLMAnalyzer(api_key="test-key", max_prompt_tokens=_budget_for(skill, 2))
+
+        output = analyzer.run(skill)
+
+        assert len(fake.prompts) == 3
+        assert fake.peak == 3
+        # The finding every chunk reports is kept once
+        assert sorted(f.title for f in output.findings) == ["Command execution", "Part 1", "Part 2", "Part 3"]
+        assert output.incomplete_analyses == []
+
+    def test_concurrency_bounded(self, tmp_path, fake_llm):
+        skill = _load_skill(tmp_path, "large", scripts=5)
+        fake = fake_llm(delay=0.05)
+
+        LLMAnalyzer(api_key="test-key", max_prompt_tokens=_budget_for(skill, 2), max_concurrent_requests=2).analyze(
+            skill
+        )
+
+        assert fake.peak == 2
+
+    def test_skipped_and_failed_chunks_reported(self, tmp_path, fake_llm):
+        skill = _load_skill(tmp_path, "large", scripts=5)
+        scripts = [f.relative_path for f in skill.get_scripts()]
+        fake_llm(fail="Analysis Part: 2 of 2")
+        analyzer = LLMAnalyzer(api_key="test-key", max_prompt_tokens=_budget_for(skill, 2), max_prompt_chunks=2)
+
+        output = analyzer.run(skill)
+
+        assert sorted(f.title for f in output.findings) == ["Command execution", "Part 1"]
+        incomplete = {(entry["file"], entry["limit"]) for entry in output.incomplete_analyses}
+        assert incomplete == {
+            (scripts[2], "llm_request"),
+            (scripts[3], "llm_request"),
+            ("notes.md", "llm_request"),
+            (scripts[4], "prompt_tokens"),
+        }
+
+    def test_usage_recorded_per_skill(self, tmp_path, fake_llm):
+        skill = _load_skill(tmp_path, "large", scripts=5)
+        fake_llm()
+        analyzer = LLMAnalyzer(api_key="test-key", max_prompt_tokens=_budget_for(skill, 2))
+
+        analyzer.analyze(skill)
+
+        usage = analyzer.usage_by_skill[str(skill.directory)]
+        assert usage.requests == 3
+        assert usage.prompt_tokens == 3000
+        assert usage.estimated_prompt_tokens > 0
+        assert analyzer.total_usage.requests == 3
+
+    def test_same_named_skills_counted_separately(self, tmp_path, fake_llm):
+        # Two skills named "large" in different directories, scanned concurrently on one analyzer
+        skills = [_load_skill(tmp_path / root, "large", scripts=5) for root in ("a", "b")]
+        fake_llm(delay=0.05)
+        analyzer = LLMAnalyzer(api_key="test-key", max_prompt_tokens=_budget_for(skills[0], 2))
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(analyzer.analyze, skills))
+
+        assert sorted(analyzer.usage_by_skill) == sorted(str(skill.directory) for skill in skills)
+        assert [analyzer.usage_by_skill[str(skill.directory)].requests for skill in skills] == [3, 3]
+        assert analyzer.total_usage.requests == 6
+
+    def test_analyzer_pickles_for_worker_processes(self, tmp_path, fake_llm):
+        skill = _load_skill(tmp_path, "large", scripts=5)
+        fake_llm()
+
+        analyzer = pickle.loads(pickle.dumps(LLMAnalyzer(api_key="test-key", max_prompt_tokens=_budget_for(skill, 2))))
+        analyzer.analyze(skill)
+
+        assert analyzer.total_usage.requests == 3
+
+
+class TestBatchedAnalysis:
+    """Test packing small skills into shared requests."""
+
+    def test_small_skills_share_a_request(self, tmp_path, fake_llm):
+        skills = [_load_skill(tmp_path, f"small{n}", scripts=1, script_chars=120) for n in range(3)]
+        fake = fake_llm()
+        analyzer = LLMAnalyzer(api_key="test-key")
+
+        results = analyzer.analyze_batch(skills)
+
+        assert len(fake.prompts) == 1
+        assert [[f.title for f in findings] for findings in results] == [["small0"], ["small1"], ["small2"]]
+        assert analyzer.total_usage.requests == 1
+        assert analyzer.total_usage.batched_requests == 1
+        shares = [analyzer.usage_by_skill[str(skill.directory)] for skill in skills]
+        assert all(usage.requests == 0 and usage.batched_requests == 1 for usage in shares)
+        assert sum(usage.prompt_tokens for usage in shares) == pytest.approx(1000, abs=2)
+
+    def test_skills_per_request_bounded(self, tmp_path, fake_llm):
+        skills = [_load_skill(tmp_path, f"small{n}", scripts=1, script_chars=120) for n in range(5)]
+        fake = fake_llm()
+
+        LLMAnalyzer(api_key="test-key", max_skills_per_request=2).analyze_batch(skills)
+
+        # Two pairs batched, the fifth skill on its own
+        assert len(fake.prompts) == 3
+        assert sum("Skill ID:" in prompt for prompt in fake.prompts) == 2
+
+    def test_missing_skill_analyzed_alone(self, tmp_path, fake_llm):
+        skills = [_load_skill(tmp_path, f"small{n}", scripts=1, script_chars=120) for n in range(3)]
+        fake = fake_llm(unanswered={"small2"})
+
+        results = LLMAnalyzer(api_key="test-key").analyze_batch(skills)
+
+        assert len(fake.prompts) == 2
+        assert "Skill ID:" not in fake.prompts[1] and "Skill Name: small2" in fake.prompts[1]
+        assert [[f.title for f in findings] for findings in results] == [["small0"], ["small1"], ["Command execution"]]
+
+    def test_large_skill_not_batched(self, tmp_path, fake_llm):
+        skills = [
+            _load_skill(tmp_path, "small0", scripts=1, script_chars=120),
+            _load_skill(tmp_path, "large", scripts=8),
+            _load_skill(tmp_path, "small1", scripts=1, script_chars=120),
+        ]
+        fake = fake_llm()
+
+        results = LLMAnalyzer(api_key="test-key").analyze_batch(skills)
+
+        assert len(fake.prompts) == 2
+        batched = [prompt for prompt in fake.prompts if "Skill ID:" in prompt]
+        assert len(batched) == 1 and "small0" in batched[0] and "small1" in batched[0]
+        assert [[f.title for f in findings] for findings in results] == [["small0"], ["Command execution"], ["small1"]]
+
+    def test_directory_scan_packs_small_skills(self, tmp_path, fake_llm):
+        for n in range(3):
+            _load_skill(tmp_path, f"small{n}", scripts=1, script_chars=120)
+        fake = fake_llm()
+
+        report = SkillScanner(analyzers=[LLMAnalyzer(api_key="test-key")]).scan_directory(tmp_path)
+
+        assert len(fake.prompts) == 1
+        assert {result.skill_name: [f.title for f in result.findings] for result in report.scan_results} == {
+            "small0": ["small0"],
+            "small1": ["small1"],
+            "small2": ["small2"],
+        }
+
+    def test_batch_job_packs_small_skills(self, tmp_path, fake_llm):
+        for n in range(2):
+            _load_skill(tmp_path, f"small{n}", scripts=1, script_chars=120)
+        fake = fake_llm()
+        task = BatchScanTask(tmp_path, False, lambda: [LLMAnalyzer(api_key="test-key")])
+
+        skill_dirs = sorted(task.prepare()) + [tmp_path / "missing"]
+        outcomes = task.scan_batch(skill_dirs)
+
+        assert task.batch_size == 5
+        assert len(fake.prompts) == 1
+        assert [[f.title for f in outcome.findings] for outcome in outcomes[:2]] == [["small0"], ["small1"]]
+        assert isinstance(outcomes[2], Exception)
+
+    def test_worker_usage_returned_to_parent(self, tmp_path, fake_llm):
+        skill_dirs = [_load_skill(tmp_path, f"small{n}", scripts=1, script_chars=120).directory for n in range(2)]
+        fake_llm()
+        parent = LLMAnalyzer(api_key="test-key")
+
+        # What a --jobs worker runs, on its own copy of the analyzer
+        _init_scan_worker([pickle.loads(pickle.dumps(parent))], SkillLoader())
+        outcomes, _, usage = _scan_skills_in_worker(skill_dirs)
+        for by_skill, total in usage:
+            parent.merge_usage(by_skill, total)
+
+        assert [[f.title for f in outcome[1][0]] for outcome in outcomes] == [["small0"], ["small1"]]
+        assert sorted(parent.usage_by_skill) == sorted(str(skill_dir) for skill_dir in skill_dirs)
+        assert (parent.total_usage.requests, parent.total_usage.batched_requests) == (1, 1)
+
+    def test_share_splits_tokens(self):
+        usage = LLMUsage(requests=1, estimated_prompt_tokens=400, prompt_tokens=1000, completion_tokens=200)
+
+        share = usage.share(0.25)
+
+        assert (share.requests, share.batched_requests) == (0, 1)
+        assert (share.estimated_prompt_tokens, share.prompt_tokens, share.completion_tokens) == (100, 250, 50)
@@ -25,6 +25,7 @@ import pytest
 
 from skill_scanner.core.reporters.json_reporter import JSONReporter
 from skill_scanner.core.reporters.markdown_reporter import MarkdownReporter
+from skill_scanner.core.reporters.ndjson_reporter import NDJSONReporter
 from skill_scanner.core.reporters.table_reporter import TableReporter
 from skill_scanner.core.scanner import SkillScanner, scan_skill
 
@@ -109,3 +110,25 @@ def test_table_reporter_multi_skill(report):
 
     # Should show all scanned skills
     assert report.total_skills_scanned > 0
+
+
+def test_ndjson_reporter_matches_report(report, example_skills_dir):
+    """Test streamed NDJSON records match the in-memory report."""
+    import io
+
+    stream = io.StringIO()
+    reporter = NDJSONReporter(stream)
+    for _, result in SkillScanner().iter_scan_directory(example_skills_dir, recursive=True):
+        reporter.write_result(result)
+    reporter.write_summary()
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    expected = report.to_dict()
+
+    assert [r["type"] for r in records] == ["result"] * report.total_skills_scanned + ["summary"]
+    assert [r["result"]["skill_name"] for r in records[:-1]] == [r["skill_name"] for r in expected["results"]]
+    summary = records[-1]["summary"]
+    assert {k: v for k, v in summary.items() if k != "timestamp"} == {
+        k: v for k, v in expected["summary"].items() if k != "timestamp"
+    }
+    assert NDJSONReporter().generate_report(report).count("\n") == report.total_skills_scanned + 1
@@ -0,0 +1,171 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for the content-hash incremental scan cache.
+"""
+
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+
+from skill_scanner.core.analyzers.behavioral_analyzer import BehavioralAnalyzer
+from skill_scanner.core.analyzers.static import StaticAnalyzer
+from skill_scanner.core.loader import SkillLoader
+from skill_scanner.core.scan_cache import CacheStats, ScanCache
+from skill_scanner.core.scanner import SkillScanner
+from skill_scanner.core.static_analysis.budget import AnalysisBudget
+
+
+@pytest.fixture
+def example_skills_dir():
+    """Get path to example skills directory."""
+    return Path(__file__).parent.parent / "evals" / "test_skills"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory."""
+    return ScanCache(cache_dir=tmp_path / "cache")
+
+
+def _findings(result):
+    return [f.to_dict() for f in result.findings]
+
+
+class TestScanCache:
+    """Tests for the ScanCache storage layer."""
+
+    def test_miss_then_hit(self, cache):
+        assert cache.get("static:scripts", "fp", "run.py", "print(1)") is None
+        cache.put("static:scripts", "fp", "run.py", "print(1)", [{"id": "X"}])
+
+        assert cache.get("static:scripts", "fp", "run.py", "print(1)") == [{"id": "X"}]
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_key_depends_on_content_path_and_fingerprint(self, cache):
+        cache.put("static:scripts", "fp", "run.py", "print(1)", [])
+
+        assert cache.get("static:scripts", "fp", "run.py", "print(2)") is None
+        assert cache.get("static:scripts", "fp", "other.py", "print(1)") is None
+        assert cache.get("static:scripts", "fp2", "run.py", "print(1)") is None
+        assert cache.get("static:yara", "fp", "run.py", "print(1)") is None
+
+    def test_persists_across_instances(self, tmp_path):
+        ScanCache(cache_dir=tmp_path).put("ns", "fp", "a.py", "x = 1", {"value": 1})
+
+        assert ScanCache(cache_dir=tmp_path).get("ns", "fp", "a.py", "x = 1") == {"value": 1}
+
+    def test_drain_stats_resets_counters(self, cache):
+        cache.get("ns", "fp", "a.py", "x")
+        stats = cache.drain_stats()
+
+        assert stats.misses == 1
+        assert cache.stats.lookups == 0
+
+    def test_counters_change_under_lock(self, cache):
+        class LockCheckedStats(CacheStats):
+            def __setattr__(self, name, value):
+                # Threads sharing the cache look up at once; unguarded increments lose updates
+                assert cache._lock.locked(), f"{name} changed outside the cache lock"
+                super().__setattr__(name, value)
+
+        cache.put("ns", "fp", "a.py", "x", [])
+        cache.stats.__class__ = LockCheckedStats
+
+        cache.get("ns", "fp", "a.py", "x")
+        cache.get("ns", "fp", "b.py", "x")
+
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_picklable_for_worker_processes(self, cache):
+        cache.put("ns", "fp", "a.py", "x", [])
+        clone = pickle.loads(pickle.dumps(cache))
+
+        assert clone.get("ns", "fp", "a.py", "x") == []
+
+
+class TestIncrementalScanning:
+    """Tests for analyzers reusing cached per-file results."""
+
+    def test_cached_rescan_matches_uncached(self, cache, example_skills_dir):
+        uncached = SkillScanner(analyzers=[StaticAnalyzer(), BehavioralAnalyzer()])
+        cached = SkillScanner(analyzers=[StaticAnalyzer(cache=cache), BehavioralAnalyzer(cache=cache)])
+        skill_dir = example_skills_dir / "malicious" / "exfiltrator"
+
+        expected = _findings(uncached.scan_skill(skill_dir))
+        first = _findings(cached.scan_skill(skill_dir))
+        first_stats = cache.drain_stats()
+        second = _findings(cached.scan_skill(skill_dir))
+        second_stats = cache.drain_stats()
+
+        assert first == expected
+        assert second == expected
+        assert first_stats.hits == 0
+        assert second_stats.misses == 0
+        assert second_stats.hits == first_stats.misses
+
+    def test_only_changed_files_are_reanalyzed(self, cache, example_skills_dir, tmp_path):
+        skill_dir = tmp_path / "skill"
+        shutil.copytree(example_skills_dir / "malicious" / "exfiltrator", skill_dir)
+        scanner = SkillScanner(analyzers=[StaticAnalyzer(cache=cache)])
+
+        scanner.scan_skill(skill_dir)
+        cache.drain_stats()
+
+        script = skill_dir / "analyze.py"
+        script.write_text(script.read_text() + "\n# changed\n")
+        scanner.scan_skill(skill_dir)
+        stats = cache.drain_stats()
+
+        assert stats.misses > 0
+        assert stats.hits > 0
+
+    def test_disabled_rules_change_fingerprint(self, cache):
+        default = StaticAnalyzer(cache=cache)
+        restricted = StaticAnalyzer(cache=cache, disabled_rules={"YARA_script_injection"})
+
+        assert default.cache_fingerprint != restricted.cache_fingerprint
+        assert default.cache_fingerprint == StaticAnalyzer(cache=cache).cache_fingerprint
+
+    def test_behavioral_entries_hit_from_another_checkout(self, cache, example_skills_dir, tmp_path):
+        source = example_skills_dir / "malicious" / "exfiltrator"
+        first_dir = tmp_path / "ci-run-1" / "exfiltrator"
+        second_dir = tmp_path / "ci-run-2" / "renamed"
+        shutil.copytree(source, first_dir)
+        shutil.copytree(source, second_dir)
+
+        BehavioralAnalyzer(cache=cache).analyze(SkillLoader().load_skill(first_dir))
+        cache.drain_stats()
+        skill = SkillLoader().load_skill(second_dir)
+        cached = [f.to_dict() for f in BehavioralAnalyzer(cache=cache).analyze(skill)]
+        stats = cache.drain_stats()
+
+        assert stats.misses == 0 and stats.hits > 0
+        # Findings point at the checkout being scanned
+        assert cached == [f.to_dict() for f in BehavioralAnalyzer().analyze(skill)]
+
+    def test_behavioral_budget_changes_fingerprint(self, cache):
+        default = BehavioralAnalyzer(cache=cache, budget=AnalysisBudget())
+
+        assert (
+            default.cache_fingerprint
+            != BehavioralAnalyzer(cache=cache, budget=AnalysisBudget(max_ast_nodes=10)).cache_fingerprint
+        )
+        assert default.cache_fingerprint == BehavioralAnalyzer(cache=cache, budget=AnalysisBudget()).cache_fingerprint
@@ -18,10 +18,15 @@
 Unit tests for scanner engine.
 """
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import pytest
 
+from skill_scanner.core.analyzers.static import StaticAnalyzer
+from skill_scanner.core.analyzers.trigger_analyzer import TriggerAnalyzer
 from skill_scanner.core.models import Severity
 from skill_scanner.core.scanner import SkillScanner, scan_skill
 
@@ -85,6 +90,37 @@ def test_scan_directory(scanner, example_skills_dir):
     assert report.critical_count > 0 or report.high_count > 0
 
 
+def test_scan_directory_parallel_matches_sequential(scanner, example_skills_dir):
+    """Test that a multi-process scan yields the same results in the same order."""
+    sequential = scanner.scan_directory(example_skills_dir, recursive=True)
+    parallel = scanner.scan_directory(example_skills_dir, recursive=True, workers=2)
+
+    assert parallel.total_skills_scanned == sequential.total_skills_scanned
+    assert [r.skill_name for r in parallel.scan_results] == [r.skill_name for r in sequential.scan_results]
+    for par_result, seq_result in zip(parallel.scan_results, sequential.scan_results):
+        assert [f.id for f in par_result.findings] == [f.id for f in seq_result.findings]
+        assert par_result.analyzers_used == seq_result.analyzers_used
+
+
+def test_finding_ids_match_in_spawned_workers(tmp_path, monkeypatch):
+    """Test that finding IDs do not depend on the worker process (spawned workers get their own hash seed)."""
+    for name, description in [("helper", "help"), ("assistant", "assistant"), ("doer", "I can do anything")]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {description}\n---\n\nDo it.\n")
+    scanner = SkillScanner(analyzers=[StaticAnalyzer(use_yara=False), TriggerAnalyzer()])
+
+    sequential = scanner.scan_directory(tmp_path, workers=1)
+    monkeypatch.setattr(
+        "skill_scanner.core.scanner.ProcessPoolExecutor",
+        partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")),
+    )
+    parallel = scanner.scan_directory(tmp_path, workers=2)
+
+    sequential_ids = [[f.id for f in result.findings] for result in sequential.scan_results]
+    assert any(finding_id.startswith("TRIGGER_") for ids in sequential_ids for finding_id in ids)
+    assert [[f.id for f in result.findings] for result in parallel.scan_results] == sequential_ids
+
+
 def test_scan_result_to_dict(scanner, example_skills_dir):
     """Test conversion of ScanResult to dictionary."""
     skill_dir = example_skills_dir / "safe" / "simple-formatter"
@@ -0,0 +1,245 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for concurrent VirusTotal lookups, the verdict cache and the rate limiter.
+
+A httpx.MockTransport stands in for the VirusTotal API, so no requests leave
+the process.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from skill_scanner.core.analyzers.static import StaticAnalyzer
+from skill_scanner.core.analyzers.virustotal_analyzer import VirusTotalAnalyzer, VirusTotalRateLimiter
+from skill_scanner.core.loader import SkillLoader
+from skill_scanner.core.scan_cache import CacheStats
+from skill_scanner.core.scanner import SkillScanner, _init_scan_worker, _scan_skills_in_worker
+from skill_scanner.core.vt_cache import VirusTotalCache
+
+MALWARE = b"\x7fELF malicious payload"
+CLEAN = b"\x89PNG clean image"
+UNKNOWN = b"\x7fELF never seen before"
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class FakeVirusTotal:
+    """Answers file report requests from a table of known hashes."""
+
+    def __init__(self, reports: dict[str, dict[str, int]], status: int | None = None):
+        self.reports = reports
+        self.status = status
+        self.requests: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        file_hash = request.url.path.rsplit("/", 1)[-1]
+        with self._lock:
+            self.requests.append(file_hash)
+        if self.status is not None:
+            return httpx.Response(self.status)
+        if file_hash not in self.reports:
+            return httpx.Response(404)
+        stats = self.reports[file_hash]
+        return httpx.Response(200, json={"data": {"attributes": {"last_analysis_stats": stats}}})
+
+
+REPORTS = {
+    _sha256(MALWARE): {"malicious": 40, "suspicious": 0, "undetected": 20, "harmless": 0},
+    _sha256(CLEAN): {"malicious": 0, "suspicious": 0, "undetected": 60, "harmless": 10},
+}
+
+
+@pytest.fixture
+def skill(tmp_path):
+    skill_dir = tmp_path / "skill"
+    (skill_dir / "lib").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        "---\nname: vendored\ndescription: Ships vendored libraries\n---\n\n# Vendored\n"
+    )
+    (skill_dir / "lib" / "a.so").write_bytes(MALWARE)
+    (skill_dir / "lib" / "b.so").write_bytes(MALWARE)  # Same content, looked up once
+    (skill_dir / "lib" / "logo.png").write_bytes(CLEAN)
+    (skill_dir / "lib" / "new.bin").write_bytes(UNKNOWN)
+    return SkillLoader().load_skill(skill_dir)
+
+
+def _analyzer(server, **kwargs) -> VirusTotalAnalyzer:
+    kwargs.setdefault("requests_per_minute", 60_000)
+    return VirusTotalAnalyzer(api_key="test-key", transport=httpx.MockTransport(server), **kwargs)
+
+
+class TestConcurrentLookups:
+    """Test hashing and lookups across files."""
+
+    def test_findings_and_validated_files(self, skill):
+        server = FakeVirusTotal(REPORTS)
+        analyzer = _analyzer(server)
+
+        findings = analyzer.analyze(skill)
+
+        assert sorted(f.file_path for f in findings) == ["lib/a.so", "lib/b.so"]
+        assert {f.rule_id for f in findings} == {"VIRUSTOTAL_MALICIOUS_FILE"}
+        assert analyzer.validated_binary_files == ["lib/logo.png"]
+        assert sorted(server.requests) == sorted({_sha256(MALWARE), _sha256(CLEAN), _sha256(UNKNOWN)})
+
+    def test_lookups_run_concurrently(self, skill):
+        barrier = threading.Barrier(3, timeout=10)
+        server = FakeVirusTotal(REPORTS)
+
+        def handler(request):
+            barrier.wait()  # Breaks (and fails the lookups) unless three requests are in flight together
+            return server(request)
+
+        analyzer = _analyzer(handler, max_workers=3)
+
+        assert len(analyzer.analyze(skill)) == 2
+
+    def test_large_files_hashed_in_chunks(self, tmp_path):
+        data = bytes(range(256)) * 20_000  # Several hash chunks
+        path = tmp_path / "big.bin"
+        path.write_bytes(data)
+
+        assert _analyzer(FakeVirusTotal({}))._calculate_sha256(path) == _sha256(data)
+
+    def test_concurrent_scans_keep_their_own_validated_files(self, tmp_path):
+        # Same path in both skills; VirusTotal knows only the first one's content as clean
+        skill_dirs = []
+        for name, content in (("clean", CLEAN), ("unknown", UNKNOWN)):
+            skill_dir = tmp_path / name
+            (skill_dir / "lib").mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: Ships a tool\n---\n\n# Tool\n")
+            (skill_dir / "lib" / "tool.bin").write_bytes(content)
+            skill_dirs.append(skill_dir)
+        analyzer = _analyzer(FakeVirusTotal(REPORTS))
+        scanner = SkillScanner(analyzers=[StaticAnalyzer(use_yara=False), analyzer])
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(scanner.scan_skill, skill_dirs * 4))
+
+        binary_findings = [
+            [f.file_path for f in result.findings if f.rule_id == "BINARY_FILE_DETECTED"] for result in results
+        ]
+        assert binary_findings == [[], ["lib/tool.bin"]] * 4
+        assert analyzer.validated_binary_files == []
+
+    def test_api_errors_not_reported_as_unknown(self, skill):
+        analyzer = _analyzer(FakeVirusTotal(REPORTS, status=500), upload_files=True)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(analyzer, "_upload_and_scan", lambda *_: pytest.fail("upload after an API error"))
+            assert analyzer.analyze(skill) == []
+
+
+class TestVerdictCache:
+    """Test that verdicts are reused across scans."""
+
+    def test_second_scan_served_from_cache(self, skill, tmp_path):
+        first = _analyzer(FakeVirusTotal(REPORTS), cache=VirusTotalCache(tmp_path / "cache"))
+        expected = sorted((f.file_path, f.severity) for f in first.analyze(skill))
+
+        server = FakeVirusTotal(REPORTS)
+        cache = VirusTotalCache(tmp_path / "cache")
+        second = _analyzer(server, cache=cache)
+        findings = second.analyze(skill)
+
+        assert server.requests == []
+        assert sorted((f.file_path, f.severity) for f in findings) == expected
+        assert second.validated_binary_files == ["lib/logo.png"]
+        assert cache.stats.hits == 3
+
+    def test_counters_change_under_lock(self, tmp_path):
+        cache = VirusTotalCache(tmp_path)
+
+        class LockCheckedStats(CacheStats):
+            def __setattr__(self, name, value):
+                # Hash lookups run on a thread pool; unguarded increments lose updates
+                assert cache._lock.locked(), f"{name} changed outside the cache lock"
+                super().__setattr__(name, value)
+
+        cache.put("known", {"malicious": 1})
+        cache.stats.__class__ = LockCheckedStats
+
+        cache.get("known")
+        cache.get("missing")
+
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_worker_counters_returned_to_parent(self, skill, tmp_path):
+        cache = VirusTotalCache(tmp_path / "cache")
+        _analyzer(FakeVirusTotal(REPORTS), cache=cache).analyze(skill)
+        cache.drain_stats()
+
+        # What a --jobs worker runs, then hands back to the parent process
+        _init_scan_worker([_analyzer(FakeVirusTotal(REPORTS), cache=cache)], SkillLoader())
+        _, cache_stats, _ = _scan_skills_in_worker([skill.directory])
+
+        assert [(stats.hits, stats.misses) for stats in cache_stats] == [(3, 0)]
+        assert cache.stats.lookups == 0
+
+    def test_not_found_answers_expire_sooner(self, tmp_path):
+        cache = VirusTotalCache(tmp_path, ttl_seconds=3600, not_found_ttl_seconds=60)
+        cache.put("known", {"malicious": 1})
+        cache.put("unknown", None)
+        with sqlite3.connect(cache.db_path) as conn:
+            conn.execute("UPDATE verdicts SET created_at = created_at - 600")
+
+        assert cache.get("known") == ({"malicious": 1}, True)
+        assert cache.get("unknown") is None
+
+    def test_errors_not_cached(self, skill, tmp_path):
+        cache = VirusTotalCache(tmp_path / "cache")
+        _analyzer(FakeVirusTotal(REPORTS, status=429), cache=cache).analyze(skill)
+
+        server = FakeVirusTotal(REPORTS)
+        _analyzer(server, cache=cache).analyze(skill)
+
+        assert len(server.requests) == 3
+
+
+class TestRateLimiter:
+    """Test the token bucket."""
+
+    def test_requests_spaced_at_quota(self):
+        limiter = VirusTotalRateLimiter(requests_per_minute=4)
+
+        delays = [limiter.reserve() for _ in range(3)]
+
+        assert delays[0] == 0.0
+        assert delays[1] == pytest.approx(15.0, abs=0.1)
+        assert delays[2] == pytest.approx(30.0, abs=0.1)
+
+    def test_every_request_waits_for_a_token(self, skill):
+        analyzer = _analyzer(FakeVirusTotal(REPORTS))
+        calls = []
+        analyzer.rate_limiter.acquire = lambda: calls.append(1)
+
+        analyzer.analyze(skill)
+
+        assert len(calls) == 3
+
+    def test_rate_must_be_positive(self):
+        with pytest.raises(ValueError):
+            VirusTotalRateLimiter(requests_per_minute=0)
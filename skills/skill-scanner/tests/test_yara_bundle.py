@@ -0,0 +1,110 @@
+# Copyright 2026 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for precompiled YARA rule bundles.
+"""
+
+import pytest
+import yara
+
+from skill_scanner.core.rules.yara_scanner import YARA_BUNDLE_SUFFIX, YaraScanner, rules_fingerprint
+
+RULE_TEMPLATE = """
+rule bundle_test_rule
+{
+    strings:
+        $marker = "%s"
+    condition:
+        $marker
+}
+"""
+
+
+@pytest.fixture
+def rules_dir(tmp_path):
+    """Create a directory with a single custom YARA rule."""
+    directory = tmp_path / "rules"
+    directory.mkdir()
+    (directory / "bundle_test.yara").write_text(RULE_TEMPLATE % "bundle_marker_one")
+    return directory
+
+
+def test_bundle_written_on_first_load(rules_dir, tmp_path):
+    bundle_dir = tmp_path / "bundles"
+
+    scanner = YaraScanner(rules_dir=rules_dir, bundle_dir=bundle_dir)
+
+    assert scanner.bundle_path.exists()
+    assert scanner.bundle_path.name == rules_fingerprint(rules_dir) + YARA_BUNDLE_SUFFIX
+
+
+def test_bundle_matches_compiled_rules(rules_dir, tmp_path):
+    bundle_dir = tmp_path / "bundles"
+    YaraScanner(rules_dir=rules_dir, bundle_dir=bundle_dir)
+
+    cached = YaraScanner(rules_dir=rules_dir, bundle_dir=bundle_dir)
+    fresh = YaraScanner(rules_dir=rules_dir, use_bundle_cache=False)
+    content = "line one\nbundle_marker_one here\n"
+
+    assert cached.scan_content(content) == fresh.scan_content(content)
+    assert cached.scan_content(content)[0]["strings"][0]["line_number"] == 2
+
+
+def test_changed_sources_use_new_bundle(rules_dir, tmp_path):
+    bundle_dir = tmp_path / "bundles"
+    first = YaraScanner(rules_dir=rules_dir, bundle_dir=bundle_dir).bundle_path
+
+    (rules_dir / "bundle_test.yara").write_text(RULE_TEMPLATE % "bundle_marker_two")
+    scanner = YaraScanner(rules_dir=rules_dir, bundle_dir=bundle_dir)
+
+    assert scanner.bundle_path != first
+    assert scanner.scan_content("bundle_marker_two")
+    assert not scanner.scan_content("bundle_marker_one")
+
+
+def test_corrupt_bundle_falls_back_to_compile(rules_dir, tmp_path):
+    bundle_dir = tmp_path / "bundles"
+    bundle_path = YaraScanner(rules_dir=rules_dir, bundle_dir=bundle_dir).bundle_path
+    bundle_path.write_bytes(b"not a yara bundle")
+
+    scanner = YaraScanner(rules_dir=rules_dir, bundle_dir=bundle_dir)
+
+    assert scanner.scan_content("bundle_marker_one")
+
+
+def test_compile_bundle_replaces_existing(rules_dir, tmp_path):
+    scanner = YaraScanner(rules_dir=rules_dir, bundle_dir=tmp_path / "bundles", use_bundle_cache=False)
+    assert not scanner.bundle_path.exists()
+
+    bundle_path = scanner.compile_bundle()
+
+    assert bundle_path.exists()
+    assert YaraScanner(rules_dir=rules_dir, bundle_dir=tmp_path / "bundles").scan_content("bundle_marker_one")
+
+
+def test_compile_bundle_compiles_once(rules_dir, tmp_path, monkeypatch):
+    compiles = []
+    real_compile = yara.compile
+    monkeypatch.setattr(yara, "compile", lambda **kwargs: compiles.append(1) or real_compile(**kwargs))
+
+    scanner = YaraScanner(
+        rules_dir=rules_dir, bundle_dir=tmp_path / "bundles", use_bundle_cache=False, load_rules=False
+    )
+    scanner.compile_bundle()
+
+    assert len(compiles) == 1
+    assert scanner.scan_content("bundle_marker_one")